@@ -14,7 +14,11 @@ class, used in the Bio.AlignIO module.
 """
 
 
+import os
 import warnings
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy
 
 from Bio import Alphabet
 from Bio import BiopythonDeprecationWarning
@@ -1383,6 +1387,33 @@ class PairwiseAlignments:
         return alignment
 
 
+class _PathList:
+    """Iterator over a list of alignment paths (PRIVATE).
+
+    This provides the interface of the path generators of the aligner for
+    the banded, X-drop, and linear memory alignments, for which the aligner
+    finds only one optimal alignment.
+    """
+
+    def __init__(self, paths):
+        self._paths = paths
+        self._index = 0
+
+    def __len__(self):
+        return len(self._paths)
+
+    def reset(self):
+        self._index = 0
+
+    def __next__(self):
+        try:
+            path = self._paths[self._index]
+        except IndexError:
+            raise StopIteration from None
+        self._index += 1
+        return path
+
+
 class PairwiseAligner(_aligners.PairwiseAligner):
     """Performs pairwise sequence alignment using dynamic programming.
 
@@ -1553,6 +1584,8 @@ class PairwiseAligner(_aligners.PairwiseAligner):
         if isinstance(seqB, Seq):
             seqB = str(seqB)
         score, paths = _aligners.PairwiseAligner.align(self, seqA, seqB)
+        if isinstance(paths, list):
+            paths = _PathList(paths)
         alignments = PairwiseAlignments(seqA, seqB, score, paths)
         return alignments
 
@@ -1564,6 +1597,169 @@ class PairwiseAligner(_aligners.PairwiseAligner):
             seqB = str(seqB)
         return _aligners.PairwiseAligner.score(self, seqA, seqB)
 
+    def score_end(self, seqA, seqB):
+        """Return the local alignment score and the end of the alignment.
+
+        The end is returned as a tuple (i, j), such that the best local
+        alignment ends with seqA[i-1] and seqB[j-1], or as None if no
+        alignment has a positive score. If several alignments have the best
+        score, the end with the lowest i (and then the lowest j) is returned.
+        This does not need a traceback, and uses the striped algorithm if
+        the striped attribute of the aligner is True. The band_width and
+        xdrop attributes are used as for the align method.
+
+        >>> from Bio import Align
+        >>> aligner = Align.PairwiseAligner(mode="local", mismatch_score=-1)
+        >>> aligner.open_gap_score = -2
+        >>> aligner.extend_gap_score = -1
+        >>> aligner.striped = True
+        >>> aligner.score_end("TTGATTACATT", "CGATTACAG")
+        (7.0, (9, 8))
+        """
+        if isinstance(seqA, Seq):
+            seqA = str(seqA)
+        if isinstance(seqB, Seq):
+            seqB = str(seqB)
+        return _aligners.PairwiseAligner.score_end(self, seqA, seqB)
+
+    def encode(self, sequence):
+        """Return a sequence as an array of the indices used by the aligner.
+
+        The letters (or other objects) of the sequence are converted to their
+        indices in the alphabet of the aligner, as done on each call of the
+        score and align methods.  The array can be used in place of the
+        sequence by these methods, to convert each sequence only once when
+        it is aligned many times, as long as the alphabet (or substitution
+        matrix) of the aligner is not changed.
+
+        >>> from Bio import Align
+        >>> aligner = Align.PairwiseAligner(alphabet="ACGT")
+        >>> print(aligner.encode("GATTACA").tolist())
+        [2, 0, 3, 3, 0, 1, 0]
+        """
+        return numpy.frombuffer(self._encode(sequence), numpy.intc)
+
+    def _encode(self, sequence):
+        """Return the indices of a sequence as bytes (PRIVATE)."""
+        if isinstance(sequence, Seq):
+            sequence = str(sequence)
+        return _aligners.PairwiseAligner.encode(self, sequence)
+
+    def _is_symmetric(self):
+        """Check if the score is the same for both orders of the sequences (PRIVATE)."""
+        for name in (
+            "internal_open_gap_score",
+            "internal_extend_gap_score",
+            "left_open_gap_score",
+            "left_extend_gap_score",
+            "right_open_gap_score",
+            "right_extend_gap_score",
+        ):
+            try:
+                if getattr(self, "target_" + name) != getattr(self, "query_" + name):
+                    return False
+            except ValueError:
+                # using a gap score function
+                return False
+        matrix = self.substitution_matrix
+        if matrix is not None and not numpy.array_equal(
+            matrix, numpy.transpose(matrix)
+        ):
+            return False
+        if self.band_width is not None and self.band_diagonal != 0:
+            # the band is on the opposite diagonal for the other order
+            return False
+        return True
+
+    def _score_pairs(self, seqsA, seqsB, workers):
+        """Return the scores of pairs of encoded sequences as an array (PRIVATE)."""
+        seqsA = tuple(seqsA)
+        seqsB = tuple(seqsB)
+        scores = numpy.empty(len(seqsA))
+        if workers is None:
+            workers = os.cpu_count() or 1
+        elif workers < 1:
+            raise ValueError("workers must be at least 1, or None, not %r" % workers)
+        if workers == 1:
+            self.score_encoded(seqsA, seqsB, scores)
+            return scores
+        # The dynamic programming runs without the GIL; use a few chunks
+        # per thread to balance the work
+        size = max(1, -(-len(scores) // (4 * workers)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(
+                    self.score_encoded,
+                    seqsA[start : start + size],
+                    seqsB[start : start + size],
+                    scores[start : start + size],
+                )
+                for start in range(0, len(scores), size)
+            ]
+            for future in futures:
+                future.result()
+        return scores
+
+    def score_many(self, query, targets, workers=1):
+        """Return the alignment scores of one sequence to many others.
+
+        Arguments:
+         - query - the sequence to align to each target.
+         - targets - a list (or other iterable) of sequences.
+         - workers - number of threads to split the work between. The
+           default (1) does all the work in the calling thread, while None
+           uses one thread per CPU.
+
+        Returns a NumPy array with the score of the alignment of each target
+        to the query, as given by score(target, query).  Each sequence is
+        converted to the indices of the aligner only once (see the encode
+        method), which saves most of the time for short sequences.
+
+        >>> from Bio import Align
+        >>> aligner = Align.PairwiseAligner(mismatch_score=-1, gap_score=-2)
+        >>> print(aligner.score_many("GAACT", ["GAACT", "GAT", "GACT"]).tolist())
+        [5.0, -1.0, 2.0]
+        """
+        query = self._encode(query)
+        targets = [self._encode(target) for target in targets]
+        return self._score_pairs(targets, [query] * len(targets), workers)
+
+    def score_matrix(self, sequences, workers=1):
+        """Return the alignment scores between all pairs of sequences.
+
+        Arguments:
+         - sequences - a list (or other iterable) of sequences.
+         - workers - number of threads to split the work between. The
+           default (1) does all the work in the calling thread, while None
+           uses one thread per CPU.
+
+        Returns a square NumPy array with score(sequences[i], sequences[j])
+        at [i, j].  Each sequence is converted to the indices of the aligner
+        only once (see the encode method).  If the gap scores for the target
+        and query are the same, and any substitution matrix is symmetric,
+        each score is calculated only once for each pair.
+
+        >>> from Bio import Align
+        >>> aligner = Align.PairwiseAligner(mismatch_score=-1, gap_score=-2)
+        >>> print(aligner.score_matrix(["GAACT", "GAT", "GACT"]).tolist())
+        [[5.0, -1.0, 2.0], [-1.0, 3.0, 1.0], [2.0, 1.0, 4.0]]
+        """
+        sequences = [self._encode(sequence) for sequence in sequences]
+        n = len(sequences)
+        symmetric = self._is_symmetric()
+        if symmetric:
+            rows, columns = numpy.triu_indices(n)
+        else:
+            rows, columns = numpy.indices((n, n)).reshape(2, -1)
+        scores = self._score_pairs(
+            [sequences[i] for i in rows], [sequences[j] for j in columns], workers
+        )
+        matrix = numpy.zeros((n, n))
+        matrix[rows, columns] = scores
+        if symmetric:
+            matrix[columns, rows] = scores
+        return matrix
+
 
 if __name__ == "__main__":
     from Bio._utils import run_doctest
@@ -10,6 +10,7 @@
 #define PY_SSIZE_T_CLEAN
 #include "Python.h"
 #include "float.h"
+#include <stdint.h>
 
 
 #define HORIZONTAL 0x1
@@ -1699,6 +1700,11 @@ typedef struct {
     Py_buffer substitution_matrix;
     PyObject* alphabet;
     signed char mapping[128];
+    Py_ssize_t band_width;      /* negative if the alignment is not banded */
+    Py_ssize_t band_diagonal;
+    double xdrop;               /* negative if X-drop is not used */
+    int linear_memory;
+    int striped;
 } Aligner;
 
 
@@ -1838,6 +1844,11 @@ Aligner_init(Aligner *self, PyObject *args, PyObject *kwds)
     self->substitution_matrix.obj = NULL;
     self->substitution_matrix.buf = NULL;
     self->algorithm = Unknown;
+    self->band_width = -1;
+    self->band_diagonal = 0;
+    self->xdrop = -1.0;
+    self->linear_memory = 0;
+    self->striped = 0;
     for (i = 0; i < 128; i++) self->mapping[i] = MISSING_LETTER;
     i = (int)'A';
     for (j = 0; j < n; i++, j++) self->mapping[i] = j;
@@ -1867,78 +1878,88 @@ Aligner_repr(Aligner* self)
   return PyUnicode_FromString(text);
 }
 
+/* Append formatted text at *p, never writing at or beyond end.  If the text
+ * does not fit, it is truncated and *p is left at the terminating null. */
+static void
+_append_text(char** p, const char* end, const char* format, ...)
+{
+    int n;
+    size_t size = end - *p;
+    va_list args;
+    va_start(args, format);
+    n = PyOS_vsnprintf(*p, size, format, args);
+    va_end(args);
+    if (n < 0) **p = '\0';
+    else if ((size_t)n >= size) *p += size - 1;
+    else *p += n;
+}
+
 static PyObject*
 Aligner_str(Aligner* self)
 {
-    int n;
     char text[1024];
     char* p = text;
+    const char* end = text + sizeof(text);
     PyObject* substitution_matrix = self->substitution_matrix.obj;
-    n = sprintf(text, "Pairwise sequence aligner with parameters\n");
-    p += n;
+    _append_text(&p, end, "Pairwise sequence aligner with parameters\n");
     if (substitution_matrix) {
-        n = sprintf(p, "  substitution_matrix: <%s object at %p>\n",
-                       Py_TYPE(substitution_matrix)->tp_name, substitution_matrix);
-        p += n;
+        _append_text(&p, end, "  substitution_matrix: <%s object at %p>\n",
+                     Py_TYPE(substitution_matrix)->tp_name, substitution_matrix);
     } else {
-        n = sprintf(p, "  match_score: %f\n", self->match);
-        p += n;
-        n = sprintf(p, "  mismatch_score: %f\n", self->mismatch);
-        p += n;
+        _append_text(&p, end, "  match_score: %f\n", self->match);
+        _append_text(&p, end, "  mismatch_score: %f\n", self->mismatch);
     }
     if (self->target_gap_function) {
-        n = sprintf(p, "  target_gap_function: %%R\n");
-        p += n;
+        _append_text(&p, end, "  target_gap_function: %%R\n");
     }
     else {
-        n = sprintf(p, "  target_internal_open_gap_score: %f\n",
-                       self->target_internal_open_gap_score);
-        p += n;
-        n = sprintf(p, "  target_internal_extend_gap_score: %f\n",
-                       self->target_internal_extend_gap_score);
-        p += n;
-        n = sprintf(p, "  target_left_open_gap_score: %f\n",
-                       self->target_left_open_gap_score);
-        p += n;
-        n = sprintf(p, "  target_left_extend_gap_score: %f\n",
-                       self->target_left_extend_gap_score);
-        p += n;
-        n = sprintf(p, "  target_right_open_gap_score: %f\n",
-                       self->target_right_open_gap_score);
-        p += n;
-        n = sprintf(p, "  target_right_extend_gap_score: %f\n",
-                       self->target_right_extend_gap_score);
-        p += n;
+        _append_text(&p, end, "  target_internal_open_gap_score: %f\n",
+                     self->target_internal_open_gap_score);
+        _append_text(&p, end, "  target_internal_extend_gap_score: %f\n",
+                     self->target_internal_extend_gap_score);
+        _append_text(&p, end, "  target_left_open_gap_score: %f\n",
+                     self->target_left_open_gap_score);
+        _append_text(&p, end, "  target_left_extend_gap_score: %f\n",
+                     self->target_left_extend_gap_score);
+        _append_text(&p, end, "  target_right_open_gap_score: %f\n",
+                     self->target_right_open_gap_score);
+        _append_text(&p, end, "  target_right_extend_gap_score: %f\n",
+                     self->target_right_extend_gap_score);
     }
     if (self->query_gap_function) {
-        n = sprintf(p, "  query_gap_function: %%R\n");
-        p += n;
+        _append_text(&p, end, "  query_gap_function: %%R\n");
     }
     else {
-        n = sprintf(p, "  query_internal_open_gap_score: %f\n",
-                       self->query_internal_open_gap_score);
-        p += n;
-        n = sprintf(p, "  query_internal_extend_gap_score: %f\n",
-                       self->query_internal_extend_gap_score);
-        p += n;
-        n = sprintf(p, "  query_left_open_gap_score: %f\n",
-                       self->query_left_open_gap_score);
-        p += n;
-        n = sprintf(p, "  query_left_extend_gap_score: %f\n",
-                       self->query_left_extend_gap_score);
-        p += n;
-        n = sprintf(p, "  query_right_open_gap_score: %f\n",
-                       self->query_right_open_gap_score);
-        p += n;
-        n = sprintf(p, "  query_right_extend_gap_score: %f\n",
-                       self->query_right_extend_gap_score);
-        p += n;
+        _append_text(&p, end, "  query_internal_open_gap_score: %f\n",
+                     self->query_internal_open_gap_score);
+        _append_text(&p, end, "  query_internal_extend_gap_score: %f\n",
+                     self->query_internal_extend_gap_score);
+        _append_text(&p, end, "  query_left_open_gap_score: %f\n",
+                     self->query_left_open_gap_score);
+        _append_text(&p, end, "  query_left_extend_gap_score: %f\n",
+                     self->query_left_extend_gap_score);
+        _append_text(&p, end, "  query_right_open_gap_score: %f\n",
+                     self->query_right_open_gap_score);
+        _append_text(&p, end, "  query_right_extend_gap_score: %f\n",
+                     self->query_right_extend_gap_score);
     }
     switch (self->mode) {
-        case Global: n = sprintf(p, "  mode: global\n"); break;
-        case Local: n = sprintf(p, "  mode: local\n"); break;
+        case Global: _append_text(&p, end, "  mode: global\n"); break;
+        case Local: _append_text(&p, end, "  mode: local\n"); break;
+    }
+    if (self->band_width >= 0) {
+        _append_text(&p, end, "  band_width: %zd\n", self->band_width);
+        _append_text(&p, end, "  band_diagonal: %zd\n", self->band_diagonal);
+    }
+    if (self->xdrop >= 0) {
+        _append_text(&p, end, "  xdrop: %g\n", self->xdrop);
+    }
+    if (self->linear_memory) {
+        _append_text(&p, end, "  linear_memory: True\n");
+    }
+    if (self->striped) {
+        _append_text(&p, end, "  striped: True\n");
     }
-    p += n;
     if (self->target_gap_function || self->query_gap_function)
         return PyUnicode_FromFormat(text, self->target_gap_function, self->query_gap_function);
     else if (self->target_gap_function)
@@ -3701,6 +3722,111 @@ Aligner_set_epsilon(Aligner* self, PyObject* value, void* closure)
     return 0;
 }
 
+static char Aligner_band_width__doc__[] = "maximum distance of the alignment from the band diagonal (None if the alignment is not banded)";
+
+static PyObject*
+Aligner_get_band_width(Aligner* self, void* closure)
+{
+    if (self->band_width < 0) {
+        Py_INCREF(Py_None);
+        return Py_None;
+    }
+    return PyLong_FromSsize_t(self->band_width);
+}
+
+static int
+Aligner_set_band_width(Aligner* self, PyObject* value, void* closure)
+{
+    Py_ssize_t band_width;
+    if (value == NULL || value == Py_None) {
+        self->band_width = -1;
+        return 0;
+    }
+    band_width = PyLong_AsSsize_t(value);
+    if (band_width == -1 && PyErr_Occurred()) return -1;
+    if (band_width < 0) {
+        PyErr_SetString(PyExc_ValueError, "band width should be non-negative");
+        return -1;
+    }
+    self->band_width = band_width;
+    return 0;
+}
+
+static char Aligner_band_diagonal__doc__[] = "diagonal (query position minus target position) at the center of the band";
+
+static PyObject*
+Aligner_get_band_diagonal(Aligner* self, void* closure)
+{   return PyLong_FromSsize_t(self->band_diagonal);
+}
+
+static int
+Aligner_set_band_diagonal(Aligner* self, PyObject* value, void* closure)
+{   const Py_ssize_t band_diagonal = PyLong_AsSsize_t(value);
+    if (band_diagonal == -1 && PyErr_Occurred()) return -1;
+    self->band_diagonal = band_diagonal;
+    return 0;
+}
+
+static char Aligner_xdrop__doc__[] = "X-drop threshold for local alignments extending from the start of both sequences (None if X-drop is not used)";
+
+static PyObject*
+Aligner_get_xdrop(Aligner* self, void* closure)
+{
+    if (self->xdrop < 0) {
+        Py_INCREF(Py_None);
+        return Py_None;
+    }
+    return PyFloat_FromDouble(self->xdrop);
+}
+
+static int
+Aligner_set_xdrop(Aligner* self, PyObject* value, void* closure)
+{
+    double xdrop;
+    if (value == NULL || value == Py_None) {
+        self->xdrop = -1.0;
+        return 0;
+    }
+    xdrop = PyFloat_AsDouble(value);
+    if (PyErr_Occurred()) return -1;
+    if (!(xdrop >= 0)) {
+        PyErr_SetString(PyExc_ValueError, "xdrop should be non-negative");
+        return -1;
+    }
+    self->xdrop = xdrop;
+    return 0;
+}
+
+static char Aligner_linear_memory__doc__[] = "if True, find one optimal global alignment using memory proportional to the sequence lengths (Hirschberg's algorithm)";
+
+static PyObject*
+Aligner_get_linear_memory(Aligner* self, void* closure)
+{   return PyBool_FromLong(self->linear_memory);
+}
+
+static int
+Aligner_set_linear_memory(Aligner* self, PyObject* value, void* closure)
+{   const int linear_memory = PyObject_IsTrue(value);
+    if (linear_memory < 0) return -1;
+    self->linear_memory = linear_memory;
+    return 0;
+}
+
+static char Aligner_striped__doc__[] = "if True, calculate local alignment scores using the striped SIMD algorithm of Farrar, if possible";
+
+static PyObject*
+Aligner_get_striped(Aligner* self, void* closure)
+{   return PyBool_FromLong(self->striped);
+}
+
+static int
+Aligner_set_striped(Aligner* self, PyObject* value, void* closure)
+{   const int striped = PyObject_IsTrue(value);
+    if (striped < 0) return -1;
+    self->striped = striped;
+    return 0;
+}
+
 static Algorithm _get_algorithm(Aligner* self)
 {
     Algorithm algorithm = self->algorithm;
@@ -3993,6 +4119,26 @@ static PyGetSetDef Aligner_getset[] = {
         (getter)Aligner_get_epsilon,
         (setter)Aligner_set_epsilon,
         Aligner_epsilon__doc__, NULL},
+    {"band_width",
+        (getter)Aligner_get_band_width,
+        (setter)Aligner_set_band_width,
+        Aligner_band_width__doc__, NULL},
+    {"band_diagonal",
+        (getter)Aligner_get_band_diagonal,
+        (setter)Aligner_set_band_diagonal,
+        Aligner_band_diagonal__doc__, NULL},
+    {"xdrop",
+        (getter)Aligner_get_xdrop,
+        (setter)Aligner_set_xdrop,
+        Aligner_xdrop__doc__, NULL},
+    {"linear_memory",
+        (getter)Aligner_get_linear_memory,
+        (setter)Aligner_set_linear_memory,
+        Aligner_linear_memory__doc__, NULL},
+    {"striped",
+        (getter)Aligner_get_striped,
+        (setter)Aligner_set_striped,
+        Aligner_striped__doc__, NULL},
     {"algorithm",
         (getter)Aligner_get_algorithm,
         (setter)NULL,
@@ -4289,6 +4435,7 @@ static PyGetSetDef Aligner_getset[] = {
     /* Needleman-Wunsch algorithm */ \
     row = PyMem_Malloc((nB+1)*sizeof(double)); \
     if (!row) return PyErr_NoMemory(); \
+    Py_BEGIN_ALLOW_THREADS \
 \
     /* The top row of the score matrix is a special case, \
      * as there are no previously aligned characters. \
@@ -4329,6 +4476,7 @@ static PyGetSetDef Aligner_getset[] = {
     SELECT_SCORE_GLOBAL(temp + (align_score), \
                         row[nB] + right_gap_extend_B, \
                         row[nB-1] + right_gap_extend_A); \
+    Py_END_ALLOW_THREADS \
     PyMem_Free(row); \
     return PyFloat_FromDouble(score);
 
@@ -4348,6 +4496,7 @@ static PyGetSetDef Aligner_getset[] = {
     /* Smith-Waterman algorithm */ \
     row = PyMem_Malloc((nB+1)*sizeof(double)); \
     if (!row) return PyErr_NoMemory(); \
+    Py_BEGIN_ALLOW_THREADS \
 \
     /* The top row of the score matrix is a special case, \
      * as there are no previously aligned characters. \
@@ -4380,6 +4529,7 @@ static PyGetSetDef Aligner_getset[] = {
     } \
     kB = sB[nB-1]; \
     SELECT_SCORE_LOCAL1(temp + (align_score)); \
+    Py_END_ALLOW_THREADS \
     PyMem_Free(row); \
     return PyFloat_FromDouble(maximum);
 
@@ -4412,6 +4562,7 @@ static PyGetSetDef Aligner_getset[] = {
         return PyErr_NoMemory(); \
     } \
     M = paths->M; \
+    Py_BEGIN_ALLOW_THREADS \
     row[0] = 0; \
     for (j = 1; j <= nB; j++) row[j] = j * left_gap_extend_A; \
     for (i = 1; i < nA; i++) { \
@@ -4434,6 +4585,7 @@ static PyGetSetDef Aligner_getset[] = {
     } \
     kB = sB[j-1]; \
     SELECT_TRACE_NEEDLEMAN_WUNSCH(right_gap_extend_A, right_gap_extend_B, align_score); \
+    Py_END_ALLOW_THREADS \
     PyMem_Free(row); \
     M[nA][nB].path = 0; \
     return Py_BuildValue("fN", score, paths);
@@ -4466,6 +4618,7 @@ static PyGetSetDef Aligner_getset[] = {
         return PyErr_NoMemory(); \
     } \
     M = paths->M; \
+    Py_BEGIN_ALLOW_THREADS \
     for (j = 0; j <= nB; j++) row[j] = 0; \
     for (i = 1; i < nA; i++) { \
         temp = 0; \
@@ -4485,7 +4638,6 @@ static PyGetSetDef Aligner_getset[] = {
     } \
     kB = sB[nB-1]; \
     SELECT_TRACE_SMITH_WATERMAN_D(align_score); \
-    PyMem_Free(row); \
 \
     /* As we don't allow zero-score extensions to alignments, \
      * we need to remove all traces towards an ENDPOINT. \
@@ -4518,6 +4670,8 @@ static PyGetSetDef Aligner_getset[] = {
             M[i][j].trace = trace; \
         } \
     } \
+    Py_END_ALLOW_THREADS \
+    PyMem_Free(row); \
     if (maximum == 0) M[0][0].path = NONE; \
     else M[0][0].path = 0; \
     return Py_BuildValue("fN", maximum, paths);
@@ -4556,6 +4710,7 @@ static PyGetSetDef Aligner_getset[] = {
     if (!Ix_row) goto exit; \
     Iy_row = PyMem_Malloc((nB+1)*sizeof(double)); \
     if (!Iy_row) goto exit; \
+    Py_BEGIN_ALLOW_THREADS \
 \
     /* The top row of the score matrix is a special case, \
      * as there are no previously aligned characters. \
@@ -4655,6 +4810,7 @@ static PyGetSetDef Aligner_getset[] = {
     Iy_row[nB] = score; \
 \
     SELECT_SCORE_GLOBAL(M_row[nB], Ix_row[nB], Iy_row[nB]); \
+    Py_END_ALLOW_THREADS \
     PyMem_Free(M_row); \
     PyMem_Free(Ix_row); \
     PyMem_Free(Iy_row); \
@@ -4693,6 +4849,7 @@ exit: \
     if (!Ix_row) goto exit; \
     Iy_row = PyMem_Malloc((nB+1)*sizeof(double)); \
     if (!Iy_row) goto exit; \
+    Py_BEGIN_ALLOW_THREADS \
  \
     /* The top row of the score matrix is a special case, \
      * as there are no previously aligned characters. \
@@ -4767,6 +4924,7 @@ exit: \
                                    Ix_temp, \
                                    Iy_temp, \
                                    (align_score)); \
+    Py_END_ALLOW_THREADS \
     PyMem_Free(M_row); \
     PyMem_Free(Ix_row); \
     PyMem_Free(Iy_row); \
@@ -4820,6 +4978,7 @@ exit: \
     if (!Iy_row) goto exit; \
     M = paths->M; \
     gaps = paths->gaps.gotoh; \
+    Py_BEGIN_ALLOW_THREADS \
  \
     /* Gotoh algorithm with three states */ \
     M_row[0] = 0; \
@@ -4919,6 +5078,10 @@ exit: \
     if (M_row[nB] < score - epsilon) M[nA][nB].trace = 0; \
     if (Ix_row[nB] < score - epsilon) gaps[nA][nB].Ix = 0; \
     if (Iy_row[nB] < score - epsilon) gaps[nA][nB].Iy = 0; \
+    Py_END_ALLOW_THREADS \
+    PyMem_Free(M_row); \
+    PyMem_Free(Ix_row); \
+    PyMem_Free(Iy_row); \
     return Py_BuildValue("fN", score, paths); \
 exit: \
     Py_DECREF(paths); \
@@ -4965,6 +5128,7 @@ exit: \
     if (!Ix_row) goto exit; \
     Iy_row = PyMem_Malloc((nB+1)*sizeof(double)); \
     if (!Iy_row) goto exit; \
+    Py_BEGIN_ALLOW_THREADS \
     M_row[0] = 0; \
     Ix_row[0] = -DBL_MAX; \
     Iy_row[0] = -DBL_MAX; \
@@ -5036,10 +5200,6 @@ exit: \
     SELECT_TRACE_GOTOH_LOCAL_ALIGN(align_score) \
     gaps[nA][nB].Ix = 0; \
     gaps[nA][nB].Iy = 0; \
-\
-    PyMem_Free(M_row); \
-    PyMem_Free(Ix_row); \
-    PyMem_Free(Iy_row); \
 \
     /* As we don't allow zero-score extensions to alignments, \
      * we need to remove all traces towards an ENDPOINT. \
@@ -5102,6 +5262,11 @@ exit: \
             gaps[i][j].Iy = trace; \
         } \
     } \
+\
+    Py_END_ALLOW_THREADS \
+    PyMem_Free(M_row); \
+    PyMem_Free(Ix_row); \
+    PyMem_Free(Iy_row); \
 \
     /* traceback */ \
     if (maximum == 0) M[0][0].path = DONE; \
@@ -6449,35 +6614,1311 @@ sequence_converter(PyObject* argument, void* pointer)
     return Py_CLEANUP_SUPPORTED;
 }
  
-static const char Aligner_score__doc__[] = "calculates the alignment score";
+/* Banded and X-drop alignments.
+ *
+ * These use the recurrences of the Gotoh algorithm for three states (M, Ix,
+ * Iy), of which the Needleman-Wunsch and Smith-Waterman algorithms are the
+ * special case with equal open and extend gap scores. Only the cells in the
+ * band, or still within X of the best score for X-drop, are calculated, using
+ * two rows of scores and one byte of traceback per calculated cell.
+ */
+
+#define BANDED_M 0
+#define BANDED_IX 1
+#define BANDED_IY 2
+#define BANDED_START 3
+
+typedef struct {
+    unsigned char* cells;   /* traceback byte for each calculated cell */
+    Py_ssize_t* offsets;    /* index in cells of column 0 of each row */
+    Py_ssize_t size;
+    Py_ssize_t allocated;
+} BandedTrace;
+
+typedef struct {
+    double score;
+    Py_ssize_t i;           /* end point of the alignment */
+    Py_ssize_t j;
+    int state;
+} BandedEnd;
+
+static int
+_check_banded(Aligner* self, Mode mode, Py_ssize_t nA, Py_ssize_t nB)
+{
+    const Py_ssize_t w = self->band_width;
+    const Py_ssize_t d = self->band_diagonal;
+    if (self->target_gap_function || self->query_gap_function) {
+        PyErr_SetString(PyExc_ValueError,
+                        "banded and X-drop alignments are not available "
+                        "for gap score functions");
+        return 0;
+    }
+    if (self->xdrop >= 0) {
+        if (mode != Local) {
+            PyErr_SetString(PyExc_ValueError,
+                            "X-drop alignments require local mode");
+            return 0;
+        }
+        if (w >= 0 && (d - w > 0 || d + w < 0)) {
+            PyErr_SetString(PyExc_ValueError,
+                            "the band does not include the start of both "
+                            "sequences");
+            return 0;
+        }
+    }
+    else if (w >= 0 && mode == Global) {
+        if (d - w > 0 || d + w < 0) {
+            PyErr_SetString(PyExc_ValueError,
+                            "the band does not include the start of both "
+                            "sequences");
+            return 0;
+        }
+        if (nB - nA < d - w || nB - nA > d + w) {
+            PyErr_SetString(PyExc_ValueError,
+                            "the band does not include the end of both "
+                            "sequences");
+            return 0;
+        }
+    }
+    return 1;
+}
+
+static int
+_banded_dynamic_programming(Aligner* self, Mode mode,
+                            const int* sA, Py_ssize_t nA,
+                            const int* sB, Py_ssize_t nB,
+                            BandedTrace* trace, BandedEnd* end)
+{
+    /* Calculates the score and end point of the best banded or X-drop
+     * alignment, and its traceback if trace is not NULL. Returns 0 if memory
+     * allocation failed, without setting an exception; the caller should hold
+     * the GIL and a reference to the substitution matrix, if any. */
+    Py_ssize_t i;
+    Py_ssize_t j;
+    Py_ssize_t lo;
+    Py_ssize_t hi;
+    Py_ssize_t blo;
+    Py_ssize_t bhi;
+    Py_ssize_t plo = 0;         /* cells of the previous row to extend */
+    Py_ssize_t phi = -1;
+    Py_ssize_t slo = 0;         /* calculated cells in the current buffers */
+    Py_ssize_t shi = -1;
+    Py_ssize_t qlo = 0;         /* calculated cells in the previous buffers */
+    Py_ssize_t qhi = -1;
+    Py_ssize_t live_lo;
+    Py_ssize_t live_hi;
+    int kA;
+    int kB;
+    int trM;
+    int trIx;
+    int trIy;
+    double m;
+    double ix;
+    double iy;
+    double t;
+    double s;
+    double best = 0;
+    double* buffer;
+    double* pM;
+    double* pIx;
+    double* pIy;
+    double* cM;
+    double* cIx;
+    double* cIy;
+    double* temp;
+    int ok = 1;
+    const int extension = (self->xdrop >= 0);
+    const double xdrop = self->xdrop;
+    const Py_ssize_t w = self->band_width;
+    const Py_ssize_t d = self->band_diagonal;
+    const double match = self->match;
+    const double mismatch = self->mismatch;
+    const double* scores = self->substitution_matrix.obj ? self->substitution_matrix.buf : NULL;
+    const Py_ssize_t n = scores ? self->substitution_matrix.shape[0] : 0;
+    const double target_open = self->target_internal_open_gap_score;
+    const double target_extend = self->target_internal_extend_gap_score;
+    const double query_open = self->query_internal_open_gap_score;
+    const double query_extend = self->query_internal_extend_gap_score;
+    const int global = (mode == Global);
+    const double target_left_open = global ? self->target_left_open_gap_score : target_open;
+    const double target_left_extend = global ? self->target_left_extend_gap_score : target_extend;
+    const double target_right_open = global ? self->target_right_open_gap_score : target_open;
+    const double target_right_extend = global ? self->target_right_extend_gap_score : target_extend;
+    const double query_left_open = global ? self->query_left_open_gap_score : query_open;
+    const double query_left_extend = global ? self->query_left_extend_gap_score : query_extend;
+    const double query_right_open = global ? self->query_right_open_gap_score : query_open;
+    const double query_right_extend = global ? self->query_right_extend_gap_score : query_extend;
+
+    buffer = PyMem_Malloc(6*(nB+1)*sizeof(double));
+    if (!buffer) return 0;
+    if (trace) {
+        trace->offsets = PyMem_RawMalloc((nA+1)*sizeof(Py_ssize_t));
+        if (!trace->offsets) {
+            PyMem_Free(buffer);
+            return 0;
+        }
+        trace->size = 0;
+        trace->allocated = nB + 1;
+        trace->cells = PyMem_RawMalloc(trace->allocated);
+        if (!trace->cells) {
+            PyMem_RawFree(trace->offsets);
+            trace->offsets = NULL;
+            PyMem_Free(buffer);
+            return 0;
+        }
+    }
+    end->score = 0;
+    end->i = 0;
+    end->j = 0;
+    end->state = BANDED_M;
+
+    Py_BEGIN_ALLOW_THREADS
+    for (j = 0; j < 6*(nB+1); j++) buffer[j] = -DBL_MAX;
+    pM = buffer;
+    pIx = pM + nB + 1;
+    pIy = pIx + nB + 1;
+    cM = pIy + nB + 1;
+    cIx = cM + nB + 1;
+    cIy = cIx + nB + 1;
+    for (i = 0; i <= nA; i++) {
+        if (w >= 0) {
+            blo = i + d - w;
+            bhi = i + d + w;
+            if (blo < 0) blo = 0;
+            if (bhi > nB) bhi = nB;
+        }
+        else {
+            blo = 0;
+            bhi = nB;
+        }
+        lo = blo;
+        if (extension && i > 0 && plo > lo) lo = plo;
+        /* clear the scores of row i-2 */
+        for (j = slo; j <= shi; j++) cM[j] = cIx[j] = cIy[j] = -DBL_MAX;
+        if (trace) {
+            if (trace->size + bhi - lo + 1 > trace->allocated) {
+                unsigned char* cells;
+                Py_ssize_t allocated = 2 * trace->allocated;
+                if (allocated < trace->size + bhi - lo + 1)
+                    allocated = trace->size + bhi - lo + 1;
+                cells = PyMem_RawRealloc(trace->cells, allocated);
+                if (!cells) {
+                    ok = 0;
+                    break;
+                }
+                trace->cells = cells;
+                trace->allocated = allocated;
+            }
+            trace->offsets[i] = trace->size - lo;
+        }
+        live_lo = nB + 1;
+        live_hi = -1;
+        for (j = lo; j <= bhi; j++) {
+            /* M: aligned letters, from (i-1, j-1) */
+            if (i > 0 && j > 0) {
+                kA = sA[i-1];
+                kB = sB[j-1];
+                if (scores) s = scores[kA*n+kB];
+                else s = (kA < 0 || kB < 0) ? 0 : (kA == kB) ? match : mismatch;
+                m = pM[j-1];
+                trM = BANDED_M;
+                t = pIx[j-1];
+                if (t > m) {
+                    m = t;
+                    trM = BANDED_IX;
+                }
+                t = pIy[j-1];
+                if (t > m) {
+                    m = t;
+                    trM = BANDED_IY;
+                }
+                if (mode == Local && !extension && m <= 0) {
+                    m = 0;
+                    trM = BANDED_START;
+                }
+                m += s;
+            }
+            else if (i == 0 && j == 0 && (global || extension)) {
+                m = 0;
+                trM = BANDED_START;
+            }
+            else {
+                m = -DBL_MAX;
+                trM = BANDED_START;
+            }
+            /* Ix: gap in the query, from (i-1, j) */
+            if (i > 0) {
+                const double open = (j == 0) ? query_left_open : (j == nB) ? query_right_open : query_open;
+                const double extend = (j == 0) ? query_left_extend : (j == nB) ? query_right_extend : query_extend;
+                ix = pM[j] + open;
+                trIx = BANDED_M;
+                t = pIx[j] + extend;
+                if (t > ix) {
+                    ix = t;
+                    trIx = BANDED_IX;
+                }
+                t = pIy[j] + open;
+                if (t > ix) {
+                    ix = t;
+                    trIx = BANDED_IY;
+                }
+            }
+            else {
+                ix = -DBL_MAX;
+                trIx = BANDED_M;
+            }
+            /* Iy: gap in the target, from (i, j-1) */
+            if (j > 0) {
+                const double open = (i == 0) ? target_left_open : (i == nA) ? target_right_open : target_open;
+                const double extend = (i == 0) ? target_left_extend : (i == nA) ? target_right_extend : target_extend;
+                iy = cM[j-1] + open;
+                trIy = BANDED_M;
+                t = cIx[j-1] + open;
+                if (t > iy) {
+                    iy = t;
+                    trIy = BANDED_IX;
+                }
+                t = cIy[j-1] + extend;
+                if (t > iy) {
+                    iy = t;
+                    trIy = BANDED_IY;
+                }
+            }
+            else {
+                iy = -DBL_MAX;
+                trIy = BANDED_M;
+            }
+            if (mode == Local && m > best) {
+                best = m;
+                end->score = m;
+                end->i = i;
+                end->j = j;
+            }
+            if (extension) {
+                t = m;
+                if (ix > t) t = ix;
+                if (iy > t) t = iy;
+                if (t < best - xdrop) {
+                    m = ix = iy = -DBL_MAX;
+                    /* only a gap in the target can reach beyond the cells
+                     * extended from the previous row */
+                    if (j > phi) {
+                        cM[j] = cIx[j] = cIy[j] = m;
+                        if (trace) trace->cells[trace->offsets[i]+j] = BANDED_START;
+                        j++;
+                        break;
+                    }
+                }
+                else {
+                    if (j < live_lo) live_lo = j;
+                    live_hi = j;
+                }
+            }
+            cM[j] = m;
+            cIx[j] = ix;
+            cIy[j] = iy;
+            if (trace) trace->cells[trace->offsets[i]+j] = trM | (trIx << 2) | (trIy << 4);
+        }
+        hi = j - 1;
+        if (trace) trace->size += hi - lo + 1;
+        /* the buffers of the current row become those of the previous row */
+        temp = pM; pM = cM; cM = temp;
+        temp = pIx; pIx = cIx; cIx = temp;
+        temp = pIy; pIy = cIy; cIy = temp;
+        slo = qlo;
+        shi = qhi;
+        qlo = lo;
+        qhi = hi;
+        if (extension) {
+            if (live_hi < 0) break;
+            plo = live_lo;
+            phi = live_hi;
+        }
+        else {
+            plo = lo;
+            phi = hi;
+        }
+    }
+    if (ok && global) {
+        /* the scores of row nA are in the previous buffers */
+        end->i = nA;
+        end->j = nB;
+        end->state = BANDED_M;
+        end->score = pM[nB];
+        if (pIx[nB] > end->score) {
+            end->score = pIx[nB];
+            end->state = BANDED_IX;
+        }
+        if (pIy[nB] > end->score) {
+            end->score = pIy[nB];
+            end->state = BANDED_IY;
+        }
+    }
+    Py_END_ALLOW_THREADS
+
+    PyMem_Free(buffer);
+    if (!ok) {
+        PyMem_RawFree(trace->offsets);
+        PyMem_RawFree(trace->cells);
+        trace->offsets = NULL;
+        trace->cells = NULL;
+    }
+    return ok;
+}
 
 static PyObject*
-Aligner_score(Aligner* self, PyObject* args, PyObject* keywords)
+_banded_path(const BandedTrace* trace, const BandedEnd* end)
+{
+    /* Returns the path of the alignment ending at end, as a tuple of the
+     * coordinates of the points where its direction changes. */
+    Py_ssize_t i = end->i;
+    Py_ssize_t j = end->j;
+    Py_ssize_t k;
+    Py_ssize_t n = 0;
+    Py_ssize_t* points;
+    int state = end->state;
+    int direction = 0;
+    int step;
+    unsigned char cell;
+    PyObject* path;
+    PyObject* point;
+
+    points = PyMem_Malloc(2*(i+j+2)*sizeof(Py_ssize_t));
+    if (!points) return PyErr_NoMemory();
+    points[n++] = i;
+    points[n++] = j;
+    while (1) {
+        cell = trace->cells[trace->offsets[i]+j];
+        switch (state) {
+            case BANDED_M:
+                state = cell & 3;
+                step = DIAGONAL;
+                break;
+            case BANDED_IX:
+                state = (cell >> 2) & 3;
+                step = VERTICAL;
+                break;
+            case BANDED_IY:
+            default:
+                state = (cell >> 4) & 3;
+                step = HORIZONTAL;
+                break;
+        }
+        /* the start of a global or X-drop alignment */
+        if (state == BANDED_START && i == 0 && j == 0) break;
+        if (direction && step != direction) {
+            points[n++] = i;
+            points[n++] = j;
+        }
+        direction = step;
+        if (step != HORIZONTAL) i--;
+        if (step != VERTICAL) j--;
+        /* the start of a local alignment, after its first aligned letters */
+        if (state == BANDED_START) break;
+    }
+    points[n++] = i;
+    points[n++] = j;
+    path = PyTuple_New(n/2);
+    if (path) {
+        for (k = 0; k < n/2; k++) {
+            point = Py_BuildValue("(nn)", points[n-2*k-2], points[n-2*k-1]);
+            if (!point) {
+                Py_DECREF(path);
+                path = NULL;
+                break;
+            }
+            PyTuple_SET_ITEM(path, k, point);
+        }
+    }
+    PyMem_Free(points);
+    return path;
+}
+
+static PyObject*
+_banded_score(Aligner* self, Mode mode,
+              const int* sA, Py_ssize_t nA, const int* sB, Py_ssize_t nB)
+{
+    BandedEnd end;
+    if (!_check_banded(self, mode, nA, nB)) return NULL;
+    if (!_banded_dynamic_programming(self, mode, sA, nA, sB, nB, NULL, &end))
+        return PyErr_NoMemory();
+    return PyFloat_FromDouble(end.score);
+}
+
+static PyObject*
+_banded_align(Aligner* self, Mode mode,
+              const int* sA, Py_ssize_t nA, const int* sB, Py_ssize_t nB)
 {
+    BandedEnd end;
+    BandedTrace trace;
+    PyObject* path;
+    PyObject* paths = NULL;
+    if (!_check_banded(self, mode, nA, nB)) return NULL;
+    if (!_banded_dynamic_programming(self, mode, sA, nA, sB, nB, &trace, &end))
+        return PyErr_NoMemory();
+    if (mode == Local && end.score <= 0) {
+        /* no alignment has a positive score */
+        paths = PyList_New(0);
+    }
+    else {
+        path = _banded_path(&trace, &end);
+        if (path) {
+            paths = PyList_New(1);
+            if (paths) PyList_SET_ITEM(paths, 0, path);
+            else Py_DECREF(path);
+        }
+    }
+    PyMem_RawFree(trace.offsets);
+    PyMem_RawFree(trace.cells);
+    if (!paths) return NULL;
+    return Py_BuildValue("dN", end.score, paths);
+}
+
+/* Linear memory global alignments.
+ *
+ * The divide-and-conquer algorithm of Hirschberg, extended to affine gaps by
+ * Myers and Miller, finds one optimal global alignment using memory
+ * proportional to the sequence lengths. The scores of the middle row of a
+ * rectangle of the dynamic programming matrix are calculated from its top
+ * left corner (forward) and from its bottom right corner (backward); the
+ * rectangle is then split in two at the cell and state in which an optimal
+ * path crosses the middle row. Small rectangles are aligned directly using a
+ * traceback matrix. The states are numbered as for banded alignments.
+ */
+
+#define HIRSCHBERG_ANY BANDED_START     /* the alignment can end in any state */
+#define HIRSCHBERG_BLOCK 65536          /* cells of the rectangles aligned directly */
+
+typedef struct {
     const int* sA;
     const int* sB;
     Py_ssize_t nA;
     Py_ssize_t nB;
-    Py_buffer bA = {0};
-    Py_buffer bB = {0};
-    const Mode mode = self->mode;
-    const Algorithm algorithm = _get_algorithm(self);
-    PyObject* result = NULL;
-    PyObject* substitution_matrix = self->substitution_matrix.obj;
+    const double* scores;
+    Py_ssize_t n;
+    double match;
+    double mismatch;
+    double target_open;
+    double target_extend;
+    double target_left_open;
+    double target_left_extend;
+    double target_right_open;
+    double target_right_extend;
+    double query_open;
+    double query_extend;
+    double query_left_open;
+    double query_left_extend;
+    double query_right_open;
+    double query_right_extend;
+    double* buffer;             /* scores of two rows, forward and backward */
+    unsigned char* trace;       /* traceback of a rectangle aligned directly */
+    unsigned char* steps;       /* state of each step of the alignment */
+    Py_ssize_t nsteps;
+} Hirschberg;
+
+/* gap in the target, in row i */
+#define HIRSCHBERG_TARGET_GAP(h, i, kind) \
+    ((i) == 0 ? (h)->target_left_##kind : \
+     (i) == (h)->nA ? (h)->target_right_##kind : (h)->target_##kind)
+
+/* gap in the query, in column j */
+#define HIRSCHBERG_QUERY_GAP(h, j, kind) \
+    ((j) == 0 ? (h)->query_left_##kind : \
+     (j) == (h)->nB ? (h)->query_right_##kind : (h)->query_##kind)
+
+#define HIRSCHBERG_PAIR_SCORE(h, kA, kB) \
+    ((h)->scores ? (h)->scores[(kA)*(h)->n+(kB)] : \
+     ((kA) < 0 || (kB) < 0) ? 0 : ((kA) == (kB)) ? (h)->match : (h)->mismatch)
 
-    static char *kwlist[] = {"sequenceA", "sequenceB", NULL};
+static void
+_hirschberg_forward(const Hirschberg* h,
+                    Py_ssize_t i0, Py_ssize_t j0, int s0,
+                    Py_ssize_t i1, Py_ssize_t j1,
+                    double** M, double** Ix, double** Iy,
+                    unsigned char* trace)
+{
+    /* Calculates the scores of the paths from (i0, j0), starting in state
+     * s0, to each cell of row i1, which are stored in M, Ix, and Iy, indexed
+     * by column minus j0. The traceback is stored if trace is not NULL. */
+    Py_ssize_t i;
+    Py_ssize_t j;
+    Py_ssize_t k;
+    const Py_ssize_t w = j1 - j0 + 1;
+    double* pM = h->buffer;
+    double* pIx = pM + w;
+    double* pIy = pIx + w;
+    double* cM = pIy + w;
+    double* cIx = cM + w;
+    double* cIy = cIx + w;
+    double* temp;
+    double m;
+    double ix;
+    double iy;
+    double t;
+    double open;
+    double extend;
+    int trM = BANDED_START;
+    int trIx = BANDED_START;
+    int trIy = BANDED_START;
+    int kA;
+    int kB;
+
+    for (i = i0; i <= i1; i++) {
+        for (j = j0, k = 0; j <= j1; j++, k++) {
+            if (i == i0 && j == j0) {
+                cM[0] = (s0 == BANDED_M) ? 0 : -DBL_MAX;
+                cIx[0] = (s0 == BANDED_IX) ? 0 : -DBL_MAX;
+                cIy[0] = (s0 == BANDED_IY) ? 0 : -DBL_MAX;
+                if (trace) trace[0] = BANDED_START;
+                continue;
+            }
+            if (i > i0 && j > j0) {
+                kA = h->sA[i-1];
+                kB = h->sB[j-1];
+                m = pM[k-1];
+                trM = BANDED_M;
+                t = pIx[k-1];
+                if (t > m) {
+                    m = t;
+                    trM = BANDED_IX;
+                }
+                t = pIy[k-1];
+                if (t > m) {
+                    m = t;
+                    trM = BANDED_IY;
+                }
+                m += HIRSCHBERG_PAIR_SCORE(h, kA, kB);
+            }
+            else m = -DBL_MAX;
+            if (i > i0) {
+                open = HIRSCHBERG_QUERY_GAP(h, j, open);
+                extend = HIRSCHBERG_QUERY_GAP(h, j, extend);
+                ix = pM[k] + open;
+                trIx = BANDED_M;
+                t = pIx[k] + extend;
+                if (t > ix) {
+                    ix = t;
+                    trIx = BANDED_IX;
+                }
+                t = pIy[k] + open;
+                if (t > ix) {
+                    ix = t;
+                    trIx = BANDED_IY;
+                }
+            }
+            else ix = -DBL_MAX;
+            if (j > j0) {
+                open = HIRSCHBERG_TARGET_GAP(h, i, open);
+                extend = HIRSCHBERG_TARGET_GAP(h, i, extend);
+                iy = cM[k-1] + open;
+                trIy = BANDED_M;
+                t = cIx[k-1] + open;
+                if (t > iy) {
+                    iy = t;
+                    trIy = BANDED_IX;
+                }
+                t = cIy[k-1] + extend;
+                if (t > iy) {
+                    iy = t;
+                    trIy = BANDED_IY;
+                }
+            }
+            else iy = -DBL_MAX;
+            cM[k] = m;
+            cIx[k] = ix;
+            cIy[k] = iy;
+            if (trace) trace[(i-i0)*w+k] = trM | (trIx << 2) | (trIy << 4);
+        }
+        temp = pM; pM = cM; cM = temp;
+        temp = pIx; pIx = cIx; cIx = temp;
+        temp = pIy; pIy = cIy; cIy = temp;
+    }
+    *M = pM;
+    *Ix = pIx;
+    *Iy = pIy;
+}
 
-    bA.obj = (PyObject*)self;
-    bB.obj = (PyObject*)self;
-    if(!PyArg_ParseTupleAndKeywords(args, keywords, "O&O&", kwlist,
-                                    sequence_converter, &bA,
-                                    sequence_converter, &bB))
+static void
+_hirschberg_backward(const Hirschberg* h,
+                     Py_ssize_t i0, Py_ssize_t j0,
+                     Py_ssize_t i1, Py_ssize_t j1, int s1,
+                     double** M, double** Ix, double** Iy)
+{
+    /* Calculates the scores of the paths from each cell of row i0 to
+     * (i1, j1), ending in state s1, given the state of the path in the cell
+     * of row i0, which are stored in M, Ix, and Iy, indexed by column minus
+     * j0. */
+    Py_ssize_t i;
+    Py_ssize_t j;
+    Py_ssize_t k;
+    const Py_ssize_t w = j1 - j0 + 1;
+    double* nM = h->buffer + 6 * (h->nB + 1);
+    double* nIx = nM + w;
+    double* nIy = nIx + w;
+    double* cM = nIy + w;
+    double* cIx = cM + w;
+    double* cIy = cIx + w;
+    double* temp;
+    double diagonal;
+    double vertical_open;
+    double vertical_extend;
+    double horizontal_open;
+    double horizontal_extend;
+    double m;
+    double ix;
+    double iy;
+    int kA;
+    int kB;
+
+    for (i = i1; i >= i0; i--) {
+        for (j = j1, k = w - 1; j >= j0; j--, k--) {
+            if (i == i1 && j == j1) {
+                cM[k] = (s1 == HIRSCHBERG_ANY || s1 == BANDED_M) ? 0 : -DBL_MAX;
+                cIx[k] = (s1 == HIRSCHBERG_ANY || s1 == BANDED_IX) ? 0 : -DBL_MAX;
+                cIy[k] = (s1 == HIRSCHBERG_ANY || s1 == BANDED_IY) ? 0 : -DBL_MAX;
+                continue;
+            }
+            if (i < i1 && j < j1) {
+                kA = h->sA[i];
+                kB = h->sB[j];
+                diagonal = nM[k+1] + HIRSCHBERG_PAIR_SCORE(h, kA, kB);
+            }
+            else diagonal = -DBL_MAX;
+            if (i < i1) {
+                vertical_open = nIx[k] + HIRSCHBERG_QUERY_GAP(h, j, open);
+                vertical_extend = nIx[k] + HIRSCHBERG_QUERY_GAP(h, j, extend);
+            }
+            else vertical_open = vertical_extend = -DBL_MAX;
+            if (j < j1) {
+                horizontal_open = cIy[k+1] + HIRSCHBERG_TARGET_GAP(h, i, open);
+                horizontal_extend = cIy[k+1] + HIRSCHBERG_TARGET_GAP(h, i, extend);
+            }
+            else horizontal_open = horizontal_extend = -DBL_MAX;
+            m = diagonal;
+            if (vertical_open > m) m = vertical_open;
+            if (horizontal_open > m) m = horizontal_open;
+            ix = diagonal;
+            if (vertical_extend > ix) ix = vertical_extend;
+            if (horizontal_open > ix) ix = horizontal_open;
+            iy = diagonal;
+            if (vertical_open > iy) iy = vertical_open;
+            if (horizontal_extend > iy) iy = horizontal_extend;
+            cM[k] = m;
+            cIx[k] = ix;
+            cIy[k] = iy;
+        }
+        temp = nM; nM = cM; cM = temp;
+        temp = nIx; nIx = cIx; cIx = temp;
+        temp = nIy; nIy = cIy; cIy = temp;
+    }
+    *M = nM;
+    *Ix = nIx;
+    *Iy = nIy;
+}
+
+static double
+_hirschberg_block(Hirschberg* h,
+                  Py_ssize_t i0, Py_ssize_t j0, int s0,
+                  Py_ssize_t i1, Py_ssize_t j1, int s1)
+{
+    /* Aligns a small rectangle using a traceback matrix, and appends the
+     * steps of the alignment. */
+    Py_ssize_t i = i1;
+    Py_ssize_t j = j1;
+    Py_ssize_t k;
+    Py_ssize_t start = h->nsteps;
+    Py_ssize_t end;
+    const Py_ssize_t w = j1 - j0 + 1;
+    double* M;
+    double* Ix;
+    double* Iy;
+    double score;
+    int state = s1;
+    unsigned char cell;
+    unsigned char* steps = h->steps;
+
+    _hirschberg_forward(h, i0, j0, s0, i1, j1, &M, &Ix, &Iy, h->trace);
+    if (state == HIRSCHBERG_ANY) {
+        state = BANDED_M;
+        score = M[w-1];
+        if (Ix[w-1] > score) {
+            state = BANDED_IX;
+            score = Ix[w-1];
+        }
+        if (Iy[w-1] > score) {
+            state = BANDED_IY;
+            score = Iy[w-1];
+        }
+    }
+    else if (state == BANDED_M) score = M[w-1];
+    else if (state == BANDED_IX) score = Ix[w-1];
+    else score = Iy[w-1];
+    end = start;
+    while (i > i0 || j > j0) {
+        steps[end++] = state;
+        cell = h->trace[(i-i0)*w+(j-j0)];
+        switch (state) {
+            case BANDED_M:
+                state = cell & 3;
+                i--;
+                j--;
+                break;
+            case BANDED_IX:
+                state = (cell >> 2) & 3;
+                i--;
+                break;
+            case BANDED_IY:
+            default:
+                state = (cell >> 4) & 3;
+                j--;
+                break;
+        }
+    }
+    /* the steps were found from the end of the alignment to its start */
+    for (k = 0; k < (end - start) / 2; k++) {
+        cell = steps[start+k];
+        steps[start+k] = steps[end-1-k];
+        steps[end-1-k] = cell;
+    }
+    h->nsteps = end;
+    return score;
+}
+
+static double
+_hirschberg(Hirschberg* h,
+            Py_ssize_t i0, Py_ssize_t j0, int s0,
+            Py_ssize_t i1, Py_ssize_t j1, int s1)
+{
+    /* Aligns the rectangle from (i0, j0), starting in state s0, to (i1, j1),
+     * ending in state s1, appending the steps of the alignment, and returns
+     * the alignment score. */
+    Py_ssize_t j;
+    Py_ssize_t k;
+    Py_ssize_t jm = j0;
+    const Py_ssize_t im = (i0 + i1) / 2;
+    int sm = BANDED_M;
+    double* fM;
+    double* fIx;
+    double* fIy;
+    double* bM;
+    double* bIx;
+    double* bIy;
+    double score = -DBL_MAX;
+    double t;
+
+    if (i1 - i0 <= 1 || (i1 - i0 + 1) * (j1 - j0 + 1) <= HIRSCHBERG_BLOCK)
+        return _hirschberg_block(h, i0, j0, s0, i1, j1, s1);
+    _hirschberg_forward(h, i0, j0, s0, im, j1, &fM, &fIx, &fIy, NULL);
+    _hirschberg_backward(h, im, j0, i1, j1, s1, &bM, &bIx, &bIy);
+    for (j = j0, k = 0; j <= j1; j++, k++) {
+        t = fM[k] + bM[k];
+        if (t > score) {
+            score = t;
+            jm = j;
+            sm = BANDED_M;
+        }
+        t = fIx[k] + bIx[k];
+        if (t > score) {
+            score = t;
+            jm = j;
+            sm = BANDED_IX;
+        }
+        t = fIy[k] + bIy[k];
+        if (t > score) {
+            score = t;
+            jm = j;
+            sm = BANDED_IY;
+        }
+    }
+    _hirschberg(h, i0, j0, s0, im, jm, sm);
+    _hirschberg(h, im, jm, sm, i1, j1, s1);
+    return score;
+}
+
+static PyObject*
+_hirschberg_align(Aligner* self, Mode mode,
+                  const int* sA, Py_ssize_t nA, const int* sB, Py_ssize_t nB)
+{
+    Hirschberg h;
+    Py_ssize_t k;
+    Py_ssize_t i = 0;
+    Py_ssize_t j = 0;
+    Py_ssize_t n = 1;
+    Py_ssize_t size;
+    int direction;
+    double score;
+    PyObject* path = NULL;
+    PyObject* point;
+    PyObject* result = NULL;
+
+    if (mode != Global) {
+        PyErr_SetString(PyExc_ValueError,
+                        "linear memory alignments require global mode");
+        return NULL;
+    }
+    if (self->target_gap_function || self->query_gap_function) {
+        PyErr_SetString(PyExc_ValueError,
+                        "linear memory alignments are not available "
+                        "for gap score functions");
+        return NULL;
+    }
+    if (self->band_width >= 0 || self->xdrop >= 0) {
+        PyErr_SetString(PyExc_ValueError,
+                        "linear memory alignments cannot be banded "
+                        "or use X-drop");
         return NULL;
+    }
+    h.sA = sA;
+    h.sB = sB;
+    h.nA = nA;
+    h.nB = nB;
+    h.scores = self->substitution_matrix.obj ? self->substitution_matrix.buf : NULL;
+    h.n = h.scores ? self->substitution_matrix.shape[0] : 0;
+    h.match = self->match;
+    h.mismatch = self->mismatch;
+    h.target_open = self->target_internal_open_gap_score;
+    h.target_extend = self->target_internal_extend_gap_score;
+    h.target_left_open = self->target_left_open_gap_score;
+    h.target_left_extend = self->target_left_extend_gap_score;
+    h.target_right_open = self->target_right_open_gap_score;
+    h.target_right_extend = self->target_right_extend_gap_score;
+    h.query_open = self->query_internal_open_gap_score;
+    h.query_extend = self->query_internal_extend_gap_score;
+    h.query_left_open = self->query_left_open_gap_score;
+    h.query_left_extend = self->query_left_extend_gap_score;
+    h.query_right_open = self->query_right_open_gap_score;
+    h.query_right_extend = self->query_right_extend_gap_score;
+    h.nsteps = 0;
+    size = 2 * (nB + 1);
+    if (size < HIRSCHBERG_BLOCK) size = HIRSCHBERG_BLOCK;
+    h.buffer = PyMem_Malloc(12*(nB+1)*sizeof(double));
+    h.trace = PyMem_Malloc(size);
+    h.steps = PyMem_Malloc(nA+nB);
+    if (!h.buffer || !h.trace || !h.steps) {
+        PyErr_NoMemory();
+        goto exit;
+    }
 
-    sA = bA.buf;
-    nA = bA.len / bA.itemsize;
-    sB = bB.buf;
-    nB = bB.len / bB.itemsize;
+    Py_BEGIN_ALLOW_THREADS
+    score = _hirschberg(&h, 0, 0, BANDED_M, nA, nB, HIRSCHBERG_ANY);
+    Py_END_ALLOW_THREADS
+
+    /* the path consists of the points where its direction changes */
+    for (k = 1; k < h.nsteps; k++) if (h.steps[k] != h.steps[k-1]) n++;
+    path = PyTuple_New(n+1);
+    if (!path) goto exit;
+    point = Py_BuildValue("(nn)", i, j);
+    if (!point) goto exit;
+    PyTuple_SET_ITEM(path, 0, point);
+    n = 1;
+    for (k = 0; k < h.nsteps; k++) {
+        direction = h.steps[k];
+        if (direction != BANDED_IY) i++;
+        if (direction != BANDED_IX) j++;
+        if (k == h.nsteps - 1 || h.steps[k+1] != direction) {
+            point = Py_BuildValue("(nn)", i, j);
+            if (!point) goto exit;
+            PyTuple_SET_ITEM(path, n++, point);
+        }
+    }
+    result = Py_BuildValue("d[O]", score, path);
+
+exit:
+    Py_XDECREF(path);
+    PyMem_Free(h.buffer);
+    PyMem_Free(h.trace);
+    PyMem_Free(h.steps);
+    return result;
+}
+
+/* Striped Smith-Waterman local alignment scores.
+ *
+ * This is the striped algorithm of Farrar (Bioinformatics 23: 156-161, 2007),
+ * using SIMD instructions to calculate the local alignment score of 8 (SSE2)
+ * or 16 (AVX2) query positions at a time in 16-bit integers. The instruction
+ * set is detected at run time. The algorithm is used only if all scores are
+ * integers, the gap scores are not positive, and opening a gap does not score
+ * higher than extending it, for which it gives the same score (and end point)
+ * as the Gotoh local alignment algorithm. Otherwise, or if the score would
+ * not fit in 16 bits, the scalar dynamic programming algorithms are used.
+ */
+
+#define STRIPED_MAX_LETTERS 4096
+
+#if defined(__GNUC__) && (defined(__x86_64__) || defined(__i386__))
+#define STRIPED_X86
+#include <immintrin.h>
+#endif
+
+typedef enum {NoSIMD, SSE2, AVX2} InstructionSet;
+
+static InstructionSet
+_striped_instruction_set(void)
+{
+#ifdef STRIPED_X86
+    static int initialized = 0;
+    static InstructionSet instruction_set = NoSIMD;
+    if (!initialized) {
+        __builtin_cpu_init();
+        if (__builtin_cpu_supports("avx2")) instruction_set = AVX2;
+        else if (__builtin_cpu_supports("sse2")) instruction_set = SSE2;
+        initialized = 1;
+    }
+    return instruction_set;
+#else
+    return NoSIMD;
+#endif
+}
+
+#define STRIPED_SMITHWATERMAN \
+    Py_ssize_t i; \
+    Py_ssize_t k; \
+    Py_ssize_t s; \
+    int kA; \
+    int16_t best = 0; \
+    int16_t value; \
+    int16_t lanes[VLANES]; \
+    const VTYPE vZero = VZERO; \
+    const VTYPE vMin = VSET1(INT16_MIN); \
+    const VTYPE vFirst = VFIRST(INT16_MIN); \
+    const VTYPE vQueryOpen = VSET1(gaps[0]); \
+    const VTYPE vQueryExtend = VSET1(gaps[1]); \
+    const VTYPE vTargetOpen = VSET1(gaps[2]); \
+    const VTYPE vTargetExtend = VSET1(gaps[3]); \
+    const VTYPE* pvProfile = (const VTYPE*)profile; \
+    const VTYPE* pvP; \
+    VTYPE* pvHStore = (VTYPE*)buffer; \
+    VTYPE* pvHLoad = pvHStore + segments; \
+    VTYPE* pvE = pvHLoad + segments; \
+    VTYPE* pvSaved = pvE + segments; \
+    VTYPE* temp; \
+    VTYPE vH; \
+    VTYPE vPrevious; \
+    VTYPE vE; \
+    VTYPE vF; \
+    VTYPE vMax; \
+ \
+    for (s = 0; s < segments; s++) { \
+        pvHStore[s] = vZero; \
+        pvHLoad[s] = vZero; \
+        pvE[s] = vMin; \
+    } \
+    for (i = 0; i < nA; i++) { \
+        kA = sA[i]; \
+        if (kA < 0) kA = letters - 1; \
+        pvP = pvProfile + kA * segments; \
+        vF = vMin; \
+        vMax = vZero; \
+        vH = VSHIFT(pvHStore[segments-1]); \
+        temp = pvHLoad; \
+        pvHLoad = pvHStore; \
+        pvHStore = temp; \
+        for (s = 0; s < segments; s++) { \
+            vH = VADDS(vH, pvP[s]); \
+            vE = pvE[s]; \
+            vH = VMAX(vH, vE); \
+            vH = VMAX(vH, vF); \
+            vH = VMAX(vH, vZero); \
+            pvHStore[s] = vH; \
+            vMax = VMAX(vMax, vH); \
+            pvE[s] = VMAX(VSUBS(vE, vQueryExtend), VSUBS(vH, vQueryOpen)); \
+            vF = VMAX(VSUBS(vF, vTargetExtend), VSUBS(vH, vTargetOpen)); \
+            vH = pvHLoad[s]; \
+        } \
+        /* lazy evaluation of gaps in the target across the stripes */ \
+        for (k = 0; k < VLANES; k++) { \
+            vF = VOR(VSHIFT(vF), vFirst); \
+            for (s = 0; s < segments; s++) { \
+                vPrevious = pvHStore[s]; \
+                vH = VMAX(vPrevious, vF); \
+                pvHStore[s] = vH; \
+                vMax = VMAX(vMax, vH); \
+                pvE[s] = VMAX(pvE[s], VSUBS(vH, vQueryOpen)); \
+                vF = VSUBS(vF, vTargetExtend); \
+                /* stop if the gap does not improve on the gaps opened in \
+                 * the first pass, which started from the earlier scores */ \
+                if (!VMOVEMASK(VCMPGT(vF, VSUBS(vPrevious, vTargetOpen)))) goto done; \
+            } \
+        } \
+done: \
+        VSTORE(lanes, vMax); \
+        value = lanes[0]; \
+        for (k = 1; k < VLANES; k++) if (lanes[k] > value) value = lanes[k]; \
+        if (value > best) { \
+            best = value; \
+            *end = i + 1; \
+            if (saved) { \
+                for (s = 0; s < segments; s++) pvSaved[s] = pvHStore[s]; \
+                *saved = (int16_t*)pvSaved; \
+            } \
+        } \
+        /* the next row could overflow */ \
+        if (best >= limit) return 0; \
+    } \
+    *score = best; \
+    return 1;
+
+#ifdef STRIPED_X86
+
+#define VTYPE __m128i
+#define VLANES 8
+#define VZERO _mm_setzero_si128()
+#define VSET1(x) _mm_set1_epi16(x)
+#define VFIRST(x) _mm_insert_epi16(_mm_setzero_si128(), x, 0)
+#define VADDS(a, b) _mm_adds_epi16(a, b)
+#define VSUBS(a, b) _mm_subs_epi16(a, b)
+#define VMAX(a, b) _mm_max_epi16(a, b)
+#define VOR(a, b) _mm_or_si128(a, b)
+#define VCMPGT(a, b) _mm_cmpgt_epi16(a, b)
+#define VMOVEMASK(a) _mm_movemask_epi8(a)
+#define VSHIFT(a) _mm_slli_si128(a, 2)
+#define VSTORE(p, a) _mm_storeu_si128((__m128i*)(p), a)
+
+__attribute__((target("sse2")))
+static int
+_striped_smithwaterman_sse2(const int16_t* profile, Py_ssize_t segments,
+                            int letters, const int* sA, Py_ssize_t nA,
+                            const int16_t gaps[4], int16_t limit,
+                            int16_t* buffer, int16_t* score,
+                            Py_ssize_t* end, int16_t** saved)
+{
+    STRIPED_SMITHWATERMAN
+}
+
+#undef VTYPE
+#undef VLANES
+#undef VZERO
+#undef VSET1
+#undef VFIRST
+#undef VADDS
+#undef VSUBS
+#undef VMAX
+#undef VOR
+#undef VCMPGT
+#undef VMOVEMASK
+#undef VSHIFT
+#undef VSTORE
+
+#define VTYPE __m256i
+#define VLANES 16
+#define VZERO _mm256_setzero_si256()
+#define VSET1(x) _mm256_set1_epi16(x)
+#define VFIRST(x) _mm256_insert_epi16(_mm256_setzero_si256(), x, 0)
+#define VADDS(a, b) _mm256_adds_epi16(a, b)
+#define VSUBS(a, b) _mm256_subs_epi16(a, b)
+#define VMAX(a, b) _mm256_max_epi16(a, b)
+#define VOR(a, b) _mm256_or_si256(a, b)
+#define VCMPGT(a, b) _mm256_cmpgt_epi16(a, b)
+#define VMOVEMASK(a) _mm256_movemask_epi8(a)
+/* shift by 2 bytes across the two 128-bit lanes */
+#define VSHIFT(a) _mm256_alignr_epi8(a, _mm256_permute2x128_si256(a, a, _MM_SHUFFLE(0, 0, 2, 0)), 14)
+#define VSTORE(p, a) _mm256_storeu_si256((__m256i*)(p), a)
+
+__attribute__((target("avx2")))
+static int
+_striped_smithwaterman_avx2(const int16_t* profile, Py_ssize_t segments,
+                            int letters, const int* sA, Py_ssize_t nA,
+                            const int16_t gaps[4], int16_t limit,
+                            int16_t* buffer, int16_t* score,
+                            Py_ssize_t* end, int16_t** saved)
+{
+    STRIPED_SMITHWATERMAN
+}
+
+#undef VTYPE
+#undef VLANES
+#undef VZERO
+#undef VSET1
+#undef VFIRST
+#undef VADDS
+#undef VSUBS
+#undef VMAX
+#undef VOR
+#undef VCMPGT
+#undef VMOVEMASK
+#undef VSHIFT
+#undef VSTORE
+
+#endif
+
+static int
+_striped_integer(double value, int16_t* result)
+{
+    if (!(value > INT16_MIN && value <= INT16_MAX)) return 0;
+    if (value != (int16_t)value) return 0;
+    *result = (int16_t)value;
+    return 1;
+}
+
+static int
+_striped_score(Aligner* self, const int* sA, Py_ssize_t nA,
+               const int* sB, Py_ssize_t nB,
+               double* score, Py_ssize_t* iend, Py_ssize_t* jend)
+{
+    /* Calculates the local alignment score using the striped algorithm, and
+     * the end point of the alignment if iend and jend are not NULL. Returns
+     * 1 if successful, 0 if the striped algorithm cannot be used, and -1 if
+     * memory allocation failed. */
+    Py_ssize_t i;
+    Py_ssize_t j;
+    Py_ssize_t k;
+    Py_ssize_t s;
+    Py_ssize_t l;
+    Py_ssize_t row = 0;
+    Py_ssize_t lanes;
+    Py_ssize_t segments;
+    int letters;
+    int kA;
+    int kB;
+    int ok = 0;
+    int16_t gaps[4];
+    int16_t value;
+    int16_t highest = 0;
+    int16_t best;
+    int16_t* profile;
+    int16_t* memory;
+    int16_t* buffer;
+    int16_t* saved = NULL;
+    const double* scores = self->substitution_matrix.obj ? self->substitution_matrix.buf : NULL;
+    const Py_ssize_t n = scores ? self->substitution_matrix.shape[0] : 0;
+    const double match = self->match;
+    const double mismatch = self->mismatch;
+    const InstructionSet instruction_set = _striped_instruction_set();
+
+    switch (instruction_set) {
+        case SSE2: lanes = 8; break;
+        case AVX2: lanes = 16; break;
+        case NoSIMD:
+        default: return 0;
+    }
+    /* penalties for opening and extending gaps in the query and the target */
+    if (!_striped_integer(-self->query_internal_open_gap_score, &gaps[0])
+     || !_striped_integer(-self->query_internal_extend_gap_score, &gaps[1])
+     || !_striped_integer(-self->target_internal_open_gap_score, &gaps[2])
+     || !_striped_integer(-self->target_internal_extend_gap_score, &gaps[3]))
+        return 0;
+    if (gaps[1] < 0 || gaps[3] < 0 || gaps[0] < gaps[1] || gaps[2] < gaps[3])
+        return 0;
+    if (scores) {
+        letters = (int)n;
+        for (k = 0; k < n * n; k++) {
+            if (!_striped_integer(scores[k], &value)) return 0;
+            if (value > highest) highest = value;
+        }
+    }
+    else {
+        /* the last row of the profile is used for negative letters */
+        letters = 0;
+        for (i = 0; i < nA; i++) {
+            kA = sA[i];
+            if (kA >= letters) {
+                if (kA >= STRIPED_MAX_LETTERS) return 0;
+                letters = kA + 1;
+            }
+        }
+        letters++;
+        if (!_striped_integer(match, &value)) return 0;
+        if (value > highest) highest = value;
+        if (!_striped_integer(mismatch, &value)) return 0;
+        if (value > highest) highest = value;
+    }
+    if (letters > STRIPED_MAX_LETTERS) return 0;
+
+    segments = (nB + lanes - 1) / lanes;
+    /* profile and four rows, aligned to 32 bytes */
+    memory = PyMem_Malloc((letters + 4) * segments * lanes * sizeof(int16_t) + 32);
+    if (!memory) {
+        PyErr_NoMemory();
+        return -1;
+    }
+    profile = (int16_t*)(((uintptr_t)memory + 31) & ~(uintptr_t)31);
+    buffer = profile + letters * segments * lanes;
+    /* query position j = s + l * segments is in lane l of segment s */
+    for (k = 0; k < letters; k++) {
+        kA = (!scores && k == letters - 1) ? -1 : (int)k;
+        for (s = 0; s < segments; s++) {
+            for (l = 0; l < lanes; l++) {
+                j = s + l * segments;
+                if (j >= nB) value = INT16_MIN;
+                else {
+                    kB = sB[j];
+                    if (scores) value = (int16_t)scores[kA*n+kB];
+                    else if (kA < 0 || kB < 0) value = 0;
+                    else value = (int16_t)((kA == kB) ? match : mismatch);
+                }
+                profile[(k*segments+s)*lanes+l] = value;
+            }
+        }
+    }
+
+    Py_BEGIN_ALLOW_THREADS
+#ifdef STRIPED_X86
+    if (instruction_set == AVX2)
+        ok = _striped_smithwaterman_avx2(profile, segments, letters, sA, nA,
+                                         gaps, INT16_MAX - highest, buffer,
+                                         &best, &row, iend ? &saved : NULL);
+    else
+        ok = _striped_smithwaterman_sse2(profile, segments, letters, sA, nA,
+                                         gaps, INT16_MAX - highest, buffer,
+                                         &best, &row, iend ? &saved : NULL);
+#endif
+    Py_END_ALLOW_THREADS
+
+    if (ok) {
+        *score = best;
+        if (iend) {
+            *iend = 0;
+            *jend = 0;
+            if (saved) {
+                /* the first query position with the best score */
+                *iend = row;
+                *jend = nB;
+                for (s = 0; s < segments; s++) {
+                    for (l = 0; l < lanes; l++) {
+                        j = s + l * segments;
+                        if (j < *jend && saved[s*lanes+l] == best) *jend = j;
+                    }
+                }
+                (*jend)++;
+            }
+        }
+    }
+    PyMem_Free(memory);
+    return ok;
+}
+
+static PyObject*
+_score_sequences(Aligner* self, Mode mode, Algorithm algorithm,
+                 const int* sA, Py_ssize_t nA, const int* sB, Py_ssize_t nB)
+{
+    PyObject* result = NULL;
+    PyObject* substitution_matrix = self->substitution_matrix.obj;
+
+    /* The dynamic programming runs without the GIL; keep the substitution
+     * matrix alive in case another thread replaces it in the meantime. */
+    Py_XINCREF(substitution_matrix);
+
+    if (self->band_width >= 0 || self->xdrop >= 0) {
+        result = _banded_score(self, mode, sA, nA, sB, nB);
+        Py_XDECREF(substitution_matrix);
+        return result;
+    }
+
+    if (self->striped && mode == Local && algorithm != WatermanSmithBeyer) {
+        double score;
+        switch (_striped_score(self, sA, nA, sB, nB, &score, NULL, NULL)) {
+            case 1:
+                result = PyFloat_FromDouble(score);
+                Py_XDECREF(substitution_matrix);
+                return result;
+            case -1:
+                Py_XDECREF(substitution_matrix);
+                return NULL;
+            default:
+                /* use the scalar algorithms */
+                break;
+        }
+    }
 
     switch (algorithm) {
         case NeedlemanWunschSmithWaterman:
@@ -6534,12 +7975,197 @@ Aligner_score(Aligner* self, PyObject* args, PyObject* keywords)
             break;
     }
 
+    Py_XDECREF(substitution_matrix);
+
+    return result;
+}
+
+static const char Aligner_score__doc__[] = "calculates the alignment score";
+
+static PyObject*
+Aligner_score(Aligner* self, PyObject* args, PyObject* keywords)
+{
+    const int* sA;
+    const int* sB;
+    Py_ssize_t nA;
+    Py_ssize_t nB;
+    Py_buffer bA = {0};
+    Py_buffer bB = {0};
+    const Mode mode = self->mode;
+    const Algorithm algorithm = _get_algorithm(self);
+    PyObject* result = NULL;
+
+    static char *kwlist[] = {"sequenceA", "sequenceB", NULL};
+
+    bA.obj = (PyObject*)self;
+    bB.obj = (PyObject*)self;
+    if(!PyArg_ParseTupleAndKeywords(args, keywords, "O&O&", kwlist,
+                                    sequence_converter, &bA,
+                                    sequence_converter, &bB))
+        return NULL;
+
+    sA = bA.buf;
+    nA = bA.len / bA.itemsize;
+    sB = bB.buf;
+    nB = bB.len / bB.itemsize;
+
+    result = _score_sequences(self, mode, algorithm, sA, nA, sB, nB);
+
+    sequence_converter(NULL, &bA);
+    sequence_converter(NULL, &bB);
+
+    return result;
+}
+
+static int
+_check_encoded(Aligner* self, PyObject* sequence, const int** s, Py_ssize_t* n)
+{
+    Py_ssize_t i;
+    const int* indices;
+    if (!PyBytes_Check(sequence)
+     || PyBytes_GET_SIZE(sequence) == 0
+     || PyBytes_GET_SIZE(sequence) % sizeof(int) != 0) {
+        PyErr_SetString(PyExc_ValueError,
+                        "expected a sequence encoded by the aligner");
+        return 0;
+    }
+    indices = (const int*)PyBytes_AS_STRING(sequence);
+    *s = indices;
+    *n = PyBytes_GET_SIZE(sequence) / sizeof(int);
+    if (self->substitution_matrix.obj) {
+        const Py_ssize_t m = self->substitution_matrix.shape[0];
+        for (i = 0; i < *n; i++) {
+            if (indices[i] < 0 || indices[i] >= m) {
+                PyErr_Format(PyExc_ValueError,
+                             "sequence item %zd is out of bound"
+                             " (%d, should be >= 0 and < %zd)",
+                             i, indices[i], m);
+                return 0;
+            }
+        }
+    }
+    return 1;
+}
+
+static const char Aligner_score_end__doc__[] = "calculates the local alignment score and the end point of the alignment";
+
+static PyObject*
+Aligner_score_end(Aligner* self, PyObject* args, PyObject* keywords)
+{
+    const int* sA;
+    const int* sB;
+    Py_ssize_t nA;
+    Py_ssize_t nB;
+    Py_buffer bA = {0};
+    Py_buffer bB = {0};
+    const Mode mode = self->mode;
+    double score = 0;
+    Py_ssize_t i = 0;
+    Py_ssize_t j = 0;
+    int ok = 0;
+    BandedEnd end;
+    PyObject* result = NULL;
+    PyObject* substitution_matrix;
+
+    static char *kwlist[] = {"sequenceA", "sequenceB", NULL};
+
+    if (mode != Local) {
+        PyErr_SetString(PyExc_ValueError,
+                        "the end point is available for local alignments only");
+        return NULL;
+    }
+    if (self->target_gap_function || self->query_gap_function) {
+        PyErr_SetString(PyExc_ValueError,
+                        "the end point is not available for gap score functions");
+        return NULL;
+    }
+    bA.obj = (PyObject*)self;
+    bB.obj = (PyObject*)self;
+    if(!PyArg_ParseTupleAndKeywords(args, keywords, "O&O&", kwlist,
+                                    sequence_converter, &bA,
+                                    sequence_converter, &bB))
+        return NULL;
+
+    sA = bA.buf;
+    nA = bA.len / bA.itemsize;
+    sB = bB.buf;
+    nB = bB.len / bB.itemsize;
+
+    substitution_matrix = self->substitution_matrix.obj;
+    Py_XINCREF(substitution_matrix);
+
+    if (!_check_banded(self, mode, nA, nB)) goto exit;
+    if (self->striped && self->band_width < 0 && self->xdrop < 0) {
+        ok = _striped_score(self, sA, nA, sB, nB, &score, &i, &j);
+        if (ok < 0) goto exit;
+    }
+    if (!ok) {
+        /* the banded alignment algorithm without a band */
+        if (!_banded_dynamic_programming(self, mode, sA, nA, sB, nB, NULL, &end)) {
+            PyErr_NoMemory();
+            goto exit;
+        }
+        score = end.score;
+        i = end.i;
+        j = end.j;
+    }
+    if (score > 0) result = Py_BuildValue("d(nn)", score, i, j);
+    else result = Py_BuildValue("dO", score, Py_None);
+
+exit:
+    Py_XDECREF(substitution_matrix);
     sequence_converter(NULL, &bA);
     sequence_converter(NULL, &bB);
 
     return result;
 }
 
+static const char Aligner_score_encoded__doc__[] = "calculates the alignment scores of pairs of encoded sequences";
+
+static PyObject*
+Aligner_score_encoded(Aligner* self, PyObject* args)
+{
+    Py_ssize_t i;
+    Py_ssize_t n;
+    const int* sA;
+    const int* sB;
+    Py_ssize_t nA;
+    Py_ssize_t nB;
+    PyObject* seqsA;
+    PyObject* seqsB;
+    PyObject* result;
+    Py_buffer buffer;
+    double* scores;
+    const Mode mode = self->mode;
+    const Algorithm algorithm = _get_algorithm(self);
+
+    if (!PyArg_ParseTuple(args, "O!O!w*", &PyTuple_Type, &seqsA,
+                                          &PyTuple_Type, &seqsB, &buffer))
+        return NULL;
+
+    n = PyTuple_GET_SIZE(seqsA);
+    if (PyTuple_GET_SIZE(seqsB) != n || buffer.len != n * (Py_ssize_t)sizeof(double)) {
+        PyErr_SetString(PyExc_ValueError, "inconsistent number of sequences");
+        PyBuffer_Release(&buffer);
+        return NULL;
+    }
+    scores = buffer.buf;
+
+    for (i = 0; i < n; i++) {
+        if (!_check_encoded(self, PyTuple_GET_ITEM(seqsA, i), &sA, &nA)) break;
+        if (!_check_encoded(self, PyTuple_GET_ITEM(seqsB, i), &sB, &nB)) break;
+        result = _score_sequences(self, mode, algorithm, sA, nA, sB, nB);
+        if (!result) break;
+        scores[i] = PyFloat_AS_DOUBLE(result);
+        Py_DECREF(result);
+    }
+    PyBuffer_Release(&buffer);
+
+    if (i < n) return NULL;
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+
 static const char Aligner_align__doc__[] = "align two sequences";
 
 static PyObject*
@@ -6554,7 +8180,7 @@ Aligner_align(Aligner* self, PyObject* args, PyObject* keywords)
     const Mode mode = self->mode;
     const Algorithm algorithm = _get_algorithm(self);
     PyObject* result = NULL;
-    PyObject* substitution_matrix = self->substitution_matrix.obj;
+    PyObject* substitution_matrix;
 
     static char *kwlist[] = {"sequenceA", "sequenceB", NULL};
 
@@ -6570,7 +8196,16 @@ Aligner_align(Aligner* self, PyObject* args, PyObject* keywords)
     sB = bB.buf;
     nB = bB.len / bB.itemsize;
 
-    switch (algorithm) {
+    /* The dynamic programming runs without the GIL; keep the substitution
+     * matrix alive in case another thread replaces it in the meantime. */
+    substitution_matrix = self->substitution_matrix.obj;
+    Py_XINCREF(substitution_matrix);
+
+    if (self->linear_memory)
+        result = _hirschberg_align(self, mode, sA, nA, sB, nB);
+    else if (self->band_width >= 0 || self->xdrop >= 0)
+        result = _banded_align(self, mode, sA, nA, sB, nB);
+    else switch (algorithm) {
         case NeedlemanWunschSmithWaterman:
             switch (mode) {
                 case Global:
@@ -6625,6 +8260,7 @@ Aligner_align(Aligner* self, PyObject* args, PyObject* keywords)
             break;
     }
 
+    Py_XDECREF(substitution_matrix);
     sequence_converter(NULL, &bA);
     sequence_converter(NULL, &bB);
 
@@ -6634,6 +8270,30 @@ Aligner_align(Aligner* self, PyObject* args, PyObject* keywords)
 static char Aligner_doc[] =
 "Aligner.\n";
 
+static const char Aligner_encode__doc__[] = "convert a sequence to the indices used by the aligner";
+
+static PyObject*
+Aligner_encode(Aligner* self, PyObject* args, PyObject* keywords)
+{
+    Py_ssize_t n;
+    Py_buffer buffer = {0};
+    PyObject* result;
+
+    static char *kwlist[] = {"sequence", NULL};
+
+    buffer.obj = (PyObject*)self;
+    if(!PyArg_ParseTupleAndKeywords(args, keywords, "O&", kwlist,
+                                    sequence_converter, &buffer))
+        return NULL;
+
+    n = buffer.len / buffer.itemsize;
+    result = PyBytes_FromStringAndSize(buffer.buf, n * sizeof(int));
+
+    sequence_converter(NULL, &buffer);
+
+    return result;
+}
+
 static PyMethodDef Aligner_methods[] = {
     {"score",
      (PyCFunction)Aligner_score,
@@ -6645,6 +8305,21 @@ static PyMethodDef Aligner_methods[] = {
      METH_VARARGS | METH_KEYWORDS,
      Aligner_align__doc__
     },
+    {"encode",
+     (PyCFunction)Aligner_encode,
+     METH_VARARGS | METH_KEYWORDS,
+     Aligner_encode__doc__
+    },
+    {"score_end",
+     (PyCFunction)Aligner_score_end,
+     METH_VARARGS | METH_KEYWORDS,
+     Aligner_score_end__doc__
+    },
+    {"score_encoded",
+     (PyCFunction)Aligner_score_encoded,
+     METH_VARARGS,
+     Aligner_score_encoded__doc__
+    },
     {NULL}  /* Sentinel */
 };
 
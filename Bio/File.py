@@ -164,6 +164,10 @@ class _IndexedSeqFileProxy:
         # Should be done by each sub-class (if possible)
         raise NotImplementedError("Not available for this file format.")
 
+    def close(self):
+        """Close the file handle being used to read the data."""
+        self._handle.close()
+
 
 class _IndexedSeqFileDict(collections.abc.Mapping):
     """Read only dictionary interface to a sequential record file.
@@ -213,7 +217,7 @@ class _IndexedSeqFileDict(collections.abc.Mapping):
             #       "%s at offset %i given length %r (%s format %s)" \
             #       % (key, offset, length, filename, format)
             if key in offsets:
-                self._proxy._handle.close()
+                self._proxy.close()
                 raise ValueError("Duplicate key '%s'" % key)
             else:
                 offsets[key] = offset
@@ -267,7 +271,7 @@ class _IndexedSeqFileDict(collections.abc.Mapping):
         if you wish to delete the file, on Windows you must first close
         all open handles to that file.
         """
-        self._proxy._handle.close()
+        self._proxy.close()
 
 
 class _SQLiteManySeqFilesDict(_IndexedSeqFileDict):
@@ -145,7 +145,7 @@ class InsdcScanner:
         self.line = line
         return header_lines
 
-    def parse_features(self, skip=False):
+    def parse_features(self, skip=False, lazy=False, qualifiers=True):
         """Return list of tuples for the features (if present).
 
         Each feature is returned as a tuple (key, location, qualifiers)
@@ -153,6 +153,11 @@ class InsdcScanner:
         "complement(join(490883..490885,1..879))") while qualifiers
         is a list of two string tuples (feature qualifier keys and values).
 
+        With lazy=True, each feature is instead returned as a tuple of the
+        key and the list of lines to give to the parse_feature method later.
+        With qualifiers=False, the qualifier lines are dropped (so only the
+        key and location are parsed).
+
         Assumes you have already read to the start of the features table.
         """
         if self.line.rstrip() not in self.FEATURE_START_MARKERS:
@@ -228,10 +233,29 @@ class InsdcScanner:
                     # white space (e.g. out of spec files with too much indentation)
                     feature_lines.append(line[self.FEATURE_QUALIFIER_INDENT :].strip())
                     line = self.handle.readline()
-                features.append(self.parse_feature(feature_key, feature_lines))
+                features.append(
+                    self._parse_feature_lines(
+                        feature_key, feature_lines, lazy, qualifiers
+                    )
+                )
         self.line = line
         return features
 
+    def _parse_feature_lines(self, feature_key, lines, lazy, qualifiers):
+        """Parse a feature, or return the lines to parse later (PRIVATE).
+
+        Used by the parse_features method.
+        """
+        if not qualifiers:
+            # The location comes first, so drop the first qualifier onwards
+            for index, line in enumerate(lines):
+                if line[:1] == "/":
+                    del lines[index:]
+                    break
+        if lazy:
+            return feature_key, lines
+        return self.parse_feature(feature_key, lines)
+
     def parse_feature(self, feature_key, lines):
         r"""Parse a feature given as a list of strings into a tuple.
 
@@ -368,7 +392,7 @@ class InsdcScanner:
                 "Problem with '%s' feature:\n%s" % (feature_key, "\n".join(lines))
             ) from None
 
-    def parse_footer(self):
+    def parse_footer(self, skip_sequence=False):
         """Return a tuple containing a list of any misc strings, and the sequence."""
         # This is a basic bit of code to scan and discard the sequence,
         # which was useful when developing the sub classes.
@@ -417,13 +441,23 @@ class InsdcScanner:
         """
         consumer.start_feature_table()
         for feature_key, location_string, qualifiers in feature_tuples:
-            consumer.feature_key(feature_key)
-            consumer.location(location_string)
-            for q_key, q_value in qualifiers:
-                if q_value is None:
-                    consumer.feature_qualifier(q_key, q_value)
-                else:
-                    consumer.feature_qualifier(q_key, q_value.replace("\n", " "))
+            InsdcScanner._feed_feature(
+                consumer, feature_key, location_string, qualifiers
+            )
+
+    @staticmethod
+    def _feed_feature(consumer, feature_key, location_string, qualifiers):
+        """Handle a single feature tuple, passing data to the consumer (PRIVATE).
+
+        Used by the _feed_feature_table() method, and when lazy loading features.
+        """
+        consumer.feature_key(feature_key)
+        consumer.location(location_string)
+        for q_key, q_value in qualifiers:
+            if q_value is None:
+                consumer.feature_qualifier(q_key, q_value)
+            else:
+                consumer.feature_qualifier(q_key, q_value.replace("\n", " "))
 
     def _feed_misc_lines(self, consumer, lines):
         """Handle any lines between features and sequence (list of strings), passing data to the consumer (PRIVATE).
@@ -434,7 +468,15 @@ class InsdcScanner:
         """
         pass
 
-    def feed(self, handle, consumer, do_features=True):
+    def feed(
+        self,
+        handle,
+        consumer,
+        do_features=True,
+        do_qualifiers=True,
+        do_sequence=True,
+        lazy_features=False,
+    ):
         """Feed a set of data into the consumer.
 
         This method is intended for use with the "old" code in Bio.GenBank
@@ -444,6 +486,14 @@ class InsdcScanner:
          - consumer - The consumer that should be informed of events.
          - do_features - Boolean, should the features be parsed?
            Skipping the features can be much faster.
+         - do_qualifiers - Boolean, should the feature qualifiers be parsed?
+           If not, the features only have a type and location.
+         - do_sequence - Boolean, should the sequence be parsed? If not, the
+           consumer is given an empty sequence.
+         - lazy_features - Boolean, should parsing the features be left until
+           they are used? Only for the Bio.GenBank._FeatureConsumer, whose
+           SeqRecord then gets a list like object which parses each feature
+           on first access.
 
         Return values:
          - true  - Passed a record
@@ -467,28 +517,47 @@ class InsdcScanner:
         self._feed_header_lines(consumer, self.parse_header())
 
         # Features (common to both EMBL and GenBank):
-        if do_features:
-            self._feed_feature_table(consumer, self.parse_features(skip=False))
-        else:
+        if not do_features:
             self.parse_features(skip=True)  # ignore the data
+        elif lazy_features:
+            # Keep the lines of each feature, only parsed when used
+            consumer.start_feature_table()
+            feature_lines = self.parse_features(lazy=True, qualifiers=do_qualifiers)
+        else:
+            self._feed_feature_table(
+                consumer, self.parse_features(qualifiers=do_qualifiers)
+            )
 
         # Footer and sequence
-        misc_lines, sequence_string = self.parse_footer()
+        misc_lines, sequence_string = self.parse_footer(skip_sequence=not do_sequence)
         self._feed_misc_lines(consumer, misc_lines)
 
         consumer.sequence(sequence_string)
         # Calls to consumer.base_number() do nothing anyway
         consumer.record_end("//")
 
+        if do_features and lazy_features:
+            consumer.data.features = _LazyFeatureList(
+                self.__class__(self.debug), consumer, feature_lines
+            )
+
         assert self.line == "//"
 
         # And we are done
         return True
 
-    def parse(self, handle, do_features=True):
+    def parse(
+        self,
+        handle,
+        do_features=True,
+        do_qualifiers=True,
+        do_sequence=True,
+        lazy_features=False,
+    ):
         """Return a SeqRecord (with SeqFeatures if do_features=True).
 
-        See also the method parse_records() for use on multi-record files.
+        See the feed() method for the optional arguments, and also the
+        method parse_records() for use on multi-record files.
         """
         from Bio.GenBank import _FeatureConsumer
         from Bio.GenBank.utils import FeatureValueCleaner
@@ -497,24 +566,36 @@ class InsdcScanner:
             use_fuzziness=1, feature_cleaner=FeatureValueCleaner()
         )
 
-        if self.feed(handle, consumer, do_features):
+        if self.feed(
+            handle, consumer, do_features, do_qualifiers, do_sequence, lazy_features
+        ):
             return consumer.data
         else:
             return None
 
-    def parse_records(self, handle, do_features=True):
+    def parse_records(
+        self,
+        handle,
+        do_features=True,
+        do_qualifiers=True,
+        do_sequence=True,
+        lazy_features=False,
+    ):
         """Parse records, return a SeqRecord object iterator.
 
         Each record (from the ID/LOCUS line to the // line) becomes a SeqRecord
 
-        The SeqRecord objects include SeqFeatures if do_features=True
+        The SeqRecord objects include SeqFeatures if do_features=True, see
+        the feed() method for the other optional arguments.
 
         This method is intended for use in Bio.SeqIO
         """
         # This is a generator function
         with as_handle(handle) as handle:
             while True:
-                record = self.parse(handle, do_features)
+                record = self.parse(
+                    handle, do_features, do_qualifiers, do_sequence, lazy_features
+                )
                 if record is None:
                     break
                 if record.id is None:
@@ -624,6 +705,151 @@ class InsdcScanner:
                         yield record
 
 
+class _LazyFeatureList(list):
+    """List of SeqFeature objects parsed from a feature table on demand (PRIVATE).
+
+    Holds the key and lines of each feature from the scanner, and only
+    parses the location and qualifiers into a SeqFeature the first time
+    that feature is accessed. Any parser warnings are therefore only shown
+    when the feature is used.
+
+    This is a list subclass so it can be used anywhere a list of features
+    is expected. Indexing and iteration parse the features as needed, while
+    methods which look at every feature (such as sort, index and count)
+    parse them all first. Copies, slices and concatenations are plain lists.
+    """
+
+    def __init__(self, scanner, consumer, features):
+        """Initialize the class.
+
+        Arguments:
+         - scanner - scanner used for the parse_feature method
+         - consumer - the Bio.GenBank._FeatureConsumer used for the record,
+           which gives the settings and sequence information needed to
+           parse the locations
+         - features - list of (key, lines) tuples
+
+        """
+        from Bio.GenBank import _FeatureConsumer
+
+        list.__init__(self, features)
+        self._scanner = scanner
+        self._consumer = _FeatureConsumer(
+            consumer._use_fuzziness, consumer._feature_cleaner
+        )
+        self._consumer._expected_size = consumer._expected_size
+        self._consumer._seq_type = consumer._seq_type
+
+    def _parse(self, index):
+        """Return the feature at this index, parsing it if needed (PRIVATE)."""
+        feature = list.__getitem__(self, index)
+        if isinstance(feature, tuple):
+            key, location, qualifiers = self._scanner.parse_feature(*feature)
+            self._scanner._feed_feature(self._consumer, key, location, qualifiers)
+            # The consumer adds the new feature to its (dummy) record
+            feature = self._consumer.data.features.pop()
+            list.__setitem__(self, index, feature)
+        return feature
+
+    def _parse_all(self):
+        """Parse any features not yet parsed (PRIVATE)."""
+        for index in range(len(self)):
+            self._parse(index)
+
+    def __getitem__(self, index):
+        """Return a feature, or a list of features for a slice."""
+        if isinstance(index, slice):
+            return [self._parse(i) for i in range(*index.indices(len(self)))]
+        return self._parse(index)
+
+    def __iter__(self):
+        """Iterate over the features, parsing them as needed."""
+        index = 0
+        while index < len(self):
+            yield self._parse(index)
+            index += 1
+
+    def __reversed__(self):
+        """Iterate over the features in reverse order, parsing them as needed."""
+        index = len(self) - 1
+        while 0 <= index < len(self):
+            yield self._parse(index)
+            index -= 1
+
+    def __contains__(self, value):
+        """Return True if the feature is in the list."""
+        self._parse_all()
+        return list.__contains__(self, value)
+
+    def __eq__(self, other):
+        """Compare the features to those in another list."""
+        if isinstance(other, list):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __ne__(self, other):
+        """Compare the features to those in another list."""
+        if isinstance(other, list):
+            return list(self) != list(other)
+        return NotImplemented
+
+    def __add__(self, other):
+        """Return a plain list of these features followed by the others."""
+        if isinstance(other, list):
+            return list(self) + list(other)
+        return NotImplemented
+
+    def __radd__(self, other):
+        """Return a plain list of the other features followed by these."""
+        if isinstance(other, list):
+            return list(other) + list(self)
+        return NotImplemented
+
+    def __mul__(self, count):
+        """Return a plain list with the features repeated."""
+        return list(self) * count
+
+    __rmul__ = __mul__
+
+    def __reduce__(self):
+        """Pickle and copy as a plain list of parsed features."""
+        return (list, (list(self),))
+
+    def __repr__(self):
+        """Return the representation of the list of features."""
+        return repr(list(self))
+
+    def copy(self):
+        """Return a shallow copy as a plain list."""
+        return list(self)
+
+    def count(self, value):
+        """Return the number of occurrences of the feature."""
+        self._parse_all()
+        return list.count(self, value)
+
+    def index(self, value, *args):
+        """Return the first index of the feature."""
+        self._parse_all()
+        return list.index(self, value, *args)
+
+    def pop(self, index=-1):
+        """Remove and return the feature at the index (default last)."""
+        if self:
+            self._parse(index)
+        return list.pop(self, index)
+
+    def remove(self, value):
+        """Remove the first occurrence of the feature."""
+        self._parse_all()
+        list.remove(self, value)
+
+    def sort(self, *args, **kwargs):
+        """Sort the features in place."""
+        self._parse_all()
+        list.sort(self, *args, **kwargs)
+
+
 class EmblScanner(InsdcScanner):
     """For extracting chunks of information in EMBL files."""
 
@@ -638,8 +864,12 @@ class EmblScanner(InsdcScanner):
     EMBL_INDENT = HEADER_WIDTH
     EMBL_SPACER = " " * EMBL_INDENT
 
-    def parse_footer(self):
-        """Return a tuple containing a list of any misc strings, and the sequence."""
+    def parse_footer(self, skip_sequence=False):
+        """Return a tuple containing a list of any misc strings, and the sequence.
+
+        With skip_sequence=True, the sequence lines are read but not parsed,
+        and an empty string is returned for the sequence.
+        """
         if self.line[: self.HEADER_WIDTH].rstrip() not in self.SEQUENCE_HEADERS:
             raise ValueError("Footer format unexpected: '%s'" % self.line)
 
@@ -658,6 +888,15 @@ class EmblScanner(InsdcScanner):
         ):
             raise ValueError("Unexpected content after SQ or CO line: %r" % self.line)
 
+        if skip_sequence:
+            line = self.line
+            while line.strip() != "//":
+                if not line:
+                    raise ValueError("Premature end of file in sequence data")
+                line = self.handle.readline()
+            self.line = line.strip()
+            return misc_lines, ""
+
         seq_lines = []
         line = self.line
         while True:
@@ -1026,6 +1265,8 @@ class _ImgtScanner(EmblScanner):
         "FH",
     ]
 
+    _bad_position_re = re.compile(r"([0-9]+)>")
+
     def _feed_first_line(self, consumer, line):
         assert line[: self.HEADER_WIDTH].rstrip() == "ID"
         if line[self.HEADER_WIDTH :].count(";") != 5:
@@ -1080,7 +1321,7 @@ class _ImgtScanner(EmblScanner):
         consumer.data_file_division(fields[4])
         self._feed_seq_length(consumer, fields[5])
 
-    def parse_features(self, skip=False):
+    def parse_features(self, skip=False, lazy=False, qualifiers=True):
         """Return list of tuples for the features (if present).
 
         Each feature is returned as a tuple (key, location, qualifiers)
@@ -1088,6 +1329,8 @@ class _ImgtScanner(EmblScanner):
         "complement(join(490883..490885,1..879))") while qualifiers
         is a list of two string tuples (feature qualifier keys and values).
 
+        See the base class for the lazy and qualifiers arguments.
+
         Assumes you have already read to the start of the features table.
         """
         if self.line.rstrip() not in self.FEATURE_START_MARKERS:
@@ -1098,8 +1341,6 @@ class _ImgtScanner(EmblScanner):
         while self.line.rstrip() in self.FEATURE_START_MARKERS:
             self.line = self.handle.readline()
 
-        bad_position_re = re.compile(r"([0-9]+)>")
-
         features = []
         line = self.line
         while True:
@@ -1152,22 +1393,32 @@ class _ImgtScanner(EmblScanner):
                     assert line[:2] == "FT"
                     feature_lines.append(line[self.FEATURE_QUALIFIER_INDENT :].strip())
                     line = self.handle.readline()
-                feature_key, location, qualifiers = self.parse_feature(
-                    feature_key, feature_lines
+                features.append(
+                    self._parse_feature_lines(
+                        feature_key, feature_lines, lazy, qualifiers
+                    )
                 )
-                # Try to handle known problems with IMGT locations here:
-                if ">" in location:
-                    # Nasty hack for common IMGT bug, should be >123 not 123>
-                    # in a location string. At least here the meaning is clear,
-                    # and since it is so common I don't want to issue a warning
-                    # warnings.warn("Feature location %s is invalid, "
-                    #              "moving greater than sign before position"
-                    #              % location, BiopythonParserWarning)
-                    location = bad_position_re.sub(r">\1", location)
-                features.append((feature_key, location, qualifiers))
         self.line = line
         return features
 
+    def parse_feature(self, feature_key, lines):
+        """Parse a feature given as a list of strings into a tuple.
+
+        As in the base class, but also fixes a common problem with IMGT
+        locations.
+        """
+        feature_key, location, qualifiers = super().parse_feature(feature_key, lines)
+        # Try to handle known problems with IMGT locations here:
+        if ">" in location:
+            # Nasty hack for common IMGT bug, should be >123 not 123>
+            # in a location string. At least here the meaning is clear,
+            # and since it is so common I don't want to issue a warning
+            # warnings.warn("Feature location %s is invalid, "
+            #              "moving greater than sign before position"
+            #              % location, BiopythonParserWarning)
+            location = self._bad_position_re.sub(r">\1", location)
+        return feature_key, location, qualifiers
+
 
 class GenBankScanner(InsdcScanner):
     """For extracting chunks of information in GenBank files."""
@@ -1194,8 +1445,12 @@ class GenBankScanner(InsdcScanner):
     STRUCTURED_COMMENT_END = "-END##"
     STRUCTURED_COMMENT_DELIM = " :: "
 
-    def parse_footer(self):
-        """Return a tuple containing a list of any misc strings, and the sequence."""
+    def parse_footer(self, skip_sequence=False):
+        """Return a tuple containing a list of any misc strings, and the sequence.
+
+        With skip_sequence=True, the sequence lines are read but not parsed,
+        and an empty string is returned for the sequence.
+        """
         if self.line[: self.HEADER_WIDTH].rstrip() not in self.SEQUENCE_HEADERS:
             raise ValueError("Footer format unexpected:  '%s'" % self.line)
 
@@ -1216,6 +1471,19 @@ class GenBankScanner(InsdcScanner):
 
         # Now just consume the sequence lines until reach the // marker
         # or a CONTIG line
+        if skip_sequence:
+            line = self.line
+            while line[:2] != "//" and not line.startswith("CONTIG"):
+                if not line:
+                    warnings.warn(
+                        "Premature end of file in sequence data", BiopythonParserWarning
+                    )
+                    line = "//"
+                    break
+                line = self.handle.readline()
+            self.line = line.rstrip()
+            return misc_lines, ""
+
         seq_lines = []
         line = self.line
         while True:
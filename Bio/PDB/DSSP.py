@@ -54,6 +54,14 @@ Typical use::
     model = structure[0]
     dssp = DSSP(model, "/local-pdb/1mot.pdb")
 
+The secondary structure can also be assigned without the DSSP program,
+using the implementation of the DSSP algorithm in this module. Here the
+solvent accessibility is calculated with the Shrake-Rupley algorithm from
+Bio.PDB.SASA using the DSSP atomic radii, so differs slightly from that given
+by the DSSP program::
+
+    dssp = DSSP(model)
+
 Note that the recent DSSP executable from the DSSP-2 package was
 renamed from ``dssp`` to ``mkdssp``. If using a recent DSSP release,
 you may need to provide the name of your DSSP executable::
@@ -94,6 +102,8 @@ from io import StringIO
 import subprocess
 import warnings
 
+import numpy
+
 from Bio.PDB.AbstractPropertyMap import AbstractResiduePropertyMap
 from Bio.PDB.PDBExceptions import PDBException
 from Bio.PDB.PDBParser import PDBParser
@@ -367,6 +377,404 @@ def _make_dssp_dict(handle):
     return dssp, keys
 
 
+# Constants from Kabsch and Sander (1983), as used by DSSP
+_HBOND_COUPLING = -27.888  # 0.42 * 0.20 * 332 kcal/mol
+_MIN_HBOND_ENERGY = -9.9
+_MAX_HBOND_ENERGY = -0.5
+_MIN_DISTANCE = 0.5
+_MAX_CA_DISTANCE = 9.0
+_MAX_PEPTIDE_BOND = 2.5
+
+# Atomic radii used by DSSP for the accessibility, with the same radius for
+# all the side chain atoms
+_ACCESSIBILITY_RADII = {"N": 1.65, "CA": 1.87, "C": 1.76, "O": 1.4}
+_SIDE_CHAIN_RADIUS = 1.8
+
+
+def _dihedrals(p0, p1, p2, p3):
+    """Return the dihedral angles in degrees for arrays of points (PRIVATE)."""
+    b0 = p0 - p1
+    b1 = p2 - p1
+    b2 = p3 - p2
+    b1 = b1 / numpy.linalg.norm(b1, axis=1)[:, numpy.newaxis]
+    v = b0 - numpy.einsum("ij,ij->i", b0, b1)[:, numpy.newaxis] * b1
+    w = b2 - numpy.einsum("ij,ij->i", b2, b1)[:, numpy.newaxis] * b1
+    x = numpy.einsum("ij,ij->i", v, w)
+    y = numpy.einsum("ij,ij->i", numpy.cross(b1, v), w)
+    return numpy.degrees(numpy.arctan2(y, x))
+
+
+def _best_two(owners, partners, energies, count):
+    """Return the two lowest energy partners of each residue (PRIVATE).
+
+    Returns arrays of shape (count, 2) with the partner indices (or -1 if
+    there are none) and their energies (or zero), lowest energy first.
+    """
+    order = numpy.lexsort((energies, owners))
+    owners = owners[order]
+    rank = numpy.arange(len(owners)) - numpy.searchsorted(owners, owners)
+    keep = rank < 2
+    indices = numpy.full((count, 2), -1)
+    values = numpy.zeros((count, 2))
+    indices[owners[keep], rank[keep]] = partners[order][keep]
+    values[owners[keep], rank[keep]] = energies[order][keep]
+    return indices, values
+
+
+def _hbond_energies(n_coords, ca_coords, c_coords, o_coords, h_coords, is_proline):
+    """Calculate the backbone hydrogen bond energies (PRIVATE).
+
+    Uses the electrostatic model of Kabsch and Sander for every pair of
+    residues with C-alpha atoms within 9 A of each other, found using the
+    KD tree. Returns the best two acceptors of each donor N-H, and the best
+    two donors of each acceptor C=O (see the _best_two function).
+    """
+    from Bio.PDB.kdtrees import KDTree
+
+    count = len(ca_coords)
+    pairs = KDTree(ca_coords, 10).neighbor_search(_MAX_CA_DISTANCE)
+    first = numpy.fromiter((pair.index1 for pair in pairs), int, len(pairs))
+    second = numpy.fromiter((pair.index2 for pair in pairs), int, len(pairs))
+    donors = numpy.concatenate((first, second))
+    acceptors = numpy.concatenate((second, first))
+    # Proline has no N-H, and like DSSP skip the preceding residue's C=O
+    keep = ~is_proline[donors] & (acceptors != donors - 1)
+    donors = donors[keep]
+    acceptors = acceptors[keep]
+
+    def distances(a, b):
+        return numpy.linalg.norm(a - b, axis=1)
+
+    d_ho = distances(h_coords[donors], o_coords[acceptors])
+    d_hc = distances(h_coords[donors], c_coords[acceptors])
+    d_nc = distances(n_coords[donors], c_coords[acceptors])
+    d_no = distances(n_coords[donors], o_coords[acceptors])
+    too_close = numpy.minimum(numpy.minimum(d_ho, d_hc), numpy.minimum(d_nc, d_no))
+    too_close = too_close < _MIN_DISTANCE
+    with numpy.errstate(divide="ignore", invalid="ignore"):
+        energies = _HBOND_COUPLING * (1 / d_ho - 1 / d_hc + 1 / d_nc - 1 / d_no)
+    energies = numpy.round(energies * 1000) / 1000
+    energies[too_close] = _MIN_HBOND_ENERGY
+    energies = numpy.maximum(energies, _MIN_HBOND_ENERGY)
+
+    bonded = energies < 0
+    donors = donors[bonded]
+    acceptors = acceptors[bonded]
+    energies = energies[bonded]
+    return (
+        _best_two(donors, acceptors, energies, count),
+        _best_two(acceptors, donors, energies, count),
+    )
+
+
+class _Bonded:
+    """Test for hydrogen bonds between arrays of residue indices (PRIVATE).
+
+    A donor N-H is bonded to an acceptor C=O if it is one of the donor's
+    two best acceptors, with an energy below -0.5 kcal/mol.
+    """
+
+    def __init__(self, partners, energies):
+        """Initialize the class."""
+        self.partners = numpy.where(energies < _MAX_HBOND_ENERGY, partners, -1)
+
+    def __call__(self, donors, acceptors):
+        """Return a boolean array, True where the pair is bonded."""
+        partners = self.partners[donors]
+        return (partners[:, 0] == acceptors) | (partners[:, 1] == acceptors)
+
+
+def _find_ladders(bonded, segments):
+    """Find the beta bridges and combine them into ladders (PRIVATE).
+
+    Arguments:
+     - bonded - a _Bonded object, to test for hydrogen bonds.
+     - segments - array giving the unbroken segment of each residue.
+
+    Returns a list of ladders, each a list of the type ("P" for parallel
+    or "A" for antiparallel), and the lists of indices on each side.
+    """
+    count = len(segments)
+    # Every bridge needs a hydrogen bond between residues i-1, i or i+1 and
+    # residues j-1, j or j+1, so only consider pairs near a hydrogen bond.
+    donors = numpy.arange(count).repeat(2)
+    acceptors = bonded.partners.ravel()
+    keep = acceptors >= 0
+    donors = donors[keep]
+    acceptors = acceptors[keep]
+    candidates = []
+    for shift_d in (-1, 0, 1):
+        for shift_a in (-1, 0, 1):
+            candidates.append(
+                numpy.stack((donors + shift_d, acceptors + shift_a), axis=1)
+            )
+    candidates = numpy.concatenate(candidates)
+    candidates.sort(axis=1)
+    i, j = candidates[:, 0], candidates[:, 1]
+    keep = (i >= 1) & (i + 4 < count) & (j >= i + 3) & (j + 1 < count)
+    # Sort by i then j, as DSSP loops over the residues
+    pairs = numpy.unique(i[keep] * count + j[keep])
+    i, j = pairs // count, pairs % count
+    unbroken = (segments[i - 1] == segments[i + 1]) & (
+        segments[j - 1] == segments[j + 1]
+    )
+    parallel = unbroken & (
+        (bonded(i + 1, j) & bonded(j, i - 1)) | (bonded(j + 1, i) & bonded(i, j - 1))
+    )
+    antiparallel = (
+        unbroken
+        & ~parallel
+        & (
+            (bonded(i + 1, j - 1) & bonded(j + 1, i - 1))
+            | (bonded(j, i) & bonded(i, j))
+        )
+    )
+
+    ladders = []
+    for i, j, is_parallel in zip(
+        i[parallel | antiparallel].tolist(),
+        j[parallel | antiparallel].tolist(),
+        parallel[parallel | antiparallel].tolist(),
+    ):
+        bridge_type = "P" if is_parallel else "A"
+        for ladder in ladders:
+            if ladder[0] != bridge_type or i != ladder[1][-1] + 1:
+                continue
+            if bridge_type == "P" and ladder[2][-1] + 1 == j:
+                ladder[1].append(i)
+                ladder[2].append(j)
+                break
+            if bridge_type == "A" and ladder[2][0] - 1 == j:
+                ladder[1].append(i)
+                ladder[2].insert(0, j)
+                break
+        else:
+            ladders.append([bridge_type, [i], [j]])
+
+    # Join ladders separated by a beta bulge
+    a = 0
+    while a < len(ladders):
+        b = a + 1
+        while b < len(ladders):
+            type_a, i_a, j_a = ladders[a]
+            type_b, i_b, j_b = ladders[b]
+            if (
+                type_a != type_b
+                or segments[min(i_a[0], i_b[0])] != segments[max(i_a[-1], i_b[-1])]
+                or segments[min(j_a[0], j_b[0])] != segments[max(j_a[-1], j_b[-1])]
+                or i_b[0] - i_a[-1] >= 6
+                or (i_a[-1] >= i_b[0] and i_a[0] <= i_b[-1])
+            ):
+                b += 1
+                continue
+            if type_a == "P":
+                bulge = (j_b[0] - j_a[-1] < 6 and i_b[0] - i_a[-1] < 3) or (
+                    j_b[0] - j_a[-1] < 3
+                )
+            else:
+                bulge = (j_a[0] - j_b[-1] < 6 and i_b[0] - i_a[-1] < 3) or (
+                    j_a[0] - j_b[-1] < 3
+                )
+            if bulge:
+                i_a.extend(i_b)
+                if type_a == "P":
+                    j_a.extend(j_b)
+                else:
+                    j_a[:0] = j_b
+                del ladders[b]
+            else:
+                b += 1
+        a += 1
+    return ladders
+
+
+def _assign_secondary_structure(bonded, segments, ca_coords):
+    """Return the DSSP secondary structure codes as a list (PRIVATE)."""
+    count = len(segments)
+    index = numpy.arange(count)
+    codes = ["-"] * count
+
+    # Beta bridges (B) and ladders (E)
+    for _, i_side, j_side in _find_ladders(bonded, segments):
+        code = "E" if len(i_side) > 1 else "B"
+        for side in (i_side, j_side):
+            for k in range(side[0], side[-1] + 1):
+                if codes[k] != "E":
+                    codes[k] = code
+
+    # An n-turn at i has a hydrogen bond from the N-H of i+n to C=O of i
+    turns = {}
+    for n in (3, 4, 5):
+        starts = numpy.zeros(count, bool)
+        i = index[: max(count - n, 0)]
+        starts[i] = (segments[i] == segments[i + n]) & bonded(i + n, i)
+        turns[n] = starts.tolist()
+
+    # Helices need two consecutive turns; the alpha helix (H) has priority
+    # over the 3-10 helix (G) and the pi helix (I)
+    for n, code in ((4, "H"), (3, "G"), (5, "I")):
+        starts = turns[n]
+        for i in range(1, count - n):
+            if starts[i] and starts[i - 1]:
+                if code == "H" or all(c in ("-", code) for c in codes[i : i + n]):
+                    codes[i : i + n] = [code] * n
+
+    # Bends where the angle between C-alpha i-2, i and i+2 exceeds 70 degrees
+    bends = [False] * count
+    if count > 4:
+        i = index[2:-2]
+        v1 = ca_coords[i] - ca_coords[i - 2]
+        v2 = ca_coords[i + 2] - ca_coords[i]
+        cosines = numpy.einsum("ij,ij->i", v1, v2) / (
+            numpy.linalg.norm(v1, axis=1) * numpy.linalg.norm(v2, axis=1)
+        )
+        kappa = numpy.degrees(numpy.arccos(numpy.clip(cosines, -1, 1)))
+        bent = (kappa > 70) & (segments[i - 2] == segments[i + 2])
+        bends[2:-2] = bent.tolist()
+
+    # Residues within a turn (T), otherwise bends (S)
+    for i in range(1, count - 1):
+        if codes[i] != "-":
+            continue
+        if any(i >= k and turns[n][i - k] for n in (3, 4, 5) for k in range(1, n)):
+            codes[i] = "T"
+        elif bends[i]:
+            codes[i] = "S"
+    return codes
+
+
+def dssp_dict_from_model(model):
+    """Create a DSSP dictionary by assigning secondary structure in Python.
+
+    This is an implementation of the DSSP algorithm of Kabsch and Sander
+    (1983), which does not need the DSSP program. The backbone hydrogen bond
+    energies are calculated with NumPy, using the KD tree from
+    Bio.PDB.kdtrees to find the neighboring residues. The accessibility
+    is calculated with the Shrake-Rupley algorithm (see Bio.PDB.SASA) using
+    the atomic radii of the DSSP program, so may differ slightly from that
+    of the DSSP program which places its surface points differently.
+
+    Parameters
+    ----------
+    model : Model
+        the model to analyse; only the amino acid residues with all the
+        backbone atoms (N, CA, C and O) are used.
+
+    Returns
+    -------
+    (out_dict, keys) : tuple
+        a dictionary that maps (chainid, resid) to the same values as the
+        make_dssp_dict function, and a list of the keys in order.
+
+    Examples
+    --------
+    >>> from Bio.PDB.DSSP import dssp_dict_from_model
+    >>> structure = PDBParser().get_structure("2BEG", "PDB/2BEG.pdb")
+    >>> dssp_dict, keys = dssp_dict_from_model(structure[0])
+    >>> print("".join(dssp_dict[key][1] for key in keys[:26]))
+    -EEEEEEEEES--SEEEEEEEEEEE-
+
+    """
+    from Bio.PDB.SASA import ShrakeRupley
+
+    residues = []
+    keys = []
+    for chain in model:
+        for res in chain:
+            if res.id[0] == " " and all(name in res for name in "N CA C O".split()):
+                residues.append(res)
+                keys.append((chain.id, res.id))
+    if not residues:
+        return {}, []
+    count = len(residues)
+
+    backbone = numpy.array(
+        [[res[name].coord for name in ("N", "CA", "C", "O")] for res in residues],
+        dtype=numpy.float64,
+    )
+    n_coords, ca_coords, c_coords, o_coords = numpy.ascontiguousarray(
+        backbone.transpose(1, 0, 2)
+    )
+
+    # Start a new segment at each new chain and each missing peptide bond
+    breaks = numpy.ones(count, bool)
+    peptide_bonds = numpy.linalg.norm(n_coords[1:] - c_coords[:-1], axis=1)
+    breaks[1:] = peptide_bonds > _MAX_PEPTIDE_BOND
+    chain_ids = [key[0] for key in keys]
+    breaks[1:] |= numpy.array(chain_ids[1:]) != numpy.array(chain_ids[:-1])
+    segments = numpy.cumsum(breaks)
+    # DSSP numbers the residues, counting each break as one
+    numbers = numpy.arange(count) + segments
+
+    # Place the amide hydrogen opposite the previous residue's C=O
+    h_coords = n_coords.copy()
+    carbonyls = c_coords[:-1] - o_coords[:-1]
+    carbonyls /= numpy.linalg.norm(carbonyls, axis=1)[:, numpy.newaxis]
+    h_coords[1:][~breaks[1:]] += carbonyls[~breaks[1:]]
+    is_proline = numpy.array([res.get_resname() == "PRO" for res in residues])
+
+    donor_bonds, acceptor_bonds = _hbond_energies(
+        n_coords, ca_coords, c_coords, o_coords, h_coords, is_proline
+    )
+    bonded = _Bonded(*donor_bonds)
+    codes = _assign_secondary_structure(bonded, segments, ca_coords)
+
+    # Backbone torsion angles, 360 where undefined
+    phi = numpy.full(count, 360.0)
+    psi = numpy.full(count, 360.0)
+    if count > 1:
+        joined = segments[1:] == segments[:-1]
+        angles = _dihedrals(c_coords[:-1], n_coords[1:], ca_coords[1:], c_coords[1:])
+        phi[1:][joined] = numpy.round(angles[joined], 1)
+        angles = _dihedrals(n_coords[:-1], ca_coords[:-1], c_coords[:-1], n_coords[1:])
+        psi[:-1][joined] = numpy.round(angles[joined], 1)
+
+    # Accessibility of the residues, ignoring any hydrogens, with the DSSP
+    # radii and more surface points than the default to be closer to DSSP
+    atoms = []
+    sizes = []
+    for res in residues:
+        res_atoms = [atom for atom in res.get_atoms() if atom.element not in ("H", "D")]
+        atoms.extend(res_atoms)
+        sizes.append(len(res_atoms))
+    radii = [
+        _ACCESSIBILITY_RADII.get(atom.get_id(), _SIDE_CHAIN_RADIUS) for atom in atoms
+    ]
+    asa = ShrakeRupley(n_points=200)._compute_atoms(atoms, radii)
+    starts = numpy.cumsum(sizes) - sizes
+    acc = numpy.add.reduceat(asa, starts)
+
+    partners = []
+    for indices, energies in (donor_bonds, acceptor_bonds):
+        relidx = numpy.where(indices >= 0, numbers[indices] - numbers[:, None], 0)
+        partners.append((relidx.tolist(), numpy.round(energies, 1).tolist()))
+    (nh_o_relidx, nh_o_energy), (o_nh_relidx, o_nh_energy) = partners
+
+    dssp = {}
+    for k, (key, res) in enumerate(zip(keys, residues)):
+        try:
+            aa = three_to_one(res.get_resname())
+        except KeyError:
+            aa = "X"
+        dssp[key] = (
+            aa,
+            codes[k],
+            int(round(acc[k])),
+            float(phi[k]),
+            float(psi[k]),
+            int(numbers[k]),
+            nh_o_relidx[k][0],
+            nh_o_energy[k][0],
+            o_nh_relidx[k][0],
+            o_nh_energy[k][0],
+            nh_o_relidx[k][1],
+            nh_o_energy[k][1],
+            o_nh_relidx[k][1],
+            o_nh_energy[k][1],
+        )
+    return dssp, keys
+
+
 class DSSP(AbstractResiduePropertyMap):
     """Run DSSP and parse secondary structure and accessibility.
 
@@ -385,6 +793,8 @@ class DSSP(AbstractResiduePropertyMap):
         structure = p.get_structure("1MOT", "/local-pdb/1mot.pdb")
         model = structure[0]
         dssp = DSSP(model, "/local-pdb/1mot.pdb")
+        # Or without the DSSP program:
+        dssp = DSSP(model)
         # DSSP data is accessed by a tuple (chain_id, res_id)
         a_key = list(dssp.keys())[2]
         # (dssp index, amino acid, secondary structure, relative ASA, phi, psi,
@@ -395,7 +805,7 @@ class DSSP(AbstractResiduePropertyMap):
     """
 
     def __init__(
-        self, model, in_file, dssp="dssp", acc_array="Sander", file_type="PDB"
+        self, model, in_file=None, dssp="dssp", acc_array="Sander", file_type="PDB"
     ):
         """Create a DSSP object.
 
@@ -404,7 +814,9 @@ class DSSP(AbstractResiduePropertyMap):
         model : Model
             The first model of the structure
         in_file : string
-            Either a PDB file or a DSSP file.
+            Either a PDB file or a DSSP file. If omitted, the secondary
+            structure is assigned in Python without running the DSSP
+            program (see the dssp_dict_from_model function).
         dssp : string
             The dssp executable (ie. the argument to subprocess)
         acc_array : string
@@ -420,8 +832,11 @@ class DSSP(AbstractResiduePropertyMap):
         # create DSSP dictionary
         file_type = file_type.upper()
         assert file_type in ["PDB", "DSSP"]
+        # Without an input file assign the secondary structure ourselves:
+        if in_file is None:
+            dssp_dict, dssp_keys = dssp_dict_from_model(model)
         # If the input file is a PDB file run DSSP and parse output:
-        if file_type == "PDB":
+        elif file_type == "PDB":
             # Newer versions of DSSP program call the binary 'mkdssp', so
             # calling 'dssp' will not work in some operating systems
             # (Debian distribution of DSSP includes a symlink for 'dssp' argument)
@@ -11,6 +11,8 @@ It is a simple container class, with list and dictionary like properties.
 
 from copy import copy
 
+import numpy
+
 from Bio.PDB.PDBExceptions import PDBConstructionException
 
 
@@ -288,9 +290,71 @@ class Entity:
             translation = array((0, 0, 1), 'f')
             entity.transform(rotation, translation)
 
+        The coordinates of all the atoms are transformed together with a
+        single matrix multiplication.
+        """
+        self.set_coords(numpy.dot(self.get_coords(), rot) + tran)
+
+    def get_coords(self):
+        """Return the atomic coordinates as an (N, 3) NumPy array.
+
+        The rows follow the order of the atoms from the get_atoms method,
+        so for disordered atoms (and residues) only the selected one is
+        included. See also the set_coords method.
+        """
+        coords = [atom.coord for atom in self.get_atoms()]
+        if not coords:
+            return numpy.zeros((0, 3), "f")
+        return numpy.array(coords)
+
+    def set_coords(self, coords):
+        """Set the atomic coordinates from an (N, 3) array.
+
+        The rows must follow the order of the atoms from the get_atoms
+        method, as returned by the get_coords method. The coordinates are
+        copied into a single new array, with the coordinates of each atom
+        a view of one row. For example, to centre a structure on the origin:
+
+        >>> from Bio.PDB.PDBParser import PDBParser
+        >>> structure = PDBParser().get_structure("1A8O", "PDB/1A8O.pdb")
+        >>> coords = structure.get_coords()
+        >>> coords.shape
+        (644, 3)
+        >>> structure.set_coords(coords - coords.mean(axis=0))
+        >>> print(abs(structure.get_coords().mean(axis=0)).max() < 0.001)
+        True
+
+        """
+        atoms = list(self.get_atoms())
+        coords = numpy.array(coords)
+        if coords.shape != (len(atoms), 3):
+            raise ValueError(
+                "Expected an array of shape (%i, 3), not %r"
+                % (len(atoms), coords.shape)
+            )
+        for atom, coord in zip(atoms, coords):
+            atom.set_coord(coord)
+
+    def get_bfactors(self):
+        """Return the B factors of the atoms as a NumPy array.
+
+        This is parallel to the array from the get_coords method.
+        """
+        return numpy.array([atom.bfactor for atom in self.get_atoms()], "f")
+
+    def get_occupancies(self):
+        """Return the occupancies of the atoms as a NumPy array.
+
+        This is parallel to the array from the get_coords method.
+        """
+        return numpy.array([atom.occupancy for atom in self.get_atoms()], "f")
+
+    def get_elements(self):
+        """Return the element symbols of the atoms as a NumPy array of strings.
+
+        This is parallel to the array from the get_coords method.
         """
-        for o in self.get_list():
-            o.transform(rot, tran)
+        return numpy.array([atom.element for atom in self.get_atoms()], str)
 
     def copy(self):
         """Copy entity recursively."""
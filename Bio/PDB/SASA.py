@@ -0,0 +1,273 @@
+# Copyright 2020 by the Biopython developers.  All rights reserved.
+#
+# This file is part of the Biopython distribution and governed by your
+# choice of the "Biopython License Agreement" or the "BSD 3-Clause License".
+# Please see the LICENSE file that should have been included as part of this
+# package.
+
+"""Calculation of solvent accessible surface areas for Bio.PDB entities.
+
+Uses the "rolling ball" algorithm developed by Shrake & Rupley (1973),
+without the need for external programs such as NACCESS or MSMS.
+
+Shrake, A; Rupley, JA. (1973). J Mol Biol
+"Environment and exposure to solvent of protein atoms. Lysozyme and insulin".
+
+Each atom is represented by a set of points evenly distributed on a sphere
+of radius equal to its van der Waals radius plus the probe radius. A point
+is accessible if it is not inside the expanded sphere of any neighboring
+atom, and the area of the atom is the fraction of accessible points times
+the area of its sphere.
+
+See the ShrakeRupley class for an example.
+"""
+
+import numpy
+
+from Bio.PDB.kdtrees import KDTree
+from Bio.PDB.PDBExceptions import PDBException
+
+__all__ = ["ShrakeRupley"]
+
+# Van der Waals radii from Bondi (1964) J Phys Chem, with hydrogen as 1.2
+# as recommended by Rowland and Taylor (1996) J Phys Chem, and calcium
+# from Mantina et al. (2009) J Phys Chem A.
+ATOMIC_RADII = {
+    "H": 1.200,
+    "HE": 1.400,
+    "C": 1.700,
+    "N": 1.550,
+    "O": 1.520,
+    "F": 1.470,
+    "NA": 2.270,
+    "MG": 1.730,
+    "P": 1.800,
+    "S": 1.800,
+    "CL": 1.750,
+    "K": 2.750,
+    "CA": 2.310,
+    "NI": 1.630,
+    "CU": 1.400,
+    "ZN": 1.390,
+    "SE": 1.900,
+    "BR": 1.850,
+    "CD": 1.580,
+    "I": 1.980,
+    "HG": 1.550,
+}
+
+
+class ShrakeRupley:
+    """Calculates SASAs using the Shrake-Rupley algorithm."""
+
+    def __init__(self, probe_radius=1.40, n_points=100, radii_dict=None):
+        """Initialize the class.
+
+        :param probe_radius: radius of the probe in A. Default is 1.40, roughly
+            the radius of a water molecule.
+        :type probe_radius: float
+
+        :param n_points: resolution of the surface of each atom. Default is 100.
+            A higher number of points results in more precise measurements,
+            but slows down the calculation.
+        :type n_points: int
+
+        :param radii_dict: user-provided dictionary of atomic radii to use in
+            the calculation, keyed by upper case element symbol. Values will
+            replace/complement those in the default ATOMIC_RADII dictionary.
+        :type radii_dict: dict
+
+        >>> sr = ShrakeRupley()
+        >>> sr = ShrakeRupley(n_points=960)
+        >>> sr = ShrakeRupley(radii_dict={"O": 3.1415})
+
+        """
+        if probe_radius <= 0.0:
+            raise ValueError(
+                "Probe radius must be a positive number: %s <= 0" % probe_radius
+            )
+        self.probe_radius = float(probe_radius)
+
+        if n_points < 1:
+            raise ValueError(
+                "Number of sphere points must be larger than 1: %s" % n_points
+            )
+        self.n_points = n_points
+
+        # Update radii list with user provided lists.
+        self.radii_dict = ATOMIC_RADII.copy()
+        if radii_dict is not None:
+            self.radii_dict.update(radii_dict)
+
+        # Pre-compute reference sphere
+        self._sphere = self._compute_sphere()
+
+    def _compute_sphere(self):
+        """Return the coordinates of evenly distributed points on a sphere (PRIVATE).
+
+        Uses the golden spiral algorithm to place points 'evenly' on the
+        surface of a sphere of radius one, centered on the origin.
+        """
+        n = self.n_points
+
+        dl = numpy.pi * (3 - 5 ** 0.5)
+        dz = 2.0 / n
+
+        longitude = 0
+        z = 1 - dz / 2
+
+        coords = numpy.zeros((n, 3), dtype=numpy.float64)
+        for k in range(n):
+            r = (1 - z * z) ** 0.5
+            coords[k, 0] = numpy.cos(longitude) * r
+            coords[k, 1] = numpy.sin(longitude) * r
+            coords[k, 2] = z
+            z -= dz
+            longitude += dl
+
+        return coords
+
+    def _find_neighbors(self, coords, radii):
+        """Return the neighbors of each atom as index arrays (PRIVATE).
+
+        Two atoms are neighbors if their expanded spheres overlap. Uses the
+        KD tree to find all the candidate pairs in a single search.
+        """
+        n_atoms = len(coords)
+        kdt = KDTree(coords, 10)
+        pairs = kdt.neighbor_search(2 * radii.max())
+        first = numpy.fromiter((pair.index1 for pair in pairs), int, len(pairs))
+        second = numpy.fromiter((pair.index2 for pair in pairs), int, len(pairs))
+        distances = numpy.fromiter((pair.radius for pair in pairs), float, len(pairs))
+        overlap = distances < radii[first] + radii[second]
+        first = first[overlap]
+        second = second[overlap]
+        # Each pair once from each side, grouped by the first atom
+        first, second = (
+            numpy.concatenate((first, second)),
+            numpy.concatenate((second, first)),
+        )
+        order = numpy.argsort(first, kind="stable")
+        ends = numpy.cumsum(numpy.bincount(first, minlength=n_atoms))
+        return numpy.split(second[order], ends[:-1])
+
+    def _compute_atoms(self, atoms, radii=None):
+        """Return an array of the surface area of each atom in a list (PRIVATE).
+
+        The atomic radii are taken from the radii dictionary using the element
+        of each atom, unless given as a sequence of the same length as atoms.
+        """
+        n_atoms = len(atoms)
+        coords = numpy.array([a.coord for a in atoms], dtype=numpy.float64)
+
+        # Pre-compute atom neighbors using KDTree
+        if radii is None:
+            radii_dict = self.radii_dict
+            try:
+                radii = numpy.array([radii_dict[a.element] for a in atoms])
+            except KeyError as err:
+                raise PDBException(
+                    "No radius for element %s, "
+                    "use the radii_dict argument to give one" % err
+                ) from None
+        else:
+            radii = numpy.array(radii, dtype=numpy.float64)
+        radii += self.probe_radius
+        neighbors = self._find_neighbors(coords, radii)
+
+        # Test the sphere points of each atom against all its neighbors
+        # at once, counting those outside all the neighbor spheres.
+        sphere = self._sphere
+        squared_radii = radii * radii
+        accessible = numpy.empty(n_atoms, dtype=numpy.int64)
+        for i in range(n_atoms):
+            points = sphere * radii[i] + coords[i]
+            j = neighbors[i]
+            if len(j):
+                delta = points[:, numpy.newaxis, :] - coords[j]
+                squared_distances = numpy.einsum("ijk,ijk->ij", delta, delta)
+                buried = (squared_distances < squared_radii[j]).any(axis=1)
+                accessible[i] = len(points) - numpy.count_nonzero(buried)
+            else:
+                accessible[i] = len(points)
+
+        # Convert accessible point count to surface area in A**2
+        return 4 * numpy.pi * squared_radii * accessible / self.n_points
+
+    def compute(self, entity, level="A"):
+        """Calculate surface accessibility surface area for an entity.
+
+        The resulting atomic surface accessibility values are attached to the
+        .sasa attribute of each entity (or atom), depending on the level. For
+        example, if level="R", all residues will have a .sasa attribute. Atoms
+        will always be assigned a .sasa attribute with their individual values.
+
+        :param entity: input entity.
+        :type entity: Bio.PDB.Entity, e.g. Residue, Chain, ...
+
+        :param level: the level at which ASA values are assigned, which can be
+            one of "A" (Atom), "R" (Residue), "C" (Chain), "M" (Model), or
+            "S" (Structure). The ASA value of an entity is the sum of all ASA
+            values of its children. Defaults to "A".
+        :type level: str
+
+        >>> from Bio.PDB import PDBParser
+        >>> from Bio.PDB.SASA import ShrakeRupley
+        >>> p = PDBParser(QUIET=1)
+        >>> struct = p.get_structure("1LCD", "PDB/1LCD.pdb")
+        >>> sr = ShrakeRupley()
+        >>> sr.compute(struct[0], level="M")
+        >>> print(round(struct[0].sasa, 2))
+        6745.6
+        >>> print(round(struct[0]["A"][11]["OE1"].sasa, 2))
+        43.93
+
+        """
+        is_valid = hasattr(entity, "level") and entity.level in {"R", "C", "M", "S"}
+        if not is_valid:
+            raise ValueError(
+                "Invalid entity type '%s'. "
+                "Must be Residue, Chain, Model, or Structure" % type(entity)
+            )
+
+        levels = ("A", "R", "C", "M", "S")
+        if level not in levels:
+            raise ValueError("Invalid level '%s'. Must be A, R, C, M, or S." % level)
+        if levels.index(level) > levels.index(entity.level):
+            raise ValueError(
+                "Level '%s' must be equal or smaller than input entity: %s"
+                % (level, entity.level)
+            )
+
+        # The models of a structure are alternatives, so each is done alone
+        if entity.level == "S":
+            groups = [list(model.get_atoms()) for model in entity]
+        else:
+            groups = [list(entity.get_atoms())]
+        atoms = [atom for group in groups for atom in group]
+        if not atoms:
+            raise PDBException("Entity has no child atoms.")
+        asa_array = numpy.concatenate(
+            [self._compute_atoms(group) for group in groups if group]
+        )
+
+        # Set atom .sasa
+        asa_list = asa_array.tolist()
+        for atom, asa in zip(atoms, asa_list):
+            atom.sasa = asa
+
+        # Aggregate values per entity level if necessary
+        if level != "A":
+            depth = levels.index(level)
+            totals = {}
+            for atom, asa in zip(atoms, asa_list):
+                parent = atom
+                for _ in range(depth):
+                    parent = parent.get_parent()
+                key = id(parent)
+                if key in totals:
+                    totals[key][1] += asa
+                else:
+                    totals[key] = [parent, asa]
+            for parent, asa in totals.values():
+                parent.sasa = asa
@@ -0,0 +1,750 @@
+# Copyright 2020 by the Biopython developers.  All rights reserved.
+#
+# This file is part of the Biopython distribution and governed by your
+# choice of the "Biopython License Agreement" or the "BSD 3-Clause License".
+# Please see the LICENSE file that should have been included as part of this
+# package.
+
+"""Fast columnar parsing of the atoms in PDB and mmCIF files.
+
+The PDBParser and MMCIFParser classes parse each atom record on its own,
+which is slow for very large structures such as cryo-EM assemblies. The
+functions in this module read all the atom records of a file in bulk into
+NumPy arrays, one array (column) per field, held in a dictionary:
+
+ - model - int, index of the model (the id of the Model object)
+ - serial - int, atom serial number (zero if missing)
+ - name - str, atom name without spaces, e.g. "CA"
+ - fullname - str, atom name including spaces, e.g. " CA "
+ - altloc - str, alternative location specifier, or " "
+ - resname - str, residue name, e.g. "ASN"
+ - chain - str, chain identifier
+ - resseq - int, residue sequence number
+ - icode - str, insertion code, or " "
+ - hetero - str, hetero flag, "W" for waters, "H" for other hetero
+   residues, otherwise " "
+ - segid - str, segment identifier
+ - element - str, upper case element symbol, e.g. "HG"
+ - coord - float32 array of shape (N, 3), the atomic coordinates
+ - occupancy - float, NaN if missing
+ - bfactor - float, B factor
+
+There is also a model_serial entry holding the serial number of each model
+given in the file (e.g. in the PDB MODEL records), and if the file has
+anisotropic B factors an anisou entry of shape (N, 6), with NaN for the
+atoms without one. Likewise the columns from a Structure object may have
+siguij and sigatm entries, of shape (N, 6) and (N, 5).
+
+The columns can be used directly for numerical work on the coordinates,
+or turned into the usual Structure object with the build_structure
+function (and back again with the columns_from_structure function):
+
+>>> from Bio.PDB.atom_columns import read_pdb_columns, build_structure
+>>> columns = read_pdb_columns("PDB/1A8O.pdb")
+>>> print(len(columns["name"]))
+644
+>>> print(columns["name"][:4])
+['N' 'CA' 'C' 'O']
+>>> print(columns["coord"].shape)
+(644, 3)
+>>> structure = build_structure("1A8O", columns)
+>>> print(len(list(structure.get_atoms())))
+644
+
+Unlike the PDBParser, the header is not parsed, and the ANISOU records are
+the only records other than the coordinates which are used (e.g. the SIGATM
+and SIGUIJ records are ignored). PQR files are not supported.
+
+The save_structure and load_structure functions use the columns to store a
+Structure object in a compact binary file, for example as a cache to avoid
+parsing the same files again.
+"""
+
+import io
+import json
+import warnings
+from operator import attrgetter
+
+import numpy
+
+from Bio.File import as_handle
+
+from Bio.PDB.MMCIF2Dict import MMCIF2Dict
+from Bio.PDB.PDBExceptions import PDBConstructionException
+from Bio.PDB.PDBExceptions import PDBConstructionWarning
+from Bio.PDB.StructureBuilder import StructureBuilder
+
+# Columns (start, end) of the fields in the ATOM/HETATM records
+_PDB_FIELDS = {
+    "serial": (6, 11),
+    "fullname": (12, 16),
+    "altloc": (16, 17),
+    "resname": (17, 20),
+    "chain": (21, 22),
+    "resseq": (22, 26),
+    "icode": (26, 27),
+    "x": (30, 38),
+    "y": (38, 46),
+    "z": (46, 54),
+    "occupancy": (54, 60),
+    "bfactor": (60, 66),
+    "segid": (72, 76),
+    "element": (76, 78),
+}
+
+# Columns of the six ANISOU values, as used by the PDBParser
+_PDB_ANISOU_FIELDS = ((28, 35), (35, 42), (43, 49), (49, 56), (56, 63), (63, 70))
+
+_MMCIF_ANISOU_KEYS = (
+    "U[1][1]",
+    "U[1][2]",
+    "U[1][3]",
+    "U[2][2]",
+    "U[2][3]",
+    "U[3][3]",
+)
+
+# Optional per-atom arrays: column, Atom attribute, StructureBuilder method
+# and number of values
+_ATOM_ARRAYS = (
+    ("anisou", "anisou_array", "set_anisou", 6),
+    ("siguij", "siguij_array", "set_siguij", 6),
+    ("sigatm", "sigatm_array", "set_sigatm", 5),
+)
+
+# A quote or a semicolon at the start of a token, which str.split would
+# not handle (a quote within a token, as in the atom name O5', is fine)
+_quoted_starts = [space + quote for space in " \t\n" for quote in "'\""] + ["\n;"]
+
+
+def _fixed_width(records, start, end):
+    """Return one field of fixed width records as an array of bytes (PRIVATE)."""
+    field = numpy.ascontiguousarray(records[:, start:end])
+    return field.view("S%i" % (end - start)).ravel()
+
+
+def _to_str(values, strip=True):
+    """Return an array of bytes or str as an array of str (PRIVATE)."""
+    if values.dtype.kind == "S":
+        values = numpy.char.decode(values, "latin-1")
+    if strip:
+        values = numpy.char.strip(values)
+    return values
+
+
+def _to_float(values, label, default):
+    """Return an array of text as float, with a default if invalid (PRIVATE).
+
+    Invalid or missing values give a PDBConstructionWarning.
+    """
+    try:
+        return values.astype(float)
+    except ValueError:
+        pass
+    result = numpy.empty(len(values), float)
+    for i, value in enumerate(values.tolist()):
+        try:
+            result[i] = float(value)
+        except ValueError:
+            result[i] = default
+    warnings.warn("Invalid or missing %s" % label, PDBConstructionWarning)
+    return result
+
+
+def _to_int(values, label):
+    """Return an array of text as int (PRIVATE)."""
+    try:
+        return values.astype(int)
+    except ValueError:
+        raise PDBConstructionException("Invalid or missing %s" % label) from None
+
+
+def _hetero_flags(is_hetatm, resname):
+    """Return the hetero flag of each atom as used in residue ids (PRIVATE)."""
+    water = (resname == "HOH") | (resname == "WAT")
+    hetero = numpy.full(len(resname), " ", "U1")
+    hetero[is_hetatm] = "H"
+    hetero[is_hetatm & water] = "W"
+    return hetero
+
+
+def _model_index(serial):
+    """Return the model index of each atom, and the model serials (PRIVATE).
+
+    A new model starts whenever the serial number changes.
+    """
+    starts = numpy.ones(len(serial), bool)
+    starts[1:] = serial[1:] != serial[:-1]
+    return numpy.cumsum(starts) - 1, serial[starts]
+
+
+def read_pdb_columns(source):
+    """Read the atoms of a PDB file into a dictionary of NumPy arrays.
+
+    Arguments:
+     - source - name of the PDB file OR an open filehandle
+
+    As with the PDBParser, a new model starts at each MODEL record, or at
+    the first atom after an ENDMDL record, and the atoms end at an END or
+    CONECT record.
+    """
+    atom_lines = []
+    anisou_lines = []
+    anisou_atoms = []
+    model_starts = []
+    model_serials = []
+    model_open = False
+    serial_num = None
+    with as_handle(source) as handle:
+        for line in handle:
+            record_type = line[0:6]
+            if record_type == "ATOM  " or record_type == "HETATM":
+                if not model_open:
+                    model_starts.append(len(atom_lines))
+                    model_serials.append(serial_num)
+                    model_open = True
+                atom_lines.append(line)
+            elif record_type == "ANISOU":
+                if atom_lines:
+                    anisou_lines.append(line)
+                    anisou_atoms.append(len(atom_lines) - 1)
+            elif record_type == "MODEL ":
+                try:
+                    serial_num = int(line[10:14])
+                except ValueError:
+                    warnings.warn(
+                        "Invalid or missing model serial number",
+                        PDBConstructionWarning,
+                    )
+                    serial_num = 0
+                model_open = False
+            elif record_type == "ENDMDL":
+                model_open = False
+                serial_num = None
+            elif record_type == "END   " or record_type == "CONECT":
+                break
+
+    n_atoms = len(atom_lines)
+    records = _pdb_records(atom_lines)
+    fields = {
+        key: _fixed_width(records, start, end)
+        for key, (start, end) in _PDB_FIELDS.items()
+    }
+
+    columns = {}
+    # Unlike the PDBParser, a MODEL record without any atoms gives no model
+    model = numpy.zeros(n_atoms, int)
+    model[model_starts[1:]] = 1
+    columns["model"] = numpy.cumsum(model)
+    columns["model_serial"] = model_serials
+    try:
+        serial = fields["serial"].astype(int)
+    except ValueError:
+        serial = numpy.zeros(n_atoms, int)
+        for i, value in enumerate(fields["serial"].tolist()):
+            try:
+                serial[i] = int(value)
+            except ValueError:
+                pass
+    columns["serial"] = serial
+    fullname = _to_str(fields["fullname"], strip=False)
+    name = numpy.char.strip(fullname)
+    # Keep the spaces of atom names with internal spaces, e.g. " N B "
+    spaced = numpy.char.find(name, " ") >= 0
+    name[spaced] = fullname[spaced]
+    columns["name"] = name
+    columns["fullname"] = fullname
+    columns["altloc"] = _to_str(fields["altloc"], strip=False)
+    resname = _to_str(fields["resname"], strip=False)
+    columns["resname"] = resname
+    columns["chain"] = _to_str(fields["chain"], strip=False)
+    columns["resseq"] = _to_int(fields["resseq"], "residue number")
+    columns["icode"] = _to_str(fields["icode"], strip=False)
+    is_hetatm = records[:, 0] == ord("H")
+    columns["hetero"] = _hetero_flags(is_hetatm, resname)
+    columns["segid"] = _to_str(fields["segid"], strip=False)
+    columns["element"] = numpy.char.upper(_to_str(fields["element"]))
+    try:
+        coord = numpy.column_stack(
+            [fields["x"].astype("f"), fields["y"].astype("f"), fields["z"].astype("f")]
+        )
+    except ValueError:
+        raise PDBConstructionException("Invalid or missing coordinate(s)") from None
+    columns["coord"] = coord.reshape(n_atoms, 3)
+    columns["occupancy"] = _to_float(fields["occupancy"], "occupancy", numpy.nan)
+    if numpy.any(columns["occupancy"] < 0):
+        warnings.warn("Negative occupancy in one or more atoms", PDBConstructionWarning)
+    columns["bfactor"] = _to_float(fields["bfactor"], "B factor", 0.0)
+
+    if anisou_lines:
+        records = _pdb_records(anisou_lines)
+        values = [
+            _fixed_width(records, start, end).astype("f")
+            for start, end in _PDB_ANISOU_FIELDS
+        ]
+        anisou = numpy.full((n_atoms, 6), numpy.nan, "f")
+        # U's are scaled by 10^4
+        anisou[anisou_atoms] = numpy.column_stack(values) / 10000.0
+        columns["anisou"] = anisou
+    return columns
+
+
+def _pdb_records(lines):
+    """Return PDB lines as a two dimensional array of bytes (PRIVATE)."""
+    # Pad with null bytes, which NumPy drops from the end of a bytes field,
+    # so a field beyond the end of a short line is empty as in the PDBParser
+    text = "".join(line.rstrip("\n").ljust(80, "\0")[:80] for line in lines)
+    data = text.encode("latin-1", errors="replace")
+    return numpy.frombuffer(data, numpy.uint8).reshape(len(lines), 80)
+
+
+def read_mmcif_columns(source):
+    """Read the atoms of a mmCIF file into a dictionary of NumPy arrays.
+
+    Arguments:
+     - source - name of the mmCIF file OR an open filehandle
+
+    Only the atom_site and atom_site_anisotrop tables are read. As with
+    the MMCIFParser, the author chain and residue numbers are used where
+    available, and a new model starts whenever the model number changes.
+    """
+    tables = {"_atom_site.": ([], []), "_atom_site_anisotrop.": ([], [])}
+    with as_handle(source) as handle:
+        keys = values = None
+        for line in handle:
+            if line.startswith("_"):
+                keys = values = None
+                for prefix, (table_keys, table_values) in tables.items():
+                    if line.startswith(prefix):
+                        table_keys.append(line.strip())
+                        keys, values = table_keys, table_values
+            elif line.startswith(("#", "loop_", "data_")):
+                keys = values = None
+            elif values is not None:
+                values.append(line)
+    atom_site = _mmcif_table(*tables["_atom_site."])
+    if not atom_site:
+        raise ValueError("No atom_site table found.")
+
+    def column(key, default=None):
+        if key in atom_site:
+            return atom_site[key]
+        if default is None:
+            raise PDBConstructionException("Missing %s" % key)
+        return default
+
+    def assigned(values):
+        values = numpy.array(values)
+        values[(values == ".") | (values == "?")] = " "
+        return values
+
+    n_atoms = len(column("_atom_site.Cartn_x"))
+    columns = {}
+    try:
+        model_num = column("_atom_site.pdbx_PDB_model_num").astype(int)
+    except PDBConstructionException:
+        # No model number column, so a single model
+        columns["model"] = numpy.zeros(n_atoms, int)
+        columns["model_serial"] = [None]
+    except ValueError:
+        raise PDBConstructionException("Invalid model number") from None
+    else:
+        columns["model"], model_serial = _model_index(model_num)
+        columns["model_serial"] = model_serial.tolist()
+    try:
+        columns["serial"] = column("_atom_site.id").astype(int)
+    except (PDBConstructionException, ValueError):
+        columns["serial"] = numpy.zeros(n_atoms, int)
+    # Remove occasional " from quoted atom names (e.g. xNA)
+    name = numpy.char.strip(column("_atom_site.label_atom_id"), '"')
+    columns["name"] = name
+    columns["fullname"] = name
+    columns["altloc"] = assigned(column("_atom_site.label_alt_id"))
+    resname = column("_atom_site.label_comp_id")
+    columns["resname"] = resname
+    columns["chain"] = column("_atom_site.auth_asym_id")
+    # if auth_seq_id is present, we use this, otherwise label_seq_id
+    if "_atom_site.auth_seq_id" in atom_site:
+        resseq = column("_atom_site.auth_seq_id")
+    else:
+        resseq = column("_atom_site.label_seq_id")
+    columns["resseq"] = _to_int(resseq, "residue number")
+    columns["icode"] = assigned(column("_atom_site.pdbx_PDB_ins_code"))
+    is_hetatm = column("_atom_site.group_PDB") == "HETATM"
+    columns["hetero"] = _hetero_flags(is_hetatm, resname)
+    columns["segid"] = numpy.full(n_atoms, " ")
+    element = column("_atom_site.type_symbol", numpy.full(n_atoms, ""))
+    columns["element"] = numpy.char.upper(element)
+    try:
+        coord = numpy.column_stack(
+            [
+                column("_atom_site.Cartn_%s" % axis).astype("f")
+                for axis in ("x", "y", "z")
+            ]
+        )
+    except ValueError:
+        raise PDBConstructionException("Invalid or missing coordinate(s)") from None
+    columns["coord"] = coord.reshape(n_atoms, 3)
+    columns["occupancy"] = _to_float(
+        column("_atom_site.occupancy"), "occupancy", numpy.nan
+    )
+    columns["bfactor"] = _to_float(column("_atom_site.B_iso_or_equiv"), "B factor", 0.0)
+
+    anisotrop = _mmcif_table(*tables["_atom_site_anisotrop."])
+    keys = ["_atom_site_anisotrop." + key for key in _MMCIF_ANISOU_KEYS]
+    if anisotrop and all(key in anisotrop for key in keys):
+        ids = anisotrop["_atom_site_anisotrop.id"].astype(int)
+        order = numpy.argsort(columns["serial"])
+        found = numpy.searchsorted(columns["serial"], ids, sorter=order)
+        found = order[numpy.minimum(found, n_atoms - 1)]
+        present = columns["serial"][found] == ids
+        anisou = numpy.full((n_atoms, 6), numpy.nan, "f")
+        values = numpy.column_stack([anisotrop[key].astype("f") for key in keys])
+        anisou[found[present]] = values[present]
+        columns["anisou"] = anisou
+    return columns
+
+
+def _mmcif_table(keys, lines):
+    """Return the columns of a mmCIF loop as arrays of str (PRIVATE).
+
+    The values are split on white space, unless some are quoted, in which
+    case the lines are tokenized by MMCIF2Dict instead.
+    """
+    if not keys:
+        return {}
+    text = "".join(lines)
+    quoted = text[:1] in ("'", '"', ";") or any(
+        start in text for start in _quoted_starts
+    )
+    if not lines or quoted:
+        # Not a loop (so each key is followed by its value), or not simple
+        if lines:
+            keys = [key.split()[0] for key in keys]
+            lines = ["loop_\n"] + [key + "\n" for key in keys] + lines
+        else:
+            lines = [key + "\n" for key in keys]
+            keys = [key.split()[0] for key in keys]
+        table = MMCIF2Dict(io.StringIO("data_atoms\n" + "".join(lines)))
+        return {key: numpy.array(table[key]) for key in keys}
+    values = text.split()
+    if len(values) % len(keys):
+        raise ValueError("Number of values in the loop is not a multiple of keys.")
+    values = numpy.array(values).reshape(-1, len(keys))
+    return {key: values[:, i] for i, key in enumerate(keys)}
+
+
+def build_structure(structure_id, columns, structure_builder=None, PERMISSIVE=True):
+    """Return a Structure object built from a dictionary of atom columns.
+
+    Arguments:
+     - structure_id - string, the id that will be used for the structure
+     - columns - dictionary of NumPy arrays, as from read_pdb_columns
+       or read_mmcif_columns
+     - structure_builder - an optional user implemented StructureBuilder
+       object
+     - PERMISSIVE - Evaluated as a Boolean. If false, exceptions in
+       constructing the SMCRA data structure are fatal. If true (DEFAULT),
+       the exceptions are given as warnings, but some residues or atoms
+       will be missing (as with the PDBParser).
+
+    The atoms are grouped into models, chains and residues in the same
+    way as by the parsers, so disordered atoms and residues are handled
+    as usual. Warnings refer to the position of the atom in the columns.
+    The coordinates of each atom are a view into a copy of the coordinate
+    array, as with Entity.set_coords.
+    """
+    if structure_builder is None:
+        structure_builder = StructureBuilder()
+    structure_builder.init_structure(structure_id)
+    n_atoms = len(columns["name"])
+
+    # Group the atoms by spotting the changes between consecutive atoms
+    model = columns["model"]
+    new_model = numpy.ones(n_atoms, bool)
+    new_model[1:] = model[1:] != model[:-1]
+    new_chain = new_model.copy()
+    new_chain[1:] |= columns["chain"][1:] != columns["chain"][:-1]
+    new_residue = new_chain.copy()
+    for key in ("resname", "hetero", "resseq", "icode"):
+        values = columns[key]
+        new_residue[1:] |= values[1:] != values[:-1]
+    new_segid = numpy.ones(n_atoms, bool)
+    new_segid[1:] = columns["segid"][1:] != columns["segid"][:-1]
+
+    model_serial = list(columns.get("model_serial", []))
+    coord = numpy.array(columns["coord"], "f")
+    occupancy = [
+        None if value != value else value for value in columns["occupancy"].tolist()
+    ]
+    atom_arrays = []
+    for key, attribute, method, width in _ATOM_ARRAYS:
+        if key in columns:
+            values = numpy.array(columns[key], "f")
+            present = ~numpy.isnan(values).any(axis=1)
+            atom_arrays.append((getattr(structure_builder, method), values, present))
+    lists = [
+        columns[key].tolist()
+        for key in (
+            "name",
+            "fullname",
+            "altloc",
+            "serial",
+            "element",
+            "bfactor",
+            "resname",
+            "hetero",
+            "resseq",
+            "icode",
+            "chain",
+            "segid",
+            "model",
+        )
+    ]
+    # Only positions where something changes need the residue level values
+    starts = numpy.flatnonzero(new_residue | new_segid).tolist()
+    new_model = new_model.tolist()
+    new_chain = new_chain.tolist()
+    new_residue = new_residue.tolist()
+    new_segid = new_segid.tolist()
+    starts.append(n_atoms)
+
+    init_atom = structure_builder.init_atom
+    set_line_counter = structure_builder.set_line_counter
+    (
+        name,
+        fullname,
+        altloc,
+        serial,
+        element,
+        bfactor,
+        resname,
+        hetero,
+        resseq,
+        icode,
+        chain,
+        segid,
+        model,
+    ) = lists
+    for start, end in zip(starts, starts[1:]):
+        set_line_counter(start)
+        if new_model[start]:
+            index = model[start]
+            serial_num = model_serial[index] if index < len(model_serial) else None
+            structure_builder.init_model(index, serial_num)
+        if new_segid[start]:
+            structure_builder.init_seg(segid[start])
+        if new_chain[start]:
+            structure_builder.init_chain(chain[start])
+        if new_residue[start]:
+            try:
+                structure_builder.init_residue(
+                    resname[start], hetero[start], resseq[start], icode[start]
+                )
+            except PDBConstructionException as message:
+                _handle_exception(message, start, PERMISSIVE)
+        for i in range(start, end):
+            set_line_counter(i)
+            try:
+                init_atom(
+                    name[i],
+                    coord[i],
+                    bfactor[i],
+                    occupancy[i],
+                    altloc[i],
+                    fullname[i],
+                    serial[i],
+                    element[i],
+                )
+            except PDBConstructionException as message:
+                _handle_exception(message, i, PERMISSIVE)
+                continue
+            for method, values, present in atom_arrays:
+                if present[i]:
+                    method(values[i])
+    return structure_builder.get_structure()
+
+
+def _handle_exception(message, index, permissive):
+    """Warn about an exception if permissive, or raise it again (PRIVATE)."""
+    message = "%s at atom %i." % (message, index)
+    if not permissive:
+        raise PDBConstructionException(message) from None
+    warnings.warn(
+        "PDBConstructionException: %s\n"
+        "Exception ignored.\n"
+        "Some atoms or residues may be missing in the data structure." % message,
+        PDBConstructionWarning,
+    )
+
+
+def columns_from_structure(structure):
+    """Return a dictionary of atom columns describing a Structure object.
+
+    This is the reverse of build_structure, so for example the atoms of a
+    structure from the MMTFParser can be handled as columns. All the atoms
+    of disordered atoms and residues are included, in an order which gives
+    the same disorder when built again.
+    """
+    rows = []
+    coord = []
+    atom_arrays = []
+    get_arrays = attrgetter(*(attribute for _, attribute, _, _ in _ATOM_ARRAYS))
+    model_serial = []
+    for index, model in enumerate(structure):
+        model_serial.append(model.serial_num)
+        for chain in model:
+            for residue in chain.get_unpacked_list():
+                field, resseq, icode = residue.id
+                hetero = field[0] if field[0] in "HW" else " "
+                for atom in _unpacked_atoms(residue):
+                    occupancy = atom.occupancy
+                    bfactor = atom.bfactor
+                    rows.append(
+                        (
+                            index,
+                            atom.serial_number or 0,
+                            atom.name,
+                            atom.fullname,
+                            atom.altloc,
+                            residue.resname,
+                            chain.id,
+                            resseq,
+                            icode,
+                            hetero,
+                            residue.segid,
+                            atom.element or "",
+                            numpy.nan if occupancy is None else occupancy,
+                            0.0 if bfactor is None else bfactor,
+                        )
+                    )
+                    coord.append(atom.coord)
+                    atom_arrays.append(get_arrays(atom))
+    keys = (
+        "model",
+        "serial",
+        "name",
+        "fullname",
+        "altloc",
+        "resname",
+        "chain",
+        "resseq",
+        "icode",
+        "hetero",
+        "segid",
+        "element",
+        "occupancy",
+        "bfactor",
+    )
+    columns = {}
+    if rows:
+        for key, values in zip(keys, zip(*rows)):
+            columns[key] = numpy.array(values)
+    else:
+        for key in keys:
+            columns[key] = numpy.array([], "U1")
+        for key in ("model", "serial", "resseq"):
+            columns[key] = numpy.array([], int)
+        for key in ("occupancy", "bfactor"):
+            columns[key] = numpy.array([], float)
+    columns["model_serial"] = model_serial
+    columns["coord"] = numpy.array(coord, "f").reshape(len(rows), 3)
+    for j, (key, attribute, method, width) in enumerate(_ATOM_ARRAYS):
+        if any(arrays[j] is not None for arrays in atom_arrays):
+            values = numpy.full((len(rows), width), numpy.nan, "f")
+            for i, arrays in enumerate(atom_arrays):
+                if arrays[j] is not None:
+                    values[i] = arrays[j]
+            columns[key] = values
+    return columns
+
+
+def _unpacked_atoms(residue):
+    """Return the atoms of a residue in an order to rebuild it (PRIVATE).
+
+    A disordered atom can have an atom with a blank altloc, which must be
+    given first.
+    """
+    atoms = []
+    for atom in residue:
+        if atom.is_disordered():
+            children = atom.disordered_get_list()
+            atoms.extend(sorted(children, key=lambda child: child.altloc != " "))
+        else:
+            atoms.append(atom)
+    return atoms
+
+
+def save_structure(structure, file):
+    """Save a Structure object to a binary file of NumPy arrays.
+
+    Arguments:
+     - structure - the Structure object
+     - file - name of the file OR an open binary mode file handle
+
+    The atoms are saved as their columns (see columns_from_structure) in
+    the NumPy .npz format, with the structure id and header, so the file
+    can be read back quickly with load_structure. This is much faster and
+    smaller than pickling the structure, but other information such as the
+    xtra dictionaries of the atoms and residues is not saved.
+    """
+    columns = columns_from_structure(structure)
+    metadata = {
+        "version": 1,
+        "id": structure.id,
+        "model_serial": columns.pop("model_serial"),
+        "header": getattr(structure, "header", {}),
+    }
+    # Most text columns have few distinct values, so save these once each
+    # with the index of the value of each atom
+    for key, values in list(columns.items()):
+        if values.dtype.kind == "U":
+            unique, index = numpy.unique(values, return_inverse=True)
+            columns[key] = index.astype(numpy.min_scalar_type(len(unique)))
+            columns[key + ".values"] = unique
+    columns["metadata"] = numpy.array(json.dumps(metadata))
+    if isinstance(file, str):
+        with open(file, "wb") as handle:
+            numpy.savez(handle, **columns)
+    else:
+        numpy.savez(file, **columns)
+
+
+def load_structure(file, structure_builder=None):
+    """Load a Structure object saved by save_structure.
+
+    Arguments:
+     - file - name of the file OR an open binary mode file handle
+     - structure_builder - an optional user implemented StructureBuilder
+       object
+
+    >>> import os
+    >>> import tempfile
+    >>> from Bio.PDB import PDBParser
+    >>> from Bio.PDB.atom_columns import save_structure, load_structure
+    >>> structure = PDBParser().get_structure("1A8O", "PDB/1A8O.pdb")
+    >>> filename = os.path.join(tempfile.mkdtemp(), "1A8O.npz")
+    >>> save_structure(structure, filename)
+    >>> copy = load_structure(filename)
+    >>> print(copy.id, len(list(copy.get_atoms())))
+    1A8O 644
+    >>> print(copy.header["name"])
+    hiv capsid c-terminal domain
+
+    Any tuples in the header are loaded as lists.
+    """
+    # Saved files never need pickle, so do not allow it for safety
+    with numpy.load(file, allow_pickle=False) as data:
+        columns = {key: data[key] for key in data.files}
+    for key in list(columns):
+        if key.endswith(".values"):
+            unique = columns.pop(key)
+            key = key[: -len(".values")]
+            columns[key] = unique[columns[key]]
+    metadata = json.loads(str(columns.pop("metadata")))
+    if metadata["version"] != 1:
+        raise ValueError("Unsupported file version %r" % metadata["version"])
+    columns["model_serial"] = metadata["model_serial"]
+    structure = build_structure(metadata["id"], columns, structure_builder)
+    structure.header = metadata["header"]
+    return structure
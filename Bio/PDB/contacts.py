@@ -0,0 +1,354 @@
+# Copyright 2020 by the Biopython developers.  All rights reserved.
+#
+# This file is part of the Biopython distribution and governed by your
+# choice of the "Biopython License Agreement" or the "BSD 3-Clause License".
+# Please see the LICENSE file that should have been included as part of this
+# package.
+
+"""Contacts between atoms, residues and chains using NumPy arrays.
+
+The NeighborSearch class returns each pair of neighboring atoms (or residues,
+chains and so on) as a tuple of Python objects. The functions in this module
+instead return the pairs as NumPy arrays of indices, which is much faster
+for large structures with millions of contacts.
+
+The atom pairs are found using a cell list: the atoms are sorted into cubic
+cells the size of the search radius, so only the atoms in neighboring cells
+need to be compared. This also makes periodic boundary conditions simple to
+support, for structures from simulations in a rectangular box.
+
+>>> from Bio.PDB import PDBParser
+>>> from Bio.PDB.contacts import atom_contacts, residue_contacts
+>>> structure = PDBParser().get_structure("1A8O", "PDB/1A8O.pdb")
+>>> coords = structure.get_coords()
+>>> i, j, distances = atom_contacts(coords, 4.0)
+>>> print(len(i))
+3727
+>>> residues, i, j = residue_contacts(structure[0], 4.0)
+>>> print(residues[i[0]].get_resname(), residues[j[0]].get_resname())
+MSE ASP
+
+"""
+
+import itertools
+
+import numpy
+
+
+# Limit on the number of cells along each axis of the grid
+_MAX_CELLS = 1024
+
+
+def _cell_offsets(n_cells):
+    """Return the offsets to the neighboring cells of a cell (PRIVATE).
+
+    Only half of the neighbors are included (plus the cell itself), so that
+    each pair of cells is considered once. Dimensions with a single cell
+    have no neighbors.
+    """
+    offsets = []
+    for offset in itertools.product((-1, 0, 1), repeat=3):
+        if any(o and n == 1 for o, n in zip(offset, n_cells)):
+            continue
+        if offset >= (0, 0, 0):
+            offsets.append(offset)
+    return numpy.array(offsets)
+
+
+def _cell_pairs(cell_a, cell_b, starts, counts):
+    """Return all pairs of atoms in pairs of cells, as two arrays (PRIVATE).
+
+    The atoms in each cell are given by their start and count in the
+    array of atoms sorted by cell.
+    """
+    sizes = counts[cell_a] * counts[cell_b]
+    total = sizes.sum()
+    pair = numpy.repeat(numpy.arange(len(sizes)), sizes)
+    position = numpy.arange(total) - numpy.repeat(numpy.cumsum(sizes) - sizes, sizes)
+    n_b = counts[cell_b][pair]
+    first = starts[cell_a][pair] + position // n_b
+    second = starts[cell_b][pair] + position % n_b
+    return first, second
+
+
+def atom_contacts(coords, radius, box=None):
+    """Return all pairs of atoms within a distance of each other.
+
+    Arguments:
+     - coords - NumPy array of shape (N, 3) with the atom coordinates,
+       for example from the get_coords method of an Entity.
+     - radius - the search radius, either a number, or an array of N
+       radii, one for each atom. In the latter case a pair of atoms is
+       in contact if their distance is at most the sum of their radii.
+       A radius of zero finds the atoms with identical coordinates.
+     - box - optional lengths of the sides of a rectangular box, for
+       periodic boundary conditions. The box has one corner at the origin
+       and the distance between atoms is that to the nearest image. The
+       search distance must be less than half of each side.
+
+    Returns three arrays (i, j, distance), with the indices of the two
+    atoms of each pair (with i < j, in order), and their distance. The
+    pairs for several smaller cutoffs can be selected from the distances,
+    without searching again:
+
+    >>> import numpy
+    >>> from Bio.PDB.contacts import atom_contacts
+    >>> coords = numpy.array([[0, 0, 0], [0, 0, 2], [0, 0, 5], [0, 0, 9.5]])
+    >>> i, j, distances = atom_contacts(coords, 4.0)
+    >>> print(i.tolist(), j.tolist(), distances.tolist())
+    [0, 1] [1, 2] [2.0, 3.0]
+    >>> print(i[distances <= 2.5].tolist(), j[distances <= 2.5].tolist())
+    [0] [1]
+
+    With periodic boundary conditions, the first and last atoms are close:
+
+    >>> i, j, distances = atom_contacts(coords, 4.0, box=(10, 10, 10))
+    >>> print(i.tolist(), j.tolist(), distances.tolist())
+    [0, 0, 1, 1] [1, 3, 2, 3] [2.0, 0.5, 3.0, 2.5]
+
+    """
+    coords = numpy.asarray(coords, dtype=numpy.float64)
+    if coords.ndim != 2 or coords.shape[1] != 3:
+        raise ValueError("Expected an array of shape (N, 3)")
+    n_atoms = len(coords)
+    radii = numpy.asarray(radius, dtype=numpy.float64)
+    if radii.ndim == 0:
+        cutoff = float(radii)
+        radii = None
+    elif radii.shape == (n_atoms,):
+        cutoff = 2 * radii.max() if n_atoms else 0.0
+    else:
+        raise ValueError("Expected one radius, or one for each atom")
+    if cutoff < 0:
+        raise ValueError("The radius must not be negative")
+
+    empty = numpy.zeros(0, int)
+    if n_atoms < 2:
+        return empty, empty, numpy.zeros(0)
+
+    if box is None:
+        origin = coords.min(axis=0)
+        extent = coords.max(axis=0) - origin
+        # Cells at least as large as the cutoff, but not too many of them
+        # for a very small (or zero) cutoff
+        cell_size = numpy.maximum(numpy.maximum(extent / _MAX_CELLS, cutoff), 1e-6)
+        n_cells = (numpy.floor(extent / cell_size) + 1).astype(int)
+    else:
+        box = numpy.asarray(box, dtype=numpy.float64)
+        if box.shape != (3,) or (box <= 0).any():
+            raise ValueError("Expected three positive box lengths")
+        if (cutoff >= box / 2).any():
+            raise ValueError("The radius must be less than half the box size")
+        coords = coords % box
+        origin = numpy.zeros(3)
+        n_cells = numpy.floor(box / max(cutoff, box.max() / _MAX_CELLS)).astype(int)
+        # With fewer than three cells a neighbor would be counted twice
+        n_cells[n_cells < 3] = 1
+        cell_size = box / n_cells
+
+    # Sort the atoms by cell, with each occupied cell as a start and count
+    cell_xyz = numpy.floor((coords - origin) / cell_size).astype(int)
+    # Rounding at the upper edge of the box
+    cell_xyz = numpy.minimum(cell_xyz, n_cells - 1)
+    cell_id = numpy.ravel_multi_index(cell_xyz.T, n_cells)
+    order = numpy.argsort(cell_id, kind="stable")
+    cells, starts, counts = numpy.unique(
+        cell_id[order], return_index=True, return_counts=True
+    )
+    sorted_coords = coords[order]
+    cells_xyz = numpy.array(numpy.unravel_index(cells, n_cells)).T
+
+    firsts = []
+    seconds = []
+    distances = []
+    for offset in _cell_offsets(n_cells):
+        cell_a = numpy.arange(len(cells))
+        neighbor_xyz = cells_xyz + offset
+        if box is None:
+            inside = ((neighbor_xyz >= 0) & (neighbor_xyz < n_cells)).all(axis=1)
+            cell_a = cell_a[inside]
+            neighbor_xyz = neighbor_xyz[inside]
+        else:
+            neighbor_xyz %= n_cells
+        neighbor = numpy.ravel_multi_index(neighbor_xyz.T, n_cells)
+        cell_b = numpy.searchsorted(cells, neighbor)
+        cell_b = numpy.minimum(cell_b, len(cells) - 1)
+        found = cells[cell_b] == neighbor
+        first, second = _cell_pairs(cell_a[found], cell_b[found], starts, counts)
+        if not offset.any():
+            keep = first < second
+            first = first[keep]
+            second = second[keep]
+        delta = sorted_coords[first] - sorted_coords[second]
+        if box is not None:
+            delta -= box * numpy.round(delta / box)
+        distance = numpy.sqrt(numpy.einsum("ij,ij->i", delta, delta))
+        first = order[first]
+        second = order[second]
+        if radii is None:
+            keep = distance <= cutoff
+        else:
+            keep = distance <= radii[first] + radii[second]
+        firsts.append(first[keep])
+        seconds.append(second[keep])
+        distances.append(distance[keep])
+
+    first = numpy.concatenate(firsts)
+    second = numpy.concatenate(seconds)
+    distance = numpy.concatenate(distances)
+    i = numpy.minimum(first, second)
+    j = numpy.maximum(first, second)
+    order = numpy.lexsort((j, i))
+    return i[order], j[order], distance[order]
+
+
+def _atom_parents(entity):
+    """Return the atoms of an entity, and the index of their parents (PRIVATE).
+
+    Returns the list of residues, and an array giving the index of the
+    residue of each atom, plus the same for the chains and models.
+    """
+    if entity.level not in ("R", "C", "M", "S"):
+        raise ValueError(
+            "Invalid entity type '%s'. "
+            "Must be Residue, Chain, Model, or Structure" % type(entity)
+        )
+    if entity.level == "R":
+        residues = [entity]
+    else:
+        residues = list(entity.get_residues())
+    residue_index = []
+    chain_index = []
+    model_index = []
+    chains = {}
+    models = {}
+    for index, residue in enumerate(residues):
+        n_atoms = len(residue)
+        chain = residue.get_parent()
+        model = chain.get_parent() if chain is not None else None
+        residue_index.append(numpy.full(n_atoms, index))
+        chain_index.append(
+            numpy.full(n_atoms, chains.setdefault(id(chain), len(chains)))
+        )
+        model_index.append(
+            numpy.full(n_atoms, models.setdefault(id(model), len(models)))
+        )
+    if residues:
+        residue_index = numpy.concatenate(residue_index)
+        chain_index = numpy.concatenate(chain_index)
+        model_index = numpy.concatenate(model_index)
+    else:
+        residue_index = chain_index = model_index = numpy.zeros(0, int)
+    return residues, residue_index, chain_index, model_index
+
+
+def residue_contacts(entity, radius, box=None):
+    """Return all pairs of residues with atoms within a distance.
+
+    Arguments:
+     - entity - Residue, Chain, Model or Structure object.
+     - radius - the search radius, or an array of radii for each atom (in
+       the order of get_atoms), see atom_contacts.
+     - box - optional box lengths for periodic boundary conditions, see
+       atom_contacts.
+
+    Returns the list of residues of the entity, and two arrays (i, j) with
+    the indices of the residues in each pair (with i < j, in order). Only
+    residues in the same model are paired.
+    """
+    residues, residue_index, chain_index, model_index = _atom_parents(entity)
+    coords = entity.get_coords()
+    i, j, distances = atom_contacts(coords, radius, box)
+    same_model = model_index[i] == model_index[j]
+    first = residue_index[i[same_model]]
+    second = residue_index[j[same_model]]
+    different = first != second
+    pairs = numpy.unique(
+        numpy.sort(numpy.column_stack((first, second))[different], axis=1), axis=0
+    )
+    if not len(pairs):
+        pairs = numpy.zeros((0, 2), int)
+    return residues, pairs[:, 0], pairs[:, 1]
+
+
+def contact_matrix(n, i, j):
+    """Return a symmetric boolean matrix from pairs of indices.
+
+    Arguments:
+     - n - the number of atoms or residues.
+     - i, j - arrays of indices, as from atom_contacts or residue_contacts.
+
+    >>> import numpy
+    >>> from Bio.PDB.contacts import contact_matrix
+    >>> print(contact_matrix(3, numpy.array([0]), numpy.array([2])))
+    [[False False  True]
+     [False False False]
+     [ True False False]]
+
+    """
+    matrix = numpy.zeros((n, n), bool)
+    matrix[i, j] = True
+    matrix[j, i] = True
+    return matrix
+
+
+def interface_residues(entity, radius=5.0, box=None):
+    """Return the residues at the interfaces between chains.
+
+    Arguments:
+     - entity - Model or Structure object (or a Chain, with no interfaces).
+     - radius - the search radius, or an array of radii for each atom (in
+       the order of get_atoms), see atom_contacts. Default 5.0 A.
+     - box - optional box lengths for periodic boundary conditions, see
+       atom_contacts.
+
+    Returns a dictionary with a key for each pair of chain ids in contact,
+    in the order the chains are found in the entity. The value is a pair
+    of lists of the residues of each chain with an atom within the radius
+    of an atom of the other chain. For a Structure, the chain ids are
+    prefixed by the model id, as in (0, "A"), to keep the models apart.
+
+    >>> from Bio.PDB import PDBParser
+    >>> from Bio.PDB.contacts import interface_residues
+    >>> structure = PDBParser().get_structure("2BEG", "PDB/2BEG.pdb")
+    >>> interfaces = interface_residues(structure[0], 4.0)
+    >>> print(sorted(interfaces))
+    [('A', 'B'), ('A', 'C'), ('B', 'C'), ('B', 'D'), ('C', 'D'), ('C', 'E'), ('D', 'E')]
+    >>> residues_a, residues_b = interfaces["A", "B"]
+    >>> print(len(residues_a), len(residues_b))
+    26 26
+
+    """
+    residues, residue_index, chain_index, model_index = _atom_parents(entity)
+    coords = entity.get_coords()
+    i, j, distances = atom_contacts(coords, radius, box)
+    chain_i = chain_index[i]
+    chain_j = chain_index[j]
+    between = (chain_i != chain_j) & (model_index[i] == model_index[j])
+    i = i[between]
+    j = j[between]
+    chain_i = chain_i[between]
+    chain_j = chain_j[between]
+    # Order each pair by chain, then take each residue once per chain pair
+    swap = chain_i > chain_j
+    i[swap], j[swap] = j[swap], i[swap].copy()
+    chain_i[swap], chain_j[swap] = chain_j[swap], chain_i[swap].copy()
+    chains = []
+    for index in numpy.unique(chain_index):
+        residue = residues[residue_index[numpy.argmax(chain_index == index)]]
+        chain = residue.get_parent()
+        if entity.level == "S":
+            chains.append((chain.get_parent().id, chain.id))
+        else:
+            chains.append(chain.id)
+    interfaces = {}
+    chain_pairs = numpy.column_stack((chain_i, chain_j))
+    for chain_a, chain_b in numpy.unique(chain_pairs, axis=0).tolist():
+        in_pair = (chain_i == chain_a) & (chain_j == chain_b)
+        residues_a = numpy.unique(residue_index[i[in_pair]])
+        residues_b = numpy.unique(residue_index[j[in_pair]])
+        interfaces[chains[chain_a], chains[chain_b]] = (
+            [residues[k] for k in residues_a],
+            [residues[k] for k in residues_b],
+        )
+    return interfaces
@@ -148,8 +148,10 @@ class IC_Chain:
     dihedraNdx: dict mapping dihedra AtomKeys to numpy array data
 
     atomArray: numpy array of homogeneous atom coords for chain
+        set by init_atom_array()
 
     atomArrayIndex: dict mapping AtomKeys to atomArray indexes
+        also the atom order for the batch methods
 
     numpy arrays for vector processing of chain di/hedra:
 
@@ -180,6 +182,13 @@ class IC_Chain:
     atom_to_internal_coordinates(verbose)
         Calculate dihedrals, angles, bond lengths (internal coordinates) for
         Atom data
+    init_atom_array()
+        Set atomArray, atomArrayIndex and the assembly steps for the batch
+        methods
+    internal_to_atom_coordinates_batch(dihedraIC, hedraIC)
+        Compute atom coords for many sets of internal coordinates at once
+    atom_to_internal_coordinates_batch(coords)
+        Compute internal coordinates for many sets of atom coords at once
     link_residues()
         Call link_dihedra() on each IC_Residue (needs rprev, rnext set)
     set_residues()
@@ -208,6 +217,8 @@ class IC_Chain:
         # self.hedraNdx = {}
         self.dihedra = {}
         # self.dihedraNdx = {}
+        # set by init_atom_array() for the batch methods
+        self._assembly_plan: Optional[List[Tuple[numpy.ndarray, ...]]] = None
         self.set_residues(verbose)  # no effect if no residues loaded
 
     # return True if a0, a1 within supplied cutoff
@@ -505,6 +516,7 @@ class IC_Chain:
             self.dihedraICr = numpy.empty(self.dihedraLen)
 
         self.dihedraNdx = dict(zip(self.dihedra.keys(), range(len(self.dihedra))))
+        self._assembly_plan = None  # new di/hedra so redo init_atom_array()
 
         self.dAtoms: numpy.ndarray = numpy.empty(
             (self.dihedraLen, 4, 4), dtype=numpy.float64
@@ -632,6 +644,205 @@ class IC_Chain:
         self.dAtoms_needs_update[...] = False
         pass
 
+    def init_atom_array(self) -> None:
+        """Set atomArray, atomArrayIndex and assembly steps for batch methods.
+
+        Assembles the chain once from the current internal coordinates (as
+        internal_to_atom_coordinates() with promote=False), recording the
+        dihedron which places each atom from three atoms already placed.
+        These steps are grouped into levels, where each step depends only on
+        earlier levels, so each level can be computed at once on arrays.
+        Atoms not placed by a dihedron, such as the N, Ca and C starting
+        each chain segment, keep their current coordinates.
+        """
+        self.init_atom_coords()
+        self.assemble_residues()
+        index: Dict["AtomKey", int] = {}
+        coords = []
+        steps = []  # target atom, 3 source atoms, dihedron
+        for ric in self.ordered_aa_ic_list:
+            if not ric.atom_coords:
+                continue
+            placed = {d.aks[3] for h1k, d in ric._assembly_steps}
+            for ak, ac in ric.atom_coords.items():
+                if ak in index:
+                    # use the last residue to build the atom, as for
+                    # coords_to_structure()
+                    coords[index[ak]] = ac
+                elif ak not in placed:
+                    index[ak] = len(coords)
+                    coords.append(ac)
+            for h1k, d in ric._assembly_steps:
+                ak = d.aks[3]
+                if ak not in index:
+                    index[ak] = len(coords)
+                    coords.append(ric.atom_coords[ak])
+                sources = tuple(index[a] for a in h1k)
+                steps.append((index[ak], sources, self.dihedraNdx[d.aks]))
+
+        self.atomArrayIndex = index
+        self.atomArray = numpy.array(coords, dtype=numpy.float64).reshape(-1, 4)
+
+        # level of each step: after the steps placing its source atoms, after
+        # any earlier step placing the same atom, and not before the steps
+        # reading the earlier position of that atom
+        written = [0] * len(coords)
+        read = [0] * len(coords)
+        levels: Dict[int, List] = {}  # steps of each level, in order
+        for step in steps:
+            target, sources, dndx = step
+            level = max(written[a] for a in sources) + 1
+            level = max(level, written[target] + 1, read[target])
+            for a in sources:
+                read[a] = max(read[a], level)
+            written[target] = level
+            levels.setdefault(level, []).append(step)
+        plan = []
+        for level in sorted(levels):
+            lsteps = levels[level]
+            plan.append(
+                (
+                    numpy.array([step[0] for step in lsteps]),
+                    numpy.array([step[1] for step in lsteps]),
+                    numpy.array([step[2] for step in lsteps]),
+                )
+            )
+        self._assembly_plan = plan
+
+        # atoms of each hedron and dihedron, -1 if not in atomArray
+        self._hedraAtomNdx = numpy.array(
+            [[index.get(ak, -1) for ak in k] for k in self.hedraNdx], dtype=int
+        ).reshape(-1, 3)
+        self._dihedraAtomNdx = numpy.array(
+            [[index.get(ak, -1) for ak in k] for k in self.dihedraNdx], dtype=int
+        ).reshape(-1, 4)
+
+    def internal_to_atom_coordinates_batch(
+        self, dihedraIC: numpy.ndarray, hedraIC: Optional[numpy.ndarray] = None
+    ) -> numpy.ndarray:
+        """Compute atom coordinates for many sets of internal coordinates.
+
+        Uses the assembly steps from init_atom_array() (called if needed),
+        placing each atom from three others with its dihedron (NeRF), for
+        all the atoms of each level and all the sets at once.  As for
+        assemble(), the coordinates are rounded to 3 decimal places.  The
+        Biopython Atom coordinates are not changed.
+
+        :param dihedraIC: numpy array [conformers][dihedraLen]
+            dihedral angles in degrees, in the order of dihedraNdx (as in
+            dihedraIC); may be a single set [dihedraLen]
+        :param hedraIC: optional numpy array [conformers][hedraLen][3]
+            length-angle-length for each hedron, in the order of hedraNdx;
+            may be a single set [hedraLen][3].  Default is the current
+            hedraIC
+        :returns: numpy array [conformers][atoms][3] in atomArrayIndex order
+        """
+        if self._assembly_plan is None:
+            self.init_atom_array()
+        dihedraIC = numpy.asarray(dihedraIC, dtype=numpy.float64)
+        if dihedraIC.ndim == 1:
+            dihedraIC = dihedraIC[numpy.newaxis]
+        if hedraIC is None:
+            hedraIC = self.hedraIC
+        hedraIC = numpy.asarray(hedraIC, dtype=numpy.float64)
+        if hedraIC.ndim == 2:
+            hedraIC = hedraIC[numpy.newaxis]
+        if dihedraIC.shape[1:] != (self.dihedraLen,):
+            raise ValueError(f"expected {self.dihedraLen} dihedral angles per set")
+        if hedraIC.shape[1:] != (self.hedraLen, 3):
+            raise ValueError(f"expected {self.hedraLen} hedra per set")
+
+        # 4th atom of each dihedron in dihedron coordinate space, as
+        # init_atom_coords(): a1 at origin, a2 on +Z, a0 on XZ plane
+        h2IC = hedraIC[:, self.dH2ndx]
+        length = numpy.where(self.dRev, h2IC[..., 0], h2IC[..., 2])  # a2-a3
+        offset = numpy.where(self.dRev, h2IC[..., 2], h2IC[..., 0])  # a1-a2
+        sar = numpy.deg2rad(180.0 - h2IC[..., 1])  # supplementary angle
+        radial = numpy.sin(sar) * length
+        dihedraICr = numpy.deg2rad(dihedraIC)
+        local = numpy.stack(
+            numpy.broadcast_arrays(
+                radial * numpy.cos(dihedraICr),
+                radial * numpy.sin(dihedraICr),
+                offset + numpy.cos(sar) * length,
+            ),
+            axis=-1,
+        )
+
+        coords = numpy.empty((len(local), len(self.atomArray), 3))
+        coords[:] = self.atomArray[:, :3]
+        for targets, sources, dndx in self._assembly_plan:
+            a0 = coords[:, sources[:, 0]]
+            a1 = coords[:, sources[:, 1]]
+            a2 = coords[:, sources[:, 2]]
+            # axes of the coordinate space of a0, a1, a2 (see coord_space())
+            ez = a2 - a1
+            ez /= numpy.linalg.norm(ez, axis=-1, keepdims=True)
+            ex = a0 - a1
+            ex -= numpy.sum(ex * ez, axis=-1, keepdims=True) * ez
+            ex /= numpy.linalg.norm(ex, axis=-1, keepdims=True)
+            ey = numpy.cross(ez, ex)
+            p = local[:, dndx]
+            coords[:, targets] = numpy.round(
+                a1 + p[..., 0:1] * ex + p[..., 1:2] * ey + p[..., 2:3] * ez, 3
+            )  # round to PDB format 8.3
+        return coords
+
+    def atom_to_internal_coordinates_batch(
+        self, coords: numpy.ndarray
+    ) -> Tuple[numpy.ndarray, numpy.ndarray]:
+        """Compute internal coordinates for many sets of atom coordinates.
+
+        The chain di/hedra must already be set up, e.g. by
+        atom_to_internal_coordinates() or reading a PIC file.  The chain
+        arrays (dihedraIC, hedraIC) are not changed.
+
+        :param coords: numpy array [conformers][atoms][3]
+            atom coordinates in atomArrayIndex order (see init_atom_array(),
+            called if needed), e.g. from internal_to_atom_coordinates_batch();
+            may be a single set [atoms][3]
+        :returns: tuple of numpy arrays
+            dihedral angles [conformers][dihedraLen] in degrees, and
+            length-angle-length [conformers][hedraLen][3] in the order of
+            dihedraNdx and hedraNdx.  NaN for any di/hedra with atoms
+            missing from atomArrayIndex
+        """
+        if self._assembly_plan is None:
+            self.init_atom_array()
+        coords = numpy.asarray(coords, dtype=numpy.float64)
+        if coords.ndim == 2:
+            coords = coords[numpy.newaxis]
+        if coords.shape[1:] != (len(self.atomArray), 3):
+            raise ValueError(f"expected coordinates for {len(self.atomArray)} atoms")
+        # extra NaN atom for index -1
+        padded = numpy.concatenate(
+            (coords, numpy.full((len(coords), 1, 3), numpy.nan)), axis=1
+        )
+
+        # hedra
+        h = padded[:, self._hedraAtomNdx]
+        a0a1 = h[:, :, 0] - h[:, :, 1]
+        a2a1 = h[:, :, 2] - h[:, :, 1]
+        len12 = numpy.linalg.norm(a0a1, axis=-1)
+        len23 = numpy.linalg.norm(a2a1, axis=-1)
+        cos_angle = numpy.sum(a0a1 * a2a1, axis=-1) / (len12 * len23)
+        angle = numpy.rad2deg(numpy.arccos(numpy.clip(cos_angle, -1.0, 1.0)))
+        hedraIC = numpy.stack((len12, angle, len23), axis=-1)
+
+        # dihedra: azimuth of a3 in coordinate space of a0, a1, a2
+        d = padded[:, self._dihedraAtomNdx]
+        ez = d[:, :, 2] - d[:, :, 1]
+        ez /= numpy.linalg.norm(ez, axis=-1, keepdims=True)
+        ex = d[:, :, 0] - d[:, :, 1]
+        ex -= numpy.sum(ex * ez, axis=-1, keepdims=True) * ez
+        ex /= numpy.linalg.norm(ex, axis=-1, keepdims=True)
+        ey = numpy.cross(ez, ex)
+        a3 = d[:, :, 3] - d[:, :, 1]
+        dihedraIC = numpy.rad2deg(
+            numpy.arctan2(numpy.sum(a3 * ey, axis=-1), numpy.sum(a3 * ex, axis=-1))
+        )
+        return dihedraIC, hedraIC
+
     def internal_to_atom_coordinates(
         self,
         verbose: bool = False,
@@ -641,7 +852,8 @@ class IC_Chain:
     ) -> None:
         """Process, IC data to Residue/Atom coords.
 
-        Not yet vectorized.
+        Not yet vectorized; see internal_to_atom_coordinates_batch() to
+        compute atom coordinates for many conformers at once.
 
         :param verbose bool: default False
             describe runtime problems
@@ -1278,6 +1490,8 @@ class IC_Residue(object):
         # generated from dihedra include some i+1 atoms
         # or initialised here from parent residue if loaded from coordinates
         self.atom_coords: Dict["AtomKey", numpy.array] = {}
+        # (hedron key, dihedron) placing each atom in last assemble()
+        self._assembly_steps: List[Tuple[HKT, "Dihedron"]] = []
         # bfactors copied from PDB file
         self.bfactors: Dict[str, float] = {}
         self.alt_ids: Union[List[str], None] = None if NO_ALTLOC else []
@@ -1723,6 +1937,7 @@ class IC_Residue(object):
         startLst.extend(NCaCKey)
 
         q = deque(startLst)
+        self._assembly_steps = []
         # resnum = self.rbase[0]
 
         # get initial coords from previous residue or IC_Chain info
@@ -1789,6 +2004,8 @@ class IC_Residue(object):
                             atomCoords[akl[3]] = numpy.round(
                                 acak3, 3
                             )  # round to PDB format 8.3
+                            # record for IC_Chain.init_atom_array()
+                            self._assembly_steps.append((h1k, d))
                             # if dbg:
                             #    print(
                             #        "        3- finished, ak:",
@@ -0,0 +1,169 @@
+# Copyright 2020 by the Biopython developers.  All rights reserved.
+#
+# This file is part of the Biopython distribution and governed by your
+# choice of the "Biopython License Agreement" or the "BSD 3-Clause License".
+# Please see the LICENSE file that should have been included as part of this
+# package.
+
+"""Parallel loading of many structure files.
+
+The parse_structures function reads PDB, mmCIF and MMTF files in a pool of
+worker processes, for example all the files of a local copy of the PDB made
+with PDBList. Rather than sending whole Structure objects between processes
+(which is slow, as each Atom and Residue is pickled on its own), the workers
+send the atoms as NumPy arrays from the Bio.PDB.atom_columns module, and the
+Structure objects are built from these in the main process.
+
+An error reading a file is reported with that file, and does not stop the
+other files being read:
+
+>>> from Bio.PDB.parallel import parse_structures
+>>> filenames = ["PDB/1A8O.pdb", "PDB/2BEG.cif", "PDB/missing.pdb"]
+>>> for filename, structure, error in parse_structures(filenames, workers=2):
+...     if error is None:
+...         print(filename, structure.id, len(list(structure.get_atoms())))
+...     else:
+...         print(filename, type(error).__name__)
+...
+PDB/1A8O.pdb 1A8O 644
+PDB/2BEG.cif 2BEG 18550
+PDB/missing.pdb FileNotFoundError
+
+The headers of the files are not parsed.
+"""
+
+import gzip
+import os
+import warnings
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from Bio.PDB.atom_columns import build_structure
+from Bio.PDB.atom_columns import columns_from_structure
+from Bio.PDB.atom_columns import read_mmcif_columns
+from Bio.PDB.atom_columns import read_pdb_columns
+from Bio.PDB.PDBExceptions import PDBConstructionWarning
+
+# File extensions of each format, as used by PDBList
+_ExtensionToFormat = {".pdb": "pdb", ".ent": "pdb", ".cif": "mmcif", ".mmtf": "mmtf"}
+
+
+def _split_filename(filename):
+    """Return the structure id and format of a file from its name (PRIVATE).
+
+    A .gz extension is ignored, and so is the pdb prefix used for the PDB
+    format files from PDBList (e.g. pdb1fat.ent).
+    """
+    name = os.path.basename(filename)
+    if name.lower().endswith(".gz"):
+        name = name[:-3]
+    name, extension = os.path.splitext(name)
+    format = _ExtensionToFormat.get(extension.lower())
+    if extension.lower() == ".ent" and name.lower().startswith("pdb"):
+        name = name[3:]
+    return name, format
+
+
+def _find_files(directory):
+    """Return the structure files in a directory and its subdirectories (PRIVATE)."""
+    filenames = []
+    for dirpath, dirnames, names in os.walk(directory):
+        dirnames.sort()
+        for name in sorted(names):
+            if _split_filename(name)[1] is not None:
+                filenames.append(os.path.join(dirpath, name))
+    return filenames
+
+
+def _read_columns(filename, format, quiet):
+    """Read the atoms of a structure file as columns (PRIVATE).
+
+    This runs in the worker processes.
+    """
+    if format not in ("pdb", "mmcif", "mmtf"):
+        raise ValueError("Unknown format %r for file %s" % (format, filename))
+    with warnings.catch_warnings():
+        if quiet:
+            warnings.filterwarnings("ignore", category=PDBConstructionWarning)
+        if format == "mmtf":
+            from Bio.PDB.mmtf import get_from_decoded
+            from mmtf import parse, parse_gzip
+
+            if filename.lower().endswith(".gz"):
+                decoder = parse_gzip(filename)
+            else:
+                decoder = parse(filename)
+            return columns_from_structure(get_from_decoded(decoder))
+        if filename.lower().endswith(".gz"):
+            handle = gzip.open(filename, "rt")
+        else:
+            handle = open(filename)
+        with handle:
+            if format == "pdb":
+                return read_pdb_columns(handle)
+            else:
+                return read_mmcif_columns(handle)
+
+
+def parse_structures(filenames, format=None, workers=None, columns=False, QUIET=False):
+    """Read many structure files using a pool of processes.
+
+    Arguments:
+     - filenames - list of file names, OR the name of a directory to
+       search (including subdirectories) for structure files.
+     - format - "pdb", "mmcif" or "mmtf". By default (None) the format of
+       each file is taken from its extension (.pdb, .ent, .cif or .mmtf,
+       optionally followed by .gz for gzip compressed files).
+     - workers - number of worker processes, defaults to the number of
+       CPUs.
+     - columns - Evaluated as a Boolean. If true, return the atoms as a
+       dictionary of NumPy arrays (see Bio.PDB.atom_columns) rather than
+       as a Structure object. This avoids the time taken to build the
+       Structure objects in the main process.
+     - QUIET - Evaluated as a Boolean. If true, warnings issued in
+       constructing the structures will be suppressed.
+
+    This is a generator function, yielding a (filename, result, error)
+    tuple for each file in the order given. The result is the Structure
+    object (with the file name without extensions as its id), or the
+    dictionary of columns, and the error is None. If the file could not
+    be read, the result is None and the error is the exception raised.
+
+    Only a few files per worker are read ahead of those being consumed,
+    limiting the memory used.
+    """
+    if isinstance(filenames, str):
+        filenames = _find_files(filenames)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        try:
+            for filename in filenames:
+                structure_id, file_format = _split_filename(filename)
+                future = executor.submit(
+                    _read_columns, filename, format or file_format, QUIET
+                )
+                pending.append((filename, structure_id, future))
+                if len(pending) > 2 * workers:
+                    yield _result(*pending.popleft(), columns, QUIET)
+            while pending:
+                yield _result(*pending.popleft(), columns, QUIET)
+        finally:
+            # If stopped early, do not read the rest of the files
+            for filename, structure_id, future in pending:
+                future.cancel()
+
+
+def _result(filename, structure_id, future, columns, quiet):
+    """Return the result for one file of parse_structures (PRIVATE)."""
+    try:
+        result = future.result()
+        if not columns:
+            with warnings.catch_warnings():
+                if quiet:
+                    warnings.filterwarnings("ignore", category=PDBConstructionWarning)
+                result = build_structure(structure_id, result)
+    except Exception as error:
+        return filename, None, error
+    return filename, result, None
@@ -0,0 +1,237 @@
+# Copyright 2020 by the Biopython developers.  All rights reserved.
+#
+# This file is part of the Biopython distribution and governed by your
+# choice of the "Biopython License Agreement" or the "BSD 3-Clause License".
+# Please see the LICENSE file that should have been included as part of this
+# package.
+
+"""RMSD matrices between many sets of coordinates.
+
+The Superimposer, SVDSuperimposer and QCPSuperimposer classes superimpose
+one pair of coordinate sets at a time. For clustering the models of an NMR
+ensemble or the frames of a simulation, the rmsd_matrix function computes
+the RMSD after optimal superposition between every pair of a stack of
+coordinate sets at once, using the QCP method for all the pairs together.
+
+>>> from Bio.PDB import PDBParser
+>>> from Bio.PDB.rmsd import rmsd_matrix
+>>> structure = PDBParser().get_structure("1LCD", "PDB/1LCD.pdb")
+>>> coords = [[a.coord for a in m.get_atoms() if a.name == "CA"] for m in structure]
+>>> matrix = rmsd_matrix(coords)
+>>> print(matrix.shape)
+(3, 3)
+>>> print("%0.2f" % matrix[0, 1])
+0.79
+
+Reference:
+
+Douglas L Theobald (2005), "Rapid calculation of RMSDs using a
+quaternion-based characteristic polynomial.", Acta Crystallogr
+A 61(4):478-480
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy
+
+# Coordinate sets of the first stack for the worker processes
+_worker_coords = None
+
+
+def _quaternion_matrix(inner):
+    """Return the 4x4 key matrices of QCP from the inner products (PRIVATE).
+
+    The inner products are an array of 3x3 matrices, the sum over the atoms
+    of the outer products of the coordinates to move and the reference.
+    """
+    Sxx, Sxy, Sxz = inner[..., 0, 0], inner[..., 0, 1], inner[..., 0, 2]
+    Syx, Syy, Syz = inner[..., 1, 0], inner[..., 1, 1], inner[..., 1, 2]
+    Szx, Szy, Szz = inner[..., 2, 0], inner[..., 2, 1], inner[..., 2, 2]
+    rows = [
+        [Sxx + Syy + Szz, Syz - Szy, Szx - Sxz, Sxy - Syx],
+        [Syz - Szy, Sxx - Syy - Szz, Sxy + Syx, Szx + Sxz],
+        [Szx - Sxz, Sxy + Syx, -Sxx + Syy - Szz, Syz + Szy],
+        [Sxy - Syx, Szx + Sxz, Syz + Szy, -Sxx - Syy + Szz],
+    ]
+    return numpy.moveaxis(numpy.array(rows), (0, 1), (-2, -1))
+
+
+def _largest_eigenvalue(inner, key, e0):
+    """Return the largest eigenvalue of each key matrix (PRIVATE).
+
+    This uses Newton's method on the characteristic polynomial, starting
+    from the upper bound e0, as in QCP.
+    """
+    c2 = -2 * (inner ** 2).sum(axis=(-2, -1)).ravel()
+    c1 = -8 * numpy.linalg.det(inner).ravel()
+    c0 = numpy.linalg.det(key).ravel()
+    eigenvalue = e0.ravel().copy()
+    for iteration in range(50):
+        x2 = eigenvalue * eigenvalue
+        value = x2 * x2 + c2 * x2 + c1 * eigenvalue + c0
+        slope = 4 * x2 * eigenvalue + 2 * c2 * eigenvalue + c1
+        with numpy.errstate(divide="ignore", invalid="ignore"):
+            step = value / slope
+        # At a repeated root, the eigenvalue is already exact
+        step[slope == 0] = 0.0
+        eigenvalue -= step
+        if (numpy.abs(step) <= 1e-11 * numpy.abs(eigenvalue)).all():
+            break
+    return eigenvalue.reshape(e0.shape)
+
+
+def _rotations(key):
+    """Return the right multiplying rotation matrices for key matrices (PRIVATE)."""
+    eigenvalues, eigenvectors = numpy.linalg.eigh(key)
+    q0, q1, q2, q3 = numpy.moveaxis(eigenvectors[..., -1], -1, 0)
+    rows = [
+        [
+            q0 * q0 + q1 * q1 - q2 * q2 - q3 * q3,
+            2 * (q1 * q2 + q0 * q3),
+            2 * (q1 * q3 - q0 * q2),
+        ],
+        [
+            2 * (q1 * q2 - q0 * q3),
+            q0 * q0 - q1 * q1 + q2 * q2 - q3 * q3,
+            2 * (q2 * q3 + q0 * q1),
+        ],
+        [
+            2 * (q1 * q3 + q0 * q2),
+            2 * (q2 * q3 - q0 * q1),
+            q0 * q0 - q1 * q1 - q2 * q2 + q3 * q3,
+        ],
+    ]
+    return numpy.moveaxis(numpy.array(rows), (0, 1), (-2, -1))
+
+
+def _rmsd_block(coords1, coords2, rotations):
+    """Return the RMSD (and rotations) between two stacks of coordinates (PRIVATE).
+
+    Both stacks must already be centered on the origin.
+    """
+    n_atoms = coords1.shape[1]
+    inner = numpy.tensordot(coords1, coords2, axes=([1], [1])).transpose(0, 2, 1, 3)
+    squares1 = (coords1 ** 2).sum(axis=(1, 2))
+    squares2 = (coords2 ** 2).sum(axis=(1, 2))
+    e0 = (squares1[:, None] + squares2[None, :]) / 2
+    key = _quaternion_matrix(inner)
+    eigenvalue = _largest_eigenvalue(inner, key, e0)
+    rmsd = numpy.sqrt(numpy.maximum(2 * (e0 - eigenvalue) / n_atoms, 0))
+    if rotations:
+        return rmsd, _rotations(key)
+    return rmsd, None
+
+
+def _set_worker_coords(coords):
+    """Store the coordinates in a worker process (PRIVATE)."""
+    global _worker_coords
+    _worker_coords = coords
+
+
+def _worker_block(start, end, coords2, rotations):
+    """Compute a block of rows of the matrix in a worker process (PRIVATE)."""
+    if coords2 is None:
+        coords2 = _worker_coords[start:]
+    return _rmsd_block(_worker_coords[start:end], coords2, rotations)
+
+
+def _centered(coords, name):
+    """Return a stack of coordinates as a centered float array (PRIVATE)."""
+    coords = numpy.asarray(coords, dtype=numpy.float64)
+    if coords.ndim != 3 or coords.shape[2] != 3:
+        raise ValueError("Expected %s as an array of shape (M, N, 3)" % name)
+    return coords - coords.mean(axis=1, keepdims=True)
+
+
+def rmsd_matrix(coords, reference=None, rotations=False, workers=1, block_size=256):
+    """Return the RMSD after superposition between many coordinate sets.
+
+    Arguments:
+     - coords - array of shape (M, N, 3), with M sets of coordinates of
+       N atoms each (for example the frames of a simulation, or a list of
+       the coordinates of the same atoms in each model).
+     - reference - optional array of shape (K, N, 3). If given, each set of
+       coords is compared to each reference, rather than to each other.
+     - rotations - Evaluated as a Boolean. If true, also return the
+       rotation matrices of the superpositions.
+     - workers - number of processes to split the work between. The
+       default (1) does all the work in this process.
+     - block_size - number of rows of the matrix to compute together,
+       limiting the memory used to about 1 kB per element of a block
+       (or 2 kB with rotations).
+
+    Returns an array of shape (M, M), or (M, K) if reference is given,
+    with the RMSD between coords[i] and coords[j] (or reference[j]) at
+    [i, j]. With rotations, returns a tuple of this and an array of shape
+    (M, M, 3, 3), or (M, K, 3, 3), with the right multiplying rotation
+    matrix (as from the get_rotran method of the superimposers) which
+    puts coords[i] on top of coords[j] (or reference[j]) at [i, j], after
+    both are centered on the origin. The translation is then given by the
+    centroid of coords[j] minus the centroid of coords[i] times the
+    rotation.
+
+    >>> import numpy
+    >>> from Bio.PDB.rmsd import rmsd_matrix
+    >>> coords = numpy.array([[0, 0, 0], [1, 0, 0], [0, 2, 0], [0, 0, 3]])
+    >>> turned = numpy.array([[0, 0, 0], [0, 1, 0], [-2, 0, 0], [0, 0, 3]])
+    >>> matrix, rotations = rmsd_matrix([coords, turned], rotations=True)
+    >>> print(numpy.round(matrix, 6).tolist())
+    [[0.0, 0.0], [0.0, 0.0]]
+    >>> print(rotations[0, 1].round().astype(int).tolist())
+    [[0, 1, 0], [-1, 0, 0], [0, 0, 1]]
+
+    """
+    coords = _centered(coords, "coords")
+    if reference is not None:
+        reference = _centered(reference, "reference")
+        if reference.shape[1] != coords.shape[1]:
+            raise ValueError("The coords and reference have different numbers of atoms")
+        n_columns = len(reference)
+    else:
+        n_columns = len(coords)
+    n_rows = len(coords)
+    matrix = numpy.zeros((n_rows, n_columns))
+    if rotations:
+        rotation_matrix = numpy.zeros((n_rows, n_columns, 3, 3))
+    starts = range(0, n_rows, block_size)
+
+    def store(start, block):
+        rmsd, rotation = block
+        end = start + len(rmsd)
+        if reference is not None:
+            matrix[start:end] = rmsd
+            if rotations:
+                rotation_matrix[start:end] = rotation
+        else:
+            # Only the upper triangle is needed, the rest is found by symmetry
+            matrix[start:end, start:] = rmsd
+            if rotations:
+                rotation_matrix[start:end, start:] = rotation
+
+    if workers == 1:
+        for start in starts:
+            end = start + block_size
+            other = reference if reference is not None else coords[start:]
+            store(start, _rmsd_block(coords[start:end], other, rotations))
+    else:
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_set_worker_coords, initargs=(coords,)
+        ) as executor:
+            futures = [
+                executor.submit(
+                    _worker_block, start, start + block_size, reference, rotations
+                )
+                for start in starts
+            ]
+            for start, future in zip(starts, futures):
+                store(start, future.result())
+    if reference is None:
+        lower = numpy.tril_indices(n_rows, -1)
+        matrix[lower] = matrix.T[lower]
+        if rotations:
+            rotation_matrix[lower] = rotation_matrix.transpose(1, 0, 3, 2)[lower]
+        # Avoid rounding errors in comparing each set to itself
+        numpy.fill_diagonal(matrix, 0.0)
+    if rotations:
+        return matrix, rotation_matrix
+    return matrix
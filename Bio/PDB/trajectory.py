@@ -0,0 +1,242 @@
+# Copyright 2020 by the Biopython developers.  All rights reserved.
+#
+# This file is part of the Biopython distribution and governed by your
+# choice of the "Biopython License Agreement" or the "BSD 3-Clause License".
+# Please see the LICENSE file that should have been included as part of this
+# package.
+
+"""Trajectories and ensembles of many models with the same atoms.
+
+The PDBParser builds a separate Model object, with its own chains, residues
+and atoms, for each model of a file. For the many frames of a simulation or
+a large NMR ensemble, the Trajectory class instead keeps a single Model as
+the topology, and the coordinates of all the frames in one NumPy array of
+shape (frames, atoms, 3), which can be a memory mapped file:
+
+>>> from Bio.PDB.trajectory import Trajectory
+>>> trajectory = Trajectory.from_pdb("1SSU", "PDB/1SSU_mod.pdb")
+>>> print(trajectory)
+<Trajectory id=1SSU frames=2 atoms=2>
+>>> print(trajectory.coords.shape)
+(2, 2, 3)
+
+Getting a frame (or iterating over the trajectory) returns the topology
+Model with the coordinates of its atoms set to views of that frame:
+
+>>> for model in trajectory:
+...     print("%0.3f %0.3f %0.3f" % tuple(model["A"][1]["N"].coord))
+-1.058 1.426 -20.149
+7.024 -5.098 -18.103
+
+Note the same Model object is returned for every frame, so getting another
+frame changes its coordinates; use its copy method to keep a frame.
+"""
+
+import io
+
+import numpy
+
+from Bio.File import as_handle
+
+from Bio.PDB.atom_columns import _fixed_width
+from Bio.PDB.atom_columns import _pdb_records
+from Bio.PDB.atom_columns import build_structure
+from Bio.PDB.atom_columns import read_pdb_columns
+from Bio.PDB.PDBExceptions import PDBConstructionException
+from Bio.PDB.Structure import Structure
+
+
+def _pdb_frames(handle):
+    """Return the ATOM and HETATM records of each frame of a PDB file (PRIVATE).
+
+    A frame ends at an ENDMDL or END record, or at a MODEL record after
+    atoms without an ENDMDL record.
+    """
+    lines = []
+    for line in handle:
+        record_type = line[0:6]
+        if record_type == "ATOM  " or record_type == "HETATM":
+            lines.append(line)
+        elif record_type in ("ENDMDL", "END   ", "END\n", "MODEL "):
+            if lines:
+                yield lines
+                lines = []
+    if lines:
+        yield lines
+
+
+def _topology(structure_id, lines):
+    """Build the topology model from the atom records of a frame (PRIVATE).
+
+    Also returns the record number of each atom of the model, as the model
+    may have the atoms in another order (e.g. for a discontinuous chain).
+    """
+    if not lines:
+        raise ValueError("No atoms found")
+    columns = read_pdb_columns(io.StringIO("".join(lines)))
+    coords = columns["coord"]
+    # Use the record number as a coordinate to find the order of the atoms
+    index_coords = numpy.zeros(coords.shape, "f")
+    index_coords[:, 0] = numpy.arange(len(coords))
+    columns["coord"] = index_coords
+    model = build_structure(structure_id, columns)[0]
+    order = model.get_coords()[:, 0].astype(int)
+    model.set_coords(coords[order])
+    if len(order) != len(lines):
+        raise ValueError("Disordered atoms are not supported in a trajectory")
+    return model, order
+
+
+def _frame_coords(lines, order, index):
+    """Return the coordinates of a frame in the order of the model (PRIVATE)."""
+    if len(lines) != len(order):
+        raise ValueError(
+            "Frame %i has %i atoms, not %i" % (index, len(lines), len(order))
+        )
+    records = _pdb_records(lines)
+    try:
+        coords = numpy.column_stack(
+            [
+                _fixed_width(records, start, start + 8).astype("f")
+                for start in (30, 38, 46)
+            ]
+        )
+    except ValueError:
+        raise PDBConstructionException("Invalid or missing coordinate(s)") from None
+    return coords[order]
+
+
+class Trajectory:
+    """Many frames of coordinates for the atoms of one Model.
+
+    The model gives the topology (chains, residues and atoms) of the
+    trajectory, and coords is an array of shape (frames, atoms, 3) with
+    the coordinates of the atoms from the get_atoms method of the model,
+    in that order, for each frame.
+    """
+
+    def __init__(self, model, coords):
+        """Initialize the class.
+
+        Arguments:
+         - model - Model object with the atoms of each frame.
+         - coords - array of shape (frames, atoms, 3), such as a memory
+           mapped array from numpy.load with mmap_mode="r". This is not
+           copied.
+
+        """
+        self.model = model
+        self.coords = coords
+        self._atoms = list(model.get_atoms())
+        if coords.ndim != 3 or coords.shape[1:] != (len(self._atoms), 3):
+            raise ValueError(
+                "Expected coordinates of shape (frames, %i, 3), not %r"
+                % (len(self._atoms), coords.shape)
+            )
+
+    def __repr__(self):
+        """Return the trajectory identifier, and numbers of frames and atoms."""
+        structure = self.model.get_parent()
+        structure_id = structure.id if structure is not None else None
+        return "<Trajectory id=%s frames=%i atoms=%i>" % (
+            structure_id,
+            len(self),
+            len(self._atoms),
+        )
+
+    def __len__(self):
+        """Return the number of frames."""
+        return len(self.coords)
+
+    def __getitem__(self, index):
+        """Return the model for a frame, or a trajectory of some frames.
+
+        An integer index returns the model with the coordinates of that
+        frame (see the get_model method). A slice (or an array of frame
+        indices or Booleans) returns a new Trajectory of those frames,
+        sharing the same model. For a slice the coordinates are a view of
+        those of this trajectory.
+        """
+        if isinstance(index, (int, numpy.integer)):
+            return self.get_model(index)
+        return Trajectory(self.model, self.coords[index])
+
+    def __iter__(self):
+        """Iterate over the model for each frame (see the get_model method)."""
+        for index in range(len(self)):
+            yield self.get_model(index)
+
+    def get_model(self, index):
+        """Return the model with the coordinates of the given frame.
+
+        The coordinates of each atom of the model are set to a view of its
+        row of the coordinates of the frame, so changing the coordinates
+        of an atom changes the trajectory (unless this is read only). The
+        same Model object is returned for every frame.
+        """
+        for atom, coord in zip(self._atoms, self.coords[index]):
+            atom.coord = coord
+        return self.model
+
+    @classmethod
+    def from_structure(cls, structure):
+        """Create a trajectory from the models of a Structure.
+
+        The first model (copied) is used as the topology, and each model
+        must have the same number of atoms (from its get_atoms method), in
+        the same order.
+        """
+        models = list(structure)
+        if not models:
+            raise ValueError("The structure has no models")
+        coords = [model.get_coords() for model in models]
+        for model, frame in zip(models, coords):
+            if frame.shape != coords[0].shape:
+                raise ValueError(
+                    "Model %s has %i atoms, not %i"
+                    % (model.id, len(frame), len(coords[0]))
+                )
+        topology = models[0].copy()
+        Structure(structure.id).add(topology)
+        return cls(topology, numpy.array(coords, "f"))
+
+    @classmethod
+    def from_pdb(cls, structure_id, source, memmap=None):
+        """Read a trajectory from a PDB file with many models.
+
+        Arguments:
+         - structure_id - the id of the Structure holding the topology.
+         - source - name of the PDB file OR an open filehandle.
+         - memmap - optional name of a NumPy .npy file to write the
+           coordinates to, which is then memory mapped, rather than
+           keeping all the coordinates in memory. The file is read twice
+           (first to count the frames), so a filehandle must be seekable.
+
+        The topology is built from the first model. Each frame must have
+        the same atom records as the first, in the same order, as written
+        by simulation programs; only the coordinates of the later frames
+        are read. A frame ends at an ENDMDL or END record.
+        """
+        if memmap is None:
+            with as_handle(source) as handle:
+                frames = _pdb_frames(handle)
+                model, order = _topology(structure_id, next(frames, None))
+                coords = [model.get_coords()]
+                for lines in frames:
+                    coords.append(_frame_coords(lines, order, len(coords)))
+            return cls(model, numpy.array(coords, "f"))
+
+        with as_handle(source) as handle:
+            start = handle.tell()
+            count = sum(1 for lines in _pdb_frames(handle))
+            handle.seek(start)
+            frames = _pdb_frames(handle)
+            model, order = _topology(structure_id, next(frames, None))
+            coords = numpy.lib.format.open_memmap(
+                memmap, mode="w+", dtype="f", shape=(count, len(order), 3)
+            )
+            coords[0] = model.get_coords()
+            for index, lines in enumerate(frames, 1):
+                coords[index] = _frame_coords(lines, order, index)
+        coords.flush()
+        return cls(model, coords)
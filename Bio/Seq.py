@@ -55,6 +55,8 @@ def _maketrans(complement_mapping):
 
 _dna_complement_table = _maketrans(ambiguous_dna_complement)
 _rna_complement_table = _maketrans(ambiguous_rna_complement)
+_dna_complement_table_bytes = bytes(_dna_complement_table.get(i, i) for i in range(256))
+_rna_complement_table_bytes = bytes(_rna_complement_table.get(i, i) for i in range(256))
 
 
 class Seq:
@@ -98,16 +100,60 @@ class Seq:
         Seq('MKQHKAMIVALIVICITAVVAALVTRKDLCEVHIRTGQTEVAVF')
         >>> print(my_seq)
         MKQHKAMIVALIVICITAVVAALVTRKDLCEVHIRTGQTEVAVF
-        """
-        # Enforce string storage
-        if not isinstance(data, str):
-            raise TypeError(
-                "The sequence data given to a Seq object should "
-                "be a string (not another Seq object etc)"
-            )
-        self._data = data
+
+        The sequence data can also be given as a bytes-like object (such
+        as bytes, a read-only memoryview, or a read-only mmap) holding
+        ASCII letters. The buffer is then used directly rather than being
+        decoded to a string, and slicing the Seq returns views on the same
+        buffer without copying the sequence data:
+
+        >>> my_seq = Seq(b"ACGTTGCA")
+        >>> my_seq[2:6]
+        Seq('GTTG')
+        >>> my_seq.reverse_complement()
+        Seq('TGCAACGT')
+        >>> bytes(my_seq[::2])
+        b'AGTC'
+
+        Writable buffers such as bytearray are copied, as otherwise
+        changing the buffer would change the (immutable) Seq object.
+        """
+        if isinstance(data, str):
+            self._data = data
+        else:
+            try:
+                view = memoryview(data)
+            except TypeError:
+                raise TypeError(
+                    "The sequence data given to a Seq object should "
+                    "be a string or bytes-like object (not another Seq object etc)"
+                ) from None
+            if view.ndim != 1 or view.itemsize != 1:
+                raise TypeError(
+                    "The sequence data given to a Seq object should be a "
+                    "one-dimensional buffer of single bytes"
+                )
+            if not view.readonly:
+                # Take a private copy to keep the Seq immutable
+                view = memoryview(view.tobytes())
+            elif view.format != "B":
+                view = view.cast("B")
+            self._data = view
         self.alphabet = alphabet  # Seq API requirement
 
+    def __getstate__(self):
+        """Return the state for pickling, with any buffer copied as bytes."""
+        state = self.__dict__.copy()
+        if isinstance(state.get("_data"), memoryview):
+            state["_data"] = state["_data"].tobytes()
+        return state
+
+    def __setstate__(self, state):
+        """Restore the state after unpickling."""
+        self.__dict__.update(state)
+        if isinstance(state.get("_data"), bytes):
+            self._data = memoryview(self._data)
+
     def __repr__(self):
         """Return (truncated) representation of the sequence for debugging."""
         if len(self) > 60:
@@ -116,7 +162,7 @@ class Seq:
             # Note total length is 54+3+3=60
             return f"{self.__class__.__name__}('{str(self)[:54]}...{str(self)[-3:]}')"
         else:
-            return f"{self.__class__.__name__}({self._data!r})"
+            return f"{self.__class__.__name__}({str(self)!r})"
 
     def __str__(self):
         """Return the full sequence as a python string, use str(my_seq).
@@ -135,7 +181,24 @@ class Seq:
                 as_string = str(seq_obj)
 
         """
-        return self._data
+        data = self._data
+        if isinstance(data, str):
+            return data
+        if data.contiguous:
+            return str(data, "ASCII")
+        return data.tobytes().decode("ASCII")
+
+    def __bytes__(self):
+        """Return the full sequence as a bytes object, use bytes(my_seq).
+
+        >>> from Bio.Seq import Seq
+        >>> bytes(Seq("ACGT"))
+        b'ACGT'
+        """
+        data = self._data
+        if isinstance(data, str):
+            return data.encode("ASCII")
+        return data.tobytes()
 
     def __hash__(self):
         """Hash of the sequence as a string (ignoring alphabet) for comparison.
@@ -228,6 +291,8 @@ class Seq:
         """
         if isinstance(index, int):
             # Return a single letter as a string
+            if isinstance(self._data, memoryview):
+                return chr(self._data[index])
             return self._data[index]
         else:
             # Return the (sub)sequence as another Seq object
@@ -864,22 +929,34 @@ class Seq:
         base = Alphabet._get_base_alphabet(self.alphabet)
         if isinstance(base, Alphabet.ProteinAlphabet):
             raise ValueError("Proteins do not have complements!")
+        data = self._data
+        if isinstance(data, memoryview):
+            # Work on the raw bytes, avoiding decoding to a string
+            data = data.tobytes()
+            u, t = b"Uu", b"Tt"
+        else:
+            u, t = "Uu", "Tt"
         if isinstance(base, Alphabet.DNAAlphabet):
-            ttable = _dna_complement_table
+            rna = False
         elif isinstance(base, Alphabet.RNAAlphabet):
-            ttable = _rna_complement_table
-        elif ("U" in self._data or "u" in self._data) and (
-            "T" in self._data or "t" in self._data
-        ):
+            rna = True
+        elif (u[:1] in data or u[1:] in data) and (t[:1] in data or t[1:] in data):
             # TODO - Handle this cleanly?
             raise ValueError("Mixed RNA/DNA found")
-        elif "U" in self._data or "u" in self._data:
+        else:
+            rna = u[:1] in data or u[1:] in data
+        if isinstance(data, bytes):
+            if rna:
+                ttable = _rna_complement_table_bytes
+            else:
+                ttable = _dna_complement_table_bytes
+        elif rna:
             ttable = _rna_complement_table
         else:
             ttable = _dna_complement_table
         # Much faster on really long sequences than the previous loop based
         # one. Thanks to Michael Palmer, University of Waterloo.
-        return Seq(str(self).translate(ttable), self.alphabet)
+        return Seq(data.translate(ttable), self.alphabet)
 
     def reverse_complement(self):
         """Return the reverse complement sequence by creating a new Seq object.
@@ -1243,6 +1320,10 @@ class UnknownSeq(Seq):
         """Return the unknown sequence as full string of the given length."""
         return self._character * self._length
 
+    def __bytes__(self):
+        """Return the unknown sequence as full bytes object of the given length."""
+        return self._character.encode("ASCII") * self._length
+
     def __repr__(self):
         """Return (truncated) representation of the sequence for debugging."""
         return f"UnknownSeq({self._length}, character={self._character!r})"
@@ -724,6 +724,8 @@ class FeatureLocation:
     would use a BeforePosition object for the start.
     """
 
+    __slots__ = ("_start", "_end", "_strand", "ref", "ref_db")
+
     def __init__(self, start, end, strand=None, ref=None, ref_db=None):
         """Initialize the class.
 
@@ -805,6 +807,15 @@ class FeatureLocation:
         self.ref = ref
         self.ref_db = ref_db
 
+    def __getstate__(self):
+        """Return the attributes as a dictionary, needed for pickling."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __setstate__(self, state):
+        """Restore the attributes from a dictionary, needed for unpickling."""
+        for name, value in state.items():
+            setattr(self, name, value)
+
     def _get_strand(self):
         """Get function for the strand property (PRIVATE)."""
         return self._strand
@@ -1132,6 +1143,8 @@ class FeatureLocation:
 class CompoundLocation:
     """For handling joins etc where a feature location has several parts."""
 
+    __slots__ = ("operator", "parts")
+
     def __init__(self, parts, operator="join"):
         """Initialize the class.
 
@@ -1207,6 +1220,15 @@ class CompoundLocation:
                 "CompoundLocation should have at least 2 parts, not %r" % parts
             )
 
+    def __getstate__(self):
+        """Return the attributes as a dictionary, needed for pickling."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __setstate__(self, state):
+        """Restore the attributes from a dictionary, needed for unpickling."""
+        for name, value in state.items():
+            setattr(self, name, value)
+
     def __str__(self):
         """Return a representation of the CompoundLocation object (with python counting)."""
         return "%s{%s}" % (self.operator, ", ".join(str(loc) for loc in self.parts))
@@ -1544,6 +1566,8 @@ class CompoundLocation:
 class AbstractPosition:
     """Abstract base class representing a position."""
 
+    __slots__ = ()
+
     def __repr__(self):
         """Represent the AbstractPosition object as a string for debugging."""
         return "%s(...)" % (self.__class__.__name__)
@@ -1584,6 +1608,8 @@ class ExactPosition(int, AbstractPosition):
 
     """
 
+    __slots__ = ()
+
     def __new__(cls, position, extension=0):
         """Create an ExactPosition object."""
         if extension != 0:
@@ -1629,7 +1655,7 @@ class UncertainPosition(ExactPosition):
     XML format explicitly marked as uncertain. Does not apply to GenBank/EMBL.
     """
 
-    pass
+    __slots__ = ()
 
 
 class UnknownPosition(AbstractPosition):
@@ -1638,6 +1664,8 @@ class UnknownPosition(AbstractPosition):
     This is used in UniProt, e.g. ? or in the XML as unknown.
     """
 
+    __slots__ = ()
+
     def __repr__(self):
         """Represent the UnknownPosition object as a string for debugging."""
         return "%s()" % self.__class__.__name__
@@ -1956,6 +1984,8 @@ class BeforePosition(int, AbstractPosition):
     like integers.
     """
 
+    __slots__ = ()
+
     # Subclasses int so can't use __init__
     def __new__(cls, position, extension=0):
         """Create a new instance in BeforePosition object."""
@@ -2032,6 +2062,8 @@ class AfterPosition(int, AbstractPosition):
     like integers.
     """
 
+    __slots__ = ()
+
     # Subclasses int so can't use __init__
     def __new__(cls, position, extension=0):
         """Create a new instance of the AfterPosition object."""
@@ -2185,10 +2217,21 @@ class OneOfPosition(int, AbstractPosition):
 class PositionGap:
     """Simple class to hold information about a gap between positions."""
 
+    __slots__ = ("gap_size",)
+
     def __init__(self, gap_size):
         """Intialize with a position object containing the gap information."""
         self.gap_size = gap_size
 
+    def __getstate__(self):
+        """Return the attributes as a dictionary, needed for pickling."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __setstate__(self, state):
+        """Restore the attributes from a dictionary, needed for unpickling."""
+        for name, value in state.items():
+            setattr(self, name, value)
+
     def __repr__(self):
         """Represent the position gap as a string for debugging."""
         return "%s(%s)" % (self.__class__.__name__, repr(self.gap_size))
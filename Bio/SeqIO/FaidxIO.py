@@ -0,0 +1,315 @@
+# Copyright 2020 by the Biopython developers.  All rights reserved.
+#
+# This file is part of the Biopython distribution and governed by your
+# choice of the "Biopython License Agreement" or the "BSD 3-Clause License".
+# Please see the LICENSE file that should have been included as part of this
+# package.
+"""Random access to FASTA files using samtools faidx style indexes.
+
+This is a companion to the Bio.SeqIO.FastaIO module. Rather than a file
+format for Bio.SeqIO.parse(...) etc, it reads and writes the ``.fai``
+index files made by ``samtools faidx``, and the ``.gzi`` index files made
+by ``bgzip -i`` (or ``samtools faidx``) for BGZF compressed FASTA files.
+
+A ``.fai`` file is a tab separated table with one line per sequence,
+giving the name (the first word of the title line), the sequence length,
+the offset of the first letter in the (uncompressed) file, the number of
+letters per line, and the number of bytes per line (including the line
+ending). This is enough to locate any region of the sequence directly.
+
+>>> from Bio.SeqIO.FaidxIO import IndexedFasta
+>>> fasta = IndexedFasta("Fasta/f002")
+>>> len(fasta)
+3
+>>> list(fasta)
+['gi|1348912|gb|G26680|G26680', 'gi|1348917|gb|G26685|G26685', 'gi|1592936|gb|G29385|G29385']
+>>> print(fasta.fetch("gi|1348917|gb|G26685|G26685", 100, 130))
+TTGTAGCCTTATCCTGGTTTTACAGATGTG
+>>> fasta.close()
+
+Here no ``Fasta/f002.fai`` file exists, so the index was built in memory by
+scanning the file. Use the write_fai function to save it for reuse.
+"""
+
+import bisect
+import mmap
+import os
+import struct
+import collections.abc
+
+from Bio import Alphabet
+from Bio import bgzf
+from Bio.File import _open_for_random_access
+from Bio.SeqRecord import SeqRecord
+
+from ._index import _LazyFastaSeq, _scan_fasta_layout
+
+
+def _build_fai(handle):
+    """Return a list of samtools faidx index entries for a FASTA file (PRIVATE).
+
+    Expects a binary handle (or a BgzfReader) at the start of the file.
+    Each entry is a tuple of the name, sequence length, offset of the
+    first letter, letters per line and bytes per line. As with samtools,
+    a ValueError is raised if the line wrapping is not uniform.
+    """
+    entries = []
+    for title, _, _, offset, length, linebases, linewidth in _scan_fasta_layout(handle):
+        try:
+            name = title[1:].split(None, 1)[0].decode()
+        except IndexError:
+            raise ValueError("Missing sequence name in FASTA title line") from None
+        if linebases is None:
+            raise ValueError(f"Different line lengths in sequence {name!r}")
+        entries.append((name, length, offset, linebases, linewidth))
+    return entries
+
+
+def read_fai(handle):
+    """Read a samtools faidx ``.fai`` index file.
+
+    Arguments:
+     - handle - input stream opened in text mode, or a path to a file
+
+    Returns a list of tuples giving the name, sequence length, offset of
+    the first letter, letters per line and bytes per line of each sequence.
+    """
+    if isinstance(handle, (str, os.PathLike)):
+        with open(handle) as stream:
+            return read_fai(stream)
+    entries = []
+    for line in handle:
+        fields = line.rstrip("\r\n").split("\t")
+        if len(fields) == 6:
+            raise ValueError("FASTQ faidx indexes are not supported")
+        if len(fields) != 5:
+            raise ValueError(f"Expected 5 tab separated fields, got: {line!r}")
+        name = fields[0]
+        length, offset, linebases, linewidth = (int(value) for value in fields[1:])
+        entries.append((name, length, offset, linebases, linewidth))
+    return entries
+
+
+def write_fai(fasta_filename, fai_filename=None):
+    """Build a samtools faidx ``.fai`` index file for a FASTA file.
+
+    Arguments:
+     - fasta_filename - the FASTA file to index, optionally BGZF compressed
+     - fai_filename - the index file to write, defaults to the FASTA
+       filename with ``.fai`` appended (as used by samtools)
+
+    Returns the number of sequences indexed.
+    """
+    if fai_filename is None:
+        fai_filename = f"{fasta_filename}.fai"
+    handle = _open_for_random_access(fasta_filename)
+    try:
+        entries = _build_fai(handle)
+    finally:
+        handle.close()
+    with open(fai_filename, "w") as handle:
+        for entry in entries:
+            handle.write("%s\t%i\t%i\t%i\t%i\n" % entry)
+    return len(entries)
+
+
+def read_gzi(handle):
+    """Read a BGZF ``.gzi`` index file.
+
+    Arguments:
+     - handle - input stream opened in binary mode, or a path to a file
+
+    Returns a list of (compressed offset, uncompressed offset) tuples for
+    the start of each BGZF block, including the implicit first block at
+    (0, 0) which is not recorded in the file.
+    """
+    if isinstance(handle, (str, os.PathLike)):
+        with open(handle, "rb") as stream:
+            return read_gzi(stream)
+    data = handle.read(8)
+    if len(data) != 8:
+        raise ValueError("Truncated .gzi file")
+    (count,) = struct.unpack("<Q", data)
+    data = handle.read(16 * count)
+    if len(data) != 16 * count:
+        raise ValueError("Truncated .gzi file")
+    values = struct.unpack("<%iQ" % (2 * count), data)
+    return [(0, 0)] + list(zip(values[::2], values[1::2]))
+
+
+def _build_gzi(handle):
+    """Return the BGZF block offsets for a ``.gzi`` index (PRIVATE).
+
+    Expects a BGZF compressed file opened in binary mode (not decompressed).
+    """
+    # The first block is always at offset zero
+    return [(0, 0)] + [
+        (start, data_start)
+        for (start, _, data_start, data_length) in bgzf.BgzfBlocks(handle)
+        if start and data_length
+    ]
+
+
+def write_gzi(bgzf_filename, gzi_filename=None):
+    """Build a ``.gzi`` index file for a BGZF compressed file.
+
+    Arguments:
+     - bgzf_filename - the BGZF compressed file to index
+     - gzi_filename - the index file to write, defaults to the compressed
+       filename with ``.gzi`` appended (as used by bgzip and samtools)
+
+    Returns the number of BGZF blocks indexed.
+    """
+    if gzi_filename is None:
+        gzi_filename = f"{bgzf_filename}.gzi"
+    with open(bgzf_filename, "rb") as handle:
+        blocks = _build_gzi(handle)
+    # The first block at offset zero is implicit
+    values = [value for block in blocks[1:] for value in block]
+    with open(gzi_filename, "wb") as handle:
+        handle.write(struct.pack("<Q", len(blocks) - 1))
+        handle.write(struct.pack("<%iQ" % len(values), *values))
+    return len(blocks)
+
+
+class _BgzfBuffer:
+    """Slice a BGZF compressed file by uncompressed offsets (PRIVATE).
+
+    Uses the block offsets from a ``.gzi`` index to seek directly to the
+    block holding the start of the requested region.
+    """
+
+    def __init__(self, handle, blocks):
+        """Initialize the class."""
+        self._handle = handle
+        self._raw_starts = [raw_start for (raw_start, _) in blocks]
+        self._data_starts = [data_start for (_, data_start) in blocks]
+
+    def __getitem__(self, index):
+        """Return the uncompressed bytes for a slice (step one only)."""
+        start, stop = index.start, index.stop
+        i = bisect.bisect_right(self._data_starts, start) - 1
+        self._handle.seek(
+            bgzf.make_virtual_offset(self._raw_starts[i], start - self._data_starts[i])
+        )
+        return self._handle.read(stop - start)
+
+
+class IndexedFasta(collections.abc.Mapping):
+    """Read only dictionary interface to a FASTA file with a faidx index.
+
+    The keys are the sequence names (the first word of the title lines),
+    and the values are SeqRecord objects whose sequence is read from the
+    file on demand, so slicing it only reads the region needed.
+
+    Any existing ``.fai`` (and for BGZF compressed files, ``.gzi``) index
+    next to the FASTA file is used, otherwise the index is built in memory
+    by scanning the file. Plain FASTA files are memory mapped.
+    """
+
+    def __init__(
+        self,
+        filename,
+        fai_filename=None,
+        gzi_filename=None,
+        alphabet=Alphabet.single_letter_alphabet,
+    ):
+        """Open a FASTA file for random access.
+
+        Arguments:
+         - filename - the FASTA file, optionally BGZF compressed
+         - fai_filename - the ``.fai`` index, defaults to the FASTA filename
+           with ``.fai`` appended; built in memory if this does not exist
+         - gzi_filename - the ``.gzi`` index for a BGZF compressed file,
+           defaults to the FASTA filename with ``.gzi`` appended; built in
+           memory if this does not exist
+         - alphabet - alphabet for the sequences
+
+        """
+        if fai_filename is None:
+            fai_filename = f"{filename}.fai"
+        handle = _open_for_random_access(filename)
+        self._handle = handle
+        self._alphabet = alphabet
+        if os.path.isfile(fai_filename):
+            entries = read_fai(fai_filename)
+        else:
+            try:
+                entries = _build_fai(handle)
+            except ValueError:
+                handle.close()
+                raise
+        self._index = {
+            name: (offset, length, linebases, linewidth)
+            for (name, length, offset, linebases, linewidth) in entries
+        }
+        if isinstance(handle, bgzf.BgzfReader):
+            if gzi_filename is None:
+                gzi_filename = f"{filename}.gzi"
+            if os.path.isfile(gzi_filename):
+                blocks = read_gzi(gzi_filename)
+            else:
+                with open(filename, "rb") as raw:
+                    blocks = _build_gzi(raw)
+            self._buffer = _BgzfBuffer(handle, blocks)
+        elif self._index:
+            self._buffer = memoryview(
+                mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+            )
+        else:
+            self._buffer = None
+
+    def __len__(self):
+        """Return the number of sequences."""
+        return len(self._index)
+
+    def __iter__(self):
+        """Iterate over the sequence names."""
+        return iter(self._index)
+
+    def __contains__(self, name):
+        """Return True if the FASTA file has a sequence of this name."""
+        return name in self._index
+
+    def __getitem__(self, name):
+        """Return a SeqRecord with the sequence read on demand."""
+        offset, length, linebases, linewidth = self._index[name]
+        seq = _LazyFastaSeq(
+            self._buffer, offset, length, linebases, linewidth, self._alphabet
+        )
+        return SeqRecord(seq, id=name, name=name, description="")
+
+    def length(self, name):
+        """Return the length of the named sequence."""
+        return self._index[name][1]
+
+    def fetch(self, name, start=None, end=None):
+        """Return a region of the named sequence as a Seq object.
+
+        Arguments:
+         - name - sequence name
+         - start - start of the region (zero based, default zero)
+         - end - end of the region (exclusive, default the sequence end)
+
+        Uses Python slicing conventions, so fetch(name, 99, 200) returns
+        the region samtools faidx would describe as ``name:100-200``.
+        """
+        return self[name].seq[start:end]
+
+    def close(self):
+        """Close the file handle being used to read the data.
+
+        Any sequences already loaded from a memory mapped file keep a
+        reference to the memory map, which is closed once they are no
+        longer in use.
+        """
+        self._handle.close()
+        self._buffer = None
+
+    def __enter__(self):
+        """Return self for use in a with statement."""
+        return self
+
+    def __exit__(self, type, value, traceback):
+        """Close the file when leaving a with statement."""
+        self.close()
@@ -15,6 +15,7 @@ You are expected to use this module via the Bio.SeqIO functions.
 """
 
 
+from Bio import StreamModeError
 from Bio.Alphabet import single_letter_alphabet
 from Bio.Seq import Seq
 from Bio.SeqRecord import SeqRecord
@@ -69,6 +70,88 @@ def SimpleFastaParser(handle):
     yield title, "".join(lines).replace(" ", "").replace("\r", "")
 
 
+def SimpleFastaChunkParser(source, chunk_size=1048576):
+    """Iterate over Fasta records in batches of string lists.
+
+    Arguments:
+     - source - input stream opened in binary mode, or a path to a file
+     - chunk_size - approximate number of bytes to read at a time
+
+    This is a block oriented counterpart to SimpleFastaParser. Rather than
+    one tuple per record, it returns a tuple of two lists for each block of
+    the file read, giving the title lines (without the leading '>'
+    character) and the sequences (with any whitespace removed):
+
+    >>> for titles, seqs in SimpleFastaChunkParser("Fasta/dups.fasta"):
+    ...     print(titles)
+    ...     print(seqs)
+    ['alpha', 'beta', 'gamma', 'alpha (again - this is a duplicate entry to test the indexing code)', 'delta']
+    ['ACGTA', 'CGTC', 'CCGCC', 'ACGTA', 'CGCGC']
+
+    Each block read is cut at the last record boundary found in it, and the
+    records before that are split up using string methods, avoiding most of
+    the per-line overhead of SimpleFastaParser. A record longer than the
+    chunk size is simply collected over several reads.
+    """
+    try:
+        handle = open(source, "rb")
+    except TypeError:
+        handle = source
+        if handle.read(0) != b"":
+            raise StreamModeError(
+                "Fasta files must be opened in binary mode for chunked reading"
+            ) from None
+    try:
+        # Blocks read but not yet parsed
+        pending = []
+        # Treat the start of the file like the end of a line
+        tail = b"\n"
+        block = handle.read(chunk_size)
+        while block:
+            # Read ahead so that the final block is not cut
+            following = handle.read(chunk_size)
+            if not following:
+                pending.append(block)
+                break
+            # The new line before a record may be at the end of the last block
+            cut = (tail + block).rfind(b"\n>")
+            tail = block[-1:]
+            if cut == -1:
+                pending.append(block)
+            else:
+                pending.append(block[:cut])
+                records = _fasta_chunk_records(b"".join(pending).decode())
+                pending = [block[cut:]]
+                if records[0]:
+                    yield records
+            block = following
+        records = _fasta_chunk_records(b"".join(pending).decode())
+        if records[0]:
+            yield records
+    finally:
+        if handle is not source:
+            handle.close()
+
+
+def _fasta_chunk_records(text):
+    """Split complete Fasta records into lists of strings (PRIVATE).
+
+    Any text before the first record (e.g. blank lines, comments) is ignored.
+    """
+    titles = []
+    seqs = []
+    # Skip the (possibly empty) text before the first record
+    for record in ("\n" + text).split("\n>")[1:]:
+        title, _, seq = record.partition("\n")
+        titles.append(title.rstrip())
+        # As in SimpleFastaParser, remove trailing whitespace on each line,
+        # and any internal spaces or embedded \r characters
+        seqs.append(
+            "".join(map(str.rstrip, seq.split("\n"))).replace(" ", "").replace("\r", "")
+        )
+    return titles, seqs
+
+
 def FastaTwoLineParser(handle):
     """Iterate over no-wrapping Fasta records as string tuples.
 
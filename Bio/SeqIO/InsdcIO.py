@@ -54,13 +54,25 @@ from .Interfaces import SequenceIterator, SequenceWriter
 class GenBankIterator(SequenceIterator):
     """Parser for GenBank files."""
 
-    def __init__(self, source):
+    def __init__(
+        self, source, features=True, qualifiers=True, sequence=True, lazy_features=False
+    ):
         """Break up a Genbank file into SeqRecord objects.
 
         Argument source is a file-like object opened in text mode or a path to a file.
         Every section from the LOCUS line to the terminating // becomes
         a single SeqRecord with associated annotation and features.
 
+        Optional arguments:
+         - features - Should the feature table be parsed (default True)?
+         - qualifiers - Should the feature qualifiers be parsed (default
+           True)? If not, the features only have a type and location.
+         - sequence - Should the sequence be parsed (default True)? If not,
+           the record has an UnknownSeq of the expected length instead.
+         - lazy_features - Should each feature only be parsed when it is
+           first used (default False)? Parsing the feature locations and
+           qualifiers is most of the work for a well annotated genome.
+
         Note that for genomes or chromosomes, there is typically only
         one record.
 
@@ -90,25 +102,52 @@ class GenBankIterator(SequenceIterator):
         L31939.1
         AF297471.1
 
+        If you only need some of the annotation, the optional arguments can
+        make parsing much faster. For example, to look at the CDS features
+        without loading the sequence:
+
+        >>> records = GenBankIterator(
+        ...     "GenBank/NC_005816.gb", sequence=False, lazy_features=True
+        ... )
+        >>> for record in records:
+        ...     print(repr(record.seq))
+        ...     for feature in record.features:
+        ...         if feature.type == "CDS" and feature.location.start < 5000:
+        ...             print(feature.location, feature.qualifiers["locus_tag"])
+        UnknownSeq(9609, character='N')
+        [86:1109](+) ['YP_pPCP01']
+        [1105:1888](+) ['YP_pPCP02']
+        [2924:3119](+) ['YP_pPCP03']
+        [3485:3857](+) ['YP_pPCP04']
+        [4342:4780](+) ['YP_pPCP05']
+        [4814:5888](-) ['YP_pPCP06']
+
         """
+        self._options = (features, qualifiers, sequence, lazy_features)
         super().__init__(source, mode="t", fmt="GenBank")
 
     def parse(self, handle):
         """Start parsing the file, and return a SeqRecord generator."""
-        records = GenBankScanner(debug=0).parse_records(handle)
+        records = GenBankScanner(debug=0).parse_records(handle, *self._options)
         return records
 
 
 class EmblIterator(SequenceIterator):
     """Parser for EMBL files."""
 
-    def __init__(self, source):
+    def __init__(
+        self, source, features=True, qualifiers=True, sequence=True, lazy_features=False
+    ):
         """Break up an EMBL file into SeqRecord objects.
 
         Argument source is a file-like object opened in text mode or a path to a file.
         Every section from the LOCUS line to the terminating // becomes
         a single SeqRecord with associated annotation and features.
 
+        The optional arguments are as for the GenBankIterator, to skip
+        parsing the features, their qualifiers or the sequence, or to only
+        parse each feature when it is first used.
+
         Note that for genomes or chromosomes, there is typically only
         one record.
 
@@ -145,11 +184,12 @@ class EmblIterator(SequenceIterator):
         CQ797900.1
 
         """
+        self._options = (features, qualifiers, sequence, lazy_features)
         super().__init__(source, mode="t", fmt="EMBL")
 
     def parse(self, handle):
         """Start parsing the file, and return a SeqRecord generator."""
-        records = EmblScanner(debug=0).parse_records(handle)
+        records = EmblScanner(debug=0).parse_records(handle, *self._options)
         return records
 
 
@@ -367,6 +367,7 @@ from Bio.SeqRecord import SeqRecord
 from Bio import StreamModeError
 from .Interfaces import SequenceIterator, SequenceWriter, _clean, _get_seq_string
 
+from itertools import repeat
 from math import log
 import warnings
 from Bio import BiopythonWarning, BiopythonParserWarning
@@ -919,80 +920,252 @@ def FastqGeneralIterator(source):
         if handle.read(0) != "":
             raise StreamModeError("Fastq files must be opened in text mode") from None
     try:
-        try:
-            line = next(handle)
-        except StopIteration:
-            return  # Premature end of file, or just empty?
+        yield from _fastq_general_records(handle)
+    finally:
+        if handle is not source:
+            handle.close()
 
-        while True:
-            if line[0] != "@":
-                raise ValueError(
-                    "Records in Fastq files should start with '@' character"
-                )
-            title_line = line[1:].rstrip()
-            seq_string = ""
-            # There will now be one or more sequence lines; keep going until we
-            # find the "+" marking the quality line:
-            for line in handle:
-                if line[0] == "+":
-                    break
-                seq_string += line.rstrip()
+
+def _fastq_general_records(handle):
+    """Iterate over FASTQ records as string tuples from lines of text (PRIVATE).
+
+    This does the work for FastqGeneralIterator, and takes any iterator
+    over the lines of the file (including their line endings).
+    """
+    try:
+        line = next(handle)
+    except StopIteration:
+        return  # Premature end of file, or just empty?
+
+    while True:
+        if line[0] != "@":
+            raise ValueError("Records in Fastq files should start with '@' character")
+        title_line = line[1:].rstrip()
+        seq_string = ""
+        # There will now be one or more sequence lines; keep going until we
+        # find the "+" marking the quality line:
+        for line in handle:
+            if line[0] == "+":
+                break
+            seq_string += line.rstrip()
+        else:
+            if seq_string:
+                raise ValueError("End of file without quality information.")
             else:
-                if seq_string:
-                    raise ValueError("End of file without quality information.")
-                else:
-                    raise ValueError("Unexpected end of file")
-            # The title here is optional, but if present must match!
-            second_title = line[1:].rstrip()
-            if second_title and second_title != title_line:
-                raise ValueError("Sequence and quality captions differ.")
-            # This is going to slow things down a little, but assuming
-            # this isn't allowed we should try and catch it here:
-            if " " in seq_string or "\t" in seq_string:
-                raise ValueError("Whitespace is not allowed in the sequence.")
-            seq_len = len(seq_string)
-
-            # There will now be at least one line of quality data, followed by
-            # another sequence, or EOF
+                raise ValueError("Unexpected end of file")
+        # The title here is optional, but if present must match!
+        second_title = line[1:].rstrip()
+        if second_title and second_title != title_line:
+            raise ValueError("Sequence and quality captions differ.")
+        # This is going to slow things down a little, but assuming
+        # this isn't allowed we should try and catch it here:
+        if " " in seq_string or "\t" in seq_string:
+            raise ValueError("Whitespace is not allowed in the sequence.")
+        seq_len = len(seq_string)
+
+        # There will now be at least one line of quality data, followed by
+        # another sequence, or EOF
+        line = None
+        quality_string = ""
+        for line in handle:
+            if line[0] == "@":
+                # This COULD be the start of a new sequence. However, it MAY just
+                # be a line of quality data which starts with a "@" character.  We
+                # should be able to check this by looking at the sequence length
+                # and the amount of quality data found so far.
+                if len(quality_string) >= seq_len:
+                    # We expect it to be equal if this is the start of a new record.
+                    # If the quality data is longer, we'll raise an error below.
+                    break
+                # Continue - its just some (more) quality data.
+            quality_string += line.rstrip()
+        else:
+            if line is None:
+                raise ValueError("Unexpected end of file")
             line = None
-            quality_string = ""
-            for line in handle:
-                if line[0] == "@":
-                    # This COULD be the start of a new sequence. However, it MAY just
-                    # be a line of quality data which starts with a "@" character.  We
-                    # should be able to check this by looking at the sequence length
-                    # and the amount of quality data found so far.
-                    if len(quality_string) >= seq_len:
-                        # We expect it to be equal if this is the start of a new record.
-                        # If the quality data is longer, we'll raise an error below.
-                        break
-                    # Continue - its just some (more) quality data.
-                quality_string += line.rstrip()
-            else:
-                if line is None:
-                    raise ValueError("Unexpected end of file")
-                line = None
 
-            if seq_len != len(quality_string):
-                raise ValueError(
-                    "Lengths of sequence and quality values differs for %s (%i and %i)."
-                    % (title_line, seq_len, len(quality_string))
-                )
+        if seq_len != len(quality_string):
+            raise ValueError(
+                "Lengths of sequence and quality values differs for %s (%i and %i)."
+                % (title_line, seq_len, len(quality_string))
+            )
 
-            # Return the record and then continue...
-            yield (title_line, seq_string, quality_string)
+        # Return the record and then continue...
+        yield (title_line, seq_string, quality_string)
 
-            if line is None:
-                break
+        if line is None:
+            break
+
+
+def FastqGeneralChunkIterator(source, chunk_size=1048576):
+    """Iterate over Fastq records in batches of string lists.
+
+    Arguments:
+     - source - input stream opened in binary mode, or a path to a file
+     - chunk_size - approximate number of bytes to read at a time
+
+    This is a block oriented counterpart to FastqGeneralIterator. Rather
+    than one tuple per record, it returns a tuple of three lists for each
+    block of the file read, giving the titles, sequences and quality strings
+    of the records in that block:
+
+    >>> for titles, seqs, quals in FastqGeneralChunkIterator("Quality/example.fastq"):
+    ...     print(titles)
+    ...     print(quals)
+    ['EAS54_6_R1_2_1_413_324', 'EAS54_6_R1_2_1_540_792', 'EAS54_6_R1_2_1_443_348']
+    [';;3;;;;;;;;;;;;7;;;;;;;88', ';;;;;;;;;;;7;;;;;-;;;3;83', ';;;;;;;;;;;9;7;;.7;393333']
+
+    Reading large blocks and splitting them with string methods avoids most
+    of the per-line and per-record overhead of FastqGeneralIterator, and the
+    batches are convenient to hand out to other processes.
+
+    Blocks using the common layout of four lines per record are split up
+    directly. Once a record with line wrapping is found, the rest of the
+    file is parsed using the same logic as FastqGeneralIterator (with the
+    records still returned in batches), which also reports any problems:
+
+    >>> for titles, seqs, quals in FastqGeneralChunkIterator("Quality/tricky.fastq"):
+    ...     print(seqs[-1])
+    TGGGAGGTTTTATGTGGAAAGCAGCAATGTACAAGA
+    """
+    try:
+        handle = open(source, "rb")
+    except TypeError:
+        handle = source
+        if handle.read(0) != b"":
+            raise StreamModeError(
+                "Fastq files must be opened in binary mode for chunked reading"
+            ) from None
+    try:
+        data = b""
+        block = handle.read(chunk_size)
+        while block:
+            # Read ahead to know if this is the final block
+            following = handle.read(chunk_size)
+            data += block
+            if following:
+                # Only use complete lines
+                end = data.rfind(b"\n") + 1
+            else:
+                end = len(data)
+            lines = data[:end].decode().split("\n")
+            if not lines[-1]:
+                # Empty string after the final new line
+                lines.pop()
+            count = len(lines) - len(lines) % 4
+            records = _fastq_chunk_records(lines[:count])
+            if following and count < len(lines) and lines[count][:1] != "@":
+                # Next record does not start as expected
+                records = None
+            if records is None:
+                # Not the simple four line layout, fall back on the full logic
+                yield from _fastq_wrapped_chunks(
+                    lines, data[end:] + following, handle, chunk_size
+                )
+                return
+            if following and count:
+                # Hold back the last record, in case more lines belong to it
+                count -= 4
+                for values in records:
+                    values.pop()
+            if records[0]:
+                yield records
+            if following:
+                # Keep any incomplete record for the next block
+                data = (
+                    "".join(line + "\n" for line in lines[count:]).encode() + data[end:]
+                )
+            elif "".join(lines[count:]).strip():
+                # Let the full logic explain the problem
+                yield from _fastq_wrapped_chunks(lines[count:], b"", handle, chunk_size)
+            block = following
     finally:
         if handle is not source:
             handle.close()
 
 
+def _fastq_chunk_records(lines):
+    """Split complete four line Fastq records into lists of strings (PRIVATE).
+
+    Returns the titles, sequences and qualities, or None if the lines do not
+    follow the simple layout of four lines per record.
+    """
+    title_lines = lines[0::4]
+    plus_lines = list(map(str.rstrip, lines[2::4]))
+    if not all(map(str.startswith, title_lines, repeat("@"))):
+        return None
+    titles = [line[1:] for line in map(str.rstrip, title_lines)]
+    if plus_lines.count("+") != len(plus_lines):
+        # Check for any repeated titles on the plus lines
+        for title, line in zip(titles, plus_lines):
+            if line[:1] != "+" or (line != "+" and line[1:] != title):
+                return None
+    seqs = list(map(str.rstrip, lines[1::4]))
+    quals = list(map(str.rstrip, lines[3::4]))
+    if list(map(len, seqs)) != list(map(len, quals)):
+        return None
+    text = "".join(seqs)
+    if " " in text or "\t" in text:
+        return None
+    return titles, seqs, quals
+
+
+def _fastq_wrapped_chunks(lines, data, handle, chunk_size):
+    """Continue FastqGeneralChunkIterator using the full Fastq logic (PRIVATE).
+
+    Takes the lines of text already read (without their line endings), any
+    remaining undecoded data, and the binary handle to read the rest from.
+    """
+
+    def iterate_lines(data):
+        for line in lines:
+            yield line + "\n"
+        while True:
+            block = handle.read(chunk_size)
+            data += block
+            if block:
+                end = data.rfind(b"\n") + 1
+            else:
+                end = len(data)
+            text_lines = data[:end].decode().split("\n")
+            data = data[end:]
+            last = text_lines.pop()
+            for line in text_lines:
+                yield line + "\n"
+            if last:
+                yield last
+            if not block:
+                break
+
+    titles = []
+    seqs = []
+    quals = []
+    size = 0
+    for title, seq, qual in _fastq_general_records(iterate_lines(data)):
+        titles.append(title)
+        seqs.append(seq)
+        quals.append(qual)
+        size += len(title) + 2 * len(seq)
+        if size >= chunk_size:
+            yield titles, seqs, quals
+            titles = []
+            seqs = []
+            quals = []
+            size = 0
+    if titles:
+        yield titles, seqs, quals
+
+
 class FastqPhredIterator(SequenceIterator):
     """Parser for FASTQ files."""
 
-    def __init__(self, source, alphabet=single_letter_alphabet, title2ids=None):
+    def __init__(
+        self,
+        source,
+        alphabet=single_letter_alphabet,
+        title2ids=None,
+        quality_array=False,
+    ):
         """Iterate over FASTQ records as SeqRecord objects.
 
         Arguments:
@@ -1003,6 +1176,10 @@ class FastqPhredIterator(SequenceIterator):
            description (in that order) for the record as a tuple of strings.
            If this is not given, then the entire title line will be used as
            the description, and the first word as the id and name.
+         - quality_array - Optional boolean, default False. If True, the
+           PHRED qualities are stored as a NumPy array of unsigned bytes
+           (dtype uint8) rather than as a list of integers, which is faster
+           to decode and to work with (requires NumPy).
 
         Note that use of title2ids matches that of Bio.SeqIO.FastaIO.
 
@@ -1055,8 +1232,31 @@ class FastqPhredIterator(SequenceIterator):
         >>> print(record.letter_annotations["phred_quality"])
         [26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 24, 26, 22, 26, 26, 13, 22, 26, 18, 24, 18, 18, 18, 18]
 
+        Alternatively, the qualities can be held as a NumPy array:
+
+        >>> with open("Quality/example.fastq") as handle:
+        ...     for record in FastqPhredIterator(handle, quality_array=True):
+        ...         pass
+        >>> qualities = record.letter_annotations["phred_quality"]
+        >>> qualities.dtype
+        dtype('uint8')
+        >>> print(qualities.min(), qualities.max())
+        13 26
+
         """
         self.title2ids = title2ids
+        if quality_array:
+            try:
+                import numpy
+            except ImportError:
+                from Bio import MissingPythonDependencyError
+
+                raise MissingPythonDependencyError(
+                    "Please install NumPy if you want to use quality_array=True."
+                ) from None
+            self._numpy = numpy
+        else:
+            self._numpy = None
         super().__init__(source, alphabet=alphabet, mode="t", fmt="Fastq")
 
     def parse(self, handle):
@@ -1066,6 +1266,9 @@ class FastqPhredIterator(SequenceIterator):
 
     def iterate(self, handle):
         """Parse the file and generate SeqRecord objects."""
+        if self._numpy is not None:
+            yield from self._iterate_arrays(handle)
+            return
         title2ids = self.title2ids
         alphabet = self.alphabet
         assert SANGER_SCORE_OFFSET == ord("!")
@@ -1101,6 +1304,123 @@ class FastqPhredIterator(SequenceIterator):
             dict.__setitem__(record._per_letter_annotations, "phred_quality", qualities)
             yield record
 
+    def _iterate_arrays(self, handle):
+        """Parse the file with the qualities as NumPy arrays (PRIVATE)."""
+        title2ids = self.title2ids
+        alphabet = self.alphabet
+        frombuffer = self._numpy.frombuffer
+        uint8 = self._numpy.uint8
+        for title_line, seq_string, quality_string in FastqGeneralIterator(handle):
+            if title2ids:
+                id, name, descr = title2ids(title_line)
+            else:
+                descr = title_line
+                id = descr.split()[0]
+                name = id
+            record = SeqRecord(
+                Seq(seq_string, alphabet), id=id, name=name, description=descr
+            )
+            qualities = _decode_phred_array(
+                quality_string, SANGER_SCORE_OFFSET, frombuffer, uint8
+            )
+            # As above, bypass the length check already done by
+            # FastqGeneralIterator.
+            dict.__setitem__(record._per_letter_annotations, "phred_quality", qualities)
+            yield record
+
+
+def _decode_phred_array(quality_string, offset, frombuffer, uint8):
+    """Decode an ASCII encoded PHRED quality string to a NumPy array (PRIVATE).
+
+    The NumPy frombuffer function and uint8 type are passed in to avoid
+    importing NumPy at module level.
+    """
+    try:
+        data = quality_string.encode("ascii")
+    except UnicodeEncodeError:
+        raise ValueError("Invalid character in quality string") from None
+    # Unsigned subtraction wraps round, so any letter below the offset
+    # gives a large value and is caught by the maximum check:
+    qualities = frombuffer(data, uint8) - uint8(offset)
+    if data and qualities.max() > 126 - offset:
+        raise ValueError("Invalid character in quality string")
+    return qualities
+
+
+def FastqPhredBatchIterator(source, batch_size=1000, offset=SANGER_SCORE_OFFSET):
+    """Iterate over FASTQ records in batches of NumPy arrays.
+
+    Arguments:
+     - source - input stream opened in text mode, or a path to a file
+     - batch_size - maximum number of records per batch
+     - offset - the ASCII offset used to encode the PHRED qualities,
+       33 for Sanger style FASTQ (default), or 64 for Illumina 1.3 to 1.7
+
+    This is built on FastqGeneralIterator, but rather than one tuple of
+    strings per record it returns a tuple for each batch of records, giving
+    a list of the title lines, a NumPy uint8 array holding the ASCII codes
+    of all the sequences concatenated, a NumPy uint8 array holding all the
+    PHRED qualities concatenated, and a NumPy array of offsets (one more
+    than the number of records) so that the sequence and qualities of
+    record i are at slice offsets[i]:offsets[i + 1] of these arrays.
+
+    This allows filtering and trimming by quality to be done with NumPy
+    operations on many reads at once:
+
+    >>> with open("Quality/example.fastq") as handle:
+    ...     for titles, seqs, quals, offsets in FastqPhredBatchIterator(handle):
+    ...         print(titles)
+    ...         print(offsets)
+    ...         print(quals[offsets[1]:offsets[2]].min())
+    ['EAS54_6_R1_2_1_413_324', 'EAS54_6_R1_2_1_540_792', 'EAS54_6_R1_2_1_443_348']
+    [ 0 25 50 75]
+    12
+
+    If all the reads in a batch are the same length, the arrays can be
+    reshaped to give one row per read:
+
+    >>> print(quals.reshape(len(titles), -1).min(axis=1))
+    [18 12 13]
+
+    Requires NumPy.
+    """
+    try:
+        import numpy
+    except ImportError:
+        from Bio import MissingPythonDependencyError
+
+        raise MissingPythonDependencyError(
+            "Please install NumPy if you want to use FastqPhredBatchIterator."
+        ) from None
+    if batch_size < 1:
+        raise ValueError("The batch size must be at least one")
+    titles = []
+    seqs = []
+    quals = []
+    for title, seq, qual in FastqGeneralIterator(source):
+        titles.append(title)
+        seqs.append(seq)
+        quals.append(qual)
+        if len(titles) == batch_size:
+            yield _phred_batch(titles, seqs, quals, offset, numpy)
+            titles = []
+            seqs = []
+            quals = []
+    if titles:
+        yield _phred_batch(titles, seqs, quals, offset, numpy)
+
+
+def _phred_batch(titles, seqs, quals, offset, numpy):
+    """Convert a batch of FASTQ strings into NumPy arrays (PRIVATE)."""
+    offsets = numpy.zeros(len(seqs) + 1, numpy.int64)
+    numpy.cumsum([len(seq) for seq in seqs], out=offsets[1:])
+    seq_data = "".join(seqs).encode("ascii")
+    sequences = numpy.frombuffer(seq_data, numpy.uint8)
+    qualities = _decode_phred_array(
+        "".join(quals), offset, numpy.frombuffer, numpy.uint8
+    )
+    return titles, sequences, qualities, offsets
+
 
 def FastqSolexaIterator(source, alphabet=single_letter_alphabet, title2ids=None):
     r"""Parse old Solexa/Illumina FASTQ like files (which differ in the quality mapping).
@@ -642,6 +642,60 @@ def parse(handle, format, alphabet=None):
     raise ValueError("Unknown format '%s'" % format)
 
 
+def parallel_parse(filename, format, alphabet=None, workers=None, chunk_size=1048576):
+    """Turn a sequence file into an iterator of SeqRecords, using several processes.
+
+    Arguments:
+     - filename   - name of the file (not a handle, as each worker process
+       opens the file itself)
+     - format     - lower case string describing the file format, one of
+       "embl", "fasta", "fasta-2line", "genbank" (or "gb"), "imgt" or "swiss"
+     - alphabet   - optional Alphabet object, as for Bio.SeqIO.parse(...)
+     - workers    - number of worker processes, defaults to the number of
+       CPUs
+     - chunk_size - approximate size in bytes of the chunks of the file
+       passed to each worker
+
+    This is a drop in replacement for Bio.SeqIO.parse(...) for large files
+    in formats where parsing each record takes a lot of work, such as
+    GenBank and EMBL. The file is split into chunks at the start of a record
+    (e.g. the LOCUS line of a GenBank record), the chunks are parsed in a
+    pool of worker processes, and the SeqRecord objects are returned in the
+    same order as in the file:
+
+    >>> from Bio import SeqIO
+    >>> for record in SeqIO.parse("GenBank/cor6_6.gb", "genbank"):
+    ...     print(record.id)
+    X55053.1
+    X62281.1
+    M81224.1
+    AJ237582.1
+    L31939.1
+    AF297471.1
+    >>> records = SeqIO.parallel_parse(
+    ...     "GenBank/cor6_6.gb", "genbank", workers=2, chunk_size=1000
+    ... )
+    >>> print([record.id for record in records])
+    ['X55053.1', 'X62281.1', 'M81224.1', 'AJ237582.1', 'L31939.1', 'AF297471.1']
+
+    The records are parsed ahead of those being used (a few chunks per
+    worker), and sent back from the worker processes by pickling them, so
+    this is only worthwhile for formats which are slow to parse. Plain text
+    files only, compressed files are not supported.
+    """
+    from ._parallel import _parallel_parse
+
+    if not isinstance(format, str):
+        raise TypeError("Need a string for the file format (lower case)")
+    if not format:
+        raise ValueError("Format required (lower case string)")
+    if not format.islower():
+        raise ValueError("Format string '%s' should be lower case" % format)
+    if alphabet is not None and not isinstance(alphabet, (Alphabet, AlphabetEncoder)):
+        raise ValueError("Invalid alphabet, %r" % alphabet)
+    return _parallel_parse(filename, format, alphabet, workers, chunk_size)
+
+
 def _force_alphabet(record_iterator, alphabet):
     """Iterate over records, over-riding the alphabet (PRIVATE)."""
     # Assume the alphabet argument has been pre-validated
@@ -791,7 +845,7 @@ def to_dict(sequences, key_function=None):
     return d
 
 
-def index(filename, format, alphabet=None, key_function=None):
+def index(filename, format, alphabet=None, key_function=None, lazy=False):
     """Indexes a sequence file and returns a dictionary like object.
 
     Arguments:
@@ -803,6 +857,8 @@ def index(filename, format, alphabet=None, key_function=None):
      - key_function - Optional callback function which when given a
        SeqRecord identifier string should return a unique key for the
        dictionary.
+     - lazy - Optional boolean, default False. If True, the sequences
+       are read from the file on demand (currently only for "fasta").
 
     This indexing function will return a dictionary like object, giving the
     SeqRecord objects as values.
@@ -842,6 +898,21 @@ def index(filename, format, alphabet=None, key_function=None):
     dictionary methods, the code will jump to the appropriate part of the
     file and then parse that section into a SeqRecord.
 
+    With a large FASTA file, such as a genome assembly, you can ask for the
+    sequences to be loaded lazily. The file is then memory mapped, and the
+    line wrapping of each record is noted while indexing (much like a
+    samtools faidx index). Slicing the sequence of a record only reads the
+    lines of the file needed for that region:
+
+    >>> from Bio import SeqIO
+    >>> records = SeqIO.index("Fasta/f002", "fasta", lazy=True)
+    >>> record = records["gi|1348917|gb|G26685|G26685"]
+    >>> len(record)
+    413
+    >>> print(record.seq[100:130])
+    TTGTAGCCTTATCCTGGTTTTACAGATGTG
+    >>> records.close()
+
     Note that not all the input formats supported by Bio.SeqIO can be used
     with this index function. It is designed to work only with sequential
     file formats (e.g. "fasta", "gb", "fastq") and is not suitable for any
@@ -914,18 +985,27 @@ def index(filename, format, alphabet=None, key_function=None):
 
     # Map the file format to a sequence iterator:
     from ._index import _FormatToRandomAccess  # Lazy import
+    from ._index import _FormatToLazyRandomAccess  # Lazy import
     from Bio.File import _IndexedSeqFileDict
 
-    try:
-        proxy_class = _FormatToRandomAccess[format]
-    except KeyError:
-        raise ValueError("Unsupported format %r" % format)
+    if lazy:
+        try:
+            proxy_class = _FormatToLazyRandomAccess[format]
+        except KeyError:
+            raise ValueError("Lazy loading is not supported for format %r" % format)
+    else:
+        try:
+            proxy_class = _FormatToRandomAccess[format]
+        except KeyError:
+            raise ValueError("Unsupported format %r" % format)
     repr = "SeqIO.index(%r, %r, alphabet=%r, key_function=%r)" % (
         filename,
         format,
         alphabet,
         key_function,
     )
+    if lazy:
+        repr = repr[:-1] + ", lazy=True)"
     return _IndexedSeqFileDict(
         proxy_class(filename, format, alphabet), key_function, repr, "SeqRecord"
     )
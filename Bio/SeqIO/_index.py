@@ -27,12 +27,16 @@ re-indexing the file for use another time.
 """
 
 
+import mmap
 import re
 from io import BytesIO
 from io import StringIO
 
 from Bio import SeqIO
 from Bio import Alphabet
+from Bio import bgzf
+from Bio.Seq import Seq
+from Bio.SeqRecord import SeqRecord
 from Bio.File import _IndexedSeqFileProxy, _open_for_random_access
 
 
@@ -267,6 +271,232 @@ class SequentialSeqFileRandomAccess(SeqFileRandomAccess):
         return b"".join(lines)
 
 
+def _scan_fasta_layout(handle):
+    """Scan a FASTA file noting the line layout of each record (PRIVATE).
+
+    Given a binary handle at the start of the file, yields a tuple for
+    each record giving the title line (as bytes, including the leading
+    greater than sign), the record start offset, the record length in
+    bytes, and then (like a samtools faidx index) the offset of the first
+    sequence letter, the sequence length, the letters per line, and the
+    bytes per line.
+
+    The last two values are None if the line wrapping is not uniform, or
+    if the sequence lines contain white space, as then the sequence can
+    not be located in the file by arithmetic alone.
+    """
+    offset = 0
+    line = handle.readline()
+    # Skip any header before first record
+    while line and not line.startswith(b">"):
+        offset += len(line)
+        line = handle.readline()
+    while line:
+        title = line
+        start_offset = offset
+        offset += len(line)
+        seq_offset = offset
+        length = 0
+        linebases = linewidth = None
+        regular = True
+        finished = False  # seen the last (short or blank) line?
+        line = handle.readline()
+        while line and not line.startswith(b">"):
+            offset += len(line)
+            bases = len(line.rstrip())
+            if bases:
+                if finished or line[bases:].strip(b"\r\n") or b" " in line[:bases]:
+                    regular = False
+                elif linebases is None:
+                    linebases = bases
+                    linewidth = len(line)
+                elif bases != linebases or len(line) != linewidth:
+                    if bases > linebases:
+                        regular = False
+                    # Otherwise this must be the last line of the sequence
+                    finished = True
+                length += bases
+            else:
+                finished = True
+            line = handle.readline()
+        if not regular:
+            linebases = linewidth = None
+        elif linebases is None:
+            # Empty sequence
+            linebases = linewidth = 0
+        yield (
+            title,
+            start_offset,
+            offset - start_offset,
+            seq_offset,
+            length,
+            linebases,
+            linewidth,
+        )
+
+
+class _LazyFastaSeq(Seq):
+    """Seq object reading a line wrapped FASTA sequence on demand (PRIVATE).
+
+    The sequence is located in the file the same way as in a samtools
+    faidx index, using the offset of its first letter, its length, and
+    the number of letters and bytes per line. The buffer can be any
+    object returning the bytes for a slice, usually a memoryview of a
+    memory mapped file, so accessing a region only reads the lines it
+    spans. A region within a single line is returned without copying.
+    """
+
+    def __init__(
+        self,
+        buffer,
+        offset,
+        length,
+        linebases,
+        linewidth,
+        alphabet=Alphabet.single_letter_alphabet,
+    ):
+        """Initialize the class."""
+        self._buffer = buffer
+        self._offset = offset
+        self._length = length
+        self._linebases = linebases
+        self._linewidth = linewidth
+        self.alphabet = alphabet
+
+    @property
+    def _data(self):
+        """Return the full sequence as a bytes-like object (PRIVATE)."""
+        return memoryview(self._read(0, self._length))
+
+    def _read(self, start, end):
+        """Return the letters from start to end as a bytes-like object (PRIVATE)."""
+        if start >= end:
+            return b""
+        linebases = self._linebases
+        linewidth = self._linewidth
+        first_line, first_column = divmod(start, linebases)
+        last_line, last_column = divmod(end - 1, linebases)
+        first = self._offset + first_line * linewidth + first_column
+        last = self._offset + last_line * linewidth + last_column
+        data = self._buffer[first : last + 1]
+        if first_line == last_line:
+            return data
+        # Remove the line endings
+        return bytes(data).translate(None, b"\r\n")
+
+    def __reduce__(self):
+        """Pickle as a plain Seq object holding the full sequence."""
+        return (Seq, (bytes(self), self.alphabet))
+
+    def __repr__(self):
+        """Return (truncated) representation of the sequence for debugging."""
+        if len(self) > 60:
+            return f"Seq('{self[:54]}...{self[-3:]}')"
+        else:
+            return f"Seq({str(self)!r})"
+
+    def __len__(self):
+        """Return the length of the sequence, use len(my_seq)."""
+        return self._length
+
+    def __getitem__(self, index):
+        """Return a subsequence of single letter, use my_seq[index].
+
+        Only the lines of the file spanned by the requested region are read.
+        """
+        if isinstance(index, int):
+            if index < 0:
+                index += self._length
+            if not 0 <= index < self._length:
+                raise IndexError("sequence index out of range")
+            return chr(self._read(index, index + 1)[0])
+        positions = range(*index.indices(self._length))
+        if not positions:
+            return Seq(b"", self.alphabet)
+        if positions.step == 1:
+            return Seq(self._read(positions.start, positions.stop), self.alphabet)
+        start = min(positions[0], positions[-1])
+        end = max(positions[0], positions[-1]) + 1
+        data = bytes(self._read(start, end))
+        return Seq(data[positions[0] - start :: positions.step], self.alphabet)
+
+
+class FastaLazyRandomAccess(SequentialSeqFileRandomAccess):
+    """Random access to a FASTA file with the sequences loaded on demand.
+
+    The file is memory mapped, and the line layout of each record is noted
+    while indexing (as in a samtools faidx index). The records returned
+    hold a Seq object which reads only the part of the file needed, so
+    slicing a small region of a large chromosome is fast.
+
+    Records where the line wrapping is not uniform, and BGZF compressed
+    files, are parsed in full as usual.
+    """
+
+    def __init__(self, filename, format, alphabet):
+        """Initialize the class."""
+        SequentialSeqFileRandomAccess.__init__(self, filename, format, alphabet)
+        self._layouts = {}
+        self._buffer = None
+        handle = self._handle
+        if not isinstance(handle, bgzf.BgzfReader):
+            try:
+                mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # Empty file
+                pass
+            else:
+                self._buffer = memoryview(mapped)
+
+    def __iter__(self):
+        """Return (id, offset, length) tuples."""
+        if self._buffer is None:
+            yield from SequentialSeqFileRandomAccess.__iter__(self)
+            return
+        layouts = self._layouts
+        handle = self._handle
+        handle.seek(0)
+        for (
+            title,
+            offset,
+            length,
+            seq_offset,
+            seq_length,
+            linebases,
+            linewidth,
+        ) in _scan_fasta_layout(handle):
+            if linebases is not None:
+                layouts[offset] = (seq_offset, seq_length, linebases, linewidth)
+            yield title[1:].strip().split(None, 1)[0].decode(), offset, length
+
+    def get(self, offset):
+        """Return the SeqRecord starting at the given offset."""
+        try:
+            seq_offset, length, linebases, linewidth = self._layouts[offset]
+        except KeyError:
+            return SeqFileRandomAccess.get(self, offset)
+        title = bytes(self._buffer[offset + 1 : seq_offset]).decode().rstrip()
+        try:
+            first_word = title.split(None, 1)[0]
+        except IndexError:
+            first_word = ""
+        alphabet = self._alphabet
+        if alphabet is None:
+            alphabet = Alphabet.single_letter_alphabet
+        seq = _LazyFastaSeq(
+            self._buffer, seq_offset, length, linebases, linewidth, alphabet
+        )
+        return SeqRecord(seq, id=first_word, name=first_word, description=title)
+
+    def close(self):
+        """Close the file handle, and drop the memory map."""
+        SequentialSeqFileRandomAccess.close(self)
+        # Any sequences already loaded keep a reference to the memory map,
+        # which is closed once they are no longer in use.
+        self._buffer = None
+        self._layouts = {}
+
+
 #######################################
 # Fiddly indexers: GenBank, EMBL, ... #
 #######################################
@@ -740,3 +970,8 @@ _FormatToRandomAccess = {
     "qual": SequentialSeqFileRandomAccess,
     "uniprot-xml": UniprotRandomAccess,
 }
+
+# Formats where the sequences can be loaded on demand, see SeqIO.index(...)
+_FormatToLazyRandomAccess = {
+    "fasta": FastaLazyRandomAccess,
+}
@@ -0,0 +1,109 @@
+# Copyright 2020 by the Biopython developers.  All rights reserved.
+#
+# This file is part of the Biopython distribution and governed by your
+# choice of the "Biopython License Agreement" or the "BSD 3-Clause License".
+# Please see the LICENSE file that should have been included as part of this
+# package.
+"""Parallel parsing of sequence files (PRIVATE).
+
+This module provides the code behind the Bio.SeqIO.parallel_parse function.
+The file is split into chunks at record boundaries, found by looking for
+the line which starts each record, and the chunks are parsed with the
+normal Bio.SeqIO parsers in a pool of worker processes.
+"""
+
+import io
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+# The start of the first line of each record, for the text formats where
+# this cannot occur anywhere else in a record.
+_FormatToRecordStart = {
+    "embl": b"ID   ",
+    "fasta": b">",
+    "fasta-2line": b">",
+    "gb": b"LOCUS ",
+    "genbank": b"LOCUS ",
+    "imgt": b"ID   ",
+    "swiss": b"ID   ",
+}
+
+
+def _record_boundaries(handle, marker, chunk_size):
+    """Return offsets splitting a file into chunks of whole records (PRIVATE).
+
+    Expects a binary handle. The first offset is zero (so any header before
+    the first record is passed to the parser), and the last is the file size.
+    Each chunk is at least chunk_size bytes long, apart from the last one.
+    """
+    handle.seek(0, os.SEEK_END)
+    size = handle.tell()
+    boundaries = [0]
+    position = chunk_size
+    while position < size:
+        handle.seek(position)
+        # Skip to the start of the next line
+        handle.readline()
+        offset = handle.tell()
+        line = handle.readline()
+        while line and not line.startswith(marker):
+            offset += len(line)
+            line = handle.readline()
+        if not line:
+            break
+        boundaries.append(offset)
+        position = offset + chunk_size
+    boundaries.append(size)
+    return boundaries
+
+
+def _parse_chunk(filename, format, alphabet, start, end):
+    """Parse the records in part of a file, returned as a list (PRIVATE).
+
+    This runs in the worker processes.
+    """
+    from Bio import SeqIO
+
+    with open(filename, "rb") as handle:
+        handle.seek(start)
+        data = handle.read(end - start)
+    # Decode as if the file was opened in text mode
+    with io.TextIOWrapper(io.BytesIO(data)) as handle:
+        return list(SeqIO.parse(handle, format, alphabet))
+
+
+def _parallel_parse(filename, format, alphabet, workers, chunk_size):
+    """Parse a file in chunks using a pool of processes (PRIVATE).
+
+    Yields the SeqRecord objects in their original order. Only a few chunks
+    per worker are parsed ahead of those being consumed, limiting the
+    number of records held in memory.
+    """
+    try:
+        marker = _FormatToRecordStart[format]
+    except KeyError:
+        raise ValueError(
+            "Format %r is not supported for parallel parsing" % format
+        ) from None
+    if workers is None:
+        workers = os.cpu_count() or 1
+    with open(filename, "rb") as handle:
+        boundaries = _record_boundaries(handle, marker, chunk_size)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        try:
+            for start, end in zip(boundaries, boundaries[1:]):
+                pending.append(
+                    executor.submit(
+                        _parse_chunk, filename, format, alphabet, start, end
+                    )
+                )
+                if len(pending) > 2 * workers:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+        finally:
+            # If stopped early, do not parse the rest of the file
+            for future in pending:
+                future.cancel()
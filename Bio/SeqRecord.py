@@ -28,10 +28,10 @@ class _RestrictedDict(dict):
     This simple subclass of the Python dictionary is used in the SeqRecord
     object for holding per-letter-annotations.  This class is intended to
     prevent simple errors by only allowing python sequences (e.g. lists,
-    strings and tuples) to be stored, and only if their length matches that
-    expected (the length of the SeqRecord's seq object).  It cannot however
-    prevent the entries being edited in situ (for example appending entries
-    to a list).
+    strings and tuples, or NumPy arrays) to be stored, and only if their
+    length matches that expected (the length of the SeqRecord's seq object).
+    It cannot however prevent the entries being edited in situ (for example
+    appending entries to a list).
 
     >>> x = _RestrictedDict(5)
     >>> x["test"] = "hello"
@@ -98,6 +98,20 @@ class _RestrictedDict(dict):
             self[key] = value
 
 
+def _join_letter_annotations(left, right):
+    """Concatenate two per-letter-annotations (PRIVATE).
+
+    Python sequences like lists and strings are simply added, but NumPy
+    arrays (e.g. from parsing FASTQ files with quality_array=True) would be
+    added element-wise, so these are joined with numpy.concatenate instead.
+    """
+    if hasattr(left, "__array__") or hasattr(right, "__array__"):
+        import numpy
+
+        return numpy.concatenate((left, right))
+    return left + right
+
+
 class SeqRecord:
     """A SeqRecord object holds a sequence and information about it.
 
@@ -928,7 +942,9 @@ class SeqRecord:
         # Can append matching per-letter-annotation
         for k, v in self.letter_annotations.items():
             if k in other.letter_annotations:
-                answer.letter_annotations[k] = v + other.letter_annotations[k]
+                answer.letter_annotations[k] = _join_letter_annotations(
+                    v, other.letter_annotations[k]
+                )
         return answer
 
     def __radd__(self, other):
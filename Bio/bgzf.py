@@ -247,10 +247,16 @@ If your data is in UTF-8 or any other incompatible encoding, you must use
 binary mode, and decode the appropriate fragments yourself.
 """
 
+import os
 import struct
 import sys
+import threading
 import zlib
 
+from collections import deque
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
 from builtins import open as _open
 
 _bgzf_magic = b"\x1f\x8b\x08\x04"
@@ -259,7 +265,7 @@ _bgzf_eof = b"\x1f\x8b\x08\x04\x00\x00\x00\x00\x00\xff\x06\x00BC\x02\x00\x1b\x00
 _bytes_BC = b"BC"
 
 
-def open(filename, mode="rb"):
+def open(filename, mode="rb", threads=1):
     r"""Open a BGZF file for reading, writing or appending.
 
     If text mode is requested, in order to avoid multi-byte characters, this is
@@ -268,11 +274,14 @@ def open(filename, mode="rb"):
 
     If your data is in UTF-8 or any other incompatible encoding, you must use
     binary mode, and decode the appropriate fragments yourself.
+
+    The optional threads argument is passed to the BgzfReader or BgzfWriter,
+    to decompress or compress the BGZF blocks using a pool of threads.
     """
     if "r" in mode.lower():
-        return BgzfReader(filename, mode)
+        return BgzfReader(filename, mode, threads=threads)
     elif "w" in mode.lower() or "a" in mode.lower():
-        return BgzfWriter(filename, mode)
+        return BgzfWriter(filename, mode, threads=threads)
     else:
         raise ValueError("Bad mode %r" % mode)
 
@@ -435,6 +444,17 @@ def _load_bgzf_block(handle, text_mode=False):
     Returns a tuple (block size and data), or at end of file
     will raise StopIteration.
     """
+    block_size, deflate_data, trailer = _read_bgzf_block(handle)
+    return block_size, _inflate_bgzf_block(deflate_data, trailer, text_mode)
+
+
+def _read_bgzf_block(handle):
+    """Read the next BGZF block without decompressing it (PRIVATE).
+
+    Returns a tuple of the block size, the deflate compressed data, and the
+    eight byte trailer (CRC and length of the uncompressed data), or at end
+    of file will raise StopIteration.
+    """
     magic = handle.read(4)
     if not magic:
         # End of file - should we signal this differently now?
@@ -465,10 +485,20 @@ def _load_bgzf_block(handle, text_mode=False):
     assert block_size is not None, "Missing BC, this isn't a BGZF file!"
     # Now comes the compressed data, CRC, and length of uncompressed data.
     deflate_size = block_size - 1 - extra_len - 19
+    return block_size, handle.read(deflate_size), handle.read(8)
+
+
+def _inflate_bgzf_block(deflate_data, trailer, text_mode=False):
+    """Decompress the data of a BGZF block and check it (PRIVATE).
+
+    Takes the deflate compressed data and the eight byte trailer as returned
+    by _read_bgzf_block. This does not use the file handle, and zlib releases
+    the GIL, so blocks can be decompressed in parallel threads.
+    """
     d = zlib.decompressobj(-15)  # Negative window size means no headers
-    data = d.decompress(handle.read(deflate_size)) + d.flush()
-    expected_crc = handle.read(4)
-    expected_size = struct.unpack("<I", handle.read(4))[0]
+    data = d.decompress(deflate_data) + d.flush()
+    expected_crc = trailer[:4]
+    expected_size = struct.unpack("<I", trailer[4:])[0]
     if expected_size != len(data):
         raise RuntimeError("Decompressed to %i, not %i" % (len(data), expected_size))
     # Should cope with a mix of Python platforms...
@@ -482,9 +512,122 @@ def _load_bgzf_block(handle, text_mode=False):
     if text_mode:
         # Note ISO-8859-1 aka Latin-1 preserves first 256 chars
         # (i.e. ASCII), but critically is a single byte encoding
-        return block_size, data.decode("latin-1")
+        return data.decode("latin-1")
     else:
-        return block_size, data
+        return data
+
+
+def _file_identity(handle):
+    """Return a key identifying the file behind a handle (PRIVATE).
+
+    Used so that readers sharing a BgzfBlockCache only share blocks from
+    the same file. Falls back on a unique object if there is no file
+    descriptor to check.
+    """
+    try:
+        stat = os.fstat(handle.fileno())
+    except (AttributeError, OSError, ValueError):
+        return object()
+    return stat.st_dev, stat.st_ino, stat.st_size, stat.st_mtime_ns
+
+
+class BgzfBlockCache:
+    """Least recently used cache of decompressed BGZF blocks.
+
+    Each BgzfReader keeps the blocks it has decompressed in a cache, so that
+    random access within a recently used region of the file does not need
+    to read and decompress the same blocks again. By default each reader has
+    its own cache holding up to max_cache blocks, but you can create a cache
+    yourself to limit its size in bytes, to share it between readers, and to
+    see how well it is working:
+
+    >>> cache = BgzfBlockCache(max_bytes=200000)
+    >>> handle = BgzfReader("SamBam/ex1.bam", "rb", cache=cache)
+    >>> data = handle.read(100000)
+    >>> handle.seek(0)
+    0
+    >>> data = handle.read(100000)
+    >>> handle.close()
+    >>> print(cache)
+    BgzfBlockCache with 2 blocks (131072 bytes), 2 hits, 2 misses, 0 evictions
+
+    Blocks are evicted once there are more than max_blocks of them, or once
+    their decompressed data takes more than max_bytes (either may be None
+    for no limit), starting with the block used least recently. Readers
+    sharing a cache only share blocks if they are reading the same file
+    (the same device and inode, size and modification time), in the same
+    mode. A cache can safely be shared between readers in different threads.
+    """
+
+    def __init__(self, max_blocks=None, max_bytes=None):
+        """Create an empty cache.
+
+        Arguments:
+         - max_blocks - maximum number of blocks to keep (default no limit)
+         - max_bytes - maximum total size of the decompressed data of the
+           blocks in bytes (default no limit)
+
+        """
+        if max_blocks is not None and max_blocks < 1:
+            raise ValueError("Use max_blocks with a minimum of 1")
+        if max_bytes is not None and max_bytes < 0:
+            raise ValueError("Use max_bytes with a minimum of 0")
+        self.max_blocks = max_blocks
+        self.max_bytes = max_bytes
+        self._blocks = OrderedDict()
+        self._lock = threading.Lock()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        """Return the number of blocks in the cache."""
+        return len(self._blocks)
+
+    def __str__(self):
+        """Return a summary of the cache contents and statistics."""
+        return "%s with %i blocks (%i bytes), %i hits, %i misses, %i evictions" % (
+            self.__class__.__name__,
+            len(self._blocks),
+            self.nbytes,
+            self.hits,
+            self.misses,
+            self.evictions,
+        )
+
+    def get(self, key):
+        """Return the cached value for this key, or None if not cached."""
+        with self._lock:
+            try:
+                value = self._blocks[key]
+            except KeyError:
+                self.misses += 1
+                return None
+            self._blocks.move_to_end(key)
+            self.hits += 1
+            return value[0]
+
+    def put(self, key, value, size):
+        """Add a value to the cache, evicting old values if needed."""
+        with self._lock:
+            old = self._blocks.pop(key, None)
+            if old is not None:
+                self.nbytes -= old[1]
+            self._blocks[key] = value, size
+            self.nbytes += size
+            while (
+                self.max_blocks is not None and len(self._blocks) > self.max_blocks
+            ) or (self.max_bytes is not None and self.nbytes > self.max_bytes):
+                key, (value, size) = self._blocks.popitem(last=False)
+                self.nbytes -= size
+                self.evictions += 1
+
+    def clear(self):
+        """Remove all the blocks from the cache (the statistics are kept)."""
+        with self._lock:
+            self._blocks.clear()
+            self.nbytes = 0
 
 
 class BgzfReader:
@@ -550,14 +693,38 @@ class BgzfReader:
     block can be up to 64kb, the default cache could take up to 6MB of
     RAM. The cache is not important for reading through the file in one
     pass, but is important for improving performance of random access.
+    Alternatively, use the cache argument to give a BgzfBlockCache, for
+    example to limit the cache size in bytes or to share it between
+    several readers (the max_cache argument is then ignored).
+
+    You can also use the threads argument to decompress the BGZF blocks
+    using a pool of threads. The compressed blocks following the current
+    block are then read ahead (two per thread) and decompressed in the
+    background, which speeds up reading through the file in one pass:
+
+    >>> handle = BgzfReader("SamBam/ex1.bam", "rb", threads=4)
+    >>> len(handle.read(200000))
+    200000
+    >>> handle.close()
+
     """
 
-    def __init__(self, filename=None, mode="r", fileobj=None, max_cache=100):
+    def __init__(
+        self,
+        filename=None,
+        mode="r",
+        fileobj=None,
+        max_cache=100,
+        threads=1,
+        cache=None,
+    ):
         """Initialize the class."""
         # TODO - Assuming we can seek, check for 28 bytes EOF empty block
         # and if missing warn about possible truncation (as in samtools)?
         if max_cache < 1:
             raise ValueError("Use max_cache with a minimum of 1")
+        if threads < 1:
+            raise ValueError("Use threads with a minimum of 1")
         # Must open the BGZF file in binary mode, but we may want to
         # treat the contents as either text or binary (unicode or
         # bytes under Python 3)
@@ -578,9 +745,21 @@ class BgzfReader:
             self._newline = b"\n"
         self._handle = handle
         self.max_cache = max_cache
-        self._buffers = {}
+        if cache is None:
+            cache = BgzfBlockCache(max_blocks=max_cache)
+        self.cache = cache
+        self._cache_key = (_file_identity(handle), self._text)
         self._block_start_offset = None
         self._block_raw_length = None
+        if threads > 1:
+            self._executor = ThreadPoolExecutor(max_workers=threads)
+        else:
+            self._executor = None
+        # Blocks being decompressed in the background, keyed by start offset,
+        # and the offset in the file where the next one would start
+        self._read_ahead = 2 * threads
+        self._prefetched = {}
+        self._prefetch_offset = None
         self._load_block(handle.tell())
 
     def _load_block(self, start_offset=None):
@@ -592,34 +771,72 @@ class BgzfReader:
         if start_offset == self._block_start_offset:
             self._within_block_offset = 0
             return
-        elif start_offset in self._buffers:
+        cached = self.cache.get((self._cache_key, start_offset))
+        if cached is not None:
             # Already in cache
-            self._buffer, self._block_raw_length = self._buffers[start_offset]
+            self._buffer, self._block_raw_length = cached
             self._within_block_offset = 0
             self._block_start_offset = start_offset
             return
-        # Must hit the disk... first check cache limits,
-        while len(self._buffers) >= self.max_cache:
-            # TODO - Implemente LRU cache removal?
-            self._buffers.popitem()
-        # Now load the block
+        # Must hit the disk... now load the block
         handle = self._handle
-        if start_offset is not None:
-            handle.seek(start_offset)
-        self._block_start_offset = handle.tell()
-        try:
-            block_size, self._buffer = _load_bgzf_block(handle, self._text)
-        except StopIteration:
-            # EOF
-            block_size = 0
-            if self._text:
-                self._buffer = ""
-            else:
-                self._buffer = b""
+        if start_offset in self._prefetched:
+            # Already read ahead, may still be decompressing
+            block_size, future = self._prefetched.pop(start_offset)
+            self._block_start_offset = start_offset
+            self._buffer = future.result()
+        else:
+            if start_offset is not None:
+                handle.seek(start_offset)
+            self._block_start_offset = handle.tell()
+            try:
+                block_size, self._buffer = _load_bgzf_block(handle, self._text)
+            except StopIteration:
+                # EOF
+                block_size = 0
+                if self._text:
+                    self._buffer = ""
+                else:
+                    self._buffer = b""
         self._within_block_offset = 0
         self._block_raw_length = block_size
         # Finally save the block in our cache,
-        self._buffers[self._block_start_offset] = self._buffer, block_size
+        self.cache.put(
+            (self._cache_key, self._block_start_offset),
+            (self._buffer, block_size),
+            len(self._buffer),
+        )
+        if self._executor is not None and block_size:
+            self._start_read_ahead()
+
+    def _start_read_ahead(self):
+        """Start decompressing the blocks after the current block (PRIVATE)."""
+        start_offset = self._block_start_offset + self._block_raw_length
+        if start_offset not in self._prefetched:
+            # Not reading through the file in order, discard any old blocks
+            self._cancel_read_ahead()
+            self._prefetch_offset = start_offset
+        if len(self._prefetched) >= self._read_ahead:
+            return
+        handle = self._handle
+        handle.seek(self._prefetch_offset)
+        while len(self._prefetched) < self._read_ahead:
+            offset = handle.tell()
+            try:
+                block_size, deflate_data, trailer = _read_bgzf_block(handle)
+            except StopIteration:
+                break
+            future = self._executor.submit(
+                _inflate_bgzf_block, deflate_data, trailer, self._text
+            )
+            self._prefetched[offset] = block_size, future
+        self._prefetch_offset = handle.tell()
+
+    def _cancel_read_ahead(self):
+        """Discard any blocks being decompressed in the background (PRIVATE)."""
+        for block_size, future in self._prefetched.values():
+            future.cancel()
+        self._prefetched = {}
 
     def tell(self):
         """Return a 64-bit unsigned BGZF virtual offset."""
@@ -732,10 +949,13 @@ class BgzfReader:
 
     def close(self):
         """Close BGZF file."""
+        if self._executor is not None:
+            self._cancel_read_ahead()
+            self._executor.shutdown()
+            self._executor = None
         self._handle.close()
         self._buffer = None
         self._block_start_offset = None
-        self._buffers = None
 
     def seekable(self):
         """Return True indicating the BGZF supports random access."""
@@ -758,11 +978,48 @@ class BgzfReader:
         self.close()
 
 
+def _make_bgzf_block(block, compresslevel):
+    """Compress data as a single BGZF block, returned as bytes (PRIVATE).
+
+    This does not use the file handle, and zlib releases the GIL, so blocks
+    can be compressed in parallel threads.
+    """
+    assert len(block) <= 65536
+    # Giving a negative window bits means no gzip/zlib headers,
+    # -15 used in samtools
+    c = zlib.compressobj(compresslevel, zlib.DEFLATED, -15, zlib.DEF_MEM_LEVEL, 0)
+    compressed = c.compress(block) + c.flush()
+    del c
+    if len(compressed) > 65536:
+        raise RuntimeError("TODO - Didn't compress enough, try less data in this block")
+    bsize = struct.pack("<H", len(compressed) + 25)  # includes -1
+    crc = struct.pack("<I", zlib.crc32(block) & 0xFFFFFFFF)
+    uncompressed_length = struct.pack("<I", len(block))
+    # Fixed 16 bytes,
+    # gzip magic bytes (4) mod time (4),
+    # gzip flag (1), os (1), extra length which is six (2),
+    # sub field which is BC (2), sub field length of two (2),
+    # Variable data,
+    # 2 bytes: block length as BC sub field (2)
+    # X bytes: the data
+    # 8 bytes: crc (4), uncompressed data length (4)
+    return _bgzf_header + bsize + compressed + crc + uncompressed_length
+
+
 class BgzfWriter:
-    """Define a BGZFWriter object."""
+    """Define a BGZFWriter object.
+
+    Use the threads argument to compress the BGZF blocks using a pool of
+    threads. The compressed blocks are still written to the file in order,
+    with up to two blocks per thread waiting to be written at any time.
+    """
 
-    def __init__(self, filename=None, mode="w", fileobj=None, compresslevel=6):
+    def __init__(
+        self, filename=None, mode="w", fileobj=None, compresslevel=6, threads=1
+    ):
         """Initilize the class."""
+        if threads < 1:
+            raise ValueError("Use threads with a minimum of 1")
         if fileobj:
             assert filename is None
             handle = fileobj
@@ -778,42 +1035,30 @@ class BgzfWriter:
         self._handle = handle
         self._buffer = b""
         self.compresslevel = compresslevel
+        if threads > 1:
+            self._executor = ThreadPoolExecutor(max_workers=threads)
+        else:
+            self._executor = None
+        # Blocks being compressed in the background, in file order
+        self._max_pending = 2 * threads
+        self._pending = deque()
 
     def _write_block(self, block):
         """Write provided data to file as a single BGZF compressed block (PRIVATE)."""
         # print("Saving %i bytes" % len(block))
-        start_offset = self._handle.tell()
-        assert len(block) <= 65536
-        # Giving a negative window bits means no gzip/zlib headers,
-        # -15 used in samtools
-        c = zlib.compressobj(
-            self.compresslevel, zlib.DEFLATED, -15, zlib.DEF_MEM_LEVEL, 0
+        if self._executor is None:
+            self._handle.write(_make_bgzf_block(block, self.compresslevel))
+            return
+        self._pending.append(
+            self._executor.submit(_make_bgzf_block, block, self.compresslevel)
         )
-        compressed = c.compress(block) + c.flush()
-        del c
-        if len(compressed) > 65536:
-            raise RuntimeError(
-                "TODO - Didn't compress enough, try less data in this block"
-            )
-        crc = zlib.crc32(block)
-        # Should cope with a mix of Python platforms...
-        if crc < 0:
-            crc = struct.pack("<i", crc)
-        else:
-            crc = struct.pack("<I", crc)
-        bsize = struct.pack("<H", len(compressed) + 25)  # includes -1
-        crc = struct.pack("<I", zlib.crc32(block) & 0xFFFFFFFF)
-        uncompressed_length = struct.pack("<I", len(block))
-        # Fixed 16 bytes,
-        # gzip magic bytes (4) mod time (4),
-        # gzip flag (1), os (1), extra length which is six (2),
-        # sub field which is BC (2), sub field length of two (2),
-        # Variable data,
-        # 2 bytes: block length as BC sub field (2)
-        # X bytes: the data
-        # 8 bytes: crc (4), uncompressed data length (4)
-        data = _bgzf_header + bsize + compressed + crc + uncompressed_length
-        self._handle.write(data)
+        while len(self._pending) > self._max_pending:
+            self._handle.write(self._pending.popleft().result())
+
+    def _write_pending(self):
+        """Wait for and write any blocks being compressed in the background (PRIVATE)."""
+        while self._pending:
+            self._handle.write(self._pending.popleft().result())
 
     def write(self, data):
         """Write method for the class."""
@@ -834,9 +1079,11 @@ class BgzfWriter:
         else:
             # print("Got %r, writing out some data..." % data)
             self._buffer += data
-            while len(self._buffer) >= 65536:
-                self._write_block(self._buffer[:65536])
-                self._buffer = self._buffer[65536:]
+            # Avoid copying the rest of the buffer after each block
+            end = len(self._buffer) - len(self._buffer) % 65536
+            for start in range(0, end, 65536):
+                self._write_block(self._buffer[start : start + 65536])
+            self._buffer = self._buffer[end:]
 
     def flush(self):
         """Flush data explicitally."""
@@ -845,6 +1092,7 @@ class BgzfWriter:
             self._buffer = self._buffer[65535:]
         self._write_block(self._buffer)
         self._buffer = b""
+        self._write_pending()
         self._handle.flush()
 
     def close(self):
@@ -857,12 +1105,18 @@ class BgzfWriter:
         """
         if self._buffer:
             self.flush()
+        self._write_pending()
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
         self._handle.write(_bgzf_eof)
         self._handle.flush()
         self._handle.close()
 
     def tell(self):
         """Return a BGZF 64-bit virtual offset."""
+        # The offset of the next block depends on those still being compressed
+        self._write_pending()
         return make_virtual_offset(self._handle.tell(), len(self._buffer))
 
     def seekable(self):
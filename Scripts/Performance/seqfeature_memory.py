@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+# Copyright 2020 by the Biopython developers.  All rights reserved.
+#
+# This code is part of the Biopython distribution and governed by its
+# license.  Please see the LICENSE file that should have been included
+# as part of this package.
+
+"""Measure the memory used by SeqFeature location objects.
+
+The location and position classes in Bio.SeqFeature use __slots__ rather
+than a per-instance dictionary. This script builds a large number of
+locations, like those from a whole genome annotation, and reports the
+memory used per location, compared to equivalent subclasses which have
+a per-instance dictionary (as the classes did before).
+
+Usage: seqfeature_memory.py [number of locations] [GenBank or EMBL file]
+"""
+
+import sys
+import tracemalloc
+
+from Bio import SeqIO
+from Bio.SeqFeature import CompoundLocation, ExactPosition, FeatureLocation
+
+
+class DictExactPosition(ExactPosition):
+    """ExactPosition with a per-instance dictionary."""
+
+
+class DictFeatureLocation(FeatureLocation):
+    """FeatureLocation with a per-instance dictionary."""
+
+
+class DictCompoundLocation(CompoundLocation):
+    """CompoundLocation with a per-instance dictionary."""
+
+
+def make_locations(count, position, simple, compound):
+    """Return a list of simple and two part locations."""
+    locations = []
+    for i in range(0, 20 * count, 20):
+        if i % 40:
+            locations.append(simple(position(i), position(i + 10), strand=1))
+        else:
+            locations.append(
+                compound(
+                    [
+                        simple(position(i), position(i + 5), strand=-1),
+                        simple(position(i + 8), position(i + 15), strand=-1),
+                    ]
+                )
+            )
+    return locations
+
+
+def measure(function, *args):
+    """Return the result of a function call and the memory it allocated."""
+    tracemalloc.start()
+    result = function(*args)
+    size, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, size
+
+
+count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+print("Building %i locations" % count)
+_, slotted = measure(
+    make_locations, count, ExactPosition, FeatureLocation, CompoundLocation
+)
+print("\tWith __slots__: %0.1f bytes per location" % (slotted / count))
+_, unslotted = measure(
+    make_locations,
+    count,
+    DictExactPosition,
+    DictFeatureLocation,
+    DictCompoundLocation,
+)
+print("\tWith __dict__: %0.1f bytes per location" % (unslotted / count))
+print("\tSaving: %0.1f%%" % (100.0 * (unslotted - slotted) / unslotted))
+
+if len(sys.argv) > 2:
+    filename = sys.argv[2]
+    format = "embl" if filename.lower().endswith(".embl") else "genbank"
+    records, size = measure(list, SeqIO.parse(filename, format))
+    features = sum(len(record.features) for record in records)
+    print("Parsing %s" % filename)
+    print(
+        "\t%i records with %i features used %0.1f MB"
+        % (len(records), features, size / 1024.0 / 1024.0)
+    )
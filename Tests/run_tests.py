@@ -80,8 +80,12 @@ if numpy is None:
             "Bio.MarkovModel",
             "Bio.MaxEntropy",
             "Bio.NaiveBayes",
+            "Bio.PDB.atom_columns",
             "Bio.PDB.Chain",
+            "Bio.PDB.contacts",
+            "Bio.PDB.DSSP",
             "Bio.PDB.Dice",
+            "Bio.PDB.Entity",
             "Bio.PDB.HSExposure",
             "Bio.PDB.MMCIF2Dict",
             "Bio.PDB.MMCIFParser",
@@ -90,6 +94,7 @@ if numpy is None:
             "Bio.PDB.Model",
             "Bio.PDB.NACCESS",
             "Bio.PDB.NeighborSearch",
+            "Bio.PDB.parallel",
             "Bio.PDB.parse_pdb_header",
             "Bio.PDB.PDBExceptions",
             "Bio.PDB.PDBList",
@@ -98,11 +103,14 @@ if numpy is None:
             "Bio.PDB.PSEA",
             "Bio.PDB.QCPSuperimposer",
             "Bio.PDB.Residue",
+            "Bio.PDB.rmsd",
+            "Bio.PDB.SASA",
             "Bio.PDB.Selection",
             "Bio.PDB.StructureAlignment",
             "Bio.PDB.StructureBuilder",
             "Bio.PDB.Structure",
             "Bio.PDB.Superimposer",
+            "Bio.PDB.trajectory",
             "Bio.PDB.Vector",
             "Bio.phenotype",
             "Bio.phenotype.parse",
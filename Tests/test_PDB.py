@@ -53,6 +53,7 @@ from Bio.PDB.PDBExceptions import PDBConstructionException, PDBConstructionWarni
 from Bio.PDB import rotmat, Vector
 from Bio.PDB import Residue, Atom
 from Bio.PDB import make_dssp_dict
+from Bio.PDB.DSSP import dssp_dict_from_model
 from Bio.PDB import DSSP
 from Bio.PDB.NACCESS import process_asa_data, process_rsa_data
 from Bio.PDB.ResidueDepth import _get_atom_radius
@@ -1568,6 +1569,32 @@ class TransformTests(unittest.TestCase):
             for i in range(0, 3):
                 self.assertAlmostEqual(newpos[i], newpos_check[i])
 
+    def test_get_set_coords(self):
+        """Get and set the coordinates of entities as arrays."""
+        for o in (self.s, self.m, self.c, self.r):
+            atoms = list(o.get_atoms())
+            coords = o.get_coords()
+            self.assertEqual(coords.shape, (len(atoms), 3))
+            for atom, coord in zip(atoms, coords):
+                self.assertTrue(numpy.array_equal(atom.coord, coord))
+            o.set_coords(coords + 1.0)
+            coords2 = o.get_coords()
+            self.assertTrue(numpy.allclose(coords2, coords + 1.0))
+            # The atoms now share a single array
+            self.assertIs(atoms[0].coord.base, atoms[-1].coord.base)
+            self.assertRaises(ValueError, o.set_coords, coords[1:])
+        self.assertRaises(ValueError, self.r.set_coords, numpy.zeros((1, 2)))
+
+    def test_atom_arrays(self):
+        """Get parallel arrays of atom properties."""
+        atoms = list(self.s.get_atoms())
+        bfactors = [atom.bfactor for atom in atoms]
+        self.assertTrue(numpy.allclose(self.s.get_bfactors(), bfactors))
+        occupancies = [atom.occupancy for atom in atoms]
+        self.assertTrue(numpy.allclose(self.s.get_occupancies(), occupancies))
+        elements = [atom.element for atom in atoms]
+        self.assertEqual(list(self.s.get_elements()), elements)
+
 
 class PDBParserTests(unittest.TestCase):
     """Test PDBParser module."""
@@ -1700,6 +1727,51 @@ class DsspTests(unittest.TestCase):
                     self.assertEqual(xtra_list, xtra_list_ref)
                     i += 1
 
+    def test_DSSP_from_model(self):
+        """Assign secondary structure without the DSSP program."""
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", PDBConstructionWarning)
+            s = PDBParser().get_structure("example", "PDB/2BEG.pdb")
+        m = s[0]
+        # The DSSP version used for 2BEG.dssp took the hydrogens with four
+        # character names (e.g. HG11 of valine) to be side chain atoms, so
+        # do the same here to compare the accessibility
+        for atom in m.get_atoms():
+            if atom.element == "H" and len(atom.get_id()) == 4:
+                atom.element = "C"
+        expected, expected_keys = make_dssp_dict("PDB/2BEG.dssp")
+        dssp, keys = dssp_dict_from_model(m)
+        self.assertEqual(keys, expected_keys)
+        for key in keys:
+            values = dssp[key]
+            expected_values = expected[key]
+            # Amino acid, secondary structure
+            self.assertEqual(values[:2], expected_values[:2])
+            # The accessibility surface points are placed differently
+            self.assertAlmostEqual(values[2], expected_values[2], delta=5)
+            # Phi, psi and the DSSP numbering
+            self.assertEqual(values[3:6], expected_values[3:6])
+            # Hydrogen bond partners and energies
+            self.assertEqual(values[6::2], expected_values[6::2])
+            for energy, expected_energy in zip(values[7::2], expected_values[7::2]):
+                self.assertAlmostEqual(energy, expected_energy, delta=0.11)
+        # Using the DSSP class
+        dssp = DSSP(m)
+        self.assertEqual(len(dssp), 130)
+        self.assertEqual(dssp[keys[1]][2], "E")
+        self.assertEqual(m["A"][27].xtra["SS_DSSP"], "S")
+
+    def test_DSSP_from_model_helices(self):
+        """Assign helices and turns without the DSSP program."""
+        s = MMCIFParser(QUIET=True).get_structure("example", "PDB/4CUP.cif")
+        dssp, keys = dssp_dict_from_model(s[0])
+        # As assigned with DSSP by the RCSB, from the secStructList of 4CUP.mmtf
+        self.assertEqual(
+            "".join(dssp[key][1] for key in keys),
+            "-TT--------TTHHHHHHHHHHHHHHSTT-GGGSS---TTTSTTHHHH-SS---HHHHHHHHHTT---S"
+            "HHHHHHHHHHHHHHHHHHS-SSSHHHHHHHHHHHHHHHHHHHHH-",
+        )
+
     def test_DSSP_RSA(self):
         """Tests the usage of different ASA tables."""
         # Tests include Sander/default, Wilke and Miller
@@ -0,0 +1,124 @@
+# This file is part of the Biopython distribution and governed by your
+# choice of the "Biopython License Agreement" or the "BSD 3-Clause License".
+# Please see the LICENSE file that should have been included as part of this
+# package.
+
+"""Unit tests for the Bio.PDB.SASA module: Surface Accessibility Calculations."""
+
+import math
+import unittest
+import warnings
+
+try:
+    import numpy
+except ImportError:
+    from Bio import MissingExternalDependencyError
+
+    raise MissingExternalDependencyError(
+        "Install NumPy if you want to use Bio.PDB."
+    ) from None
+
+try:
+    from Bio.PDB.SASA import ShrakeRupley
+except ImportError:
+    from Bio import MissingExternalDependencyError
+
+    raise MissingExternalDependencyError(
+        "C module Bio.PDB.kdtrees not compiled"
+    ) from None
+
+from Bio.PDB import PDBParser
+from Bio.PDB.Atom import Atom
+from Bio.PDB.PDBExceptions import PDBConstructionWarning, PDBException
+from Bio.PDB.Residue import Residue
+
+
+def make_residue(coords, elements):
+    """Return a residue holding atoms at the given coordinates."""
+    residue = Residue((" ", 1, " "), "UNK", " ")
+    for i, (coord, element) in enumerate(zip(coords, elements)):
+        name = "X%i" % i
+        atom = Atom(name, numpy.array(coord, "f"), 0.0, 1.0, " ", name, i, element)
+        residue.add(atom)
+    return residue
+
+
+class SASA_ShrakeRupleyTests(unittest.TestCase):
+    """Tests for the Shrake-Rupley algorithm."""
+
+    @classmethod
+    def setUpClass(cls):
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", PDBConstructionWarning)
+            cls.structure = PDBParser(QUIET=True).get_structure("1LCD", "PDB/1LCD.pdb")
+
+    def test_isolated_atom(self):
+        """Check the area of an isolated atom is that of its sphere."""
+        residue = make_residue([(0, 0, 0)], ["C"])
+        ShrakeRupley().compute(residue)
+        self.assertAlmostEqual(residue["X0"].sasa, 4 * math.pi * (1.7 + 1.4) ** 2)
+
+    def test_two_atoms(self):
+        """Check the area of two overlapping atoms against the exact value."""
+        distance = 4.0
+        residue = make_residue([(0, 0, 0), (distance, 0, 0)], ["C", "O"])
+        ShrakeRupley(n_points=5000).compute(residue, level="R")
+        for name, r1, r2 in (("X0", 3.1, 2.92), ("X1", 2.92, 3.1)):
+            # Subtract the cap of the sphere inside the other sphere
+            cap = r1 - (distance ** 2 + r1 ** 2 - r2 ** 2) / (2 * distance)
+            expected = 4 * math.pi * r1 ** 2 - 2 * math.pi * r1 * cap
+            self.assertAlmostEqual(residue[name].sasa / expected, 1.0, places=2)
+        self.assertAlmostEqual(residue.sasa, residue["X0"].sasa + residue["X1"].sasa)
+
+    def test_levels(self):
+        """Check the values at each level are the sums of their atoms."""
+        model = self.structure[0]
+        sr = ShrakeRupley()
+        sr.compute(model, level="A")
+        atom_values = {atom.full_id: atom.sasa for atom in model.get_atoms()}
+        for level, entities in (
+            ("R", list(model.get_residues())),
+            ("C", list(model)),
+            ("M", [model]),
+        ):
+            sr.compute(model, level=level)
+            for entity in entities:
+                self.assertAlmostEqual(
+                    entity.sasa,
+                    sum(atom_values[atom.full_id] for atom in entity.get_atoms()),
+                )
+
+    def test_models(self):
+        """Check each model of a structure is calculated on its own."""
+        sr = ShrakeRupley()
+        sr.compute(self.structure, level="M")
+        expected = [model.sasa for model in self.structure]
+        self.assertEqual(len(expected), 3)
+        for model, value in zip(self.structure, expected):
+            sr.compute(model, level="M")
+            self.assertAlmostEqual(model.sasa, value)
+        sr.compute(self.structure, level="S")
+        self.assertAlmostEqual(self.structure.sasa, sum(expected))
+
+    def test_radii(self):
+        """Check a user supplied radius is used."""
+        residue = make_residue([(0, 0, 0)], ["FE"])
+        self.assertRaises(PDBException, ShrakeRupley().compute, residue)
+        ShrakeRupley(probe_radius=1.0, radii_dict={"FE": 2.0}).compute(residue)
+        self.assertAlmostEqual(residue["X0"].sasa, 4 * math.pi * 9.0)
+
+    def test_bad_arguments(self):
+        """Check invalid arguments are rejected."""
+        self.assertRaises(ValueError, ShrakeRupley, probe_radius=-1.40)
+        self.assertRaises(ValueError, ShrakeRupley, n_points=0)
+        sr = ShrakeRupley()
+        model = self.structure[0]
+        self.assertRaises(ValueError, sr.compute, model, level="X")
+        self.assertRaises(ValueError, sr.compute, model, level="S")
+        atom = next(model.get_atoms())
+        self.assertRaises(ValueError, sr.compute, atom)
+
+
+if __name__ == "__main__":
+    runner = unittest.TextTestRunner(verbosity=2)
+    unittest.main(testRunner=runner)
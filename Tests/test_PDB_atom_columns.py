@@ -0,0 +1,289 @@
+# This file is part of the Biopython distribution and governed by your
+# choice of the "Biopython License Agreement" or the "BSD 3-Clause License".
+# Please see the LICENSE file that should have been included as part of this
+# package.
+
+"""Unit tests for the Bio.PDB.atom_columns module."""
+
+import json
+import os
+import tempfile
+import unittest
+import warnings
+from io import BytesIO, StringIO
+
+try:
+    import numpy
+except ImportError:
+    from Bio import MissingExternalDependencyError
+
+    raise MissingExternalDependencyError(
+        "Install NumPy if you want to use Bio.PDB."
+    ) from None
+
+from Bio.PDB import MMCIFParser, PDBParser
+from Bio.PDB.atom_columns import build_structure
+from Bio.PDB.atom_columns import columns_from_structure
+from Bio.PDB.atom_columns import load_structure
+from Bio.PDB.atom_columns import read_mmcif_columns
+from Bio.PDB.atom_columns import read_pdb_columns
+from Bio.PDB.atom_columns import save_structure
+from Bio.PDB.PDBExceptions import PDBConstructionException
+from Bio.PDB.PDBExceptions import PDBConstructionWarning
+
+
+def summary(structure, serial=True):
+    """Return a list describing every model, chain, residue and atom."""
+    result = []
+    for model in structure:
+        result.append((model.id, model.serial_num))
+        for chain in model:
+            for residue in chain:
+                result.append((chain.id, residue.id, residue.resname, residue.segid))
+                for atom in residue.get_unpacked_list():
+                    result.append(
+                        (
+                            atom.name,
+                            atom.fullname,
+                            atom.altloc,
+                            atom.coord.tolist(),
+                            atom.bfactor,
+                            atom.occupancy,
+                            atom.element,
+                            atom.serial_number if serial else None,
+                            (
+                                None
+                                if atom.anisou_array is None
+                                else atom.anisou_array.tolist()
+                            ),
+                        )
+                    )
+    return result
+
+
+class ReadColumnsTests(unittest.TestCase):
+    """Check the columns read from PDB and mmCIF files."""
+
+    def test_pdb(self):
+        """Read the columns of a PDB file with several models."""
+        columns = read_pdb_columns("PDB/1LCD.pdb")
+        self.assertEqual(len(columns["name"]), 3384)
+        self.assertEqual(columns["model_serial"], [1, 2, 3])
+        self.assertEqual(numpy.bincount(columns["model"]).tolist(), [1137, 1125, 1122])
+        self.assertEqual(columns["coord"].shape, (3384, 3))
+        self.assertEqual(columns["coord"].dtype, numpy.float32)
+        self.assertEqual(columns["name"][0], "O5'")
+        self.assertEqual(columns["fullname"][0], " O5'")
+        self.assertEqual(columns["resname"][0], " DA")
+        self.assertEqual(columns["chain"][0], "B")
+        self.assertEqual(columns["resseq"][0], 1)
+        self.assertEqual(columns["element"][0], "O")
+        self.assertEqual(columns["serial"][1], 2)
+        self.assertNotIn("anisou", columns)
+
+    def test_pdb_handle(self):
+        """Read the columns from a handle, with ANISOU and END records."""
+        handle = StringIO(
+            "ATOM      1  N   HIS A   0     -16.300 -47.169   4.756  1.00117.90           N  \n"
+            "ANISOU    1  N   HIS A   0    15749  15048  14002  -6397  -1058    947       N  \n"
+            "HETATM    2  O   HOH A   1      -1.000   2.000   3.500  0.50 10.00           O  \n"
+            "END" + " " * 77 + "\n"
+            "HETATM    3  O   HOH A   2      -1.000   2.000   3.500  0.50 10.00           O  \n"
+        )
+        columns = read_pdb_columns(handle)
+        self.assertEqual(columns["hetero"].tolist(), [" ", "W"])
+        self.assertEqual(columns["model_serial"], [None])
+        self.assertEqual(columns["occupancy"].tolist(), [1.0, 0.5])
+        self.assertEqual(columns["bfactor"].tolist(), [117.9, 10.0])
+        self.assertTrue(numpy.allclose(columns["coord"][1], [-1.0, 2.0, 3.5]))
+        self.assertTrue(
+            numpy.allclose(
+                columns["anisou"][0],
+                [1.5749, 1.5048, 1.4002, -0.6397, -0.1058, 0.0947],
+            )
+        )
+        self.assertTrue(numpy.isnan(columns["anisou"][1]).all())
+
+    def test_mmcif(self):
+        """Read the columns of a mmCIF file."""
+        columns = read_mmcif_columns("PDB/1A8O.cif")
+        self.assertEqual(len(columns["name"]), 644)
+        self.assertEqual(columns["model_serial"], [1])
+        self.assertEqual(columns["name"][:4].tolist(), ["N", "CA", "C", "O"])
+        self.assertEqual(columns["serial"][:4].tolist(), [1, 2, 3, 4])
+        self.assertEqual(columns["altloc"][0], " ")
+        self.assertEqual(columns["icode"][0], " ")
+        self.assertEqual(columns["hetero"][-1], "W")
+
+    def test_mmcif_quoted(self):
+        """Read mmCIF values which need quotes."""
+        handle = StringIO(
+            "data_test\n"
+            "loop_\n"
+            "_atom_site.group_PDB\n"
+            "_atom_site.id\n"
+            "_atom_site.type_symbol\n"
+            "_atom_site.label_atom_id\n"
+            "_atom_site.label_alt_id\n"
+            "_atom_site.label_comp_id\n"
+            "_atom_site.auth_asym_id\n"
+            "_atom_site.auth_seq_id\n"
+            "_atom_site.pdbx_PDB_ins_code\n"
+            "_atom_site.Cartn_x\n"
+            "_atom_site.Cartn_y\n"
+            "_atom_site.Cartn_z\n"
+            "_atom_site.occupancy\n"
+            "_atom_site.B_iso_or_equiv\n"
+            "HETATM 1 C 'C 1' . XYZ A 1 ? 1.0 2.0 3.0 1.0 ?\n"
+            'HETATM 2 O "O5\'" . XYZ A 1 ? 4.0 5.0 6.0 1.0 ?\n'
+            "#\n"
+        )
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always", PDBConstructionWarning)
+            columns = read_mmcif_columns(handle)
+        self.assertEqual(len(caught), 1)
+        self.assertEqual(columns["name"].tolist(), ["C 1", "O5'"])
+        self.assertEqual(columns["bfactor"].tolist(), [0.0, 0.0])
+        self.assertEqual(columns["hetero"].tolist(), ["H", "H"])
+        self.assertEqual(columns["model_serial"], [None])
+
+
+class BuildStructureTests(unittest.TestCase):
+    """Check the structures built from the columns match the parsers."""
+
+    def check_pdb(self, filename):
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", PDBConstructionWarning)
+            expected = PDBParser().get_structure("test", filename)
+            structure = build_structure("test", read_pdb_columns(filename))
+        self.assertEqual(summary(structure), summary(expected))
+
+    def check_mmcif(self, filename):
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", PDBConstructionWarning)
+            expected = MMCIFParser().get_structure("test", filename)
+            structure = build_structure("test", read_mmcif_columns(filename))
+        # The MMCIFParser does not set the atom serial numbers
+        self.assertEqual(summary(structure, False), summary(expected, False))
+
+    def test_pdb(self):
+        """Build structures from PDB files."""
+        for filename in ("1A8O", "1LCD", "2XHE", "a_structure", "occupancy"):
+            self.check_pdb("PDB/%s.pdb" % filename)
+
+    def test_mmcif(self):
+        """Build structures from mmCIF files."""
+        for filename in ("1A8O", "1LCD", "2XHE", "3JQH"):
+            self.check_mmcif("PDB/%s.cif" % filename)
+
+    def test_disordered(self):
+        """Check disordered residues are built as by the parser."""
+        structure = build_structure("3JQH", read_mmcif_columns("PDB/3JQH.cif"))
+        residue = structure[0]["A"][(" ", 1, " ")]
+        self.assertEqual(residue.is_disordered(), 2)
+        self.assertEqual(sorted(residue.disordered_get_id_list()), ["PRO", "SER"])
+
+    def test_coords(self):
+        """Check the atom coordinates are views into one array."""
+        columns = read_pdb_columns("PDB/1A8O.pdb")
+        structure = build_structure("1A8O", columns)
+        atoms = list(structure.get_atoms())
+        self.assertIs(atoms[0].coord.base, atoms[-1].coord.base)
+        self.assertIsNot(atoms[0].coord.base, columns["coord"])
+        self.assertTrue(numpy.array_equal(structure.get_coords(), columns["coord"]))
+
+    def test_columns_from_structure(self):
+        """Check a structure is the same after a round trip through columns."""
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", PDBConstructionWarning)
+            for structure in (
+                PDBParser().get_structure("test", "PDB/a_structure.pdb"),
+                PDBParser().get_structure("test", "PDB/2XHE.pdb"),
+                MMCIFParser().get_structure("test", "PDB/3JQH.cif"),
+            ):
+                columns = columns_from_structure(structure)
+                copy = build_structure("test", columns)
+                self.assertEqual(summary(copy, False), summary(structure, False))
+                # The same disordered atoms and residues are selected
+                self.assertEqual(
+                    [atom.get_full_id() + (atom.altloc,) for atom in copy.get_atoms()],
+                    [
+                        atom.get_full_id() + (atom.altloc,)
+                        for atom in structure.get_atoms()
+                    ],
+                )
+
+    def test_strict(self):
+        """Check exceptions are fatal unless permissive."""
+        columns = read_pdb_columns("PDB/a_structure.pdb")
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", PDBConstructionWarning)
+            build_structure("test", columns)
+            self.assertRaises(
+                PDBConstructionException,
+                build_structure,
+                "test",
+                columns,
+                PERMISSIVE=False,
+            )
+
+
+class SaveLoadTests(unittest.TestCase):
+    """Check saving and loading structures in a binary file."""
+
+    def check(self, structure):
+        handle = BytesIO()
+        save_structure(structure, handle)
+        handle.seek(0)
+        copy = load_structure(handle)
+        self.assertEqual(copy.id, structure.id)
+        self.assertEqual(copy.header, structure.header)
+        self.assertEqual(summary(copy, False), summary(structure, False))
+        return copy
+
+    def test_pdb(self):
+        """Save and load structures from PDB files."""
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", PDBConstructionWarning)
+            for filename in ("1LCD", "2XHE", "a_structure"):
+                structure = PDBParser().get_structure(filename, "PDB/%s.pdb" % filename)
+                # Make the header match after a round trip through JSON
+                structure.header = json.loads(json.dumps(structure.header))
+                self.check(structure)
+
+    def test_mmcif(self):
+        """Save and load structures from mmCIF files."""
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", PDBConstructionWarning)
+            structure = MMCIFParser().get_structure("3JQH", "PDB/3JQH.cif")
+        structure.header = json.loads(json.dumps(structure.header))
+        self.check(structure)
+
+    def test_sigatm(self):
+        """Check the standard deviations of atoms are saved."""
+        structure = PDBParser(QUIET=True).get_structure("test", "PDB/1A8O.pdb")
+        atom = structure[0]["A"][152]["CA"]
+        atom.set_siguij(numpy.arange(6, dtype="f"))
+        atom.set_sigatm(numpy.arange(5, dtype="f"))
+        copy = self.check(structure)
+        copy_atom = copy[0]["A"][152]["CA"]
+        self.assertEqual(copy_atom.siguij_array.tolist(), list(range(6)))
+        self.assertEqual(copy_atom.sigatm_array.tolist(), list(range(5)))
+        self.assertIsNone(copy[0]["A"][152]["N"].sigatm_array)
+
+    def test_filename(self):
+        """Save and load using a file name."""
+        structure = PDBParser(QUIET=True).get_structure("1A8O", "PDB/1A8O.pdb")
+        handle, filename = tempfile.mkstemp(suffix=".npz")
+        os.close(handle)
+        try:
+            save_structure(structure, filename)
+            copy = load_structure(filename)
+        finally:
+            os.remove(filename)
+        self.assertEqual(summary(copy), summary(structure))
+
+
+if __name__ == "__main__":
+    runner = unittest.TextTestRunner(verbosity=2)
+    unittest.main(testRunner=runner)
@@ -0,0 +1,185 @@
+# This file is part of the Biopython distribution and governed by your
+# choice of the "Biopython License Agreement" or the "BSD 3-Clause License".
+# Please see the LICENSE file that should have been included as part of this
+# package.
+
+"""Unit tests for the Bio.PDB.contacts module."""
+
+import unittest
+
+try:
+    import numpy
+except ImportError:
+    from Bio import MissingExternalDependencyError
+
+    raise MissingExternalDependencyError(
+        "Install NumPy if you want to use Bio.PDB."
+    ) from None
+
+from Bio.PDB import NeighborSearch, PDBParser
+from Bio.PDB.contacts import atom_contacts
+from Bio.PDB.contacts import contact_matrix
+from Bio.PDB.contacts import interface_residues
+from Bio.PDB.contacts import residue_contacts
+
+
+def brute_force(coords, radius, box=None):
+    """Return the pairs of atoms in contact, comparing every pair."""
+    delta = coords[:, None] - coords[None, :]
+    if box is not None:
+        delta -= box * numpy.round(delta / box)
+    distances = numpy.sqrt((delta ** 2).sum(axis=-1))
+    if numpy.ndim(radius):
+        radius = radius[:, None] + radius[None, :]
+    i, j = numpy.nonzero(numpy.triu(distances <= radius, 1))
+    return i, j, distances[i, j]
+
+
+class AtomContactsTests(unittest.TestCase):
+    """Check the atom pairs against comparing all pairs."""
+
+    def check(self, coords, radius, box=None):
+        i, j, distances = atom_contacts(coords, radius, box)
+        expected_i, expected_j, expected_distances = brute_force(coords, radius, box)
+        self.assertEqual(i.tolist(), expected_i.tolist())
+        self.assertEqual(j.tolist(), expected_j.tolist())
+        self.assertTrue(numpy.allclose(distances, expected_distances))
+
+    def test_random(self):
+        """Find contacts between random points."""
+        random = numpy.random.RandomState(7)
+        for n in (2, 10, 300):
+            coords = random.uniform(-20, 20, (n, 3))
+            for radius in (0.5, 3.0, 12.0):
+                self.check(coords, radius)
+
+    def test_periodic(self):
+        """Find contacts with periodic boundary conditions."""
+        random = numpy.random.RandomState(7)
+        box = numpy.array([20.0, 30.0, 9.0])
+        # Points outside the box are wrapped into it
+        coords = random.uniform(-30, 30, (300, 3))
+        for radius in (0.5, 2.5, 4.4):
+            self.check(coords, radius, box)
+        self.assertRaises(ValueError, atom_contacts, coords, 4.5, box)
+        self.assertRaises(ValueError, atom_contacts, coords, 1.0, (1.0, 2.0))
+
+    def test_radii(self):
+        """Find contacts with a radius for each atom."""
+        random = numpy.random.RandomState(7)
+        coords = random.uniform(-10, 10, (200, 3))
+        radii = random.uniform(0.5, 2.0, 200)
+        self.check(coords, radii)
+        self.check(coords, radii, (25.0, 25.0, 25.0))
+        self.assertRaises(ValueError, atom_contacts, coords, radii[:-1])
+
+    def test_small(self):
+        """Find contacts between no atoms or one atom."""
+        for n in (0, 1):
+            i, j, distances = atom_contacts(numpy.zeros((n, 3)), 2.0)
+            self.assertEqual(len(i), 0)
+            self.assertEqual(len(j), 0)
+            self.assertEqual(len(distances), 0)
+        i, j, distances = atom_contacts(numpy.zeros((3, 3)), 0.0)
+        self.assertEqual(list(zip(i, j)), [(0, 1), (0, 2), (1, 2)])
+        self.assertRaises(ValueError, atom_contacts, numpy.zeros(3), 2.0)
+
+    def test_zero_radius(self):
+        """Find atoms with the same coordinates in a large volume."""
+        random = numpy.random.RandomState(3)
+        coords = random.uniform(0, 100, (400, 3))
+        coords = numpy.concatenate((coords, coords[::40]))
+        for radius in (0.0, 1e-3):
+            self.check(coords, radius)
+            self.check(coords, radius, numpy.array([100.0, 100.0, 100.0]))
+        i, j, distances = atom_contacts(coords, 0.0)
+        self.assertEqual(len(i), 10)
+        self.assertEqual(distances.tolist(), [0.0] * 10)
+
+
+class EntityContactsTests(unittest.TestCase):
+    """Check the residue contacts and interfaces against NeighborSearch."""
+
+    @classmethod
+    def setUpClass(cls):
+        parser = PDBParser(QUIET=True)
+        cls.structure = parser.get_structure("2BEG", "PDB/2BEG.pdb")
+
+    def test_atoms(self):
+        """Check the atom pairs match NeighborSearch."""
+        atoms = list(self.structure.get_atoms())
+        i, j, distances = atom_contacts(self.structure.get_coords(), 4.0)
+        expected = {frozenset(pair) for pair in NeighborSearch(atoms).search_all(4.0)}
+        self.assertEqual(
+            {frozenset((atoms[a], atoms[b])) for a, b in zip(i, j)}, expected
+        )
+
+    def test_residues(self):
+        """Check the residue pairs match NeighborSearch."""
+        model = self.structure[0]
+        residues, i, j = residue_contacts(model, 4.0)
+        self.assertEqual(residues, list(model.get_residues()))
+        self.assertTrue((i < j).all())
+        atoms = list(model.get_atoms())
+        expected = {
+            frozenset(pair) for pair in NeighborSearch(atoms).search_all(4.0, "R")
+        }
+        self.assertEqual(
+            {frozenset((residues[a], residues[b])) for a, b in zip(i, j)}, expected
+        )
+        matrix = contact_matrix(len(residues), i, j)
+        self.assertEqual(matrix.sum(), 2 * len(expected))
+        self.assertTrue((matrix == matrix.T).all())
+
+    def test_interface(self):
+        """Check the interface residues between chains."""
+        model = self.structure[0]
+        interfaces = interface_residues(model, 4.0)
+        atoms = list(model.get_atoms())
+        expected = {}
+        for atom_a, atom_b in NeighborSearch(atoms).search_all(4.0):
+            residue_a = atom_a.get_parent()
+            residue_b = atom_b.get_parent()
+            chain_a = residue_a.get_parent().id
+            chain_b = residue_b.get_parent().id
+            if chain_a > chain_b:
+                chain_a, chain_b = chain_b, chain_a
+                residue_a, residue_b = residue_b, residue_a
+            if chain_a != chain_b:
+                residues = expected.setdefault((chain_a, chain_b), (set(), set()))
+                residues[0].add(residue_a)
+                residues[1].add(residue_b)
+        self.assertEqual(sorted(interfaces), sorted(expected))
+        for key, (residues_a, residues_b) in interfaces.items():
+            self.assertEqual(set(residues_a), expected[key][0])
+            self.assertEqual(set(residues_b), expected[key][1])
+            self.assertEqual(
+                residues_a, sorted(residues_a, key=lambda residue: residue.id[1])
+            )
+        # A structure keeps the models apart
+        structure_interfaces = interface_residues(self.structure, 4.0)
+        self.assertEqual(
+            sorted(structure_interfaces),
+            [((0, chain_a), (0, chain_b)) for chain_a, chain_b in sorted(expected)],
+        )
+
+    def test_chain(self):
+        """Check a single chain has no interfaces."""
+        self.assertEqual(interface_residues(self.structure[0]["A"]), {})
+        self.assertRaises(
+            ValueError, residue_contacts, list(self.structure.get_atoms())[0], 4.0
+        )
+
+    def test_residue(self):
+        """Check a single residue has no contacts with other residues."""
+        residue = list(self.structure.get_residues())[0]
+        residues, i, j = residue_contacts(residue, 4.0)
+        self.assertEqual(residues, [residue])
+        self.assertEqual(len(i), 0)
+        self.assertEqual(len(j), 0)
+        self.assertEqual(interface_residues(residue, 4.0), {})
+
+
+if __name__ == "__main__":
+    runner = unittest.TextTestRunner(verbosity=2)
+    unittest.main(testRunner=runner)
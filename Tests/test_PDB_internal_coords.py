@@ -223,6 +223,87 @@ class Rebuild(unittest.TestCase):
         self.assertTrue(maxPeptideBondPass)
 
 
+class BatchCoordinates(unittest.TestCase):
+    """Compare the batch methods of IC_Chain to the per residue methods."""
+
+    PDB_parser = PDBParser(PERMISSIVE=True, QUIET=True)
+    CIF_parser = MMCIFParser(QUIET=True)
+
+    def get_ic_chain(self, structure, chain_id):
+        chain = structure[0][chain_id]
+        chain.atom_to_internal_coordinates()
+        return chain.internal_coord
+
+    def test_batch_rebuild(self):
+        """Rebuild many conformers at once, as assemble_residues()."""
+        structure = self.PDB_parser.get_structure("2XHE", "PDB/2XHE.pdb")
+        cic = self.get_ic_chain(structure, "A")
+        cic.init_atom_array()
+        index = dict(cic.atomArrayIndex)
+        coords = cic.internal_to_atom_coordinates_batch(cic.dihedraIC)
+        self.assertEqual(coords.shape, (1, len(index), 3))
+        self.assertTrue(numpy.allclose(coords[0], cic.atomArray[:, :3]))
+
+        rng = numpy.random.default_rng(1)
+        dihedra = cic.dihedraIC + rng.normal(0, 10, (3, cic.dihedraLen))
+        coords = cic.internal_to_atom_coordinates_batch(dihedra)
+        self.assertEqual(coords.shape, (3, len(index), 3))
+        for conformer in (0, 2):
+            for key, ndx in cic.dihedraNdx.items():
+                cic.dihedra[key].angle = dihedra[conformer, ndx]
+            cic.init_atom_array()
+            self.assertEqual(cic.atomArrayIndex, index)
+            self.assertTrue(numpy.allclose(coords[conformer], cic.atomArray[:, :3]))
+
+    def test_batch_internal_coords(self):
+        """Compute internal coordinates of many conformers at once."""
+        structure = self.CIF_parser.get_structure("3JQH", "PDB/3JQH.cif")
+        cic = self.get_ic_chain(structure, "A")
+        cic.init_atom_array()
+        coords = numpy.stack((cic.atomArray[:, :3], cic.atomArray[:, :3] + 1.5))
+        dihedra, hedra = cic.atom_to_internal_coordinates_batch(coords)
+        self.assertEqual(dihedra.shape, (2, cic.dihedraLen))
+        self.assertEqual(hedra.shape, (2, cic.hedraLen, 3))
+        for conformer in range(2):
+            difference = (dihedra[conformer] - cic.dihedraIC + 180.0) % 360.0 - 180.0
+            self.assertLess(numpy.abs(difference).max(), 0.01)
+            self.assertTrue(numpy.allclose(hedra[conformer], cic.hedraIC, atol=0.01))
+
+        # round trip of the dihedra used to place each atom
+        rng = numpy.random.default_rng(2)
+        perturbed = cic.dihedraIC + rng.normal(0, 10, (4, cic.dihedraLen))
+        coords = cic.internal_to_atom_coordinates_batch(perturbed, cic.hedraIC)
+        dihedra, hedra = cic.atom_to_internal_coordinates_batch(coords)
+        placed = {}
+        for targets, sources, dndx in cic._assembly_plan:
+            placed.update(zip(targets, dndx))
+        used = sorted(set(placed.values()))
+        difference = (dihedra[:, used] - perturbed[:, used] + 180.0) % 360.0 - 180.0
+        self.assertLess(numpy.abs(difference).max(), 0.1)
+
+    def test_batch_errors(self):
+        """Check the array shapes for the batch methods."""
+        structure = self.PDB_parser.get_structure("1LCD", "PDB/1LCD.pdb")
+        cic = self.get_ic_chain(structure, "A")
+        self.assertRaises(
+            ValueError, cic.internal_to_atom_coordinates_batch, cic.dihedraIC[:-1]
+        )
+        self.assertRaises(
+            ValueError,
+            cic.internal_to_atom_coordinates_batch,
+            cic.dihedraIC,
+            cic.hedraIC[:-1],
+        )
+        self.assertRaises(
+            ValueError,
+            cic.atom_to_internal_coordinates_batch,
+            cic.atomArray[:-1, :3],
+        )
+        # a single set of coordinates is a batch of one
+        dihedra, hedra = cic.atom_to_internal_coordinates_batch(cic.atomArray[:, :3])
+        self.assertEqual(dihedra.shape, (1, cic.dihedraLen))
+
+
 if __name__ == "__main__":
     runner = unittest.TextTestRunner(verbosity=2)
     unittest.main(testRunner=runner)
@@ -0,0 +1,135 @@
+# This file is part of the Biopython distribution and governed by your
+# choice of the "Biopython License Agreement" or the "BSD 3-Clause License".
+# Please see the LICENSE file that should have been included as part of this
+# package.
+
+"""Unit tests for the Bio.PDB.parallel module."""
+
+import gzip
+import os
+import shutil
+import tempfile
+import unittest
+import warnings
+
+try:
+    import numpy
+except ImportError:
+    from Bio import MissingExternalDependencyError
+
+    raise MissingExternalDependencyError(
+        "Install NumPy if you want to use Bio.PDB."
+    ) from None
+
+from Bio.PDB import MMCIFParser, PDBParser
+from Bio.PDB.atom_columns import read_pdb_columns
+from Bio.PDB.parallel import parse_structures
+from Bio.PDB.PDBExceptions import PDBConstructionException
+from Bio.PDB.PDBExceptions import PDBConstructionWarning
+
+
+class ParseStructuresTests(unittest.TestCase):
+    """Check parse_structures gives the same structures as the parsers."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp(prefix="biopython_test_pdb_parallel_")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def check(self, structure, expected):
+        self.assertEqual(structure.id, expected.id)
+        self.assertEqual(
+            [atom.get_full_id() for atom in structure.get_atoms()],
+            [atom.get_full_id() for atom in expected.get_atoms()],
+        )
+        self.assertTrue(
+            numpy.array_equal(structure.get_coords(), expected.get_coords())
+        )
+
+    def test_files(self):
+        """Read a list of files in the given order."""
+        filenames = ["PDB/2BEG.cif", "PDB/1A8O.pdb", "PDB/1LCD.pdb"]
+        results = list(parse_structures(filenames, workers=2, QUIET=True))
+        self.assertEqual([result[0] for result in results], filenames)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", PDBConstructionWarning)
+            expected = [
+                MMCIFParser().get_structure("2BEG", "PDB/2BEG.cif"),
+                PDBParser().get_structure("1A8O", "PDB/1A8O.pdb"),
+                PDBParser().get_structure("1LCD", "PDB/1LCD.pdb"),
+            ]
+        for (filename, structure, error), old in zip(results, expected):
+            self.assertIsNone(error)
+            self.check(structure, old)
+
+    def test_directory(self):
+        """Read the files in a directory laid out like a PDB mirror."""
+        os.mkdir(os.path.join(self.temp_dir, "a8"))
+        os.mkdir(os.path.join(self.temp_dir, "lc"))
+        mirror_pdb = os.path.join(self.temp_dir, "a8", "pdb1a8o.ent.gz")
+        with open("PDB/1A8O.pdb", "rb") as handle:
+            with gzip.open(mirror_pdb, "wb") as output:
+                output.write(handle.read())
+        mirror_cif = os.path.join(self.temp_dir, "lc", "1lcd.cif")
+        shutil.copy("PDB/1LCD.cif", mirror_cif)
+        # Other files are ignored
+        with open(os.path.join(self.temp_dir, "lc", "README"), "w") as handle:
+            handle.write("Not a structure\n")
+        results = list(parse_structures(self.temp_dir, workers=1, QUIET=True))
+        self.assertEqual([result[0] for result in results], [mirror_pdb, mirror_cif])
+        self.assertEqual([result[1].id for result in results], ["1a8o", "1lcd"])
+        self.assertEqual(len(list(results[0][1].get_atoms())), 644)
+
+    def test_columns(self):
+        """Read the files as columns."""
+        results = list(
+            parse_structures(["PDB/1A8O.pdb"], workers=1, columns=True, QUIET=True)
+        )
+        filename, columns, error = results[0]
+        self.assertIsNone(error)
+        expected = read_pdb_columns("PDB/1A8O.pdb")
+        self.assertEqual(sorted(columns), sorted(expected))
+        for key in expected:
+            self.assertTrue(numpy.array_equal(columns[key], expected[key]), key)
+
+    def test_errors(self):
+        """Check errors are reported with their file."""
+        bad = os.path.join(self.temp_dir, "bad.pdb")
+        with open(bad, "w") as handle:
+            handle.write(
+                "ATOM      1  N   HIS A   0     -16.300 -47.16X   4.756  1.00117.90\n"
+            )
+        unknown = os.path.join(self.temp_dir, "unknown.xyz")
+        with open(unknown, "w") as handle:
+            handle.write("1\n\nC 0.0 0.0 0.0\n")
+        filenames = [bad, "PDB/1A8O.pdb", unknown, "PDB/missing.cif"]
+        results = list(parse_structures(filenames, workers=2))
+        self.assertEqual([result[0] for result in results], filenames)
+        errors = [result[2] for result in results]
+        self.assertIsInstance(errors[0], PDBConstructionException)
+        self.assertIsNone(errors[1])
+        self.assertIsInstance(errors[2], ValueError)
+        self.assertIsInstance(errors[3], FileNotFoundError)
+        self.assertIsNone(results[0][1])
+        self.assertEqual(results[1][1].id, "1A8O")
+
+    def test_format(self):
+        """Check the format argument overrides the file extension."""
+        filename = os.path.join(self.temp_dir, "1A8O.txt")
+        shutil.copy("PDB/1A8O.pdb", filename)
+        results = list(parse_structures([filename], format="pdb", workers=1))
+        self.assertIsNone(results[0][2])
+        self.assertEqual(results[0][1].id, "1A8O")
+
+    def test_early_stop(self):
+        """Check stopping before the end of the files."""
+        results = parse_structures(["PDB/1A8O.pdb"] * 10, workers=1)
+        filename, structure, error = next(results)
+        self.assertEqual(structure.id, "1A8O")
+        results.close()
+
+
+if __name__ == "__main__":
+    runner = unittest.TextTestRunner(verbosity=2)
+    unittest.main(testRunner=runner)
@@ -0,0 +1,101 @@
+# This file is part of the Biopython distribution and governed by your
+# choice of the "Biopython License Agreement" or the "BSD 3-Clause License".
+# Please see the LICENSE file that should have been included as part of this
+# package.
+
+"""Unit tests for the Bio.PDB.rmsd module."""
+
+import unittest
+
+try:
+    import numpy
+except ImportError:
+    from Bio import MissingExternalDependencyError
+
+    raise MissingExternalDependencyError(
+        "Install NumPy if you want to use Bio.PDB."
+    ) from None
+
+from Bio.PDB import PDBParser
+from Bio.PDB.QCPSuperimposer import QCPSuperimposer
+from Bio.PDB.rmsd import rmsd_matrix
+from Bio.SVDSuperimposer import SVDSuperimposer
+
+
+class RMSDMatrixTests(unittest.TestCase):
+    """Check the RMSD matrices against the superimposer classes."""
+
+    def setUp(self):
+        random = numpy.random.RandomState(11)
+        self.coords = random.normal(scale=5.0, size=(9, 25, 3))
+        self.reference = random.normal(scale=5.0, size=(4, 25, 3))
+
+    def check(self, matrix, coords, reference, rotations=None):
+        superimposer = SVDSuperimposer()
+        for i, moving in enumerate(coords):
+            for j, fixed in enumerate(reference):
+                superimposer.set(fixed, moving)
+                superimposer.run()
+                self.assertAlmostEqual(matrix[i, j], superimposer.get_rms(), places=6)
+                if rotations is not None:
+                    rot, tran = superimposer.get_rotran()
+                    self.assertTrue(numpy.allclose(rotations[i, j], rot))
+
+    def test_matrix(self):
+        """Compute the RMSD between all pairs of a stack."""
+        matrix, rotations = rmsd_matrix(self.coords, rotations=True, block_size=4)
+        self.assertEqual(matrix.shape, (9, 9))
+        self.assertEqual(rotations.shape, (9, 9, 3, 3))
+        self.check(matrix, self.coords, self.coords, rotations)
+        self.assertTrue((numpy.diag(matrix) == 0).all())
+        self.assertTrue((matrix == matrix.T).all())
+        # The same without rotations, and in one block
+        self.assertTrue(numpy.allclose(rmsd_matrix(self.coords), matrix))
+
+    def test_reference(self):
+        """Compute the RMSD of a stack to a stack of references."""
+        matrix, rotations = rmsd_matrix(
+            self.coords, self.reference, rotations=True, block_size=2
+        )
+        self.assertEqual(matrix.shape, (9, 4))
+        self.check(matrix, self.coords, self.reference, rotations)
+
+    def test_qcp(self):
+        """Compare with the QCPSuperimposer for the models of a structure."""
+        structure = PDBParser(QUIET=True).get_structure("1LCD", "PDB/1LCD.pdb")
+        coords = [
+            [atom.coord for atom in model.get_atoms() if atom.name == "P"]
+            for model in structure
+        ]
+        matrix = rmsd_matrix(coords)
+        superimposer = QCPSuperimposer()
+        for i, moving in enumerate(coords):
+            for j, fixed in enumerate(coords):
+                if i == j:
+                    # The QCPSuperimposer has rounding errors here
+                    continue
+                superimposer.set(numpy.array(fixed), numpy.array(moving))
+                superimposer.run()
+                self.assertAlmostEqual(matrix[i, j], superimposer.get_rms(), places=4)
+
+    def test_workers(self):
+        """Split the work between processes."""
+        expected = rmsd_matrix(self.coords, rotations=True)
+        result = rmsd_matrix(self.coords, rotations=True, workers=2, block_size=3)
+        self.assertTrue(numpy.allclose(result[0], expected[0]))
+        self.assertTrue(numpy.allclose(result[1], expected[1]))
+        result = rmsd_matrix(self.coords, self.reference, workers=2, block_size=3)
+        self.assertTrue(
+            numpy.allclose(result, rmsd_matrix(self.coords, self.reference))
+        )
+
+    def test_errors(self):
+        """Check the shapes of the coordinates."""
+        self.assertRaises(ValueError, rmsd_matrix, self.coords[0])
+        self.assertRaises(ValueError, rmsd_matrix, self.coords[:, :, :2])
+        self.assertRaises(ValueError, rmsd_matrix, self.coords, self.coords[:, :5])
+
+
+if __name__ == "__main__":
+    runner = unittest.TextTestRunner(verbosity=2)
+    unittest.main(testRunner=runner)
@@ -0,0 +1,138 @@
+# This file is part of the Biopython distribution and governed by your
+# choice of the "Biopython License Agreement" or the "BSD 3-Clause License".
+# Please see the LICENSE file that should have been included as part of this
+# package.
+
+"""Unit tests for the Bio.PDB.trajectory module."""
+
+import os
+import tempfile
+import unittest
+import warnings
+from io import StringIO
+
+try:
+    import numpy
+except ImportError:
+    from Bio import MissingExternalDependencyError
+
+    raise MissingExternalDependencyError(
+        "Install NumPy if you want to use Bio.PDB."
+    ) from None
+
+from Bio.PDB import PDBParser
+from Bio.PDB.PDBExceptions import PDBConstructionWarning
+from Bio.PDB.trajectory import Trajectory
+
+
+def write_frames(handle, n_frames):
+    """Write the first model of 1LCD several times, moving the atoms."""
+    with open("PDB/1LCD.pdb") as source:
+        lines = []
+        for line in source:
+            if line.startswith("ENDMDL"):
+                break
+            if line.startswith(("ATOM  ", "HETATM")):
+                lines.append(line)
+    for frame in range(n_frames):
+        handle.write("MODEL     %4i\n" % (frame + 1))
+        for line in lines:
+            x = float(line[30:38]) + frame
+            y = float(line[38:46]) - frame / 2
+            handle.write("%s%8.3f%8.3f%s" % (line[:30], x, y, line[46:]))
+        handle.write("ENDMDL\n")
+    handle.write("END\n")
+
+
+class TrajectoryTests(unittest.TestCase):
+    """Check the trajectories have the coordinates of each model."""
+
+    def setUp(self):
+        handle = StringIO()
+        write_frames(handle, 4)
+        self.text = handle.getvalue()
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", PDBConstructionWarning)
+            self.structure = PDBParser().get_structure("test", StringIO(self.text))
+
+    def check(self, trajectory):
+        self.assertEqual(len(trajectory), 4)
+        for model, expected in zip(trajectory, self.structure):
+            self.assertEqual(
+                [atom.get_full_id()[2:] for atom in model.get_atoms()],
+                [atom.get_full_id()[2:] for atom in expected.get_atoms()],
+            )
+            self.assertTrue(
+                numpy.array_equal(model.get_coords(), expected.get_coords())
+            )
+
+    def test_from_pdb(self):
+        """Read a trajectory from a PDB file."""
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", PDBConstructionWarning)
+            trajectory = Trajectory.from_pdb("test", StringIO(self.text))
+        self.assertEqual(repr(trajectory), "<Trajectory id=test frames=4 atoms=1137>")
+        self.assertEqual(trajectory.coords.dtype, numpy.float32)
+        self.check(trajectory)
+
+    def test_memmap(self):
+        """Read a trajectory into a memory mapped file."""
+        handle, filename = tempfile.mkstemp(suffix=".npy")
+        os.close(handle)
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", PDBConstructionWarning)
+                trajectory = Trajectory.from_pdb(
+                    "test", StringIO(self.text), memmap=filename
+                )
+            self.assertIsInstance(trajectory.coords, numpy.memmap)
+            self.check(trajectory)
+            # Reopen the coordinates with the same topology
+            coords = numpy.load(filename, mmap_mode="r")
+            self.check(Trajectory(trajectory.model, coords))
+            del trajectory, coords
+        finally:
+            os.remove(filename)
+
+    def test_from_structure(self):
+        """Create a trajectory from the models of a structure."""
+        trajectory = Trajectory.from_structure(self.structure)
+        self.check(trajectory)
+        # The topology is a copy of the first model
+        self.assertIsNot(trajectory.model, self.structure[0])
+        structure = PDBParser(QUIET=True).get_structure("1LCD", "PDB/1LCD.pdb")
+        self.assertRaises(ValueError, Trajectory.from_structure, structure)
+
+    def test_slicing(self):
+        """Get frames and trajectories of some of the frames."""
+        trajectory = Trajectory.from_structure(self.structure)
+        model = trajectory[-1]
+        self.assertIs(model, trajectory.model)
+        self.assertTrue(numpy.array_equal(model.get_coords(), trajectory.coords[3]))
+        part = trajectory[1::2]
+        self.assertIsInstance(part, Trajectory)
+        self.assertIs(part.model, trajectory.model)
+        self.assertEqual(len(part), 2)
+        self.assertTrue(numpy.shares_memory(part.coords, trajectory.coords))
+        self.assertTrue(numpy.array_equal(part[1].get_coords(), trajectory.coords[3]))
+        part = trajectory[numpy.array([0, 2])]
+        self.assertEqual(len(part), 2)
+        # The atom coordinates are views of the frame
+        atom = next(trajectory[2].get_atoms())
+        atom.coord[0] = 1000.0
+        self.assertEqual(trajectory.coords[2, 0, 0], 1000.0)
+
+    def test_errors(self):
+        """Check frames must have the same atoms."""
+        text = self.text.replace("ENDMDL\nEND\n", "").rsplit("\n", 2)[0] + "\n"
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", PDBConstructionWarning)
+            self.assertRaises(ValueError, Trajectory.from_pdb, "test", StringIO(text))
+            self.assertRaises(ValueError, Trajectory.from_pdb, "test", StringIO(""))
+        model = self.structure[0]
+        self.assertRaises(ValueError, Trajectory, model, numpy.zeros((2, 10, 3)))
+
+
+if __name__ == "__main__":
+    runner = unittest.TextTestRunner(verbosity=2)
+    unittest.main(testRunner=runner)
@@ -15,7 +15,7 @@ from Bio.Data.CodonTable import TranslationError
 from Bio.SeqFeature import FeatureLocation, AfterPosition, BeforePosition
 from Bio.SeqFeature import CompoundLocation, UnknownPosition, SeqFeature
 from Bio.SeqFeature import ExactPosition, WithinPosition, BetweenPosition
-from Bio.SeqFeature import OneOfPosition
+from Bio.SeqFeature import OneOfPosition, PositionGap, UncertainPosition
 
 
 class TestReference(unittest.TestCase):
@@ -243,6 +243,64 @@ class TestPositions(unittest.TestCase):
         self.assertEqual(between_pos._right, between_pos2._right)
         self.assertEqual(oneof_pos.position_choices, oneof_pos2.position_choices)
 
+    def test_slots(self):
+        """Test simple positions have no per-instance dictionary."""
+        for pos in (
+            ExactPosition(5),
+            UncertainPosition(5),
+            UnknownPosition(),
+            BeforePosition(5),
+            AfterPosition(5),
+            PositionGap(5),
+        ):
+            self.assertFalse(hasattr(pos, "__dict__"), repr(pos))
+            with self.assertRaises(AttributeError):
+                pos.spam = 1
+
+
+class TestLocationSlots(unittest.TestCase):
+    """Test locations using __slots__ still behave as before."""
+
+    def setUp(self):
+        self.locations = [
+            FeatureLocation(5, 10, strand=-1, ref="AL391218.9", ref_db="GenBank"),
+            FeatureLocation(BeforePosition(5), AfterPosition(10), strand=1)
+            + FeatureLocation(WithinPosition(12, left=12, right=15), 20),
+            CompoundLocation(
+                [FeatureLocation(1, 3), FeatureLocation(3, 8)], operator="order"
+            ),
+        ]
+
+    def test_no_dict(self):
+        """Test locations have no per-instance dictionary."""
+        for loc in self.locations:
+            self.assertFalse(hasattr(loc, "__dict__"), repr(loc))
+            with self.assertRaises(AttributeError):
+                loc.spam = 1
+
+    def test_pickle(self):
+        """Test pickling and unpickling locations with all protocols."""
+        import pickle
+
+        for loc in self.locations:
+            for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+                loc2 = pickle.loads(pickle.dumps(loc, protocol))
+                self.assertEqual(loc, loc2)
+                self.assertEqual(repr(loc), repr(loc2))
+        gap = pickle.loads(pickle.dumps(PositionGap(5), 0))
+        self.assertEqual(gap.gap_size, 5)
+
+    def test_copy(self):
+        """Test copying locations."""
+        import copy
+
+        for loc in self.locations:
+            self.assertEqual(repr(loc), repr(copy.copy(loc)))
+            self.assertEqual(repr(loc), repr(copy.deepcopy(loc)))
+        loc = copy.copy(self.locations[0])
+        loc.strand = 1
+        self.assertEqual(self.locations[0].strand, -1)
+
 
 if __name__ == "__main__":
     runner = unittest.TextTestRunner(verbosity=2)
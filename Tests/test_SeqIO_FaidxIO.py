@@ -0,0 +1,124 @@
+# This code is part of the Biopython distribution and governed by its
+# license.  Please see the LICENSE file that should have been included
+# as part of this package.
+"""Tests for Bio.SeqIO.FaidxIO module."""
+
+import os
+import random
+import shutil
+import tempfile
+import unittest
+from io import BytesIO
+from io import StringIO
+
+from Bio import SeqIO
+from Bio import bgzf
+from Bio.Seq import Seq
+from Bio.SeqRecord import SeqRecord
+from Bio.SeqIO.FaidxIO import IndexedFasta
+from Bio.SeqIO.FaidxIO import read_fai, write_fai, read_gzi, write_gzi
+
+
+class FaidxTests(unittest.TestCase):
+    """Test reading and writing faidx indexes."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp(prefix="biopython_test_faidx_")
+        rng = random.Random(42)
+        self.records = [
+            SeqRecord(
+                Seq("".join(rng.choice("ACGT") for _ in range(length))),
+                id="seq%i" % i,
+                description="",
+            )
+            for i, length in enumerate([0, 1, 60, 61, 50000, 120000])
+        ]
+        self.fasta = os.path.join(self.temp_dir, "example.fasta")
+        SeqIO.write(self.records, self.fasta, "fasta")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def check_fetch(self, fasta):
+        rng = random.Random(1)
+        self.assertEqual(list(fasta), [r.id for r in self.records])
+        for record in self.records:
+            self.assertEqual(fasta.length(record.id), len(record))
+            self.assertEqual(fasta[record.id].seq, record.seq)
+            for _ in range(20):
+                start = rng.randint(0, len(record))
+                end = rng.randint(start, len(record))
+                self.assertEqual(
+                    str(fasta.fetch(record.id, start, end)),
+                    str(record.seq[start:end]),
+                )
+        self.assertRaises(KeyError, fasta.fetch, "missing")
+
+    def test_fai_round_trip(self):
+        """Check writing and reading a .fai file."""
+        self.assertEqual(write_fai(self.fasta), len(self.records))
+        entries = read_fai(self.fasta + ".fai")
+        self.assertEqual(
+            entries[:3],
+            [("seq0", 0, 6, 0, 0), ("seq1", 1, 12, 1, 2), ("seq2", 60, 20, 60, 61)],
+        )
+        with open(self.fasta + ".fai") as handle:
+            self.assertEqual(handle.readline(), "seq0\t0\t6\t0\t0\n")
+
+    def test_read_fai_samtools(self):
+        """Check reading a .fai file as written by samtools."""
+        handle = StringIO(
+            "chr1\t248956422\t112\t70\t71\nchrM\t16569\t253105752\t70\t71\n"
+        )
+        self.assertEqual(
+            read_fai(handle),
+            [
+                ("chr1", 248956422, 112, 70, 71),
+                ("chrM", 16569, 253105752, 70, 71),
+            ],
+        )
+        handle = StringIO("read1\t4\t7\t4\t5\t14\n")
+        self.assertRaises(ValueError, read_fai, handle)
+
+    def test_irregular(self):
+        """Check indexing fails with irregular line wrapping."""
+        filename = os.path.join(self.temp_dir, "bad.fasta")
+        with open(filename, "w") as handle:
+            handle.write(">good\nACGT\nAC\n>bad\nACG\nACGT\nA\n")
+        self.assertRaises(ValueError, write_fai, filename)
+        self.assertRaises(ValueError, IndexedFasta, filename)
+
+    def test_plain(self):
+        """Check fetching from a plain FASTA file."""
+        with IndexedFasta(self.fasta) as fasta:
+            self.check_fetch(fasta)
+        write_fai(self.fasta)
+        with IndexedFasta(self.fasta) as fasta:
+            self.check_fetch(fasta)
+
+    def test_bgzf(self):
+        """Check fetching from a BGZF compressed FASTA file."""
+        filename = self.fasta + ".gz"
+        with open(self.fasta, "rb") as handle:
+            data = handle.read()
+        with bgzf.BgzfWriter(filename) as handle:
+            handle.write(data)
+        with IndexedFasta(filename) as fasta:
+            self.check_fetch(fasta)
+        write_fai(filename)
+        self.assertEqual(write_gzi(filename), 3)
+        blocks = read_gzi(filename + ".gzi")
+        self.assertEqual(len(blocks), 3)
+        self.assertEqual(blocks[0], (0, 0))
+        self.assertEqual(blocks[1][1], 65536)
+        with IndexedFasta(filename) as fasta:
+            self.check_fetch(fasta)
+
+    def test_read_gzi_truncated(self):
+        """Check a truncated .gzi file is rejected."""
+        self.assertRaises(ValueError, read_gzi, BytesIO(b"\x02\0\0\0\0\0\0\0"))
+
+
+if __name__ == "__main__":
+    runner = unittest.TextTestRunner(verbosity=2)
+    unittest.main(testRunner=runner)
@@ -6,13 +6,16 @@
 """Tests for Bio.SeqIO.FastaIO module."""
 
 
+import os
 import unittest
+from io import BytesIO
 from io import StringIO
 
 from Bio import SeqIO
 from Bio.SeqIO.FastaIO import FastaIterator
 from Bio.Alphabet import generic_nucleotide, generic_dna
 from Bio.SeqIO.FastaIO import SimpleFastaParser, FastaTwoLineParser
+from Bio.SeqIO.FastaIO import SimpleFastaChunkParser
 
 
 def title_to_ids(title):
@@ -203,6 +206,43 @@ class TestSimpleFastaParsers(unittest.TestCase):
             self.assertEqual(list(SimpleFastaParser(handle1)), out)
             self.assertEqual(list(SimpleFastaParser(handle2)), out)
 
+    def test_SimpleFastaChunkParser(self):
+        """Test SimpleFastaChunkParser matches SimpleFastaParser."""
+        inputs = (
+            self.ins_two_line
+            + self.ins_multiline
+            + self.ins_two_line_edges
+            + self.ins_simple_edges
+            + ["comment\n\n>1 a\r\nAC GT\r\nA\r\n>2\r\n\r\n", ">1\nAC\n>2>3\n"]
+        )
+        for inp in inputs:
+            expected = list(SimpleFastaParser(StringIO(inp)))
+            for chunk_size in (1, 2, 3, 5, 1000):
+                records = []
+                for titles, seqs in SimpleFastaChunkParser(
+                    BytesIO(inp.encode()), chunk_size
+                ):
+                    self.assertTrue(titles)
+                    records.extend(zip(titles, seqs))
+                self.assertEqual(records, expected)
+
+    def test_SimpleFastaChunkParser_files(self):
+        """Test SimpleFastaChunkParser on example files."""
+        for filename in os.listdir("Fasta"):
+            filename = os.path.join("Fasta", filename)
+            if not os.path.isfile(filename) or filename.endswith(".gz"):
+                continue
+            with open(filename) as handle:
+                expected = list(SimpleFastaParser(handle))
+            for chunk_size in (7, 100, 1048576):
+                records = []
+                for titles, seqs in SimpleFastaChunkParser(filename, chunk_size):
+                    records.extend(zip(titles, seqs))
+                self.assertEqual(records, expected, msg=filename)
+        with open("Fasta/f002") as handle:
+            with self.assertRaises(ValueError):
+                next(SimpleFastaChunkParser(handle))
+
     def test_regular_FastaTwoLineParser(self):
         """Test regular FastaTwoLineParser cases."""
         for inp, out in zip(self.ins_two_line, self.outs_two_line):
@@ -5,11 +5,13 @@
 
 """Tests for SeqIO Insdc module."""
 
+import copy
 import unittest
 from io import StringIO
 
 from Bio import SeqIO
 from Bio.Alphabet import generic_dna
+from Bio.SeqIO.InsdcIO import EmblIterator, GenBankIterator
 from Bio.Seq import Seq
 from Bio.SeqFeature import SeqFeature, FeatureLocation
 from Bio.SeqRecord import SeqRecord
@@ -104,6 +106,109 @@ class TestEmblRewrite(unittest.TestCase):
         self.check_rewrite("EMBL/AE017046.embl")
 
 
+class TestPartialParsing(unittest.TestCase):
+    """Check the options to skip or delay parsing parts of the records."""
+
+    files = [
+        (GenBankIterator, "GenBank/NC_005816.gb", "genbank"),
+        (GenBankIterator, "GenBank/cor6_6.gb", "genbank"),
+        (GenBankIterator, "GenBank/arab1.gb", "genbank"),
+        (EmblIterator, "EMBL/TRBG361.embl", "embl"),
+        (EmblIterator, "EMBL/A04195.imgt", "embl"),
+    ]
+
+    def test_lazy_features(self):
+        """Check lazy loaded features match the normal parser."""
+        for iterator, filename, fmt in self.files:
+            for old, new in zip(
+                SeqIO.parse(filename, fmt), iterator(filename, lazy_features=True)
+            ):
+                self.assertEqual(len(old.features), len(new.features))
+                # Slicing a record uses the feature list
+                self.assertEqual(len(old[10:-10].features), len(new[10:-10].features))
+                # Slicing the feature list gives a plain list
+                new.features = new.features[:]
+                self.assertTrue(compare_record(old, new))
+
+    def test_lazy_list(self):
+        """Check the lazy feature list acts like a list."""
+        record = next(GenBankIterator("GenBank/NC_005816.gb", lazy_features=True))
+        features = record.features
+        self.assertEqual(len(features), 41)
+        self.assertIs(features[-1], features[40])
+        self.assertEqual([f.type for f in features[1:3]], ["repeat_region", "gene"])
+        source = features.pop(0)
+        self.assertEqual(source.type, "source")
+        features.append(source)
+        self.assertIs(features[-1], source)
+        self.assertEqual(len(features), 41)
+
+    def test_lazy_list_sort(self):
+        """Check sorting the lazy feature list in place."""
+        old = next(SeqIO.parse("GenBank/NC_005816.gb", "genbank"))
+        new = next(GenBankIterator("GenBank/NC_005816.gb", lazy_features=True))
+        self.assertIsInstance(new.features, list)
+        old.features.sort(key=lambda f: (f.type, f.location.start))
+        new.features.sort(key=lambda f: (f.type, f.location.start))
+        self.assertEqual(
+            [(f.type, str(f.location)) for f in old.features],
+            [(f.type, str(f.location)) for f in new.features],
+        )
+        self.assertEqual(new.features.index(new.features[5]), 5)
+        self.assertIn(new.features[5], new.features)
+
+    def test_lazy_list_new_record(self):
+        """Check using the lazy feature list for a new SeqRecord."""
+        old = next(SeqIO.parse("GenBank/NC_005816.gb", "genbank"))
+        new = next(GenBankIterator("GenBank/NC_005816.gb", lazy_features=True))
+        record = SeqRecord(new.seq, id=new.id, features=new.features)
+        self.assertEqual(len(record.features), 41)
+        self.assertEqual(
+            [str(f.location) for f in old.features],
+            [str(f.location) for f in record.features],
+        )
+        self.assertEqual(len(record[100:1000].features), len(old[100:1000].features))
+        # Copies are plain lists of parsed features
+        features = copy.deepcopy(new.features)
+        self.assertIs(type(features), list)
+        self.assertEqual(features[3].type, old.features[3].type)
+        self.assertIs(type([] + new.features), list)
+
+    def test_skip_qualifiers(self):
+        """Check parsing features without their qualifiers."""
+        for iterator, filename, fmt in self.files:
+            for lazy in (False, True):
+                for old, new in zip(
+                    SeqIO.parse(filename, fmt),
+                    iterator(filename, qualifiers=False, lazy_features=lazy),
+                ):
+                    self.assertEqual(len(old.features), len(new.features))
+                    for old_f, new_f in zip(old.features, new.features):
+                        self.assertEqual(old_f.type, new_f.type)
+                        self.assertEqual(str(old_f.location), str(new_f.location))
+                        self.assertEqual(new_f.qualifiers, {})
+
+    def test_skip_sequence(self):
+        """Check parsing records without their sequence."""
+        for iterator, filename, fmt in self.files:
+            for old, new in zip(
+                SeqIO.parse(filename, fmt), iterator(filename, sequence=False)
+            ):
+                self.assertEqual(old.id, new.id)
+                self.assertEqual(len(old), len(new))
+                self.assertEqual(len(old.features), len(new.features))
+                self.assertEqual(str(new.seq), "N" * len(new))
+
+    def test_skip_features(self):
+        """Check parsing records without any features."""
+        for iterator, filename, fmt in self.files:
+            for old, new in zip(
+                SeqIO.parse(filename, fmt), iterator(filename, features=False)
+            ):
+                self.assertEqual(old.seq, new.seq)
+                self.assertEqual(new.features, [])
+
+
 class ConvertTestsInsdc(SeqIOConverterTestBaseClass):
     def test_conversion(self):
         """Test format conversion by SeqIO.write/SeqIO.parse and SeqIO.convert."""
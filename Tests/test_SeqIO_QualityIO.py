@@ -23,6 +23,11 @@ from Bio.Data.IUPACData import ambiguous_dna_letters, ambiguous_rna_letters
 
 from test_SeqIO import SeqIOTestBaseClass, SeqIOConverterTestBaseClass
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 
 class QualityIOTestBaseClass(SeqIOTestBaseClass):
     def compare_record(self, old, new, fmt=None, msg=None):
@@ -1101,6 +1106,171 @@ class TestsConverter(SeqIOConverterTestBaseClass, QualityIOTestBaseClass):
                 self.failure_check(filename, in_format, out_format, alphabet)
 
 
+class TestFastqChunks(unittest.TestCase):
+    """Test FastqGeneralChunkIterator matches FastqGeneralIterator."""
+
+    def check_chunks(self, filename, chunk_size):
+        try:
+            expected = list(QualityIO.FastqGeneralIterator(filename))
+        except ValueError as err:
+            with self.assertRaises(ValueError) as cm:
+                for values in QualityIO.FastqGeneralChunkIterator(filename, chunk_size):
+                    pass
+            self.assertEqual(str(cm.exception), str(err))
+            return
+        records = []
+        for titles, seqs, quals in QualityIO.FastqGeneralChunkIterator(
+            filename, chunk_size
+        ):
+            self.assertTrue(titles)
+            self.assertEqual(len(titles), len(seqs))
+            self.assertEqual(len(titles), len(quals))
+            records.extend(zip(titles, seqs, quals))
+        self.assertEqual(records, expected, msg=filename)
+
+    def test_files(self):
+        """Check all the example FASTQ files, including invalid ones."""
+        for filename in os.listdir("Quality"):
+            if filename.endswith(".fastq"):
+                for chunk_size in (1, 7, 100, 1048576):
+                    self.check_chunks(os.path.join("Quality", filename), chunk_size)
+
+    def test_handles(self):
+        """Check binary handles are required."""
+        with open("Quality/example.fastq", "rb") as handle:
+            chunks = list(QualityIO.FastqGeneralChunkIterator(handle, 100))
+        self.assertEqual(
+            [titles for (titles, seqs, quals) in chunks],
+            [
+                ["EAS54_6_R1_2_1_413_324"],
+                ["EAS54_6_R1_2_1_540_792", "EAS54_6_R1_2_1_443_348"],
+            ],
+        )
+        with open("Quality/example.fastq") as handle:
+            with self.assertRaises(ValueError):
+                next(QualityIO.FastqGeneralChunkIterator(handle))
+        self.assertEqual(list(QualityIO.FastqGeneralChunkIterator(BytesIO(b""))), [])
+
+
+if numpy:
+
+    class TestFastqArrays(unittest.TestCase):
+        """Test parsing FASTQ qualities as NumPy arrays."""
+
+        filenames = [
+            "Quality/example.fastq",
+            "Quality/tricky.fastq",
+            "Quality/sanger_93.fastq",
+            "Quality/sanger_faked.fastq",
+            "Quality/zero_length.fastq",
+        ]
+
+        def test_records(self):
+            """Check quality_array=True matches the default lists."""
+            for filename in self.filenames:
+                expected = list(SeqIO.parse(filename, "fastq"))
+                records = list(
+                    QualityIO.FastqPhredIterator(filename, quality_array=True)
+                )
+                self.assertEqual(len(records), len(expected))
+                for old, new in zip(expected, records):
+                    self.assertEqual(old.id, new.id)
+                    self.assertEqual(old.seq, new.seq)
+                    qualities = new.letter_annotations["phred_quality"]
+                    self.assertIsInstance(qualities, numpy.ndarray)
+                    self.assertEqual(qualities.dtype, numpy.uint8)
+                    self.assertEqual(
+                        list(qualities), old.letter_annotations["phred_quality"]
+                    )
+                    self.assertEqual(new.format("fastq"), old.format("fastq"))
+
+        def test_record_methods(self):
+            """Check slicing, adding and reverse complementing array records."""
+            filename = "Quality/example.fastq"
+            old = next(SeqIO.parse(filename, "fastq"))
+            new = next(QualityIO.FastqPhredIterator(filename, quality_array=True))
+            for old_rec, new_rec in [
+                (old[:5] + old[5:], new[:5] + new[5:]),
+                (old[10:] + old[:10], new[10:] + new[:10]),
+                (old[:5] + old[20:], new[:5] + old[20:]),
+                (old[3:-3], new[3:-3]),
+                (old.reverse_complement(), new.reverse_complement()),
+                (old[::-2].reverse_complement(), new[::-2].reverse_complement()),
+            ]:
+                self.assertEqual(old_rec.seq, new_rec.seq)
+                qualities = new_rec.letter_annotations["phred_quality"]
+                self.assertIsInstance(qualities, numpy.ndarray)
+                self.assertEqual(
+                    list(qualities), old_rec.letter_annotations["phred_quality"]
+                )
+                self.assertEqual(new_rec.format("fastq"), old_rec.format("fastq"))
+
+        def test_invalid(self):
+            """Check invalid quality characters are rejected."""
+            tests = [
+                ("Quality/error_qual_del.fastq", 3),
+                ("Quality/error_qual_space.fastq", 3),
+                ("Quality/error_qual_vtab.fastq", 0),
+                ("Quality/error_qual_escape.fastq", 4),
+                ("Quality/error_qual_null.fastq", 0),
+            ]
+            for filename, good_count in tests:
+                records = QualityIO.FastqPhredIterator(filename, quality_array=True)
+                for i in range(good_count):
+                    next(records)
+                self.assertRaises(ValueError, next, records)
+                batches = QualityIO.FastqPhredBatchIterator(filename, batch_size=1)
+                for i in range(good_count):
+                    next(batches)
+                self.assertRaises(ValueError, next, batches)
+
+        def test_batches(self):
+            """Check batches of arrays match the records."""
+            for filename in self.filenames:
+                expected = list(SeqIO.parse(filename, "fastq"))
+                for batch_size in (1, 2, 1000):
+                    count = 0
+                    for (
+                        titles,
+                        seqs,
+                        quals,
+                        offsets,
+                    ) in QualityIO.FastqPhredBatchIterator(filename, batch_size):
+                        self.assertLessEqual(len(titles), batch_size)
+                        self.assertEqual(len(offsets), len(titles) + 1)
+                        self.assertEqual(offsets[-1], len(seqs))
+                        self.assertEqual(len(seqs), len(quals))
+                        for i, title in enumerate(titles):
+                            record = expected[count]
+                            start, end = offsets[i], offsets[i + 1]
+                            self.assertEqual(title, record.description)
+                            self.assertEqual(
+                                seqs[start:end].tobytes().decode(), str(record.seq)
+                            )
+                            self.assertEqual(
+                                list(quals[start:end]),
+                                record.letter_annotations["phred_quality"],
+                            )
+                            count += 1
+                    self.assertEqual(count, len(expected))
+
+        def test_batches_illumina(self):
+            """Check batches of arrays with the Illumina 1.3+ offset."""
+            filename = "Quality/illumina_faked.fastq"
+            expected = list(SeqIO.parse(filename, "fastq-illumina"))
+            ((titles, seqs, quals, offsets),) = QualityIO.FastqPhredBatchIterator(
+                filename, offset=64
+            )
+            self.assertEqual(
+                list(quals),
+                [
+                    q
+                    for record in expected
+                    for q in record.letter_annotations["phred_quality"]
+                ],
+            )
+
+
 if __name__ == "__main__":
     runner = unittest.TextTestRunner(verbosity=2)
     unittest.main(testRunner=runner)
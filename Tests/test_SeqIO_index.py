@@ -756,6 +756,95 @@ if sqlite3:
             self.assertEqual(ids, list(d))
 
 
+class LazyFastaIndexTests(unittest.TestCase):
+    """Test SeqIO.index with lazy loading of FASTA sequences."""
+
+    def check_lazy(self, filename):
+        records = SeqIO.index(filename, "fasta", lazy=True)
+        try:
+            for expected in SeqIO.parse(filename, "fasta"):
+                record = records[expected.id]
+                self.assertEqual(record.id, expected.id)
+                self.assertEqual(record.description, expected.description)
+                self.assertEqual(len(record.seq), len(expected.seq))
+                self.assertEqual(str(record.seq), str(expected.seq))
+                n = len(expected)
+                for start, end, step in [
+                    (0, n, 1),
+                    (5, 70, 1),
+                    (59, 61, 1),
+                    (-80, -3, 1),
+                    (3, n - 3, 7),
+                    (None, None, -1),
+                    (n - 1, 10, -4),
+                ]:
+                    self.assertEqual(
+                        str(record.seq[start:end:step]),
+                        str(expected.seq[start:end:step]),
+                    )
+                if n:
+                    self.assertEqual(record.seq[-1], expected.seq[-1])
+                self.assertEqual(
+                    record.seq.reverse_complement(), expected.seq.reverse_complement()
+                )
+        finally:
+            records.close()
+
+    def test_wrapped(self):
+        """Check lazy FASTA index with line wrapped sequences."""
+        self.check_lazy("Fasta/f002")
+        self.check_lazy("GenBank/NC_000932.faa")
+
+    def test_irregular(self):
+        """Check lazy FASTA index with irregular line wrapping and line endings."""
+        data = (
+            b"header text\n"
+            b">alpha first\r\nACGTA\r\nCGTAC\r\nGT\r\n\r\n"
+            b">beta\nACG\nACGTT\nA\n"
+            b">gamma\nAC GT\nACGT\n"
+            b">delta\n"
+            b">epsilon\nACGTACGT\nAC\nACGTACGT"
+        )
+        with tempfile.NamedTemporaryFile(suffix=".fasta", delete=False) as handle:
+            handle.write(data)
+        try:
+            self.check_lazy(handle.name)
+        finally:
+            os.remove(handle.name)
+
+    def test_slice_reads_region(self):
+        """Check a slice within one line is a view on the file."""
+        records = SeqIO.index("Fasta/f002", "fasta", lazy=True)
+        seq = records["gi|1348912|gb|G26680|G26680"].seq[10:20]
+        self.assertIsInstance(seq._data, memoryview)
+        self.assertEqual(seq, "GGACACAGGG")
+        records.close()
+
+    def test_bgzf(self):
+        """Check lazy index falls back to parsing for BGZF files."""
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", BiopythonParserWarning)
+            expected = SeqIO.read("GenBank/NC_000932.gb", "gb")
+        handle, filename = tempfile.mkstemp(suffix=".fasta.bgz")
+        os.close(handle)
+        try:
+            from Bio import bgzf
+
+            with bgzf.BgzfWriter(filename) as handle:
+                handle.write(expected.format("fasta").encode())
+            records = SeqIO.index(filename, "fasta", lazy=True)
+            self.assertEqual(records[expected.id].seq, expected.seq)
+            records.close()
+        finally:
+            os.remove(filename)
+
+    def test_unsupported(self):
+        """Check lazy index rejects other formats."""
+        self.assertRaises(
+            ValueError, SeqIO.index, "GenBank/NC_000932.gb", "gb", lazy=True
+        )
+
+
 if __name__ == "__main__":
     runner = unittest.TextTestRunner(verbosity=2)
     unittest.main(testRunner=runner)
@@ -0,0 +1,100 @@
+# This code is part of the Biopython distribution and governed by its
+# license.  Please see the LICENSE file that should have been included
+# as part of this package.
+"""Tests for Bio.SeqIO.parallel_parse function."""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from Bio import SeqIO
+from Bio.Alphabet import generic_dna
+
+
+class ParallelParseTests(unittest.TestCase):
+    """Check parallel_parse gives the same records as parse."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp(prefix="biopython_test_parallel_")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def combine(self, filenames, name):
+        """Concatenate several files into one with many records."""
+        combined = os.path.join(self.temp_dir, name)
+        with open(combined, "wb") as output:
+            for filename in filenames:
+                with open(filename, "rb") as handle:
+                    output.write(handle.read())
+        return combined
+
+    def check(self, filename, format, alphabet=None):
+        expected = list(SeqIO.parse(filename, format, alphabet))
+        self.assertTrue(expected)
+        for chunk_size in (1, 2000, 1048576):
+            records = list(
+                SeqIO.parallel_parse(
+                    filename, format, alphabet, workers=2, chunk_size=chunk_size
+                )
+            )
+            self.assertEqual(len(records), len(expected))
+            for old, new in zip(expected, records):
+                self.assertEqual(old.id, new.id)
+                self.assertEqual(old.description, new.description)
+                self.assertEqual(str(old.seq), str(new.seq))
+                self.assertEqual(repr(old.seq.alphabet), repr(new.seq.alphabet))
+                self.assertEqual(len(old.features), len(new.features))
+                self.assertEqual(old.annotations, new.annotations)
+
+    def test_genbank(self):
+        """Check parallel parsing of GenBank files."""
+        filename = self.combine(
+            [
+                "GenBank/cor6_6.gb",
+                "GenBank/NC_005816.gb",
+                "GenBank/arab1.gb",
+                "GenBank/cor6_6.gb",
+            ],
+            "example.gb",
+        )
+        self.check(filename, "genbank")
+        self.check(filename, "gb")
+
+    def test_embl(self):
+        """Check parallel parsing of EMBL files."""
+        filename = self.combine(
+            ["EMBL/Human_contigs.embl", "EMBL/AE017046.embl", "EMBL/TRBG361.embl"],
+            "example.embl",
+        )
+        self.check(filename, "embl")
+
+    def test_fasta(self):
+        """Check parallel parsing of FASTA files."""
+        self.check("Fasta/f002", "fasta", generic_dna)
+        self.check("Fasta/aster.pro", "fasta")
+
+    def test_swiss(self):
+        """Check parallel parsing of SwissProt files."""
+        self.check("SwissProt/multi_ex.txt", "swiss")
+
+    def test_early_stop(self):
+        """Check stopping before the end of the file."""
+        records = SeqIO.parallel_parse(
+            "GenBank/cor6_6.gb", "genbank", workers=1, chunk_size=1
+        )
+        self.assertEqual(next(records).id, "X55053.1")
+        records.close()
+
+    def test_unsupported(self):
+        """Check formats without a record start line are rejected."""
+        with self.assertRaises(ValueError):
+            next(SeqIO.parallel_parse("Quality/example.fastq", "fastq"))
+        with self.assertRaises(ValueError):
+            next(SeqIO.parallel_parse("GenBank/cor6_6.gb", "GenBank"))
+
+
+if __name__ == "__main__":
+    runner = unittest.TextTestRunner(verbosity=2)
+    unittest.main(testRunner=runner)
@@ -1135,6 +1135,63 @@ class StringMethodTests(unittest.TestCase):
     # TODO - Addition...
 
 
+class BytesSeqTests(unittest.TestCase):
+    """Test Seq objects backed by bytes-like buffers."""
+
+    def test_equivalent_to_str(self):
+        """Check bytes backed Seq behaves like a string backed Seq."""
+        text = "ACGTNRYacgtnry-"
+        s1 = Seq(text, generic_dna)
+        s2 = Seq(text.encode("ASCII"), generic_dna)
+        self.assertEqual(str(s2), text)
+        self.assertEqual(repr(s2), repr(s1))
+        self.assertEqual(len(s2), len(s1))
+        self.assertEqual(s2, s1)
+        self.assertEqual(hash(s2), hash(s1))
+        self.assertEqual(bytes(s2), bytes(s1))
+        self.assertEqual(s2.complement(), s1.complement())
+        self.assertEqual(s2.reverse_complement(), s1.reverse_complement())
+        self.assertEqual(s2[3:-3].translate(), s1[3:-3].translate())
+        for i in range(-len(text), len(text)):
+            self.assertEqual(s2[i], s1[i])
+        for index in (slice(2, 7), slice(None, None, -1), slice(1, None, 3)):
+            self.assertEqual(str(s2[index]), str(s1[index]))
+
+    def test_slice_is_view(self):
+        """Check slicing a bytes backed Seq does not copy the data."""
+        data = b"ACGT" * 10
+        s = Seq(data)
+        sub = s[4:12]
+        self.assertIsInstance(sub._data, memoryview)
+        self.assertIs(sub._data.obj, data)
+        self.assertEqual(sub, "ACGTACGT")
+
+    def test_buffer_types(self):
+        """Check Seq accepts the common bytes-like objects."""
+        self.assertEqual(Seq(memoryview(b"ACGT")), "ACGT")
+        buffer = bytearray(b"ACGT")
+        s = Seq(buffer)
+        buffer[0:1] = b"T"
+        # Writable buffers are copied, so the Seq is not changed
+        self.assertEqual(s, "ACGT")
+
+    def test_rna_complement(self):
+        """Check complement of bytes backed RNA."""
+        self.assertEqual(Seq(b"ACGUacgu").complement(), "UGCAugca")
+        self.assertRaises(ValueError, Seq(b"ACGTU").complement)
+
+    def test_pickle(self):
+        """Check bytes backed Seq can be pickled."""
+        import pickle
+
+        s = Seq(b"ACGTACGT")[2:]
+        s2 = pickle.loads(pickle.dumps(s))
+        self.assertEqual(s2, "GTACGT")
+        self.assertIsInstance(s2._data, memoryview)
+        s3 = pickle.loads(pickle.dumps(UnknownSeq(5, character="N")))
+        self.assertEqual(s3, "NNNNN")
+
+
 class FileBasedTests(unittest.TestCase):
     """Test Seq objects created from files by SeqIO."""
 
@@ -26,11 +26,11 @@ class BgzfTests(unittest.TestCase):
         if os.path.isfile(self.temp_file):
             os.remove(self.temp_file)
 
-    def rewrite(self, compressed_input_file, output_file):
+    def rewrite(self, compressed_input_file, output_file, threads=1):
         with gzip.open(compressed_input_file, "rb") as h:
             data = h.read()
 
-        with bgzf.BgzfWriter(output_file, "wb") as h:
+        with bgzf.BgzfWriter(output_file, "wb", threads=threads) as h:
             h.write(data)
             self.assertFalse(h.seekable())
             self.assertFalse(h.isatty())
@@ -85,7 +85,7 @@ class BgzfTests(unittest.TestCase):
         self.assertEqual(len(old), len(new))
         self.assertEqual(old, new)
 
-    def check_by_line(self, old_file, new_file, old_gzip=False):
+    def check_by_line(self, old_file, new_file, old_gzip=False, threads=1):
         if old_gzip:
             with gzip.open(old_file) as handle:
                 old = handle.read()
@@ -101,7 +101,9 @@ class BgzfTests(unittest.TestCase):
                 old = old.decode("latin1")
 
             for cache in [1, 10]:
-                with bgzf.BgzfReader(new_file, mode, max_cache=cache) as h:
+                with bgzf.BgzfReader(
+                    new_file, mode, max_cache=cache, threads=threads
+                ) as h:
                     if "b" in mode:
                         new = b"".join(line for line in h)
                     else:
@@ -113,7 +115,7 @@ class BgzfTests(unittest.TestCase):
                 )
                 self.assertEqual(old, new)
 
-    def check_by_char(self, old_file, new_file, old_gzip=False):
+    def check_by_char(self, old_file, new_file, old_gzip=False, threads=1):
         if old_gzip:
             with gzip.open(old_file) as handle:
                 old = handle.read()
@@ -129,7 +131,7 @@ class BgzfTests(unittest.TestCase):
                 old = old.decode("latin1")
 
             for cache in [1, 10]:
-                h = bgzf.BgzfReader(new_file, mode, max_cache=cache)
+                h = bgzf.BgzfReader(new_file, mode, max_cache=cache, threads=threads)
                 temp = []
                 while True:
                     char = h.read(1)
@@ -150,7 +152,7 @@ class BgzfTests(unittest.TestCase):
                 )
                 self.assertEqual(old, new)
 
-    def check_random(self, filename):
+    def check_random(self, filename, threads=1):
         """Check BGZF random access by reading blocks in forward & reverse order."""
         with gzip.open(filename, "rb") as h:
             old = h.read()
@@ -160,7 +162,7 @@ class BgzfTests(unittest.TestCase):
 
         # Forward, using explicit open/close
         new = b""
-        h = bgzf.BgzfReader(filename, "rb")
+        h = bgzf.BgzfReader(filename, "rb", threads=threads)
         self.assertTrue(h.seekable())
         self.assertFalse(h.isatty())
         self.assertEqual(h.fileno(), h._handle.fileno())
@@ -177,7 +179,7 @@ class BgzfTests(unittest.TestCase):
 
         # Reverse, using with statement
         new = b""
-        with bgzf.BgzfReader(filename, "rb") as h:
+        with bgzf.BgzfReader(filename, "rb", threads=threads) as h:
             for start, raw_len, data_start, data_len in blocks[::-1]:
                 h.seek(bgzf.make_virtual_offset(start, 0))
                 data = h.read(data_len)
@@ -189,7 +191,7 @@ class BgzfTests(unittest.TestCase):
 
         # Jump back - non-sequential seeking
         if len(blocks) >= 3:
-            h = bgzf.BgzfReader(filename, "rb", max_cache=1)
+            h = bgzf.BgzfReader(filename, "rb", max_cache=1, threads=threads)
             # Seek to a late block in the file,
             # half way into the third last block
             start, raw_len, data_start, data_len = blocks[-3]
@@ -222,7 +224,7 @@ class BgzfTests(unittest.TestCase):
                 real_offset = data_start + within_offset
                 v_offsets.append((voffset, real_offset))
         shuffle(v_offsets)
-        h = bgzf.BgzfReader(filename, "rb", max_cache=1)
+        h = bgzf.BgzfReader(filename, "rb", max_cache=1, threads=threads)
         for voffset, real_offset in v_offsets:
             h.seek(0)
             self.assertTrue(voffset >= 0 and real_offset >= 0)
@@ -409,6 +411,84 @@ class BgzfTests(unittest.TestCase):
             self.assertEqual(data[:4], b"\x01\x02\x03\x04")
             self.assertEqual(data[-5:], b"\x01\x02\x03\x04\n")
 
+    def test_threads_bam_ex1(self):
+        """Check reading and writing BGZF blocks using threads."""
+        self.check_random("SamBam/ex1.bam", threads=3)
+        self.check_by_char("SamBam/ex1.bam", "SamBam/ex1.bam", True, threads=3)
+        self.rewrite("SamBam/ex1.bam", self.temp_file, threads=3)
+        self.check_blocks("SamBam/ex1.bam", self.temp_file)
+
+    def test_threads_example_gb(self):
+        """Check reading and writing a GenBank file using threads."""
+        self.check_by_line(
+            "GenBank/NC_000932.gb", "GenBank/NC_000932.gb.bgz", threads=2
+        )
+        self.rewrite("GenBank/NC_000932.gb.bgz", self.temp_file, threads=2)
+        self.check_blocks("GenBank/NC_000932.gb.bgz", self.temp_file)
+
+    def test_threads_write_tell(self):
+        """Check offsets while writing using threads."""
+        offsets = []
+        with bgzf.open(self.temp_file, "wb", threads=4) as h:
+            for i in range(10):
+                offsets.append(h.tell())
+                h.write(b"Magic" + b"Y" * 100000)
+                h.flush()
+        with bgzf.open(self.temp_file, "rb", threads=4) as h:
+            for offset in offsets[::-1]:
+                h.seek(offset)
+                self.assertEqual(h.read(6), b"MagicY")
+        self.assertRaises(ValueError, bgzf.BgzfWriter, self.temp_file, threads=0)
+
+    def test_cache_lru(self):
+        """Check the BGZF block cache evicts the least recently used block."""
+        cache = bgzf.BgzfBlockCache(max_blocks=2)
+        cache.put("a", 1, 10)
+        cache.put("b", 2, 20)
+        self.assertEqual(cache.get("a"), 1)
+        cache.put("c", 3, 30)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("c"), 3)
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.nbytes, 40)
+        self.assertEqual((cache.hits, cache.misses, cache.evictions), (2, 1, 1))
+        cache = bgzf.BgzfBlockCache(max_bytes=50)
+        for key in "abcde":
+            cache.put(key, key, 20)
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.evictions, 3)
+        cache.clear()
+        self.assertEqual((len(cache), cache.nbytes), (0, 0))
+        self.assertRaises(ValueError, bgzf.BgzfBlockCache, max_blocks=0)
+
+    def test_cache_shared(self):
+        """Check sharing a BGZF block cache between readers."""
+        with open("SamBam/ex1.bam", "rb") as h:
+            blocks = list(bgzf.BgzfBlocks(h))
+        cache = bgzf.BgzfBlockCache(max_bytes=10000000)
+        with bgzf.BgzfReader("SamBam/ex1.bam", "rb", cache=cache) as h:
+            old = h.read(500000)
+        self.assertEqual(len(cache), len(blocks))
+        self.assertEqual(cache.hits, 0)
+        misses = cache.misses
+        with bgzf.BgzfReader("SamBam/ex1.bam", "rb", cache=cache) as h:
+            for start, raw_len, data_start, data_len in blocks[::-1]:
+                h.seek(bgzf.make_virtual_offset(start, 0))
+                self.assertEqual(
+                    h.read(data_len), old[data_start : data_start + data_len]
+                )
+        # All the blocks should be found in the cache
+        self.assertEqual(cache.misses, misses)
+        self.assertGreaterEqual(cache.hits, len(blocks))
+        # Different mode, so the blocks are not shared
+        with bgzf.BgzfReader("SamBam/ex1.bam", "r", cache=cache) as h:
+            h.read(100)
+        self.assertEqual(cache.misses, misses + 1)
+        # Different file, so the blocks are not shared
+        with bgzf.BgzfReader("GenBank/cor6_6.gb.bgz", "rb", cache=cache) as h:
+            h.read(100)
+        self.assertEqual(cache.misses, misses + 2)
+
     def test_BgzfBlocks_TypeError(self):
         """Check get expected TypeError from BgzfBlocks."""
         for mode in ("r", "rb"):
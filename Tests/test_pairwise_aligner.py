@@ -9,8 +9,11 @@
 import array
 import os
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 
 from Bio import Align, SeqIO
+from Bio.Align import substitution_matrices
+from Bio.Seq import Seq
 
 
 class TestAlignerProperties(unittest.TestCase):
@@ -2255,6 +2258,511 @@ A---AAT-TG-AAGAGTTTGATC-ATGGCTCAG-A-TTGAACGCTGGCGGCAG-GCCTAA-CACATGCAAGTCGA-ACGG
         self.assertAlmostEqual(alignment.score, 1286.0)
 
 
+class TestThreads(unittest.TestCase):
+    def test_threads(self):
+        path = os.path.join("Align", "bsubtilis.fa")
+        seq1 = str(SeqIO.read(path, "fasta").seq)
+        path = os.path.join("Align", "ecoli.fa")
+        seq2 = str(SeqIO.read(path, "fasta").seq)
+        pairs = [
+            (seq1[i : i + 200], seq2[j : j + 150])
+            for i in range(0, 1000, 250)
+            for j in range(0, 1000, 250)
+        ]
+        for mode in ("global", "local"):
+            for gap_scores in ((-1, -1), (-2, -0.5)):
+                aligner = Align.PairwiseAligner(mode=mode)
+                aligner.open_gap_score, aligner.extend_gap_score = gap_scores
+                scores = [aligner.score(s1, s2) for s1, s2 in pairs]
+                alignments = [str(aligner.align(s1, s2)[0]) for s1, s2 in pairs]
+                with ThreadPoolExecutor(max_workers=4) as executor:
+                    self.assertEqual(
+                        list(executor.map(aligner.score, *zip(*pairs))), scores
+                    )
+                    self.assertEqual(
+                        [
+                            str(alignments[0])
+                            for alignments in executor.map(aligner.align, *zip(*pairs))
+                        ],
+                        alignments,
+                    )
+
+
+class TestScoreMany(unittest.TestCase):
+    sequences = [
+        "GAACT",
+        "GAT",
+        "ACGTTGCA",
+        "TTTTGAC",
+        "gaact",
+        "GXACT",
+        Seq("CCGATTAG"),
+    ]
+
+    def check(self, aligner, sequences):
+        scores = aligner.score_many(sequences[0], sequences)
+        self.assertEqual(
+            scores.tolist(), [aligner.score(s, sequences[0]) for s in sequences]
+        )
+        self.assertEqual(
+            aligner.score_many(sequences[0], sequences, workers=3).tolist(),
+            scores.tolist(),
+        )
+        expected = [[aligner.score(s1, s2) for s2 in sequences] for s1 in sequences]
+        matrix = aligner.score_matrix(sequences)
+        self.assertEqual(matrix.shape, (len(sequences), len(sequences)))
+        self.assertEqual(matrix.tolist(), expected)
+        self.assertEqual(aligner.score_matrix(sequences, workers=2).tolist(), expected)
+
+    def test_score_many(self):
+        for mode in ("global", "local"):
+            aligner = Align.PairwiseAligner(mode=mode, mismatch_score=-1)
+            for gap_scores in ((0, 0), (-1, -1), (-2, -0.5)):
+                aligner.open_gap_score, aligner.extend_gap_score = gap_scores
+                self.assertTrue(aligner._is_symmetric())
+                self.check(aligner, self.sequences)
+            aligner.target_end_gap_score = 0
+            self.assertFalse(aligner._is_symmetric())
+            self.check(aligner, self.sequences)
+
+    def test_workers(self):
+        aligner = Align.PairwiseAligner(mismatch_score=-1, gap_score=-1)
+        sequences = self.sequences
+        scores = aligner.score_many(sequences[0], sequences).tolist()
+        self.assertEqual(
+            aligner.score_many(sequences[0], sequences, workers=None).tolist(), scores
+        )
+        matrix = aligner.score_matrix(sequences).tolist()
+        self.assertEqual(aligner.score_matrix(sequences, workers=None).tolist(), matrix)
+        for workers in (0, -1):
+            with self.assertRaises(ValueError):
+                aligner.score_many(sequences[0], sequences, workers=workers)
+            with self.assertRaises(ValueError):
+                aligner.score_matrix(sequences, workers=workers)
+
+    def test_score_many_gap_function(self):
+        def gap_score(i, n):
+            return -2 - n
+
+        aligner = Align.PairwiseAligner(mismatch_score=-1)
+        aligner.target_gap_score = gap_score
+        aligner.query_gap_score = gap_score
+        self.assertFalse(aligner._is_symmetric())
+        self.check(aligner, self.sequences[:4])
+
+    def test_score_many_substitution_matrix(self):
+        aligner = Align.PairwiseAligner(open_gap_score=-10, extend_gap_score=-1)
+        aligner.substitution_matrix = substitution_matrices.load("BLOSUM62")
+        self.assertTrue(aligner._is_symmetric())
+        self.check(aligner, ["KEVLA", "EVL", "HEAGAWGHEE", "PAWHEAE"])
+        with self.assertRaises(ValueError):
+            aligner.score_many("KEVLA", ["EVL", "EVJL"])
+
+    def test_encode(self):
+        aligner = Align.PairwiseAligner()
+        self.assertEqual(aligner.encode("ACxz").tolist(), [0, 2, -1, 25])
+        self.assertEqual(aligner.encode(Seq("GAT")).tolist(), [6, 0, 19])
+        self.assertAlmostEqual(
+            aligner.score(aligner.encode("GAACT"), aligner.encode("GAT")), 3.0
+        )
+        with self.assertRaises(ValueError):
+            aligner.encode("AC1")
+        with self.assertRaises(ValueError):
+            aligner.encode("")
+        aligner.alphabet = ["Ala", "Gly", "Trp"]
+        self.assertEqual(aligner.encode(["Trp", "Ala"]).tolist(), [2, 0])
+        self.assertEqual(
+            aligner.score_many(["Gly", "Trp"], [["Trp"], ["Gly", "Ala"]]).tolist(),
+            [1.0, 1.0],
+        )
+
+
+class TestBandedAlignment(unittest.TestCase):
+    sequences = [
+        "GAACTGATTACAGGTTCC",
+        "GAACTTACAGGTTCG",
+        "TTACAGG",
+        "CCGATTAGGACTTAGCA",
+        "GATTACA",
+    ]
+
+    def check_wide_band(self, aligner):
+        # A band including all cells gives the same score as the full
+        # dynamic programming matrix, and one of its optimal alignments.
+        for seqA in self.sequences:
+            for seqB in self.sequences:
+                aligner.band_width = None
+                score = aligner.score(seqA, seqB)
+                paths = [alignment.path for alignment in aligner.align(seqA, seqB)]
+                aligner.band_width = 20
+                self.assertEqual(aligner.score(seqA, seqB), score)
+                alignments = aligner.align(seqA, seqB)
+                self.assertEqual(len(alignments), len(paths[:1]))
+                for alignment in alignments:
+                    self.assertEqual(alignment.score, score)
+                    self.assertIn(alignment.path, paths)
+
+    def test_wide_band(self):
+        aligner = Align.PairwiseAligner(match_score=2, mismatch_score=-1)
+        for mode in ("global", "local"):
+            aligner.mode = mode
+            for gap_scores in ((-1, -1), (-2, -0.5), (-3, -1)):
+                aligner.open_gap_score, aligner.extend_gap_score = gap_scores
+                self.check_wide_band(aligner)
+                aligner.end_gap_score = 0
+                self.check_wide_band(aligner)
+
+    def test_banded_global(self):
+        aligner = Align.PairwiseAligner(
+            match_score=2, mismatch_score=-1, open_gap_score=-2, extend_gap_score=-1
+        )
+        self.assertIsNone(aligner.band_width)
+        self.assertEqual(aligner.band_diagonal, 0)
+        seqA = "GAACTGATTACAGGTTCC"
+        seqB = "GAACTTACAGGTTCG"
+        aligner.band_width = 2
+        aligner.band_diagonal = -1
+        self.assertEqual(aligner.band_width, 2)
+        self.assertEqual(aligner.band_diagonal, -1)
+        self.assertEqual(aligner.algorithm, "Gotoh global alignment algorithm")
+        self.assertEqual(aligner.score(seqA, seqB), 23.0)
+        alignments = aligner.align(seqA, seqB)
+        self.assertEqual(len(alignments), 1)
+        alignment = alignments[0]
+        self.assertEqual(alignment.score, 23.0)
+        self.assertEqual(
+            str(alignment),
+            """\
+GAACTGATTACAGGTTCC
+||||---||||||||||.
+GAAC---TTACAGGTTCG
+""",
+        )
+        self.assertEqual(alignment.path, ((0, 0), (4, 4), (7, 4), (18, 15)))
+        aligner.band_width = 1
+        with self.assertRaises(ValueError):
+            aligner.score(seqA, seqB)
+        with self.assertRaises(ValueError):
+            aligner.align(seqA, seqB)
+        aligner.band_diagonal = -2
+        with self.assertRaises(ValueError):
+            aligner.score(seqA, seqB)
+        aligner.band_width = None
+        self.assertEqual(aligner.score(seqA, seqB), 23.0)
+
+    def test_banded_local(self):
+        aligner = Align.PairwiseAligner(
+            mode="local",
+            match_score=2,
+            mismatch_score=-1,
+            open_gap_score=-2,
+            extend_gap_score=-1,
+        )
+        seqA = "GAACTGATTACAGGTTCC"
+        seqB = "GAACTTACAGGTTCG"
+        self.assertEqual(aligner.score(seqA, seqB), 24.0)
+        aligner.band_width = 1
+        self.assertEqual(aligner.score(seqA, seqB), 11.0)
+        alignments = aligner.align(seqA, seqB)
+        self.assertEqual(len(alignments), 1)
+        alignment = alignments[0]
+        self.assertEqual(alignment.score, 11.0)
+        self.assertEqual(
+            [line.rstrip() for line in str(alignment).splitlines()],
+            [
+                "GAACTGATTACAGGTTCC",
+                "|||||.|",
+                "GAACTTACAGGTTCG",
+            ],
+        )
+        self.assertEqual(alignment.path, ((0, 0), (7, 7)))
+        # the band does not have to include the start or end of the sequences
+        aligner.band_width = 0
+        aligner.band_diagonal = -3
+        self.assertEqual(aligner.score(seqA, seqB), 20.0)
+        alignment = aligner.align(seqA, seqB)[0]
+        self.assertEqual(alignment.path, ((7, 4), (17, 14)))
+        aligner.band_diagonal = 30
+        self.assertEqual(aligner.score(seqA, seqB), 0.0)
+        self.assertEqual(len(aligner.align(seqA, seqB)), 0)
+
+    def test_xdrop(self):
+        aligner = Align.PairwiseAligner(
+            mode="local",
+            match_score=2,
+            mismatch_score=-1,
+            open_gap_score=-2,
+            extend_gap_score=-1,
+        )
+        self.assertIsNone(aligner.xdrop)
+        seqA = "GAACTGATTACAGGTTCCGGCAT"
+        seqB = "GAACTGTTACTGCCCCAAAAAGC"
+        aligner.xdrop = 3
+        self.assertEqual(aligner.xdrop, 3.0)
+        self.assertEqual(aligner.score(seqA, seqB), 19.0)
+        alignments = aligner.align(seqA, seqB)
+        self.assertEqual(len(alignments), 1)
+        alignment = alignments[0]
+        self.assertEqual(alignment.score, 19.0)
+        self.assertEqual(
+            [line.rstrip() for line in str(alignment).splitlines()],
+            [
+                "GAACTGATTACAGGTTCCGGCAT",
+                "||||||-||||.|",
+                "GAACTG-TTACTGCCCCAAAAAGC",
+            ],
+        )
+        self.assertEqual(alignment.path, ((0, 0), (6, 6), (7, 6), (13, 12)))
+        # with a larger X, the extension continues across the mismatches
+        aligner.xdrop = 50
+        self.assertEqual(aligner.score(seqA, seqB), 20.0)
+        alignment = aligner.align(seqA, seqB)[0]
+        self.assertEqual(
+            [line.rstrip() for line in str(alignment).splitlines()],
+            [
+                "GAACTGATTACAGGTTCCGGCAT",
+                "||||||-||||---|.||-.||",
+                "GAACTG-TTAC---TGCC-CCAAAAAGC",
+            ],
+        )
+        # the extension always starts at the start of both sequences
+        aligner.xdrop = 3
+        self.assertEqual(aligner.score("TTTTGAACT", "GAACT"), 0.0)
+        self.assertEqual(len(aligner.align("TTTTGAACT", "GAACT")), 0)
+        # X-drop can be combined with a band
+        aligner.band_width = 0
+        self.assertEqual(aligner.score(seqA, seqB), 13.0)
+        self.assertEqual(aligner.align(seqA, seqB)[0].path, ((0, 0), (8, 8)))
+
+    def test_errors(self):
+        aligner = Align.PairwiseAligner()
+        with self.assertRaises(ValueError):
+            aligner.band_width = -1
+        with self.assertRaises(ValueError):
+            aligner.xdrop = -1
+        aligner.xdrop = 10
+        with self.assertRaises(ValueError):
+            aligner.score("GAACT", "GAT")
+        aligner.mode = "local"
+        aligner.band_width = 1
+        aligner.band_diagonal = 2
+        with self.assertRaises(ValueError):
+            aligner.score("GAACT", "GAT")
+        aligner.xdrop = None
+        aligner.band_width = None
+
+        def gap_score(i, n):
+            return -n
+
+        aligner.gap_score = gap_score
+        aligner.band_width = 2
+        with self.assertRaises(ValueError):
+            aligner.score("GAACT", "GAT")
+        with self.assertRaises(ValueError):
+            aligner.align("GAACT", "GAT")
+
+    def test_str(self):
+        aligner = Align.PairwiseAligner()
+        aligner.substitution_matrix = substitution_matrices.load("BLOSUM62")
+        aligner.band_width = 123456789012
+        aligner.band_diagonal = -123456789012
+        aligner.xdrop = 1.7e308
+        aligner.striped = True
+        aligner.linear_memory = True
+        lines = str(aligner).splitlines()
+        self.assertEqual(
+            lines[-5:],
+            [
+                "  band_width: 123456789012",
+                "  band_diagonal: -123456789012",
+                "  xdrop: 1.7e+308",
+                "  linear_memory: True",
+                "  striped: True",
+            ],
+        )
+        # very long scores are truncated rather than overflowing the buffer
+        aligner.open_gap_score = -1e300
+        self.assertLess(len(str(aligner)), 1024)
+
+    def test_score_matrix(self):
+        aligner = Align.PairwiseAligner(mismatch_score=-1, gap_score=-1)
+        aligner.band_width = 3
+        self.assertTrue(aligner._is_symmetric())
+        aligner.mode = "local"
+        aligner.band_diagonal = 1
+        self.assertFalse(aligner._is_symmetric())
+        expected = [
+            [aligner.score(seqA, seqB) for seqB in self.sequences]
+            for seqA in self.sequences
+        ]
+        self.assertEqual(aligner.score_matrix(self.sequences).tolist(), expected)
+
+
+class TestLinearMemoryAlignment(unittest.TestCase):
+    def test_alignment(self):
+        aligner = Align.PairwiseAligner(
+            match_score=2,
+            mismatch_score=-1,
+            open_gap_score=-2,
+            extend_gap_score=-1,
+            end_gap_score=0,
+        )
+        self.assertFalse(aligner.linear_memory)
+        seqA = "GAACTGATTACAGGTTCC"
+        seqB = "TTACAGGTTCGGAAC"
+        paths = [alignment.path for alignment in aligner.align(seqA, seqB)]
+        aligner.linear_memory = True
+        self.assertTrue(aligner.linear_memory)
+        self.assertEqual(aligner.score(seqA, seqB), 19.0)
+        alignments = aligner.align(seqA, seqB)
+        self.assertEqual(len(alignments), 1)
+        alignment = alignments[0]
+        self.assertEqual(alignment.score, 19.0)
+        self.assertEqual(
+            str(alignment),
+            """\
+GAACTGATTACAGGTTCC----
+-------||||||||||.----
+-------TTACAGGTTCGGAAC
+""",
+        )
+        self.assertEqual(alignment.path, ((0, 0), (7, 0), (18, 11), (18, 15)))
+        self.assertEqual(paths, [alignment.path])
+
+    def test_optimal(self):
+        # These sequences are long enough to be split by the algorithm.
+        seqA = "GAACTGATTACAGGTTCCGGCAT" * 20
+        seqB = seqA[:100] + seqA[130:250].replace("A", "G") + "TTTT" + seqA[250:]
+        aligner = Align.PairwiseAligner(match_score=2, mismatch_score=-1)
+        for gap_scores in ((-1, -1), (-2, -0.5), (-5, -1)):
+            aligner.open_gap_score, aligner.extend_gap_score = gap_scores
+            for end_gap_score in (None, 0):
+                if end_gap_score is not None:
+                    aligner.end_gap_score = end_gap_score
+                for seq1, seq2 in ((seqA, seqB), (seqB, seqA), (seqA[:40], seqB)):
+                    aligner.linear_memory = False
+                    score = aligner.score(seq1, seq2)
+                    aligner.linear_memory = True
+                    alignment = aligner.align(seq1, seq2)[0]
+                    self.assertEqual(alignment.score, score)
+                    self.assertEqual(alignment.path[0], (0, 0))
+                    self.assertEqual(alignment.path[-1], (len(seq1), len(seq2)))
+
+    def test_substitution_matrix(self):
+        aligner = Align.PairwiseAligner()
+        aligner.substitution_matrix = substitution_matrices.load("BLOSUM62")
+        aligner.open_gap_score = -10
+        aligner.extend_gap_score = -0.5
+        seqA = "MKTAYIAKQRQISFVKSHFSRQLEERLGLIEVQAPILSRVGDGTQDNLSGAEKAVQVKVKALPDAQFEVV"
+        seqA *= 6
+        seqB = seqA[:120] + seqA[150:300] + "WWWW" + seqA[300:]
+        self.assertEqual(aligner.score(seqA, seqB), 1861.0)
+        aligner.linear_memory = True
+        alignment = aligner.align(seqA, seqB)[0]
+        self.assertEqual(alignment.score, 1861.0)
+        self.assertEqual(
+            alignment.path,
+            ((0, 0), (120, 120), (150, 120), (300, 270), (300, 274), (420, 394)),
+        )
+
+    def test_errors(self):
+        aligner = Align.PairwiseAligner(linear_memory=True)
+        aligner.mode = "local"
+        with self.assertRaises(ValueError):
+            aligner.align("GAACT", "GAT")
+        # only the alignments use the linear memory algorithm
+        self.assertEqual(aligner.score("GAACT", "GAT"), 3.0)
+        aligner.mode = "global"
+        aligner.band_width = 2
+        with self.assertRaises(ValueError):
+            aligner.align("GAACT", "GAT")
+        aligner.band_width = None
+
+        def gap_score(i, n):
+            return -n
+
+        aligner.gap_score = gap_score
+        with self.assertRaises(ValueError):
+            aligner.align("GAACT", "GAT")
+
+
+class TestStripedScore(unittest.TestCase):
+    sequences = [
+        "GAACTGATTACAGGTTCCGGCAT",
+        "GAACTGTTACTGCCCCAAAAAGC",
+        "TTACAGG",
+        "CCGATTAGGACTTAGCAXTTAGCCGATTAGGACTTAGCA",
+        "GATTACAGATTACAGATTACAGATTACA",
+        "A",
+    ]
+
+    def check(self, aligner):
+        for seqA in self.sequences:
+            for seqB in self.sequences:
+                aligner.striped = False
+                score = aligner.score(seqA, seqB)
+                end = aligner.score_end(seqA, seqB)
+                self.assertEqual(end[0], score)
+                aligner.striped = True
+                self.assertEqual(aligner.score(seqA, seqB), score)
+                self.assertEqual(aligner.score_end(seqA, seqB), end)
+
+    def test_striped(self):
+        aligner = Align.PairwiseAligner(mode="local")
+        self.assertFalse(aligner.striped)
+        for match_score, mismatch_score in ((1, 0), (2, -1), (5, -4), (1.5, -0.5)):
+            aligner.match_score = match_score
+            aligner.mismatch_score = mismatch_score
+            for gap_scores in ((0, 0), (-1, -1), (-3, -1), (-5, -2), (-2, -3)):
+                aligner.open_gap_score, aligner.extend_gap_score = gap_scores
+                self.check(aligner)
+            aligner.target_open_gap_score = -4
+            aligner.target_extend_gap_score = -1
+            aligner.query_open_gap_score = -2
+            aligner.query_extend_gap_score = -2
+            self.check(aligner)
+
+    def test_substitution_matrix(self):
+        aligner = Align.PairwiseAligner(mode="local")
+        aligner.substitution_matrix = substitution_matrices.load("BLOSUM62")
+        aligner.open_gap_score = -11
+        aligner.extend_gap_score = -1
+        self.check(aligner)
+
+    def test_score_end(self):
+        aligner = Align.PairwiseAligner(
+            mode="local", mismatch_score=-1, open_gap_score=-2, extend_gap_score=-1
+        )
+        aligner.striped = True
+        self.assertTrue(aligner.striped)
+        self.assertEqual(aligner.score_end("TTGATTACATT", "CGATTACAG"), (7.0, (9, 8)))
+        self.assertEqual(
+            aligner.score_end(Seq("TTGATTACATT"), Seq("CGATTACAG")), (7.0, (9, 8))
+        )
+        # the first of the alignments with the best score
+        self.assertEqual(aligner.score_end("GATCCGAT", "GAT"), (3.0, (3, 3)))
+        self.assertEqual(aligner.score_end("TTTT", "GGG"), (0.0, None))
+        aligner.band_width = 0
+        aligner.band_diagonal = -5
+        self.assertEqual(aligner.score_end("GATCCGAT", "GAT"), (3.0, (8, 3)))
+        aligner.mode = "global"
+        with self.assertRaises(ValueError):
+            aligner.score_end("GATCCGAT", "GAT")
+        # in global mode, the scores are calculated as usual
+        aligner.band_width = None
+        self.assertEqual(aligner.score("GATCCGAT", "GAT"), -3.0)
+
+    def test_large_score(self):
+        # The score does not fit in 16 bits, so the scalar algorithm is used.
+        aligner = Align.PairwiseAligner(mode="local", match_score=5)
+        aligner.striped = True
+        sequence = "GAACTGATTACAGGTTCCGGCAT" * 400
+        self.assertEqual(aligner.score(sequence, sequence), 46000.0)
+        self.assertEqual(
+            aligner.score_end(sequence, sequence), (46000.0, (9200, 9200))
+        )
+
+
 class TestKeywordArgumentsConstructor(unittest.TestCase):
     def test_confusing_arguments(self):
         aligner = Align.PairwiseAligner(